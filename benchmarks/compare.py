@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Compare benchmark results between commits.
+
+Metrics named ``*_per_second`` are better when higher, and the others when lower.
+"""
+
+import json
+from typing import Dict, Iterator, Tuple
+
+import click
+
+Key = Tuple[str, str]
+
+
+def _load(file) -> Dict[Key, Dict[str, float]]:
+    document = json.load(file)
+    return {
+        (record["benchmark"], json.dumps(record["params"], sort_keys=True)): record["metrics"]
+        for record in document["results"]
+    }
+
+
+def _changes(base, head) -> Iterator[Tuple[Key, str, float, float, float]]:
+    for key, base_metrics in base.items():
+        head_metrics = head.get(key, {})
+        for name, base_value in base_metrics.items():
+            head_value = head_metrics.get(name)
+            if head_value is None or not base_value:
+                continue
+            change = head_value / base_value - 1.0
+            slowdown = -change if name.endswith("_per_second") else change
+            yield key, name, base_value, head_value, slowdown
+
+
+@click.command()
+@click.argument("base", type=click.File("r"))
+@click.argument("head", type=click.File("r"))
+@click.option(
+    "-t",
+    "--threshold",
+    type=click.FloatRange(min=0.0),
+    default=0.1,
+    show_default=True,
+    help="The rate of slowdown to be regarded as a regression.",
+)
+def main(base, head, threshold: float) -> None:
+    """
+    Compare HEAD results with BASE ones, which are written by ``run.py``.
+    Exits with 1 when any regression is found.
+    """
+    regressed = False
+    for (benchmark, params), name, base_value, head_value, slowdown in _changes(
+        _load(base), _load(head)
+    ):
+        mark = ""
+        if slowdown > threshold:
+            mark = "  REGRESSION"
+            regressed = True
+        direction = "slower" if slowdown > 0 else "faster"
+        click.echo(
+            f"{benchmark} {params} {name}: "
+            f"{base_value:.4g} -> {head_value:.4g} ({abs(slowdown):.1%} {direction}){mark}"
+        )
+
+    if regressed:
+        raise click.exceptions.Exit(1)
+
+
+if __name__ == "__main__":
+    main()
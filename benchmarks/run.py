@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Benchmarks of Preacher against a local stand-in server.
+
+Results are written as JSON, which can be compared between commits with ``compare.py``.
+"""
+
+import gc
+import json
+import math
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import timeit
+from datetime import datetime, timezone
+from logging import getLogger
+from multiprocessing import get_all_start_methods
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import click
+import requests
+import yaml
+
+from preacher import __version__
+from preacher.app.cli.executor import ExecutorFactory
+from preacher.app.cli.executor import FORKING_PROCESS_POOL_FACTORY, HYBRID_POOL_FACTORY
+from preacher.app.cli.executor import PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY
+from preacher.compilation.extraction import create_extraction_compiler
+from preacher.compilation.scenario import compile_scenarios
+from preacher.compilation.yaml import load_from_paths
+from preacher.core.extraction import ResponseBodyAnalyzer
+from preacher.core.request import ExecutionReport, Requester, Response, ResponseBody
+from preacher.core.scenario import CaseListener, CaseRunner, Scenario, ScenarioResult
+from preacher.core.scheduling import Listener, create_scheduler
+from preacher.core.unit import UnitRunner
+from preacher.plugin import impl
+from preacher.plugin.manager import get_plugin_manager
+from preacher.presentation.html import HtmlReporter
+from server import JSON_BODY, XML_BODY, serving
+
+Record = Dict[str, Any]
+
+_LOGGER = getLogger("preacher.benchmark")
+_LOGGER.disabled = True
+
+_EXECUTORS: Dict[str, ExecutorFactory] = {
+    "process": PROCESS_POOL_FACTORY,
+    "thread": THREAD_POOL_FACTORY,
+    "hybrid": HYBRID_POOL_FACTORY,
+}
+if "fork" in get_all_start_methods():
+    _EXECUTORS["fork"] = FORKING_PROCESS_POOL_FACTORY
+
+_BODY_DESCRIPTIONS = [
+    {"describe": {"key": "foo"}, "should": {"equal": "bar"}},
+    {"describe": {"jq": ".numbers"}, "should": {"have_length": 10}},
+    {"describe": {"jq": ".items[].name"}, "should": {"have_item": "item-3"}},
+    {
+        "describe": {"jq": ".items[] | select(.enabled) | .id", "multiple": True},
+        "should": {"have_length": 10},
+    },
+]
+_CASE = {
+    "request": "/json",
+    "response": {
+        "status_code": 200,
+        "headers": [
+            {"describe": {"key": "content-type"}, "should": {"equal": "application/json"}},
+        ],
+        "body": _BODY_DESCRIPTIONS,
+    },
+}
+
+
+class _Settings:
+    def __init__(self, base_url: str, quick: bool, executors: Sequence[str], concurrencies):
+        self.base_url = base_url
+        self.executors = executors
+        self.concurrencies = concurrencies
+        self.scenarios, self.cases = (4, 10) if quick else (20, 50)
+        self.compiled_scenarios, self.compiled_files = (20, 2) if quick else (200, 10)
+        self.operations = 100 if quick else 1000
+
+
+class _Body(ResponseBody):
+    def __init__(self, content: bytes):
+        self._content = content
+
+    @property
+    def text(self) -> str:
+        return self._content.decode("utf-8")
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+
+class _Response(Response):
+    def __init__(self, content_type: str, content: bytes):
+        self._headers = {"content-type": content_type}
+        self._body = _Body(content)
+
+    @property
+    def id(self) -> str:
+        return "benchmark"
+
+    @property
+    def elapsed(self) -> float:
+        return 0.0
+
+    @property
+    def status_code(self) -> int:
+        return 200
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._headers
+
+    @property
+    def body(self) -> ResponseBody:
+        return self._body
+
+
+class _Recorder(Listener):
+    def __init__(self):
+        self.results: List[ScenarioResult] = []
+        self.executions: List[Tuple[ExecutionReport, Response]] = []
+
+    def on_execution(self, execution: ExecutionReport, response: Optional[Response]) -> None:
+        if response is not None:
+            self.executions.append((execution, response))
+
+    def on_scenario(self, result: ScenarioResult) -> None:
+        self.results.append(result)
+
+
+def _create_plugin_manager():
+    manager = get_plugin_manager()
+    if not manager.is_registered(impl):
+        manager.register(impl)
+    return manager
+
+
+def _scenario_objs(scenarios: int, cases: int) -> List[object]:
+    return [
+        {
+            "label": f"Scenario {i}",
+            "ordered": False,
+            "cases": [dict(_CASE, label=f"Case {j}") for j in range(cases)],
+        }
+        for i in range(scenarios)
+    ]
+
+
+def _compile(objs: List[object]) -> List[Scenario]:
+    manager = _create_plugin_manager()
+    return list(compile_scenarios(objs, plugin_manager=manager, logger=_LOGGER))
+
+
+def _percentile(values: Sequence[float], rate: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(math.ceil(rate * len(ordered)) - 1, 0)]
+
+
+def _distribution(prefix: str, seconds: Sequence[float]) -> Dict[str, float]:
+    return {
+        f"{prefix}_mean_ms": sum(seconds) / len(seconds) * 1000,
+        f"{prefix}_p50_ms": _percentile(seconds, 0.5) * 1000,
+        f"{prefix}_p99_ms": _percentile(seconds, 0.99) * 1000,
+    }
+
+
+def _run_scenarios(
+    settings: _Settings,
+    factory: ExecutorFactory,
+    concurrency: int,
+    scenarios: List[Scenario],
+) -> Tuple[float, _Recorder]:
+    recorder = _Recorder()
+    prepared = factory.prepare(scenarios)
+    starts = time.perf_counter()
+    with factory.create(concurrency) as executor:
+        scheduler = create_scheduler(executor, base_url=settings.base_url, listener=recorder)
+        scheduler.run(prepared)
+    seconds = time.perf_counter() - starts
+
+    # The forking executor freezes objects not to be collected.
+    gc.unfreeze()
+    return seconds, recorder
+
+
+def bench_throughput(settings: _Settings) -> List[Record]:
+    """Scenarios run end to end for each executor and concurrency."""
+    records: List[Record] = []
+    for name in settings.executors:
+        for concurrency in settings.concurrencies:
+            scenarios = _compile(_scenario_objs(settings.scenarios, settings.cases))
+            seconds, recorder = _run_scenarios(
+                settings, _EXECUTORS[name], concurrency, scenarios
+            )
+            cases = settings.scenarios * settings.cases
+            elapsed = [response.elapsed for _, response in recorder.executions]
+            metrics = {"seconds": seconds, "cases_per_second": cases / seconds}
+            metrics.update(_distribution("response", elapsed))
+            records.append(
+                {
+                    "params": {"executor": name, "concurrency": concurrency, "cases": cases},
+                    "metrics": metrics,
+                }
+            )
+    return records
+
+
+def bench_overhead(settings: _Settings) -> List[Record]:
+    """Time spent on each case except waiting for responses, which is run sequentially."""
+
+    class ElapsedRecorder(CaseListener):
+        def __init__(self):
+            self.elapsed = 0.0
+
+        def on_execution(self, execution: ExecutionReport, response: Optional[Response]):
+            if response is not None:
+                self.elapsed += response.elapsed
+
+    scenarios = _compile(_scenario_objs(1, settings.cases * 4))
+    listener = ElapsedRecorder()
+    requester = Requester(base_url=settings.base_url)
+    runner = CaseRunner(UnitRunner(requester), listener=listener)
+
+    overheads = []
+    with requests.Session() as session:
+        for case in scenarios[0].cases:
+            listener.elapsed = 0.0
+            starts = time.perf_counter()
+            runner.run(case, session=session)
+            overheads.append(time.perf_counter() - starts - listener.elapsed)
+    return [{"params": {"cases": len(overheads)}, "metrics": _distribution("overhead", overheads)}]
+
+
+def bench_compilation(settings: _Settings) -> List[Record]:
+    """Loading and compiling large generated suites from YAML files."""
+    objs = _scenario_objs(settings.compiled_scenarios, settings.cases)
+    per_file = math.ceil(len(objs) / settings.compiled_files)
+    cases = settings.compiled_scenarios * settings.cases
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index in range(settings.compiled_files):
+            path = os.path.join(directory, f"scenario-{index}.yml")
+            begins, ends = index * per_file, (index + 1) * per_file
+            with open(path, "w") as f:
+                yaml.safe_dump_all(objs[begins:ends], f)
+            paths.append(path)
+
+        manager = _create_plugin_manager()
+        starts = time.perf_counter()
+        loaded = list(load_from_paths(paths, plugin_manager=manager, logger=_LOGGER))
+        loading = time.perf_counter() - starts
+
+    starts = time.perf_counter()
+    _compile(loaded)
+    compiling = time.perf_counter() - starts
+
+    metrics = {
+        "loading_seconds": loading,
+        "compiling_seconds": compiling,
+        "cases_per_second": cases / (loading + compiling),
+    }
+    return [{"params": {"files": len(paths), "cases": cases}, "metrics": metrics}]
+
+
+def _time_operation(settings: _Settings, operation: Callable[[], object]) -> Dict[str, float]:
+    number = settings.operations
+    best = min(timeit.Timer(operation).repeat(repeat=5, number=number))
+    return {"us_per_operation": best / number * 1_000_000}
+
+
+def bench_extraction(settings: _Settings) -> List[Record]:
+    """Extracting values from responses, including parsing them."""
+    compiler = create_extraction_compiler(plugin_manager=_create_plugin_manager())
+    json_body = _Body(JSON_BODY)
+    xml_body = _Body(XML_BODY)
+    targets = {
+        "key": ({"key": "foo"}, json_body),
+        "jq": ({"jq": ".items[3].name"}, json_body),
+        "xpath": ({"xpath": "/root/item[4]/name"}, xml_body),
+    }
+
+    records = []
+    for name, (obj, body) in targets.items():
+        extractor = compiler.compile(obj)
+        metrics = _time_operation(settings, lambda: extractor.extract(ResponseBodyAnalyzer(body)))
+        records.append({"params": {"extractor": name}, "metrics": metrics})
+    return records
+
+
+def bench_verification(settings: _Settings) -> List[Record]:
+    """Verifying a response along a typical description."""
+    scenarios = _compile(_scenario_objs(1, 1))
+    description = scenarios[0].cases[0].response
+    response = _Response("application/json", JSON_BODY)
+
+    metrics = _time_operation(settings, lambda: description.verify(response))
+    return [{"params": {"descriptions": len(_BODY_DESCRIPTIONS)}, "metrics": metrics}]
+
+
+def bench_reporting(settings: _Settings) -> List[Record]:
+    """Rendering HTML reports of results and responses."""
+    scenarios = _compile(_scenario_objs(settings.scenarios, settings.cases))
+    _, recorder = _run_scenarios(settings, THREAD_POOL_FACTORY, 4, scenarios)
+
+    with tempfile.TemporaryDirectory() as directory:
+        reporter = HtmlReporter(directory)
+        starts = time.perf_counter()
+        reporter.export_results(recorder.results)
+        results = time.perf_counter() - starts
+
+        starts = time.perf_counter()
+        for execution, response in recorder.executions:
+            reporter.export_response(execution, response)
+        responses = time.perf_counter() - starts
+
+    metrics = {
+        "results_seconds": results,
+        "responses_seconds": responses,
+        "responses_per_second": len(recorder.executions) / responses,
+    }
+    params = {"scenarios": len(recorder.results), "responses": len(recorder.executions)}
+    return [{"params": params, "metrics": metrics}]
+
+
+BENCHMARKS: Dict[str, Callable[[_Settings], List[Record]]] = {
+    "throughput": bench_throughput,
+    "overhead": bench_overhead,
+    "compilation": bench_compilation,
+    "extraction": bench_extraction,
+    "verification": bench_verification,
+    "reporting": bench_reporting,
+}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ("git", "rev-parse", "HEAD"),
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@click.command()
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="The file to write results into. The standard output by default.",
+)
+@click.option(
+    "-b",
+    "--benchmark",
+    "benchmarks",
+    type=click.Choice(list(BENCHMARKS)),
+    multiple=True,
+    help="A benchmark to run, which can be given multiple times. All by default.",
+)
+@click.option(
+    "-E",
+    "--executor",
+    "executors",
+    type=click.Choice(list(_EXECUTORS)),
+    multiple=True,
+    help="An executor of the throughput benchmark. All by default.",
+)
+@click.option(
+    "-c",
+    "--concurrency",
+    "concurrencies",
+    type=click.IntRange(min=1),
+    multiple=True,
+    help="A concurrency of the throughput benchmark. 1, 4 and 16 by default.",
+)
+@click.option(
+    "--latency",
+    type=click.FloatRange(min=0.0),
+    default=0.0,
+    show_default=True,
+    help="Seconds for which the server waits before each response.",
+)
+@click.option("--quick", is_flag=True, help="Run with small sizes to check the benchmarks work.")
+def main(output, benchmarks, executors, concurrencies, latency, quick) -> None:
+    """Run benchmarks and write the results as JSON."""
+    benchmarks = benchmarks or tuple(BENCHMARKS)
+    executors = executors or tuple(_EXECUTORS)
+    concurrencies = concurrencies or (1, 4, 16)
+
+    records = []
+    with serving(latency=latency) as base_url:
+        settings = _Settings(base_url, quick, executors, concurrencies)
+        for name in benchmarks:
+            click.echo(f"Running {name}", err=True)
+            for record in BENCHMARKS[name](settings):
+                records.append(dict(benchmark=name, **record))
+
+    document = {
+        "meta": {
+            "preacher": __version__,
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "latency": latency,
+            "quick": quick,
+        },
+        "results": records,
+    }
+    json.dump(document, output, indent=2)
+    output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+A stand-in server for benchmarks.
+
+Responses are built in advance and connections are kept alive,
+so that the server costs as little as possible compared with Preacher.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import get_context
+from typing import Dict, Iterator, Tuple
+
+import click
+
+JSON_BODY = json.dumps(
+    {
+        "foo": "bar",
+        "numbers": list(range(10)),
+        "items": [{"id": i, "name": f"item-{i}", "enabled": i % 2 == 0} for i in range(20)],
+    }
+).encode("utf-8")
+
+XML_BODY = (
+    "<root>"
+    + "".join(f'<item id="{i}"><name>item-{i}</name></item>' for i in range(20))
+    + "</root>"
+).encode("utf-8")
+
+TEXT_BODY = b"text"
+
+_RESPONSES: Dict[str, Tuple[str, bytes]] = {
+    "/json": ("application/json", JSON_BODY),
+    "/xml": ("application/xml", XML_BODY),
+    "/text": ("text/plain", TEXT_BODY),
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and bodies are written separately, which is delayed by Nagle's algorithm.
+    disable_nagle_algorithm = True
+    latency = 0.0
+
+    def do_GET(self):
+        path, _, _ = self.path.partition("?")
+        content_type, body = _RESPONSES.get(path, ("text/plain", b"Not Found"))
+        if self.latency:
+            time.sleep(self.latency)
+
+        self.send_response(200 if path in _RESPONSES else 404)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _create_server(port: int, latency: float) -> ThreadingHTTPServer:
+    handler = type("Handler", (_Handler,), {"latency": latency})
+    server = ThreadingHTTPServer(("localhost", port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def _serve(port: int, latency: float, ports) -> None:
+    with _create_server(port, latency) as server:
+        ports.put(server.server_address[1])
+        server.serve_forever()
+
+
+@contextmanager
+def serving(port: int = 0, latency: float = 0.0) -> Iterator[str]:
+    """
+    Serve in another process not to compete with benchmarks for the GIL.
+
+    Args:
+        port: The port to listen. A free port is chosen when ``0``.
+        latency: Seconds to wait before each response, which simulates real backends.
+    Returns:
+        The base URL of the server.
+    """
+    context = get_context("spawn")
+    ports = context.SimpleQueue()
+    process = context.Process(target=_serve, args=(port, latency, ports), daemon=True)
+    process.start()
+    try:
+        yield f"http://localhost:{ports.get()}"
+    finally:
+        process.terminate()
+        process.join()
+
+
+@click.command()
+@click.option("-p", "--port", type=int, default=5000, show_default=True)
+@click.option("--latency", type=float, default=0.0, show_default=True)
+def main(port: int, latency: float) -> None:
+    """Serve until interrupted."""
+    with _create_server(port, latency) as server:
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
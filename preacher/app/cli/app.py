@@ -1,34 +1,61 @@
 """CLI Application implementation."""
 
-from typing import Iterable, Optional, Sequence
+import shutil
+from logging import Logger
+from tempfile import mkdtemp
+from typing import Iterable, List, Optional, Pattern, Sequence
+
+from pluggy import PluginManager
+
+from preacher import __version__ as _version
 
 from preacher.compilation.argument import Arguments
-from preacher.compilation.scenario import compile_scenarios
+from preacher.compilation.scenario import ScenarioSelector, compile_scenarios
 from preacher.compilation.yaml import load_from_paths
-from preacher.core.scheduling import create_scheduler
+from preacher.core.profiling import PHASE_COMPILE, PHASE_LOAD, CProfiler, Profiler
+from preacher.core.profiling import MergingProfiler, write_summary
+from preacher.core.scenario import ResultCompactor, Scenario
+from preacher.core.scheduling import Listener, ScenarioScheduler, create_scheduler
 from preacher.core.status import Status
+from preacher.core.tracing import Tracer, write_trace
 from preacher.plugin.loader import load_plugins
 from preacher.plugin.manager import get_plugin_manager
 from preacher.presentation.listener import create_listener
-from .executor import ExecutorFactory, PROCESS_POOL_FACTORY
+from .daemon import Daemon
+from .executor import ExecutorFactory, HybridPoolFactory, PROCESS_POOL_FACTORY, compile_all
 from .logging import ColoredFormatter, create_system_logger
+from .watch import ScenarioFiles, Watcher
 
 __all__ = ["app"]
 
 _REPORT_LOGGER_NAME = "preacher.cli.report.logging"
+_SCENARIOS_AHEAD_PER_WORKER = 4
 
 
 def app(
     paths: Sequence[str] = (),
     base_url: str = "",
     arguments: Optional[Arguments] = None,
+    tags: Iterable[str] = (),
+    excluded_tags: Iterable[str] = (),
+    label: Optional[Pattern] = None,
     level: Status = Status.SUCCESS,
     report_dir: Optional[str] = None,
+    compact: bool = False,
+    body_limit: Optional[int] = None,
     delay: float = 0.1,
     retry: int = 0,
     timeout: Optional[float] = None,
+    max_failures: Optional[int] = None,
+    deadline: Optional[float] = None,
     concurrency: int = 1,
     executor_factory: Optional[ExecutorFactory] = None,
+    profile_dir: Optional[str] = None,
+    trace_path: Optional[str] = None,
+    metrics_path: Optional[str] = None,
+    metrics_port: Optional[int] = None,
+    interval: Optional[float] = None,
+    watch: bool = False,
     plugins: Iterable[str] = (),
     verbosity: int = 0,
 ) -> int:
@@ -48,25 +75,51 @@ def app(
         "Running condition\n"
         "  Paths: %s\n"
         "  Arguments: %s\n"
+        "  Tags: %s\n"
+        "  Excluded tags: %s\n"
+        "  Label pattern: %s\n"
         "  Base URL: %s\n"
         "  Logging report level: %s\n"
         "  Reporting directory path: %s\n"
+        "  Compact reports: %s\n"
+        "  Max request body length in reports: %s\n"
         "  Max retry count: %d\n"
         "  Delay between attempts in seconds: %s\n"
         "  Timeout in seconds: %s\n"
+        "  Max failures: %s\n"
+        "  Deadline in seconds: %s\n"
         "  Concurrency: %s\n"
         "  Executor: %s\n"
+        "  Profiling directory path: %s\n"
+        "  Trace file path: %s\n"
+        "  Metrics file path: %s\n"
+        "  Metrics port: %s\n"
+        "  Interval of runs in seconds: %s\n"
+        "  Watch scenario files: %s\n"
         "  Verbosity: %d",
         paths,
         arguments,
+        tags,
+        excluded_tags,
+        label,
         base_url,
         level,
         report_dir,
+        compact,
+        body_limit,
         retry,
         delay,
         timeout,
+        max_failures,
+        deadline,
         concurrency,
         executor_factory,
+        profile_dir,
+        trace_path,
+        metrics_path,
+        metrics_port,
+        interval,
+        watch,
         verbosity,
     )
 
@@ -77,17 +130,41 @@ def app(
         logger.exception(error)
         return 3
 
-    objs = load_from_paths(paths, plugin_manager=plugin_manager, logger=logger)
-    scenarios = compile_scenarios(
-        objs,
-        arguments=arguments,
-        plugin_manager=plugin_manager,
-        logger=logger,
+    tracer = Tracer(mkdtemp(prefix="preacher-trace-")) if trace_path else None
+    cprofiler = CProfiler(profile_dir) if profile_dir else None
+    profiler = _merge_profilers(tracer, cprofiler)
+    selector = _create_selector(tags, excluded_tags, label)
+    files = (
+        ScenarioFiles(paths, arguments, plugin_manager, profiler, logger, selector)
+        if watch
+        else None
     )
+    if files:
+        scenarios = files.scenarios()
+    else:
+        scenarios = _compile(
+            paths,
+            arguments,
+            plugin_manager,
+            profiler,
+            selector,
+            interval,
+            logger,
+        )
 
-    listener = create_listener(level=level, formatter=ColoredFormatter(), report_dir=report_dir)
     executor_factory = executor_factory or PROCESS_POOL_FACTORY
+    listener: Optional[Listener] = None
     try:
+        # Created in this block so that profiles and traces are cleaned up even when it fails.
+        listener = create_listener(
+            level=level,
+            formatter=ColoredFormatter(),
+            report_dir=report_dir,
+            profiler=profiler,
+            metrics_path=metrics_path,
+            metrics_port=metrics_port,
+        )
+        prepared_scenarios = executor_factory.prepare(scenarios)
         logger.info("Start running scenarios.")
         with executor_factory.create(concurrency) as executor:
             scheduler = create_scheduler(
@@ -97,15 +174,121 @@ def app(
                 timeout=timeout,
                 retry=retry,
                 delay=delay,
+                compactor=_create_compactor(compact, body_limit),
+                profiler=profiler,
+                # Sessions kept for each thread serve as the connection pools of hybrid workers.
+                keep_sessions=(
+                    interval is not None
+                    or watch
+                    or isinstance(executor_factory, HybridPoolFactory)
+                ),
+                max_failures=max_failures,
+                deadline=deadline,
+                window=concurrency * _SCENARIOS_AHEAD_PER_WORKER,
             )
-            status = scheduler.run(scenarios)
+            status = _run(scheduler, prepared_scenarios, interval, files, logger)
     except Exception as error:
         logger.exception(error)
         return 3
     finally:
         logger.info("End running scenarios.")
+        if listener:
+            listener.close()
+        # Worker processes have already dumped their profiles on exit.
+        if cprofiler:
+            cprofiler.dump()
+            write_summary(cprofiler.directory)
+            logger.info("Profiles are written into %s", cprofiler.directory)
+        if tracer and trace_path:
+            _write_trace(tracer, trace_path, paths, logger)
 
     if not status.is_succeeded:
         return 1
 
     return 0
+
+
+def _compile(
+    paths: Sequence[str],
+    arguments: Arguments,
+    plugin_manager: PluginManager,
+    profiler: Profiler,
+    selector: Optional[ScenarioSelector],
+    interval: Optional[float],
+    logger: Logger,
+) -> Iterable[Scenario]:
+    objs = profiler.iterate(
+        PHASE_LOAD,
+        load_from_paths(paths, plugin_manager=plugin_manager, logger=logger),
+    )
+    scenarios = profiler.iterate(
+        PHASE_COMPILE,
+        compile_scenarios(
+            objs,
+            arguments=arguments,
+            plugin_manager=plugin_manager,
+            logger=logger,
+            selector=selector,
+        ),
+    )
+    if interval is not None:
+        # Compiled only once to be run repeatedly.
+        scenarios = compile_all(scenarios)
+    return scenarios
+
+
+def _run(
+    scheduler: ScenarioScheduler,
+    scenarios: Iterable[Scenario],
+    interval: Optional[float],
+    files: Optional[ScenarioFiles],
+    logger: Logger,
+) -> Status:
+    if files:
+        # The scenarios have been prepared from the files, which are the same objects.
+        logger.info("Watch scenario files until interrupted.")
+        return Watcher(files, logger).run(scheduler.run)
+
+    if interval is None:
+        return scheduler.run(scenarios)
+
+    # Listeners, the executor and sessions are all kept warm between runs.
+    logger.info("Run every %s seconds until interrupted.", interval)
+    return Daemon(interval, logger).run(lambda: scheduler.run(scenarios))
+
+
+def _merge_profilers(*profilers: Optional[Profiler]) -> Profiler:
+    # Former profilers enclose latter ones, so tracing includes the overhead of profiling.
+    enabled: List[Profiler] = [profiler for profiler in profilers if profiler]
+    if not enabled:
+        return Profiler()
+    if len(enabled) == 1:
+        return enabled[0]
+    return MergingProfiler(enabled)
+
+
+def _write_trace(tracer: Tracer, path: str, paths: Sequence[str], logger: Logger) -> None:
+    tracer.dump()
+    try:
+        write_trace(tracer.directory, path, metadata={"version": _version, "paths": list(paths)})
+    finally:
+        shutil.rmtree(tracer.directory, ignore_errors=True)
+    logger.info("A trace is written into %s", path)
+
+
+def _create_selector(
+    tags: Iterable[str],
+    excluded_tags: Iterable[str],
+    label: Optional[Pattern],
+) -> Optional[ScenarioSelector]:
+    tags = list(tags)
+    excluded_tags = list(excluded_tags)
+    if not tags and not excluded_tags and label is None:
+        return None
+    return ScenarioSelector(tags=tags, excluded_tags=excluded_tags, label=label)
+
+
+def _create_compactor(compact: bool, body_limit: Optional[int]) -> Optional[ResultCompactor]:
+    if not compact and body_limit is None:
+        return None
+    return ResultCompactor(drop_succeeded_details=compact, max_body_length=body_limit)
@@ -0,0 +1,90 @@
+"""Repeated runs in a long-running process."""
+
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from logging import Logger
+from typing import Callable, Iterator
+
+from preacher.core.status import Status
+
+_TRIGGER_SIGNAL_NAME = "SIGUSR1"
+_STOP_SIGNAL_NAMES = ("SIGINT", "SIGTERM")
+
+
+class Daemon:
+    """
+    Runs repeatedly on an interval until stopped.
+    A run can be triggered before the interval elapses by ``trigger`` or ``SIGUSR1``,
+    and ``SIGINT`` or ``SIGTERM`` stops running after the current run.
+    """
+
+    def __init__(self, interval: float, logger: Logger):
+        """
+        Args:
+            interval: The interval between the starts of runs in seconds.
+            logger: A logger.
+        """
+        self._interval = interval
+        self._logger = logger
+        self._woken = threading.Event()
+        self._stopped = False
+
+    def trigger(self) -> None:
+        """Run without waiting for the interval."""
+        self._woken.set()
+
+    def stop(self) -> None:
+        """Stop running after the current run."""
+        self._stopped = True
+        self._woken.set()
+
+    def run(self, func: Callable[[], Status]) -> Status:
+        """
+        Run the function repeatedly.
+
+        Returns:
+            The status of the last run.
+        """
+        status = Status.SKIPPED
+        with handling_signals(self.trigger, self.stop):
+            while not self._stopped:
+                self._woken.clear()
+                starts = time.monotonic()
+                status = func()
+
+                waiting_time = max(self._interval - (time.monotonic() - starts), 0.0)
+                if not self._stopped:
+                    self._logger.info("Wait %.1f seconds for the next run.", waiting_time)
+                self._woken.wait(waiting_time)
+        return status
+
+
+@contextmanager
+def handling_signals(trigger: Callable[[], None], stop: Callable[[], None]) -> Iterator[None]:
+    """
+    Handle ``SIGUSR1`` with ``trigger`` and ``SIGINT`` or ``SIGTERM`` with ``stop`` in the block.
+    Signals are handled only in the main thread, where handlers can be set.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    funcs = {_TRIGGER_SIGNAL_NAME: trigger}
+    funcs.update((name, stop) for name in _STOP_SIGNAL_NAMES)
+    originals = {}
+    for name, func in funcs.items():
+        number = getattr(signal, name, None)
+        if number is not None:
+            originals[number] = signal.signal(number, partial(_handle, func))
+    try:
+        yield
+    finally:
+        for number, original in originals.items():
+            signal.signal(number, original)
+
+
+def _handle(func: Callable[[], None], *_args) -> None:
+    func()
@@ -1,5 +1,17 @@
+import os
 from abc import ABC, abstractmethod
-from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import Executor
+from importlib import import_module
+from math import ceil
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Union
+
+from preacher.core.util.sharing import share
+
+# Executor implementations are imported on creation, which makes the CLI start fast.
+if TYPE_CHECKING:
+    from preacher.core.scenario import Scenario  # pragma: no cover
+
+_HEAVY_MODULES = ("requests", "hamcrest", "lxml.etree", "jq", "numpy")
 
 
 class ExecutorFactory(ABC):
@@ -11,16 +23,134 @@ class ExecutorFactory(ABC):
     def create(self, concurrency: int) -> Executor:
         """Create an executor."""
 
+    def prepare(self, scenarios: Iterable["Scenario"]) -> Iterable["Scenario"]:
+        """
+        Prepare scenarios to be run before an executor is created.
+        The default implementation does nothing.
+        """
+        return scenarios
+
 
 class _ProcessPoolFactory(ExecutorFactory):
     def create(self, concurrency: int) -> Executor:
+        from concurrent.futures import ProcessPoolExecutor
+
         return ProcessPoolExecutor(concurrency)
 
 
 class _ThreadPoolFactory(ExecutorFactory):
     def create(self, concurrency: int) -> Executor:
+        from concurrent.futures import ThreadPoolExecutor
+
         return ThreadPoolExecutor(concurrency)
 
 
+class HybridPoolFactory(ExecutorFactory):
+    """
+    Creates process pools whose workers run tasks on thread pools.
+    By default, there are as many processes as CPUs up to the concurrency,
+    which is shared by their threads.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        threads_per_process: Optional[int] = None,
+    ):
+        """
+        Args:
+            processes: The number of processes.
+            threads_per_process: The number of threads in each process.
+        """
+        self._processes = processes
+        self._threads_per_process = threads_per_process
+
+    def create(self, concurrency: int) -> Executor:
+        from .hybrid import HybridPoolExecutor
+
+        processes = self._processes or min(os.cpu_count() or 1, concurrency)
+        threads_per_process = self._threads_per_process or ceil(concurrency / processes)
+        return HybridPoolExecutor(processes, threads_per_process)
+
+
+class _ForkingProcessPoolFactory(ExecutorFactory):
+    """
+    Creates process pools whose workers are forked after all scenarios are compiled.
+    Workers share the compiled cases and imported modules with the parent copy-on-write,
+    and cases are sent to workers as references.
+    Available only on platforms that support forking.
+    """
+
+    def prepare(self, scenarios: Iterable["Scenario"]) -> Iterable["Scenario"]:
+        prepared = scenarios if isinstance(scenarios, _Prepared) else _Prepared(scenarios)
+        for scenario in prepared.scenarios:
+            _share_cases(scenario)
+        return prepared
+
+    def create(self, concurrency: int) -> Executor:
+        from .forking import ForkingProcessPoolExecutor
+
+        for name in _HEAVY_MODULES:
+            try:
+                import_module(name)
+            except ImportError:  # pragma: no cover
+                pass
+        return ForkingProcessPoolExecutor(concurrency)
+
+
+class _Prepared(Iterable["Scenario"]):
+    """
+    Scenarios compiled in advance.
+    The iterator raises the errors on compilation in order, and can be continued then,
+    as the original iterator can.
+    """
+
+    def __init__(self, scenarios: Iterable["Scenario"]):
+        self._items: List[Union["Scenario", Exception]] = []
+        iterator = iter(scenarios)
+        while True:
+            try:
+                self._items.append(next(iterator))
+            except StopIteration:
+                break
+            except Exception as error:
+                self._items.append(error)
+
+    @property
+    def scenarios(self) -> Iterator["Scenario"]:
+        return (item for item in self._items if not isinstance(item, Exception))
+
+    def __iter__(self) -> Iterator["Scenario"]:
+        return _Replaying(self._items)
+
+
+class _Replaying(Iterator["Scenario"]):
+    def __init__(self, items: List[Union["Scenario", Exception]]):
+        self._items = iter(items)
+
+    def __next__(self) -> "Scenario":
+        item = next(self._items)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def compile_all(scenarios: Iterable["Scenario"]) -> Iterable["Scenario"]:
+    """
+    Compile all scenarios in advance, which can be iterated repeatedly.
+    The errors on compilation are raised on each iteration.
+    """
+    return _Prepared(scenarios)
+
+
+def _share_cases(scenario: "Scenario") -> None:
+    for case in scenario.cases:
+        share(case)
+    for subscenario in scenario.subscenarios:
+        _share_cases(subscenario)
+
+
 PROCESS_POOL_FACTORY = _ProcessPoolFactory()
 THREAD_POOL_FACTORY = _ThreadPoolFactory()
+FORKING_PROCESS_POOL_FACTORY = _ForkingProcessPoolFactory()
+HYBRID_POOL_FACTORY = HybridPoolFactory()
@@ -0,0 +1,30 @@
+"""A process pool whose workers are forked after compiling scenarios."""
+
+import gc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any
+
+from preacher.core.util.sharing import unshare_all
+
+
+class ForkingProcessPoolExecutor(ProcessPoolExecutor):
+    """
+    Forks workers, which share the objects made before creating this pool with the parent.
+    The objects are neither collected nor shared any longer after this pool shuts down.
+    Available only on platforms that support forking.
+    """
+
+    def __init__(self, max_workers: int):
+        # Objects made so far are never collected, which avoids their pages copied on write.
+        gc.collect()
+        gc.freeze()
+        super().__init__(max_workers, mp_context=get_context("fork"))
+
+    def shutdown(self, *args: Any, **kwargs: Any) -> None:
+        try:
+            super().shutdown(*args, **kwargs)
+        finally:
+            # Workers may be forked until shutdown.
+            unshare_all()
+            gc.unfreeze()
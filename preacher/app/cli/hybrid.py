@@ -0,0 +1,219 @@
+"""A process pool whose workers run tasks on thread pools."""
+
+import pickle
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import count
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext
+from multiprocessing.reduction import ForkingPickler
+from queue import Empty
+from threading import BoundedSemaphore, Lock, Thread
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+_POLLING_INTERVAL = 0.1
+
+
+class HybridPoolExecutor(Executor):
+    """
+    Runs tasks in worker processes, each of which runs tasks concurrently on threads.
+    Waits for I/O overlap on threads while CPU-bound work spreads over processes.
+    Tasks and results must be pickled as on ``ProcessPoolExecutor``.
+    Worker processes take tasks only when they have idle threads.
+    Tasks wait in this process until workers can take them,
+    so they can be cancelled until then as on ``ProcessPoolExecutor``.
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        threads_per_process: int,
+        mp_context: Optional[BaseContext] = None,
+    ):
+        """
+        Args:
+            processes: The number of worker processes.
+            threads_per_process: The number of threads in each worker process.
+            mp_context: The multiprocessing context. The default context is used when ``None``.
+        Raises:
+            ValueError: when given non-positive numbers.
+        """
+        if processes < 1:
+            raise ValueError(f"processes must be positive, given {processes}")
+        if threads_per_process < 1:
+            raise ValueError(f"threads_per_process must be positive, given {threads_per_process}")
+
+        self._process_count = processes
+        self._threads_per_process = threads_per_process
+        self._context: Any = mp_context or get_context()
+
+        self._lock = Lock()
+        self._ids = count()
+        self._futures: Dict[int, Future] = {}
+        self._pending: Deque[Tuple[int, bytes]] = deque()
+        # Each process can take one more task than its threads not to wait for dispatching.
+        self._capacity = processes * (threads_per_process + 1)
+        self._dispatched = 0
+        self._stopping = False
+        self._processes: List[Any] = []
+        self._tasks: Any = None
+        self._results: Any = None
+        self._collector: Optional[Thread] = None
+        self._shutdown = False
+        self._broken: Optional[str] = None
+
+    def submit(self, __fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "Future[Any]":
+        with self._lock:
+            if self._broken:
+                raise BrokenProcessPool(self._broken)
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+
+            # Pickled here so that errors are raised to the caller.
+            data = bytes(ForkingPickler.dumps((__fn, args, kwargs)))
+            self._start()
+
+            task_id = next(self._ids)
+            future: Future = Future()
+            self._futures[task_id] = future
+            self._pending.append((task_id, data))
+            self._dispatch()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            if cancel_futures:
+                self._cancel_pending()
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if self._tasks is None:
+                return
+            self._dispatch()
+
+        if wait:
+            self._stop()
+        else:
+            Thread(target=self._stop, daemon=True).start()
+
+    def _start(self) -> None:
+        if self._tasks is not None:
+            return
+
+        self._tasks = self._context.SimpleQueue()
+        self._results = self._context.Queue()
+        for _ in range(self._process_count):
+            process = self._context.Process(
+                target=_work,
+                args=(self._tasks, self._results, self._threads_per_process),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+        self._collector = Thread(target=self._collect, name="preacher-hybrid-pool", daemon=True)
+        self._collector.start()
+
+    def _cancel_pending(self) -> None:
+        # Called with the lock held.
+        while self._pending:
+            task_id, _ = self._pending.popleft()
+            self._futures.pop(task_id).cancel()
+
+    def _dispatch(self) -> None:
+        # Called with the lock held.
+        while self._pending and self._dispatched < self._capacity:
+            task_id, data = self._pending.popleft()
+            if not self._futures[task_id].set_running_or_notify_cancel():
+                del self._futures[task_id]
+                continue
+            self._dispatched += 1
+            self._tasks.put((task_id, data))
+
+        # Workers stop after taking all the tasks, which are put before.
+        if self._shutdown and not self._pending and not self._stopping:
+            self._stopping = True
+            for _ in self._processes:
+                self._tasks.put(None)
+
+    def _stop(self) -> None:
+        for process in self._processes:
+            process.join()
+        self._results.put(None)
+        if self._collector:
+            self._collector.join()
+
+    def _collect(self) -> None:
+        while True:
+            try:
+                payload = self._results.get(timeout=_POLLING_INTERVAL)
+            except Empty:
+                if self._is_broken():
+                    self._break()
+                    return
+                continue
+            if payload is None:
+                return
+
+            task_id, succeeded, data = payload
+            with self._lock:
+                future = self._futures.pop(task_id)
+                self._dispatched -= 1
+                self._dispatch()
+            try:
+                value = pickle.loads(data)
+            except Exception as error:
+                # Fails only this task not to stop collecting the others.
+                message = f"Failed to unpickle the result: {error.__class__.__name__}: {error}"
+                future.set_exception(RuntimeError(message))
+                continue
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def _is_broken(self) -> bool:
+        return any(process.exitcode not in (None, 0) for process in self._processes)
+
+    def _break(self) -> None:
+        with self._lock:
+            self._broken = "A worker process terminated abruptly."
+            futures = [future for future in self._futures.values() if not future.cancelled()]
+            self._futures.clear()
+            self._pending.clear()
+        for process in self._processes:
+            if process.exitcode is None:
+                process.terminate()
+        for future in futures:
+            future.set_exception(BrokenProcessPool(self._broken))
+
+
+def _work(tasks: Any, results: Any, threads: int) -> None:
+    idle = BoundedSemaphore(threads)
+    with ThreadPoolExecutor(threads) as pool:
+        while True:
+            idle.acquire()
+            item = tasks.get()
+            if item is None:
+                break
+            pool.submit(_run, item, results, idle)
+
+
+def _run(item: Any, results: Any, idle: BoundedSemaphore) -> None:
+    task_id, data = item
+    try:
+        fn, args, kwargs = pickle.loads(data)
+        succeeded, value = True, fn(*args, **kwargs)
+    except BaseException as error:
+        succeeded, value = False, error
+
+    # Values are pickled separately so that the collector knows the task
+    # even when a value cannot be unpickled.
+    try:
+        payload = bytes(ForkingPickler.dumps(value))
+    except Exception as error:
+        message = f"Failed to pickle the result: {error.__class__.__name__}: {error}"
+        succeeded, payload = False, bytes(ForkingPickler.dumps(RuntimeError(message)))
+    results.put((task_id, succeeded, payload))
+    idle.release()
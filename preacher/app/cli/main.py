@@ -1,11 +1,12 @@
 """Preacher CLI."""
 
 import sys
-from typing import Iterable, Optional, Sequence
+from typing import Iterable, Optional, Pattern, Sequence
 
 from click import FloatRange
 from click import IntRange
 from click import Path
+from click import UsageError
 from click import argument
 from click import command
 from click import help_option
@@ -15,24 +16,40 @@ from click import version_option
 from preacher import __version__ as _version
 from preacher.compilation.argument import Arguments
 from preacher.core.status import Status
-from .app import app
-from .executor import ExecutorFactory
+from .executor import ExecutorFactory, HybridPoolFactory
 from .option import ArgumentType
 from .option import ExecutorFactoryType
 from .option import LevelType
+from .option import PatternType
 from .option import pairs_callback
 from .option import positive_float_callback
 
 _ENV_PREFIX = "PREACHER_CLI_"
 _ENV_BASE_URL = f"{_ENV_PREFIX}BASE_URL"
 _ENV_ARGUMENT = f"{_ENV_PREFIX}ARGUMENT"
+_ENV_TAG = f"{_ENV_PREFIX}TAG"
+_ENV_EXCLUDE_TAG = f"{_ENV_PREFIX}EXCLUDE_TAG"
+_ENV_LABEL = f"{_ENV_PREFIX}LABEL"
 _ENV_LEVEL = f"{_ENV_PREFIX}LEVEL"
 _ENV_RETRY = f"{_ENV_PREFIX}RETRY"
 _ENV_DELAY = f"{_ENV_PREFIX}DELAY"
 _ENV_TIMEOUT = f"{_ENV_PREFIX}TIMEOUT"
+_ENV_FAIL_FAST = f"{_ENV_PREFIX}FAIL_FAST"
+_ENV_MAX_FAILURES = f"{_ENV_PREFIX}MAX_FAILURES"
+_ENV_DEADLINE = f"{_ENV_PREFIX}DEADLINE"
 _ENV_CONCURRENCY = f"{_ENV_PREFIX}CONCURRENCY"
 _ENV_CONCURRENT_EXECUTOR = f"{_ENV_PREFIX}CONCURRENT_EXECUTOR"
+_ENV_PROCESSES = f"{_ENV_PREFIX}PROCESSES"
+_ENV_THREADS_PER_PROCESS = f"{_ENV_PREFIX}THREADS_PER_PROCESS"
 _ENV_REPORT = f"{_ENV_PREFIX}REPORT"
+_ENV_COMPACT = f"{_ENV_PREFIX}COMPACT"
+_ENV_BODY_LIMIT = f"{_ENV_PREFIX}BODY_LIMIT"
+_ENV_PROFILE = f"{_ENV_PREFIX}PROFILE"
+_ENV_TRACE = f"{_ENV_PREFIX}TRACE"
+_ENV_METRICS = f"{_ENV_PREFIX}METRICS"
+_ENV_METRICS_PORT = f"{_ENV_PREFIX}METRICS_PORT"
+_ENV_INTERVAL = f"{_ENV_PREFIX}INTERVAL"
+_ENV_WATCH = f"{_ENV_PREFIX}WATCH"
 _ENV_PLUGIN = f"{_ENV_PREFIX}PLUGIN"
 
 
@@ -56,6 +73,29 @@ _ENV_PLUGIN = f"{_ENV_PREFIX}PLUGIN"
     multiple=True,
     callback=pairs_callback,
 )
+@option(
+    "tags",
+    "--tag",
+    help="run only the scenarios and cases with any of these tags",
+    metavar="tag",
+    envvar=_ENV_TAG,
+    multiple=True,
+)
+@option(
+    "excluded_tags",
+    "--exclude-tag",
+    help="skip the scenarios and cases with any of these tags",
+    metavar="tag",
+    envvar=_ENV_EXCLUDE_TAG,
+    multiple=True,
+)
+@option(
+    "label",
+    "--label",
+    help="run only the top-level scenarios whose labels match this regular expression",
+    type=PatternType(),
+    envvar=_ENV_LABEL,
+)
 @option(
     "level",
     "-l",
@@ -73,6 +113,22 @@ _ENV_PLUGIN = f"{_ENV_PREFIX}PLUGIN"
     type=Path(file_okay=False, writable=True),
     envvar=_ENV_REPORT,
 )
+@option(
+    "compact",
+    "--compact",
+    help="drop the details of succeeded cases from reports",
+    is_flag=True,
+    envvar=_ENV_COMPACT,
+    default=False,
+)
+@option(
+    "body_limit",
+    "--body-limit",
+    help="truncate request bodies in reports to this length",
+    metavar="num",
+    type=IntRange(min=0),
+    envvar=_ENV_BODY_LIMIT,
+)
 @option(
     "retry",
     "-r",
@@ -103,6 +159,31 @@ _ENV_PLUGIN = f"{_ENV_PREFIX}PLUGIN"
     envvar=_ENV_TIMEOUT,
     callback=positive_float_callback,
 )
+@option(
+    "fail_fast",
+    "--fail-fast",
+    help="skip the scenarios not started yet after a failed scenario",
+    is_flag=True,
+    envvar=_ENV_FAIL_FAST,
+    default=False,
+)
+@option(
+    "max_failures",
+    "--max-failures",
+    help="skip the scenarios not started yet after this number of failed scenarios",
+    metavar="num",
+    type=IntRange(min=1),
+    envvar=_ENV_MAX_FAILURES,
+)
+@option(
+    "deadline",
+    "--deadline",
+    help="skip the scenarios not started yet after this time limit of a run in seconds",
+    metavar="sec",
+    type=FloatRange(min=0.0),
+    envvar=_ENV_DEADLINE,
+    callback=positive_float_callback,
+)
 @option(
     "concurrency",
     "-c",
@@ -122,6 +203,77 @@ _ENV_PLUGIN = f"{_ENV_PREFIX}PLUGIN"
     envvar=_ENV_CONCURRENT_EXECUTOR,
     default="process",
 )
+@option(
+    "processes",
+    "--processes",
+    help="set the number of processes for the hybrid executor",
+    metavar="num",
+    type=IntRange(min=1),
+    envvar=_ENV_PROCESSES,
+)
+@option(
+    "threads_per_process",
+    "--threads-per-process",
+    help="set the number of threads in each process for the hybrid executor",
+    metavar="num",
+    type=IntRange(min=1),
+    envvar=_ENV_THREADS_PER_PROCESS,
+)
+@option(
+    "profile_dir",
+    "--profile",
+    help="profile each phase and write the profiles into this directory",
+    metavar="dir",
+    type=Path(file_okay=False, writable=True),
+    envvar=_ENV_PROFILE,
+)
+@option(
+    "trace_path",
+    "--trace",
+    help="write a trace of cases in the Chrome trace event format into this file",
+    metavar="file",
+    type=Path(dir_okay=False, writable=True),
+    envvar=_ENV_TRACE,
+)
+@option(
+    "metrics_path",
+    "--metrics",
+    help="write metrics in the OpenMetrics text format into this file at the end",
+    metavar="file",
+    type=Path(dir_okay=False, writable=True),
+    envvar=_ENV_METRICS,
+)
+@option(
+    "metrics_port",
+    "--metrics-port",
+    help="serve metrics in the OpenMetrics text format on this port of localhost",
+    metavar="num",
+    type=IntRange(min=1, max=65535),
+    envvar=_ENV_METRICS_PORT,
+)
+@option(
+    "interval",
+    "--interval",
+    help=(
+        "run repeatedly at this interval in seconds until interrupted, "
+        "loading and compiling scenarios only once"
+    ),
+    metavar="sec",
+    type=FloatRange(min=0.0),
+    envvar=_ENV_INTERVAL,
+    callback=positive_float_callback,
+)
+@option(
+    "watch",
+    "--watch",
+    help=(
+        "run again whenever scenario files or the files they include change, "
+        "recompiling and running only the changed ones"
+    ),
+    is_flag=True,
+    envvar=_ENV_WATCH,
+    default=False,
+)
 @option(
     "plugins",
     "-p",
@@ -145,28 +297,71 @@ def main(
     paths: Sequence[str],
     base_url: str,
     arguments: Arguments,
+    tags: Sequence[str],
+    excluded_tags: Sequence[str],
+    label: Optional[Pattern],
     level: Status,
     report_dir: Optional[str],
+    compact: bool,
+    body_limit: Optional[int],
     retry: int,
     delay: float,
     timeout: Optional[float],
+    fail_fast: bool,
+    max_failures: Optional[int],
+    deadline: Optional[float],
     concurrency: int,
     executor_factory: ExecutorFactory,
+    processes: Optional[int],
+    threads_per_process: Optional[int],
+    profile_dir: Optional[str],
+    trace_path: Optional[str],
+    metrics_path: Optional[str],
+    metrics_port: Optional[int],
+    interval: Optional[float],
+    watch: bool,
     plugins: Iterable[str],
     verbosity: int,
 ) -> None:
     """Preacher CLI: Web API Verification without Coding"""
+    if watch and not paths:
+        raise UsageError("--watch needs scenario paths, not the standard input.")
+    if watch and interval is not None:
+        raise UsageError("--watch cannot be used with --interval.")
+    if processes is not None or threads_per_process is not None:
+        if not isinstance(executor_factory, HybridPoolFactory):
+            raise UsageError("--processes and --threads-per-process need --executor hybrid.")
+        executor_factory = HybridPoolFactory(processes, threads_per_process)
+    if fail_fast and max_failures is None:
+        max_failures = 1
+
+    # Imported lazily not to load heavy dependencies only to parse options.
+    from .app import app
+
     exit_code = app(
         paths=paths,
         base_url=base_url,
         arguments=arguments,
+        tags=tags,
+        excluded_tags=excluded_tags,
+        label=label,
         level=level,
         report_dir=report_dir,
+        compact=compact,
+        body_limit=body_limit,
         retry=retry,
         delay=delay,
         timeout=timeout,
+        max_failures=max_failures,
+        deadline=deadline,
         concurrency=concurrency,
         executor_factory=executor_factory,
+        profile_dir=profile_dir,
+        trace_path=trace_path,
+        metrics_path=metrics_path,
+        metrics_port=metrics_port,
+        interval=interval,
+        watch=watch,
         plugins=plugins,
         verbosity=verbosity,
     )
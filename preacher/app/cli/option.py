@@ -4,7 +4,7 @@ import logging
 import re
 import shlex
 from enum import IntEnum
-from typing import Iterable, Mapping, Optional, Tuple, Union, Any
+from typing import Iterable, Mapping, Optional, Pattern, Tuple, Union, Any
 
 from click import Choice
 from click import Context
@@ -14,12 +14,11 @@ from click import ParamType
 from click import Option
 from click import STRING
 
-from yaml import safe_load
-from yaml.error import MarkedYAMLError
-
 from preacher.compilation.argument import Arguments
 from preacher.core.status import Status
-from .executor import ExecutorFactory, PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY
+from .executor import ExecutorFactory
+from .executor import FORKING_PROCESS_POOL_FACTORY, HYBRID_POOL_FACTORY
+from .executor import PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY
 
 
 class Level(IntEnum):
@@ -36,6 +35,8 @@ _LEVEL_MAP: Mapping[str, Level] = {str(level): level for level in Level}
 _CONCURRENT_EXECUTOR_FACTORY_MAP: Mapping[str, ExecutorFactory] = {
     "process": PROCESS_POOL_FACTORY,
     "thread": THREAD_POOL_FACTORY,
+    "fork": FORKING_PROCESS_POOL_FACTORY,
+    "hybrid": HYBRID_POOL_FACTORY,
 }
 
 
@@ -96,6 +97,24 @@ class ExecutorFactoryType(ParamType):
         return _CONCURRENT_EXECUTOR_FACTORY_MAP[key.lower()]
 
 
+class PatternType(ParamType):
+
+    name = "regex"
+
+    def convert(
+        self,
+        value: Any,
+        param: Optional[Parameter],
+        ctx: Optional[Context],
+    ) -> Pattern:
+        if isinstance(value, Pattern):
+            return value
+        try:
+            return re.compile(value)
+        except re.error as error:
+            self.fail(f"Invalid regular expression: {value}\n{error}", param, ctx)
+
+
 def pairs_callback(
     _context: Context,
     _option_or_parameter: Union[Option, Parameter],
@@ -122,6 +141,9 @@ def _parse_argument(value: str) -> Tuple[str, object]:
     if not match:
         raise BadParameter(f"Invalid format argument: {value}")
 
+    from yaml import safe_load
+    from yaml.error import MarkedYAMLError
+
     key = match.group(1)
     try:
         value = safe_load(match.group(2))
@@ -0,0 +1,181 @@
+"""Runs of scenarios on changes of their files."""
+
+import os
+import threading
+from itertools import chain
+from logging import Logger
+from typing import Callable, Collection, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pluggy import PluginManager
+
+from preacher.compilation.argument import Arguments
+from preacher.compilation.scenario import ScenarioSelector, create_scenario_compiler
+from preacher.compilation.yaml import RecordingLoader, create_loader
+from preacher.core.logger import default_logger
+from preacher.core.profiling import PHASE_COMPILE, PHASE_LOAD, Profiler
+from preacher.core.scenario import Scenario
+from preacher.core.status import Status
+from .daemon import handling_signals
+from .executor import compile_all
+
+DEFAULT_POLL_INTERVAL = 0.5
+
+_Stamp = Optional[Tuple[int, int]]
+
+
+class _File:
+    def __init__(self, scenarios: Iterable[Scenario], dependencies: Iterable[str]):
+        self.scenarios = scenarios
+        self._stamps: Dict[str, _Stamp] = {path: _stamp(path) for path in dependencies}
+
+    def is_changed(self) -> bool:
+        return any(_stamp(path) != stamp for path, stamp in self._stamps.items())
+
+
+class ScenarioFiles:
+    """
+    Scenarios compiled for each file.
+    A file is recompiled only when it or one of the files it includes or refers to changes,
+    and the scenarios of the other files are kept as compiled.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str],
+        arguments: Optional[Arguments] = None,
+        plugin_manager: Optional[PluginManager] = None,
+        profiler: Optional[Profiler] = None,
+        logger: Optional[Logger] = None,
+        selector: Optional[ScenarioSelector] = None,
+    ):
+        self._loader = create_loader(
+            plugin_manager=plugin_manager,
+            logger=logger,
+            loader=RecordingLoader(),
+        )
+        self._compiler = create_scenario_compiler(plugin_manager=plugin_manager, logger=logger)
+        self._arguments = arguments or {}
+        self._profiler = profiler or Profiler()
+        self._logger = logger or default_logger
+        self._selector = selector
+        self._files = {path: self._compile(path) for path in paths}
+
+    def scenarios(self, paths: Optional[Collection[str]] = None) -> Iterable[Scenario]:
+        """
+        Iterate the scenarios of the files in order,
+        which raises the errors on loading or compilation as compiling does.
+
+        Args:
+            paths: The paths of the files. All the files when not given.
+        """
+        return chain.from_iterable(
+            file.scenarios for path, file in self._files.items() if paths is None or path in paths
+        )
+
+    def update(self) -> List[str]:
+        """
+        Recompile the files that have changed since they were compiled.
+
+        Returns:
+            The paths of the recompiled files.
+        """
+        changed = [path for path, file in self._files.items() if file.is_changed()]
+        for path in changed:
+            self._files[path] = self._compile(path)
+        return changed
+
+    def _compile(self, path: str) -> _File:
+        self._logger.debug("Load: %s", path)
+        objs = self._profiler.iterate(PHASE_LOAD, self._loader.load_all_from_path(path))
+        scenarios = self._profiler.iterate(
+            PHASE_COMPILE,
+            chain.from_iterable(
+                self._compiler.compile_flattening(
+                    obj,
+                    arguments=self._arguments,
+                    selector=self._selector,
+                )
+                for obj in objs
+            ),
+        )
+        compiled = compile_all(scenarios)
+        return _File(compiled, self._loader.pop_paths())
+
+
+class Watcher:
+    """
+    Runs scenarios again whenever their files change, until stopped.
+    Only the scenarios of the changed files are run again,
+    while all of them are run again by ``trigger`` or ``SIGUSR1``.
+    ``SIGINT`` or ``SIGTERM`` stops watching.
+    """
+
+    def __init__(
+        self,
+        files: ScenarioFiles,
+        logger: Logger,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        """
+        Args:
+            files: The scenario files to watch.
+            logger: A logger.
+            poll_interval: The interval of checking changes in seconds.
+        """
+        self._files = files
+        self._logger = logger
+        self._poll_interval = poll_interval
+        self._woken = threading.Event()
+        self._triggered = False
+        self._stopped = False
+
+    def trigger(self) -> None:
+        """Run all the scenarios without waiting for changes."""
+        self._triggered = True
+        self._woken.set()
+
+    def stop(self) -> None:
+        """Stop watching after the current run."""
+        self._stopped = True
+        self._woken.set()
+
+    def run(self, func: Callable[[Iterable[Scenario]], Status]) -> Status:
+        """
+        Run all the scenarios first, and then the ones changed.
+
+        Returns:
+            The status of the last run.
+        """
+        with handling_signals(self.trigger, self.stop):
+            status = func(self._files.scenarios())
+            while not self._stopped:
+                self._logger.info("Watch changes of scenario files.")
+                scenarios = self._wait_for_changes()
+                if scenarios is None:
+                    break
+                status = func(scenarios)
+        return status
+
+    def _wait_for_changes(self) -> Optional[Iterable[Scenario]]:
+        while True:
+            self._woken.wait(self._poll_interval)
+            self._woken.clear()
+            if self._stopped:
+                return None
+
+            changed = self._files.update()
+            if changed:
+                self._logger.info("Changed: %s", ", ".join(changed))
+            if self._triggered:
+                self._triggered = False
+                return self._files.scenarios()
+            if changed:
+                return self._files.scenarios(changed)
+
+
+def _stamp(path: str) -> _Stamp:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
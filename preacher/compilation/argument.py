@@ -1,9 +1,10 @@
 from collections.abc import Mapping
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 
-from .util.functional import run_recursively
+from .error import CompilationError, on_index, on_key
 
 Arguments = Mapping
+Binder = Callable[[Arguments], object]
 
 
 class Argument:
@@ -19,14 +20,76 @@ class Argument:
         return arguments.get(self._key)
 
 
-def _inject_arguments(obj: object, arguments: Optional[Arguments]) -> object:
+class Template:
+    """
+    An object whose argument slots are located only once, and bound many times.
+    Subtrees that contain no arguments are shared among the bound objects as they are.
+    """
+
+    def __init__(self, obj: object):
+        """
+        Raises:
+            CompilationError: when a mapping in the object has a non-string key.
+        """
+        self._obj = obj
+        self._bind = _compile_binder(obj)
+
+    @property
+    def is_static(self) -> bool:
+        """Whether this template has no argument slots."""
+        return self._bind is None
+
+    def bind(self, arguments: Optional[Arguments] = None) -> object:
+        if self._bind is None:
+            return self._obj
+        return self._bind(arguments or {})
+
+
+def _compile_binder(obj: object) -> Optional[Binder]:
     if isinstance(obj, Argument):
-        return obj.apply_arguments(arguments)
-    return obj
+        return obj.apply_arguments
+    if isinstance(obj, Mapping):
+        return _compile_mapping_binder(obj)
+    if isinstance(obj, list):
+        return _compile_list_binder(obj)
+    return None
+
+
+def _compile_mapping_binder(obj: Mapping) -> Optional[Binder]:
+    items: List[Tuple[str, object, Optional[Binder]]] = []
+    for key, value in obj.items():
+        if not isinstance(key, str):
+            message = f"Key must be a string, given {type(key)}: {key}"
+            raise CompilationError(message)
+        with on_key(key):
+            items.append((key, value, _compile_binder(value)))
+
+    if all(bind is None for (_, _, bind) in items):
+        return None
+
+    def _bind(arguments: Arguments) -> object:
+        return {key: value if bind is None else bind(arguments) for (key, value, bind) in items}
+
+    return _bind
+
+
+def _compile_list_binder(obj: list) -> Optional[Binder]:
+    items: List[Tuple[object, Optional[Binder]]] = []
+    for idx, value in enumerate(obj):
+        with on_index(idx):
+            items.append((value, _compile_binder(value)))
+
+    if all(bind is None for (_, bind) in items):
+        return None
+
+    def _bind(arguments: Arguments) -> object:
+        return [value if bind is None else bind(arguments) for (value, bind) in items]
+
+    return _bind
 
 
 def inject_arguments(
     obj: object,
     arguments: Optional[Arguments] = None,
 ) -> object:
-    return run_recursively(lambda o: _inject_arguments(o, arguments), obj)
+    return Template(obj).bind(arguments)
@@ -3,6 +3,7 @@
 from typing import Any, Callable, Mapping, Optional
 
 from preacher.compilation.error import CompilationError, on_key
+from preacher.compilation.util.interning import Interner
 from preacher.compilation.util.type import ensure_bool, ensure_mapping, ensure_str
 from preacher.core.extraction.extraction import Extractor
 from preacher.core.extraction.impl.key import KeyExtractor
@@ -29,15 +30,22 @@ Factory = Callable[[str, Mapping[str, object]], Extractor]
 class ExtractionCompiler:
     def __init__(self):
         self._factory_map = {}
+        self._interner: Interner[Extractor] = Interner()
 
     def add_factory(self, key: str, factory: Factory):
         self._factory_map[key] = factory
+        self._interner.clear()
 
     def compile(self, obj: object) -> Extractor:
-        """`obj` should be a mapping or a string."""
+        """
+        `obj` should be a mapping or a string.
+        Extractors compiled from equal objects are shared.
+        """
+        return self._interner.intern(obj, self._compile)
 
+    def _compile(self, obj: object) -> Extractor:
         if isinstance(obj, str):
-            return self.compile({_KEY_JQ: obj})
+            return self._compile({_KEY_JQ: obj})
 
         if not isinstance(obj, Mapping):
             message = f"Must be a map or a string, given {type(obj)}"
@@ -1,12 +1,34 @@
+import csv
+import json
+import os
+from collections.abc import Mapping as MappingABC
 from dataclasses import dataclass, field
-from typing import Optional
+from itertools import islice
+from random import Random
+from typing import Iterable, Iterator, Mapping, Optional
 
 from .argument import Arguments
-from .error import on_key
-from .util.type import ensure_optional_str, ensure_mapping
+from .error import CompilationError, on_key, on_index
+from .util.type import ensure_optional_str, ensure_mapping, ensure_str
 
 _KEY_LABEL = "label"
 _KEY_ARGUMENTS = "args"
+_KEY_SOURCE = "source"
+_KEY_FORMAT = "format"
+_KEY_START = "start"
+_KEY_STOP = "stop"
+_KEY_STEP = "step"
+_KEY_SAMPLE = "sample"
+_KEY_SEED = "seed"
+
+_FORMAT_CSV = "csv"
+_FORMAT_JSONL = "jsonl"
+_FORMATS = (_FORMAT_CSV, _FORMAT_JSONL)
+_EXTENSION_FORMAT_MAP = {
+    ".csv": _FORMAT_CSV,
+    ".jsonl": _FORMAT_JSONL,
+    ".ndjson": _FORMAT_JSONL,
+}
 
 
 @dataclass(frozen=True)
@@ -15,6 +37,71 @@ class Parameter:
     arguments: Arguments = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class ParameterSource(Iterable[Parameter]):
+    """
+    Parameters streamed from a CSV or a JSON Lines file.
+    The file is read row by row every time this is iterated,
+    so that the whole table is never held in memory.
+    """
+
+    path: str
+    format: str = _FORMAT_CSV
+    label: Optional[str] = None
+    columns: Optional[Mapping[str, str]] = None
+    start: int = 0
+    stop: Optional[int] = None
+    step: int = 1
+    sample: Optional[float] = None
+    seed: Optional[int] = None
+
+    def __iter__(self) -> Iterator[Parameter]:
+        rows: Iterator = islice(enumerate(self._read_rows()), self.start, self.stop, self.step)
+        if self.sample is not None:
+            random = Random(self.seed)
+            sample = self.sample
+            rows = (item for item in rows if random.random() < sample)
+
+        for idx, row in rows:
+            with on_index(idx):
+                yield self._to_parameter(row)
+
+    def _to_parameter(self, row: object) -> Parameter:
+        row = ensure_mapping(row)
+
+        label = None
+        if self.label is not None:
+            with on_key(self.label):
+                label = ensure_optional_str(row.get(self.label))
+
+        if self.columns is None:
+            return Parameter(label=label, arguments=dict(row))
+        arguments = {name: row.get(column) for (name, column) in self.columns.items()}
+        return Parameter(label=label, arguments=arguments)
+
+    def _read_rows(self) -> Iterator[object]:
+        try:
+            with open(self.path, newline="", encoding="utf-8") as f:
+                if self.format == _FORMAT_JSONL:
+                    yield from _read_json_lines(f)
+                else:
+                    yield from csv.DictReader(f)
+        except (OSError, UnicodeDecodeError, csv.Error) as error:
+            raise CompilationError(f"Failed to read parameters: {error}", cause=error)
+
+
+def _read_json_lines(lines: Iterable[str]) -> Iterator[object]:
+    for idx, line in enumerate(lines):
+        if not line.strip():
+            continue
+        with on_index(idx):
+            try:
+                value = json.loads(line)
+            except ValueError as error:
+                raise CompilationError(f"Invalid JSON line: {error}", cause=error)
+        yield value
+
+
 def compile_parameter(obj: object) -> Parameter:
     """
     Compile a parameter.
@@ -33,3 +120,96 @@ def compile_parameter(obj: object) -> Parameter:
     with on_key(_KEY_ARGUMENTS):
         arguments = ensure_mapping(obj.get(_KEY_ARGUMENTS, {}))
     return Parameter(label=label, arguments=arguments)
+
+
+def is_parameter_source(obj: object) -> bool:
+    return isinstance(obj, MappingABC) and _KEY_SOURCE in obj
+
+
+def compile_parameter_source(obj: object) -> ParameterSource:
+    """
+    Compile a parameter source, which streams parameters from a file.
+
+    Args:
+        obj: A compiled object, which should be a mapping that has a ``source`` key.
+    Returns:
+        A parameter source as the result of compilation.
+        The file is not read until it is iterated.
+    Raises:
+        CompilationError: when the compilation fails.
+    """
+    obj = ensure_mapping(obj)
+
+    with on_key(_KEY_SOURCE):
+        path = ensure_str(obj.get(_KEY_SOURCE))
+    with on_key(_KEY_FORMAT):
+        format = _compile_format(obj.get(_KEY_FORMAT), path)
+    with on_key(_KEY_LABEL):
+        label = ensure_optional_str(obj.get(_KEY_LABEL))
+    with on_key(_KEY_ARGUMENTS):
+        columns = _compile_columns(obj.get(_KEY_ARGUMENTS))
+    with on_key(_KEY_START):
+        start = _ensure_int(obj.get(_KEY_START, 0), minimum=0)
+    with on_key(_KEY_STOP):
+        stop_obj = obj.get(_KEY_STOP)
+        stop = None if stop_obj is None else _ensure_int(stop_obj, minimum=0)
+    with on_key(_KEY_STEP):
+        step = _ensure_int(obj.get(_KEY_STEP, 1), minimum=1)
+    with on_key(_KEY_SAMPLE):
+        sample = _compile_sample(obj.get(_KEY_SAMPLE))
+    with on_key(_KEY_SEED):
+        seed_obj = obj.get(_KEY_SEED)
+        seed = None if seed_obj is None else _ensure_int(seed_obj)
+
+    return ParameterSource(
+        path=path,
+        format=format,
+        label=label,
+        columns=columns,
+        start=start,
+        stop=stop,
+        step=step,
+        sample=sample,
+        seed=seed,
+    )
+
+
+def _compile_format(obj: object, path: str) -> str:
+    if obj is None:
+        extension = os.path.splitext(path)[1].lower()
+        return _EXTENSION_FORMAT_MAP.get(extension, _FORMAT_CSV)
+
+    format = ensure_str(obj).lower()
+    if format not in _FORMATS:
+        raise CompilationError(f"Must be in {list(_FORMATS)}, but given: {obj}")
+    return format
+
+
+def _compile_columns(obj: object) -> Optional[Mapping[str, str]]:
+    if obj is None:
+        return None
+
+    obj = ensure_mapping(obj)
+    columns = {}
+    for name, column in obj.items():
+        with on_key(name):
+            columns[ensure_str(name)] = ensure_str(column)
+    return columns
+
+
+def _compile_sample(obj: object) -> Optional[float]:
+    if obj is None:
+        return None
+    if isinstance(obj, bool) or not isinstance(obj, (int, float)):
+        raise CompilationError(f"Must be a number, given {type(obj)}")
+    if not 0.0 <= obj <= 1.0:
+        raise CompilationError(f"Must be in [0.0, 1.0], given {obj}")
+    return float(obj)
+
+
+def _ensure_int(obj: object, minimum: Optional[int] = None) -> int:
+    if isinstance(obj, bool) or not isinstance(obj, int):
+        raise CompilationError(f"Must be an integer, given {type(obj)}")
+    if minimum is not None and obj < minimum:
+        raise CompilationError(f"Must be greater than or equal to {minimum}, given {obj}")
+    return obj
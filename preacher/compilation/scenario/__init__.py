@@ -2,11 +2,13 @@ from .case import CaseCompiler, CaseCompiled
 from .factory import create_scenario_compiler
 from .integration import compile_scenarios
 from .scenario import ScenarioCompiler
+from .selection import ScenarioSelector
 
 __all__ = [
     "CaseCompiler",
     "CaseCompiled",
     "ScenarioCompiler",
+    "ScenarioSelector",
     "create_scenario_compiler",
     "compile_scenarios",
 ]
@@ -13,6 +13,7 @@ from preacher.compilation.util.functional import map_compile
 from preacher.compilation.util.type import (
     ensure_bool,
     ensure_optional_str,
+    ensure_str,
     ensure_list,
     ensure_mapping,
     or_else,
@@ -31,6 +32,8 @@ _KEY_CONDITIONS = "when"
 _KEY_REQUEST = "request"
 _KEY_RESPONSE = "response"
 _KEY_WAIT = "wait"
+_KEY_TAGS = "tags"
+_KEY_DEPENDS_ON = "depends_on"
 
 
 @dataclass(frozen=True)
@@ -41,6 +44,8 @@ class CaseCompiled:
     request: Optional[RequestCompiled] = None
     response: Optional[ResponseDescriptionCompiled] = None
     wait: Optional[timedelta] = None
+    tags: Optional[List[str]] = None
+    depends_on: Optional[List[str]] = None
 
     def replace(self, other: CaseCompiled) -> CaseCompiled:
         return CaseCompiled(
@@ -50,6 +55,8 @@ class CaseCompiled:
             request=or_else(other.request, self.request),
             response=or_else(other.response, self.response),
             wait=or_else(other.wait, self.wait),
+            tags=or_else(other.tags, self.tags),
+            depends_on=or_else(other.depends_on, self.depends_on),
         )
 
     def fix(self) -> Case:
@@ -60,6 +67,8 @@ class CaseCompiled:
             request=self.request.fix() if self.request else None,
             response=self.response.fix() if self.response else None,
             waiting_time=self.wait,
+            tags=self.tags or (),
+            depends_on=self.depends_on or (),
         )
 
 
@@ -150,6 +159,18 @@ class CaseCompiler:
                 wait = compile_timedelta(wait_obj)
             compiled = replace(compiled, wait=wait)
 
+        tags_obj = obj.get(_KEY_TAGS)
+        if tags_obj is not None:
+            with on_key(_KEY_TAGS):
+                tags = compile_strings(tags_obj)
+            compiled = replace(compiled, tags=tags)
+
+        depends_on_obj = obj.get(_KEY_DEPENDS_ON)
+        if depends_on_obj is not None:
+            with on_key(_KEY_DEPENDS_ON):
+                depends_on = compile_strings(depends_on_obj)
+            compiled = replace(compiled, depends_on=depends_on)
+
         return compiled
 
     def of_default(self, default: CaseCompiled) -> CaseCompiler:
@@ -167,3 +188,13 @@ class CaseCompiler:
             description=self._description,
             default=self._default.replace(default),
         )
+
+
+def compile_strings(obj: object) -> List[str]:
+    """
+    Compile a string or a list of strings into a list of strings, e.g. tags.
+
+    Raises:
+        CompilationError: when compilation fails.
+    """
+    return list(map_compile(ensure_str, ensure_list(obj)))
@@ -7,6 +7,7 @@ from pluggy import PluginManager
 from preacher.compilation.argument import Arguments
 from preacher.core.scenario.scenario import Scenario
 from .factory import create_scenario_compiler
+from .selection import ScenarioSelector
 
 
 def compile_scenarios(
@@ -14,8 +15,9 @@ def compile_scenarios(
     arguments: Optional[Arguments] = None,
     plugin_manager: Optional[PluginManager] = None,
     logger: Optional[Logger] = None,
+    selector: Optional[ScenarioSelector] = None,
 ) -> Iterator[Scenario]:
     compiler = create_scenario_compiler(plugin_manager=plugin_manager, logger=logger)
     return itertools.chain.from_iterable(
-        compiler.compile_flattening(obj, arguments=arguments) for obj in objs
+        compiler.compile_flattening(obj, arguments=arguments, selector=selector) for obj in objs
     )
@@ -1,14 +1,15 @@
 """Scenario compilation."""
 
 from functools import partial
-from typing import Iterator, List, Optional, Mapping
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, Sequence, TypeVar, Union
 
-from preacher.compilation.argument import Arguments, inject_arguments
-from preacher.compilation.error import on_key
+from preacher.compilation.argument import Arguments, Template
+from preacher.compilation.error import CompilationError, on_index, on_key
 from preacher.compilation.parameter import Parameter, compile_parameter
+from preacher.compilation.parameter import compile_parameter_source, is_parameter_source
 from preacher.compilation.util.functional import (
     map_compile,
-    compile_flattening,
+    compile_flattening_into,
 )
 from preacher.compilation.util.type import (
     ensure_bool,
@@ -18,7 +19,10 @@ from preacher.compilation.util.type import (
 )
 from preacher.compilation.verification import DescriptionCompiler
 from preacher.core.scenario import Scenario, Case
-from .case import CaseCompiler
+from preacher.core.scenario.util.dependency import resolve_dependencies, sort_topologically
+from preacher.core.verification import Description
+from .case import CaseCompiler, compile_strings
+from .selection import ScenarioSelector
 
 _KEY_LABEL = "label"
 _KEY_WHEN = "when"
@@ -27,6 +31,79 @@ _KEY_ORDERED = "ordered"
 _KEY_CASES = "cases"
 _KEY_PARAMETERS = "parameters"
 _KEY_SUBSCENARIOS = "subscenarios"
+_KEY_TAGS = "tags"
+_KEY_DEPENDS_ON = "depends_on"
+
+T = TypeVar("T")
+
+
+class _Memo(Generic[T]):
+    """Memorizes the last result computed for the same key object."""
+
+    def __init__(self) -> None:
+        self._key: object = None
+        self._value: Optional[T] = None
+        self._is_set = False
+
+    def get(self, key: object, compute: Callable[[], T]) -> T:
+        if not self._is_set or self._key is not key:
+            self._value = compute()
+            self._key = key
+            self._is_set = True
+        return self._value  # type: ignore
+
+
+class _ScenarioTemplate:
+    """
+    A scenario object whose argument slots are located only once.
+    Compiled values that depend on no argument are memorized,
+    so that binding arguments repeatedly, e.g. for parameters, costs only for argument slots.
+    """
+
+    def __init__(self, obj: object):
+        obj = ensure_mapping(obj)
+
+        with on_key(_KEY_LABEL):
+            self.label = Template(obj.get(_KEY_LABEL))
+        with on_key(_KEY_TAGS):
+            self.tags = Template(obj.get(_KEY_TAGS, []))
+        with on_key(_KEY_DEPENDS_ON):
+            self.depends_on = Template(obj.get(_KEY_DEPENDS_ON, []))
+        self.parameters = obj.get(_KEY_PARAMETERS)
+        with on_key(_KEY_ORDERED):
+            self.ordered = Template(obj.get(_KEY_ORDERED, True))
+        with on_key(_KEY_DEFAULT):
+            self.default = Template(obj.get(_KEY_DEFAULT, {}))
+        with on_key(_KEY_WHEN):
+            self.conditions = Template(obj.get(_KEY_WHEN, []))
+        with on_key(_KEY_CASES):
+            self.cases = Template(obj.get(_KEY_CASES, []))
+        with on_key(_KEY_SUBSCENARIOS):
+            subscenario_objs = ensure_list(obj.get(_KEY_SUBSCENARIOS, []))
+            self.subscenarios: List[_ScenarioTemplate] = list(
+                map_compile(_ScenarioTemplate, subscenario_objs)
+            )
+
+        self.is_static: bool = (
+            all(
+                template.is_static
+                for template in (
+                    self.label,
+                    self.tags,
+                    self.depends_on,
+                    self.ordered,
+                    self.default,
+                    self.conditions,
+                    self.cases,
+                )
+            )
+            and all(subscenario.is_static for subscenario in self.subscenarios)
+        )
+
+        self.case_memo: _Memo[CaseCompiler] = _Memo()
+        self.conditions_memo: _Memo[List[Description]] = _Memo()
+        self.cases_memo: _Memo[List[Case]] = _Memo()
+        self.scenario_memo: _Memo[Scenario] = _Memo()
 
 
 class ScenarioCompiler:
@@ -46,45 +123,128 @@ class ScenarioCompiler:
         Raises:
             CompilationError: when the compilation fails.
         """
+        template = _compile_top_level_template(obj)
+        return self._compile_template(template, arguments or {})
 
-        obj = ensure_mapping(obj)
-        arguments = arguments or {}
+    def compile_flattening(
+        self,
+        obj: object,
+        arguments: Optional[Arguments] = None,
+        selector: Optional[ScenarioSelector] = None,
+    ) -> Iterator[Scenario]:
+        """
+        Compile the given object into a scenario with flattening:
+        a nested object list results in a flattened scenario.
+        A scenario parameterized by a parameter source results in scenarios for each parameter,
+        which are compiled lazily not to hold all of them.
+
+        Args:
+            obj: A compiled object or a list.
+            arguments: Arguments to inject.
+            selector: A selector of scenarios. The objects not to be selected are not compiled.
+        Returns:
+            A scenario iterator as the result of compilation.
+        Raises:
+            CompilationError: when the compilation fails for each iteration.
+        """
+
+        compile = partial(self._compile_streaming, arguments=arguments or {})
+        if selector is None:
+            return compile_flattening_into(compile, obj)
 
-        label_obj = inject_arguments(obj.get(_KEY_LABEL), arguments)
+        def _compile(item: object) -> Iterator[Optional[Scenario]]:
+            if not selector.may_select(item):
+                return iter(())
+            return (selector.select(scenario) for scenario in compile(item))
+
+        scenarios = compile_flattening_into(_compile, obj)
+        return (scenario for scenario in scenarios if scenario is not None)
+
+    def _compile_streaming(self, obj: object, arguments: Arguments) -> Iterator[Scenario]:
+        template = _compile_top_level_template(obj)
+        if not is_parameter_source(template.parameters):
+            yield self._compile_template(template, arguments)
+            return
+
+        # Each parameterized scenario is wrapped alone with the label and the tags.
         with on_key(_KEY_LABEL):
-            label = ensure_optional_str(label_obj)
-
-        parameters_obj = obj.get(_KEY_PARAMETERS)
-        if parameters_obj is not None:
-            with on_key(_KEY_PARAMETERS):
-                parameters_obj = ensure_list(parameters_obj)
-                parameters = list(map_compile(compile_parameter, parameters_obj))
-            subscenarios = [
-                self._compile_parameterized(obj, arguments, parameter) for parameter in parameters
-            ]
-            return Scenario(label=label, subscenarios=subscenarios)
-
-        ordered_obj = inject_arguments(obj.get(_KEY_ORDERED, True), arguments)
+            label = ensure_optional_str(template.label.bind(arguments))
+        with on_key(_KEY_TAGS):
+            tags = compile_strings(template.tags.bind(arguments))
+        for subscenario in self._iterate_parameterized(template, arguments):
+            yield Scenario(label=label, subscenarios=[subscenario], tags=tags)
+
+    def _compile_template(self, template: _ScenarioTemplate, arguments: Arguments) -> Scenario:
+        with on_key(_KEY_LABEL):
+            label = ensure_optional_str(template.label.bind(arguments))
+        with on_key(_KEY_TAGS):
+            tags = compile_strings(template.tags.bind(arguments))
+        with on_key(_KEY_DEPENDS_ON):
+            depends_on = compile_strings(template.depends_on.bind(arguments))
+
+        if template.parameters is not None:
+            return self._compile_parameters(template, label, tags, depends_on, arguments)
+        return self._compile_body(template, label, tags, depends_on, arguments)
+
+    def _compile_parameters(
+        self,
+        template: _ScenarioTemplate,
+        label: Optional[str],
+        tags: List[str],
+        depends_on: List[str],
+        arguments: Arguments,
+    ) -> Scenario:
+        return Scenario(
+            label=label,
+            subscenarios=list(self._iterate_parameterized(template, arguments)),
+            tags=tags,
+            depends_on=depends_on,
+        )
+
+    def _compile_body(
+        self,
+        template: _ScenarioTemplate,
+        label: Optional[str],
+        tags: List[str],
+        depends_on: List[str],
+        arguments: Arguments,
+    ) -> Scenario:
         with on_key(_KEY_ORDERED):
-            ordered = ensure_bool(ordered_obj)
+            ordered = ensure_bool(template.ordered.bind(arguments))
 
-        default_obj = inject_arguments(obj.get(_KEY_DEFAULT, {}), arguments)
         with on_key(_KEY_DEFAULT):
-            case_compiler = self._case.compile_default(default_obj)
+            case_compiler = _compile_memorized(
+                template.default,
+                template.case_memo,
+                self._case,
+                arguments,
+                self._case.compile_default,
+            )
 
-        condition_obj = inject_arguments(obj.get(_KEY_WHEN, []), arguments)
         with on_key(_KEY_WHEN):
-            conditions = self._compile_conditions(condition_obj)
+            conditions = _compile_memorized(
+                template.conditions,
+                template.conditions_memo,
+                self._description,
+                arguments,
+                self._compile_conditions,
+            )
 
-        case_obj = inject_arguments(obj.get(_KEY_CASES, []), arguments)
         with on_key(_KEY_CASES):
-            cases = self._compile_cases(case_compiler, case_obj)
+            cases = _compile_memorized(
+                template.cases,
+                template.cases_memo,
+                case_compiler,
+                arguments,
+                partial(self._compile_cases, case_compiler),
+            )
+            if ordered:
+                _ensure_no_dependencies(cases)
 
-        subscenario_obj = obj.get(_KEY_SUBSCENARIOS, [])
         with on_key(_KEY_SUBSCENARIOS):
             subscenarios = self._compile_subscenarios(
                 case_compiler,
-                subscenario_obj,
+                template.subscenarios,
                 arguments,
             )
 
@@ -94,59 +254,122 @@ class ScenarioCompiler:
             conditions=conditions,
             cases=cases,
             subscenarios=subscenarios,
+            tags=tags,
+            depends_on=depends_on,
         )
 
-    def compile_flattening(
-        self,
-        obj: object,
-        arguments: Optional[Arguments] = None,
-    ) -> Iterator[Scenario]:
-        """
-        Compile the given object into a scenario with flattening:
-        a nested object list results in a flattened scenario.
-
-        Args:
-            obj: A compiled object or a list.
-            arguments: Arguments to inject.
-        Returns:
-            A scenario iterator as the result of compilation.
-        Raises:
-            CompilationError: when the compilation fails for each iteration.
-        """
-
-        compile = partial(self.compile, arguments=arguments)
-        return compile_flattening(compile, obj)
-
     def _compile_conditions(self, obj: object):
         return list(map_compile(self._description.compile, ensure_list(obj)))
 
     @staticmethod
     def _compile_cases(case_compiler: CaseCompiler, obj: object) -> List[Case]:
-        return list(map_compile(case_compiler.compile_fixed, ensure_list(obj)))
+        cases = list(map_compile(case_compiler.compile_fixed, ensure_list(obj)))
+        _check_dependencies(cases)
+        return cases
 
     def _compile_subscenarios(
         self,
         case: CaseCompiler,
-        obj: object,
+        templates: List[_ScenarioTemplate],
         arguments: Arguments,
     ) -> List[Scenario]:
         compiler = ScenarioCompiler(description=self._description, case=case)
-        return list(
-            map_compile(
-                lambda sub_obj: compiler.compile(sub_obj, arguments=arguments),
-                ensure_list(obj),
-            )
-        )
+
+        def _compile(template: _ScenarioTemplate) -> Scenario:
+            if template.is_static:
+                return template.scenario_memo.get(
+                    case,
+                    lambda: compiler._compile_template(template, arguments),
+                )
+            return compiler._compile_template(template, arguments)
+
+        subscenarios = list(map_compile(_compile, templates))
+        _check_dependencies(subscenarios)
+        return subscenarios
+
+    def _iterate_parameterized(
+        self,
+        template: _ScenarioTemplate,
+        arguments: Arguments,
+    ) -> Iterator[Scenario]:
+        with on_key(_KEY_PARAMETERS):
+            parameters = _compile_parameters(template.parameters)
+        for parameter in _iterate_on_key(_KEY_PARAMETERS, parameters):
+            yield self._compile_parameterized(template, arguments, parameter)
 
     def _compile_parameterized(
         self,
-        obj: Mapping,
+        template: _ScenarioTemplate,
         arguments: Arguments,
         parameter: Parameter,
     ) -> Scenario:
-        template = {k: v for (k, v) in obj.items() if k not in (_KEY_LABEL, _KEY_PARAMETERS)}
-        template["label"] = parameter.label
-
         arguments = dict(arguments)
         arguments.update(parameter.arguments)
-        return self.compile(template, arguments)
+        # Tags and dependencies belong to the parent of the parameterized scenarios.
+        return self._compile_body(template, parameter.label, [], [], arguments)
+
+
+def _compile_top_level_template(obj: object) -> _ScenarioTemplate:
+    template = _ScenarioTemplate(obj)
+    if ensure_mapping(obj).get(_KEY_DEPENDS_ON):
+        with on_key(_KEY_DEPENDS_ON):
+            raise CompilationError("Only subscenarios can depend on other scenarios")
+    return template
+
+
+def _compile_memorized(
+    template: Template,
+    memo: _Memo[T],
+    key: object,
+    arguments: Arguments,
+    compile: Callable[[object], T],
+) -> T:
+    if not template.is_static:
+        return compile(template.bind(arguments))
+    return memo.get(key, lambda: compile(template.bind()))
+
+
+def _check_dependencies(items: Sequence[Union[Case, Scenario]]) -> None:
+    labels = {item.label for item in items}
+    for index, item in enumerate(items):
+        unknown = [label for label in item.depends_on if label not in labels]
+        if unknown:
+            with on_index(index), on_key(_KEY_DEPENDS_ON):
+                raise CompilationError(f"Depends on unknown labels: {', '.join(unknown)}")
+        if item.label in item.depends_on:
+            with on_index(index), on_key(_KEY_DEPENDS_ON):
+                raise CompilationError(f"Depends on itself: {item.label}")
+
+    dependencies = resolve_dependencies(
+        [item.label for item in items],
+        [item.depends_on for item in items],
+    )
+    startable = set(sort_topologically(dependencies))
+    for index in range(len(items)):
+        if index not in startable:
+            with on_index(index), on_key(_KEY_DEPENDS_ON):
+                raise CompilationError("Never runs because of cyclic dependencies")
+
+
+def _ensure_no_dependencies(cases: List[Case]) -> None:
+    for index, case in enumerate(cases):
+        if case.depends_on:
+            with on_index(index), on_key(_KEY_DEPENDS_ON):
+                raise CompilationError("Cases can depend on others only in unordered scenarios")
+
+
+def _compile_parameters(obj: object) -> Iterable[Parameter]:
+    if is_parameter_source(obj):
+        # Parameters from a source are read lazily row by row.
+        return compile_parameter_source(obj)
+    return list(map_compile(compile_parameter, ensure_list(obj)))
+
+
+def _iterate_on_key(key: str, items: Iterable[Parameter]) -> Iterator[Parameter]:
+    iterator = iter(items)
+    while True:
+        with on_key(key):
+            item = next(iterator, None)
+        if item is None:
+            return
+        yield item
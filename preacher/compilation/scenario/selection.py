@@ -0,0 +1,217 @@
+"""Selection of scenarios and cases by their tags and labels."""
+
+from collections.abc import Mapping
+from typing import AbstractSet, FrozenSet, Iterable, List, Optional, Pattern, Sequence, Union
+
+from preacher.core.scenario import Case, Scenario
+from preacher.core.scenario.util.dependency import resolve_dependencies
+
+_KEY_LABEL = "label"
+_KEY_TAGS = "tags"
+_NESTED_KEYS = ("default", "cases", "subscenarios")
+
+
+class ScenarioSelector:
+    """
+    Selects scenarios and cases.
+
+    Tags of a scenario are inherited by its cases and subscenarios.
+    A case is selected when it has none of the excluded tags
+    and, if included tags are given, has any of them.
+    In an ordered scenario, the cases before a selected case are also selected
+    unless they have any of the excluded tags.
+    The cases and subscenarios that selected ones depend on are also selected,
+    and the ones depending on excluded ones are excluded too.
+    A scenario is selected when it has some selected cases or subscenarios,
+    and the label pattern, if given, is searched only in the labels of top-level scenarios.
+    """
+
+    def __init__(
+        self,
+        tags: Iterable[str] = (),
+        excluded_tags: Iterable[str] = (),
+        label: Optional[Pattern] = None,
+    ):
+        """
+        Args:
+            tags: The tags to include. All are included when empty.
+            excluded_tags: The tags to exclude, which take priority over the included ones.
+            label: The pattern to search in the labels of top-level scenarios.
+        """
+        self._tags = frozenset(tags)
+        self._excluded_tags = frozenset(excluded_tags)
+        self._label = label
+
+    def may_select(self, obj: object) -> bool:
+        """
+        Check a scenario object before compilation, which costs much more than checking.
+        Only literal labels and tags are checked,
+        so ``False`` means that the compiled scenario is never selected
+        but ``True`` does not mean that it is.
+        """
+        if not isinstance(obj, Mapping):
+            return True
+
+        label = obj.get(_KEY_LABEL)
+        if self._label and isinstance(label, str) and not self._label.search(label):
+            return False
+
+        tags = _literal_tags(obj.get(_KEY_TAGS, []))
+        if tags is None:
+            return True
+        if tags & self._excluded_tags:
+            return False
+        if not self._tags or tags & self._tags:
+            return True
+        return any(_may_have_tags(obj[key]) for key in _NESTED_KEYS if key in obj)
+
+    def select(self, scenario: Scenario) -> Optional[Scenario]:
+        """
+        Select a top-level scenario and the cases in it.
+
+        Returns:
+            The scenario only with the selected cases and subscenarios,
+            which is the given one when all are selected, or ``None`` when none is selected.
+        """
+        if self._label and not (scenario.label and self._label.search(scenario.label)):
+            return None
+        return self._select(scenario, frozenset(), not self._tags)
+
+    def _select(
+        self,
+        scenario: Scenario,
+        inherited_tags: FrozenSet[str],
+        included: bool,
+    ) -> Optional[Scenario]:
+        tags = inherited_tags | scenario.tags
+        if tags & self._excluded_tags:
+            return None
+        included = included or bool(tags & self._tags)
+
+        cases = self._select_cases(scenario, tags, included)
+        subscenarios = self._select_subscenarios(scenario, tags, included)
+        if cases == scenario.cases and subscenarios == scenario.subscenarios:
+            return scenario if included or cases or subscenarios else None
+        if not cases and not subscenarios:
+            return None
+        return Scenario(
+            label=scenario.label,
+            ordered=scenario.ordered,
+            conditions=scenario.conditions,
+            cases=cases,
+            subscenarios=subscenarios,
+            tags=scenario.tags,
+            depends_on=scenario.depends_on,
+        )
+
+    def _select_cases(
+        self,
+        scenario: Scenario,
+        tags: FrozenSet[str],
+        included: bool,
+    ) -> List[Case]:
+        selected = [
+            index
+            for index, case in enumerate(scenario.cases)
+            if self._selects_case(case, tags, included)
+        ]
+        if scenario.ordered and selected:
+            # The preceding cases can store context values for the selected ones.
+            preceding = scenario.cases[: selected[-1] + 1]
+            return [case for case in preceding if not self._excludes(case, tags)]
+
+        excluded = {
+            index for index, case in enumerate(scenario.cases) if self._excludes(case, tags)
+        }
+        return [
+            scenario.cases[index]
+            for index in _close_dependencies(scenario.cases, selected, excluded)
+        ]
+
+    def _select_subscenarios(
+        self,
+        scenario: Scenario,
+        tags: FrozenSet[str],
+        included: bool,
+    ) -> List[Scenario]:
+        subscenarios = scenario.subscenarios
+        selections = [self._select(subscenario, tags, included) for subscenario in subscenarios]
+        selected = [index for index, selection in enumerate(selections) if selection is not None]
+        excluded = {
+            index
+            for index, subscenario in enumerate(subscenarios)
+            if (tags | subscenario.tags) & self._excluded_tags
+        }
+
+        results = []
+        for index in _close_dependencies(subscenarios, selected, excluded):
+            selection = selections[index]
+            if selection is None:
+                # Scenarios depended on are selected as a whole.
+                selection = self._select(subscenarios[index], tags, True)
+            if selection is not None:
+                results.append(selection)
+        return results
+
+    def _selects_case(self, case: Case, inherited_tags: FrozenSet[str], included: bool) -> bool:
+        if self._excludes(case, inherited_tags):
+            return False
+        return included or bool((inherited_tags | case.tags) & self._tags)
+
+    def _excludes(self, case: Case, inherited_tags: FrozenSet[str]) -> bool:
+        return bool((inherited_tags | case.tags) & self._excluded_tags)
+
+
+def _close_dependencies(
+    items: Sequence[Union[Case, Scenario]],
+    selected: Iterable[int],
+    excluded: AbstractSet[int],
+) -> List[int]:
+    """
+    Add the indices of the items that the selected ones depend on transitively.
+    Excluded items are not added, and the ones depending on them are removed,
+    which would otherwise run without the contextual values that they hand off.
+    """
+    dependencies = resolve_dependencies(
+        [item.label for item in items],
+        [item.depends_on for item in items],
+    )
+
+    closed = set()
+    stack = list(selected)
+    while stack:
+        index = stack.pop()
+        if index in closed or index in excluded:
+            continue
+        closed.add(index)
+        stack.extend(dependencies[index])
+
+    removed = set(excluded)
+    while True:
+        dependents = {
+            index
+            for index in closed - removed
+            if any(dependency in removed for dependency in dependencies[index])
+        }
+        if not dependents:
+            break
+        removed |= dependents
+    return sorted(closed - removed)
+
+
+def _literal_tags(obj: object) -> Optional[FrozenSet[str]]:
+    if isinstance(obj, str):
+        return frozenset((obj,))
+    if isinstance(obj, list) and all(isinstance(item, str) for item in obj):
+        return frozenset(obj)
+    return None
+
+
+def _may_have_tags(obj: object) -> bool:
+    if isinstance(obj, list):
+        return any(_may_have_tags(item) for item in obj)
+    if not isinstance(obj, Mapping):
+        return True
+    if _KEY_TAGS in obj:
+        return True
+    return any(_may_have_tags(obj[key]) for key in _NESTED_KEYS if key in obj)
@@ -39,11 +39,22 @@ def compile_flattening(
     obj: object,
 ) -> Iterator[T]:
     """Compile while flattening object, which can be a nested list."""
+    return compile_flattening_into(lambda item: (func(item),), obj)
+
+
+def compile_flattening_into(
+    func: Callable[[object], Iterable[T]],
+    obj: object,
+) -> Iterator[T]:
+    """
+    Compile while flattening object, which can be a nested list,
+    where each item is compiled into any number of results lazily.
+    """
 
     if not isinstance(obj, list):
-        yield func(obj)
+        yield from func(obj)
         return
 
     for idx, item in enumerate(obj):
         with on_index(idx):
-            yield from compile_flattening(func, item)
+            yield from compile_flattening_into(func, item)
@@ -0,0 +1,77 @@
+"""Interning utilities for compilations."""
+
+from collections.abc import Mapping
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from preacher.core.util.lru import LruCache
+
+T = TypeVar("T")
+
+_DEFAULT_MAXSIZE = 1024
+
+
+class Interner(Generic[T]):
+    """
+    Shares compiled objects among equal compiled sources (a.k.a. hash-consing).
+    Compiled objects must be immutable to be shared.
+    Only the recently used ones are kept not to hold all the objects
+    compiled through the lifetime of a compiler.
+    """
+
+    def __init__(self, maxsize: int = _DEFAULT_MAXSIZE):
+        self._items: LruCache[Hashable, T] = LruCache(maxsize)
+
+    def intern(self, obj: object, compile: Callable[[object], T]) -> T:
+        """
+        Returns the object compiled from an equal source once, or compiles the given source.
+
+        Args:
+            obj: A compiled object.
+            compile: A compilation function, of which result is shared.
+        Returns:
+            The result of compilation.
+        Raises:
+            CompilationError: when compilation fails, which is not memorized.
+        """
+        key = freeze(obj)
+        if key is None:
+            return compile(obj)
+
+        item = self._items.get(key)
+        if item is None:
+            item = compile(obj)
+            self._items.put(key, item)
+        return item
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+def freeze(obj: object) -> Optional[Hashable]:
+    """
+    Convert a compiled object into a hashable key,
+    which is equal to the other key only when the compiled objects are equal and of the same type.
+
+    Returns:
+        The key, or ``None`` when the object cannot be frozen.
+    """
+    try:
+        key = _freeze(obj)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _freeze(obj: object) -> Hashable:
+    if isinstance(obj, Mapping):
+        items = sorted(((k, _freeze(v)) for (k, v) in obj.items()), key=_sort_key)
+        return (Mapping, tuple(items))
+    if isinstance(obj, list):
+        return (list, tuple(_freeze(item) for item in obj))
+    # Contains the type to distinguish equal values of different types, e.g. `1` and `True`.
+    return (type(obj), obj)
+
+
+def _sort_key(item: tuple) -> str:
+    return repr(item[0])
@@ -3,6 +3,7 @@
 from preacher.compilation.error import on_key
 from preacher.compilation.extraction import ExtractionCompiler
 from preacher.compilation.util.functional import map_compile
+from preacher.compilation.util.interning import Interner
 from preacher.compilation.util.type import ensure_list, ensure_mapping, ensure_optional_str
 from preacher.core.verification import Description
 from .predicate import PredicateCompiler
@@ -16,10 +17,16 @@ class DescriptionCompiler:
     def __init__(self, extraction: ExtractionCompiler, predicate: PredicateCompiler):
         self._extraction = extraction
         self._predicate = predicate
+        self._interner: Interner[Description] = Interner()
 
-    def compile(self, obj: object):
-        """`obj` should be a mapping."""
+    def compile(self, obj: object) -> Description:
+        """
+        `obj` should be a mapping.
+        Descriptions compiled from equal objects are shared.
+        """
+        return self._interner.intern(obj, self._compile)
 
+    def _compile(self, obj: object) -> Description:
         obj = ensure_mapping(obj)
 
         extraction_obj = obj.get(_KEY_DESCRIBE)
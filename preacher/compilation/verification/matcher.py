@@ -8,10 +8,14 @@ from hamcrest.core.matcher import Matcher
 
 from preacher.compilation.error import CompilationError, on_key
 from preacher.compilation.util.functional import map_compile
+from preacher.compilation.util.interning import Interner
 from preacher.compilation.util.type import ensure_list
 from preacher.core.value import Value
 from preacher.core.value.impl.datetime import parse_datetime_value_with_format
 from preacher.core.value.impl.static import StaticValue
+from preacher.core.verification.collection import every_item, no_item, unique_items
+from preacher.core.verification.collection import has_max, has_min, has_sum
+from preacher.core.verification.collection import sorted_ascending, sorted_descending
 from preacher.core.verification.hamcrest import before, after, day_of_week
 from preacher.core.verification.matcher import MatcherFactory
 from preacher.core.verification.matcher import MatcherFunc
@@ -34,6 +38,7 @@ class MatcherFactoryCompiler:
         self._static: Dict[str, MatcherFactory] = {}
         self._taking_value: Dict[str, Tuple[MatcherFunc, ValueFunc]] = {}
         self._recursive: Dict[str, Tuple[MatcherFunc, bool]] = {}
+        self._interner: Interner[MatcherFactory] = Interner()
 
     def add_static(
         self,
@@ -52,6 +57,7 @@ class MatcherFactoryCompiler:
             item = StaticMatcherFactory(item)
         for key in self._ensure_keys(keys):
             self._static[key] = item
+        self._interner.clear()
 
     def add_taking_value(
         self,
@@ -70,6 +76,7 @@ class MatcherFactoryCompiler:
 
         for key in self._ensure_keys(keys):
             self._taking_value[key] = (matcher_func, value_func)
+        self._interner.clear()
 
     def add_recursive(
         self,
@@ -88,10 +95,12 @@ class MatcherFactoryCompiler:
 
         for key in self._ensure_keys(keys):
             self._recursive[key] = (matcher_func, multiple)
+        self._interner.clear()
 
     def compile(self, obj: object) -> MatcherFactory:
         """
         Compile an object into a matcher factory.
+        Matcher factories compiled from equal objects are shared.
 
         Args:
             obj: A compiled object.
@@ -100,7 +109,9 @@ class MatcherFactoryCompiler:
         Raises:
             CompilationError: when compilation fails.
         """
+        return self._interner.intern(obj, self._compile)
 
+    def _compile(self, obj: object) -> MatcherFactory:
         if isinstance(obj, str) and obj in self._static:
             return self._static[obj]
 
@@ -178,6 +189,14 @@ def add_default_matchers(compiler: MatcherFactoryCompiler) -> None:
     compiler.add_recursive(("have_items",), hamcrest.has_items)
     compiler.add_recursive(("contain_exactly",), hamcrest.contains_exactly)
     compiler.add_recursive(("contain_in_any_order",), hamcrest.contains_inanyorder)
+    compiler.add_recursive(("have_every_item",), every_item, multiple=False)
+    compiler.add_recursive(("have_no_item",), no_item, multiple=False)
+    compiler.add_static(("be_sorted",), sorted_ascending())
+    compiler.add_static(("be_sorted_descending",), sorted_descending())
+    compiler.add_static(("have_unique_items",), unique_items())
+    compiler.add_recursive(("have_sum",), has_sum, multiple=False)
+    compiler.add_recursive(("have_min",), has_min, multiple=False)
+    compiler.add_recursive(("have_max",), has_max, multiple=False)
 
     # For datetime.
     compiler.add_taking_value(("be_before",), before, parse_datetime_value_with_format)
@@ -1,5 +1,6 @@
 """Predicate compilation."""
 
+from preacher.compilation.util.interning import Interner
 from preacher.core.verification.matcher import MatcherWrappingPredicate
 from preacher.core.verification.predicate import Predicate
 from .matcher import MatcherFactoryCompiler
@@ -8,7 +9,12 @@ from .matcher import MatcherFactoryCompiler
 class PredicateCompiler:
     def __init__(self, matcher_factory: MatcherFactoryCompiler):
         self._matcher_factory = matcher_factory
+        self._interner: Interner[Predicate] = Interner()
 
     def compile(self, obj: object) -> Predicate:
+        """Predicates compiled from equal objects are shared."""
+        return self._interner.intern(obj, self._compile)
+
+    def _compile(self, obj: object) -> Predicate:
         factory = self._matcher_factory.compile(obj)
         return MatcherWrappingPredicate(factory)
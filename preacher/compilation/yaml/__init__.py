@@ -4,5 +4,6 @@ YAML handling.
 
 from .factory import create_loader
 from .integration import load_from_paths
+from .recording import RecordingLoader
 
-__all__ = ["create_loader", "load_from_paths"]
+__all__ = ["create_loader", "load_from_paths", "RecordingLoader"]
@@ -10,10 +10,11 @@ from preacher.core.logger import default_logger
 def create_loader(
     plugin_manager: Optional[PluginManager] = None,
     logger: Optional[Logger] = None,
+    loader: Optional[Loader] = None,
 ) -> Loader:
     logger = logger or default_logger
 
-    loader = Loader()
+    loader = loader or Loader()
     if plugin_manager:
         plugin_manager.hook.preacher_modify_yaml_loader(loader=loader)
     else:
@@ -0,0 +1,33 @@
+from typing import Iterator, List
+
+from yamlen import Loader
+
+
+class RecordingLoader(Loader):
+    """
+    Records the paths of files to load, including ones included with ``!include``
+    and ones referred to with ``!path``.
+    Paths are recorded even when they are not found, which can be created later.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._paths: List[str] = []
+
+    def load_from_path(self, path: str) -> object:
+        self._paths.append(path)
+        return super().load_from_path(path)
+
+    def load_all_from_path(self, path: str) -> Iterator:
+        self._paths.append(path)
+        return super().load_all_from_path(path)
+
+    def record(self, path: str) -> None:
+        """Record the path of a file that is read apart from loading YAML."""
+        self._paths.append(path)
+
+    def pop_paths(self) -> List[str]:
+        """Return the paths recorded so far and clear them."""
+        paths = self._paths
+        self._paths = []
+        return paths
@@ -4,6 +4,7 @@ from yamlen.tag.impl.inclusion import InclusionTag
 from .argument import ArgumentTag
 from .context import ContextTag
 from .datetime import RelativeDatetimeTag
+from .path import PathTag
 
 __all__ = ["add_default_tags"]
 
@@ -13,3 +14,4 @@ def add_default_tags(loader: Loader) -> None:
     loader.add_tag("!argument", ArgumentTag())
     loader.add_tag("!context", ContextTag())
     loader.add_tag("!relative_datetime", RelativeDatetimeTag())
+    loader.add_tag("!path", PathTag())
@@ -0,0 +1,22 @@
+import os
+
+from yaml import Node
+from yamlen import Tag, TagContext
+
+from preacher.compilation.yaml.recording import RecordingLoader
+
+
+class PathTag(Tag):
+    """
+    Resolves a path relative to the directory of the YAML file, like ``!include``.
+    The path is left as it is when the YAML is not loaded from a file.
+    Recording loaders record the path as a file to watch.
+    """
+
+    def construct(self, node: Node, context: TagContext) -> str:
+        path = str(context.constructor.construct_scalar(node))  # type: ignore
+        if context.origin is not None:
+            path = os.path.join(context.origin, path)
+        if isinstance(context.loader, RecordingLoader):
+            context.loader.record(path)
+        return path
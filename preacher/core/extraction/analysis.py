@@ -4,16 +4,16 @@ Value analysis.
 
 import json
 from abc import ABC, abstractmethod
-from functools import partial
-from typing import Callable, Dict, Generic, Mapping, Optional, TypeVar
-
-from lxml.etree import _Element as Element, XMLParser, fromstring
+from typing import TYPE_CHECKING, Callable, Dict, Generic, Mapping, Optional, TypeVar
 
 from preacher.core.request.response import ResponseBody
 from preacher.core.util.functional import recursive_map
 from preacher.core.util.serialization import to_serializable
 from .error import ExtractionError
 
+if TYPE_CHECKING:
+    from lxml.etree import _Element as Element  # pragma: no cover
+
 Source = TypeVar("Source")
 T = TypeVar("T")
 
@@ -32,7 +32,7 @@ class Analyzer(ABC):
         ...  # pragma: no cover
 
     @abstractmethod
-    def for_etree(self, extract: Callable[[Element], T]) -> T:
+    def for_etree(self, extract: Callable[["Element"], T]) -> T:
         ...  # pragma: no cover
 
 
@@ -76,7 +76,15 @@ class _LazyLoader(Generic[Source, T]):
 
 JSON_LOAD = json.loads
 JSON_ERROR = ExtractionError("Not a valid JSON content")
-XML_LOAD = partial(fromstring, parser=XMLParser())
+
+
+def _load_xml(content: bytes) -> "Element":
+    from lxml.etree import XMLParser, fromstring  # Imported only when XML is analyzed.
+
+    return fromstring(content, parser=XMLParser())
+
+
+XML_LOAD = _load_xml
 XML_ERROR = ExtractionError("Not a valid XML content")
 
 
@@ -95,7 +103,7 @@ class ResponseBodyAnalyzer(Analyzer):
             raise ExtractionError(f"Expected a dictionary, but given {type(json_value)}")
         return extract(json_value)
 
-    def for_etree(self, extract: Callable[[Element], T]) -> T:
+    def for_etree(self, extract: Callable[["Element"], T]) -> T:
         return extract(self._etree_loader.get())
 
 
@@ -115,5 +123,5 @@ class MappingAnalyzer(Analyzer):
     def for_mapping(self, extract: Callable[[Mapping], T]) -> T:
         return extract(self._loader.get())
 
-    def for_etree(self, extract: Callable[[Element], T]) -> T:
+    def for_etree(self, extract: Callable[["Element"], T]) -> T:
         raise ExtractionError("Not an XML content")
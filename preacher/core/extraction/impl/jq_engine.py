@@ -1,7 +1,14 @@
+import threading
+from importlib.util import find_spec
 from typing import Iterator
 
 from preacher.core.extraction import ExtractionError
 from preacher.core.extraction.impl.jq_ import JqEngine
+from preacher.core.util.lru import LruCache
+
+# Recently compiled programs are cached for each thread, shared among all the engines.
+_LOCAL = threading.local()
+_MAX_PROGRAMS = 256
 
 
 class PyJqEngine(JqEngine):
@@ -11,17 +18,27 @@ class PyJqEngine(JqEngine):
         self._compile = jq.compile
 
     def iter(self, query: str, text: str) -> Iterator[object]:
-        try:
-            compiled = self._compile(query)
-        except ValueError:
-            raise ExtractionError(f"Invalid jq script: {query}")
-        return compiled.input(text=text)
+        return self._compiled(query).input(text=text)
+
+    def _compiled(self, query: str):
+        programs = _programs()
+        compiled = programs.get(query)
+        if compiled is None:
+            try:
+                compiled = self._compile(query)
+            except ValueError:
+                raise ExtractionError(f"Invalid jq script: {query}")
+            programs.put(query, compiled)
+        return compiled
 
     @staticmethod
     def is_available() -> bool:
-        try:
-            import jq  # noqa: F401
+        # Not imported here to find it available without loading it.
+        return find_spec("jq") is not None
+
 
-            return True
-        except ImportError:  # pragma: no cover
-            return False
+def _programs() -> LruCache[str, object]:
+    programs = getattr(_LOCAL, "programs", None)
+    if programs is None:
+        programs = _LOCAL.programs = LruCache(_MAX_PROGRAMS)
+    return programs
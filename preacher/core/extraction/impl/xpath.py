@@ -1,10 +1,25 @@
-from typing import Callable, Any, List, Mapping, Optional
-
-from lxml.etree import _Element as Element, XPathEvalError
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Any, List, Mapping, Optional, Tuple
 
 from preacher.core.extraction import Analyzer, ExtractionError
 from preacher.core.extraction.extraction import Extractor
 from preacher.core.util.functional import identity, apply_if_not_none
+from preacher.core.util.lru import LruCache
+
+if TYPE_CHECKING:
+    from lxml.etree import _Element as Element, XPath  # pragma: no cover
+
+# Recently compiled XPaths are cached for each thread because they are not thread-safe.
+_LOCAL = threading.local()
+_MAX_PROGRAMS = 256
+
+
+@lru_cache(maxsize=None)
+def _load_etree() -> Any:
+    from lxml import etree  # Imported only when XPath is used.
+
+    return etree
 
 
 class XPathExtractor(Extractor):
@@ -19,6 +34,7 @@ class XPathExtractor(Extractor):
         self._multiple = multiple
         self._cast = cast or identity
         self._namespaces = namespaces or {}
+        self._key = (query, tuple(sorted(self._namespaces.items())))
 
     def extract(self, analyzer: Analyzer) -> object:
         elements = analyzer.for_etree(self._extract)
@@ -33,12 +49,27 @@ class XPathExtractor(Extractor):
 
     @staticmethod
     def _convert(elem: object) -> str:
-        if isinstance(elem, Element):
+        if isinstance(elem, _load_etree()._Element):
             return elem.text
         return str(elem)
 
-    def _extract(self, elem: Element) -> List[Element]:
+    def _extract(self, elem: "Element") -> List["Element"]:
         try:
-            return elem.xpath(self._query, namespaces=self._namespaces)
-        except XPathEvalError:
+            return self._compiled()(elem)
+        except _load_etree().XPathError:
             raise ExtractionError(f"Invalid XPath: {self._query}")
+
+    def _compiled(self) -> "XPath":
+        programs = _programs()
+        compiled = programs.get(self._key)
+        if compiled is None:
+            compiled = _load_etree().XPath(self._query, namespaces=self._namespaces)
+            programs.put(self._key, compiled)
+        return compiled
+
+
+def _programs() -> "LruCache[Tuple, XPath]":
+    programs = getattr(_LOCAL, "programs", None)
+    if programs is None:
+        programs = _LOCAL.programs = LruCache(_MAX_PROGRAMS)
+    return programs
@@ -0,0 +1,296 @@
+"""
+Profiling of each phase: loading, compiling, executing, verifying and reporting.
+
+Phases are profiled for each process and thread, which are dumped into a directory as below.
+
+- ``<phase>-<pid>-<thread>.prof``: ``pstats`` dumps.
+- ``<pid>.collapsed``: collapsed stacks in microseconds for flame graphs,
+  whose root frames are the phases.
+- ``summary.txt``: the hottest functions of each phase over all processes and threads.
+"""
+
+import cProfile
+import os
+import pstats
+import re
+import threading
+from collections import Counter, defaultdict
+from contextlib import ExitStack, contextmanager, nullcontext
+from glob import escape, glob
+from io import StringIO
+from multiprocessing.util import Finalize
+from typing import ContextManager, Dict, Iterable, Iterator, List, Mapping, Tuple, TypeVar
+
+PHASE_LOAD = "load"
+PHASE_COMPILE = "compile"
+PHASE_EXECUTE = "execute"
+PHASE_VERIFY = "verify"
+PHASE_REPORT = "report"
+PHASES = (PHASE_LOAD, PHASE_COMPILE, PHASE_EXECUTE, PHASE_VERIFY, PHASE_REPORT)
+
+SUMMARY_FILE_NAME = "summary.txt"
+DEFAULT_SUMMARY_LIMIT = 20
+
+_MAX_STACK_DEPTH = 64
+_MIN_SECONDS = 1e-6
+
+T = TypeVar("T")
+
+
+class Profiler:
+    """
+    Profiler interface.
+    Default implementations profile nothing.
+    """
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """Profile the block as the phase."""
+        return nullcontext()
+
+    def span(self, name: str, category: str, **args: object) -> ContextManager[None]:
+        """Mark the block as a span like a case or an attempt, which is not a phase."""
+        return nullcontext()
+
+    def record_span(
+        self,
+        name: str,
+        category: str,
+        starts: float,
+        ends: float,
+        **args: object,
+    ) -> None:
+        """
+        Record a span measured elsewhere, which can overlap others on the same thread.
+
+        Args:
+            starts: The start time in seconds since the epoch.
+            ends: The end time in seconds since the epoch.
+        """
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterable[T]:
+        """Profile each iteration as the phase."""
+        return iterable
+
+    def dump(self) -> None:
+        """Dump the profiles in this process."""
+
+
+class MergingProfiler(Profiler):
+    """Delegates to profilers, where former ones enclose latter ones."""
+
+    def __init__(self, profilers: Iterable[Profiler]):
+        self._profilers = list(profilers)
+
+    def phase(self, name: str) -> ContextManager[None]:
+        return _entering(profiler.phase(name) for profiler in self._profilers)
+
+    def span(self, name: str, category: str, **args: object) -> ContextManager[None]:
+        return _entering(profiler.span(name, category, **args) for profiler in self._profilers)
+
+    def record_span(
+        self,
+        name: str,
+        category: str,
+        starts: float,
+        ends: float,
+        **args: object,
+    ) -> None:
+        for profiler in self._profilers:
+            profiler.record_span(name, category, starts, ends, **args)
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterable[T]:
+        for profiler in reversed(self._profilers):
+            iterable = profiler.iterate(name, iterable)
+        return iterable
+
+    def dump(self) -> None:
+        for profiler in self._profilers:
+            profiler.dump()
+
+
+@contextmanager
+def _entering(managers: Iterable[ContextManager[None]]) -> Iterator[None]:
+    with ExitStack() as stack:
+        for manager in managers:
+            stack.enter_context(manager)
+        yield
+
+
+class CProfiler(Profiler):
+    """
+    Profiles phases with ``cProfile`` and dumps them into a directory.
+    Copies in other processes profile on their own and dump when the processes exit.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: The directory to dump profiles into, which is created if not exists.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._profiles: Dict[Tuple[str, str], List[cProfile.Profile]] = defaultdict(list)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def phase(self, name: str) -> ContextManager[None]:
+        return _Phase(self, name)
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterable[T]:
+        return _Profiling(self, name, iter(iterable))
+
+    def dump(self) -> None:
+        with self._lock:
+            profiles = dict(self._profiles)
+            self._profiles.clear()
+
+        collapsed: Counter = Counter()
+        for (phase, thread), phase_profiles in profiles.items():
+            stats = pstats.Stats(*phase_profiles)
+            stats.dump_stats(self._path(f"{phase}-{self._pid}-{_sanitize(thread)}.prof"))
+            for stack, microseconds in _collapse(stats.stats, phase):  # type: ignore
+                collapsed[stack] += microseconds
+
+        if collapsed:
+            with open(self._path(f"{self._pid}.collapsed"), "w") as f:
+                for stack, microseconds in sorted(collapsed.items()):
+                    f.write(f"{stack} {microseconds}\n")
+
+    def _profile_of(self, phase: str) -> cProfile.Profile:
+        profiles: Dict[str, cProfile.Profile] = self._local.__dict__.setdefault("profiles", {})
+        profile = profiles.get(phase)
+        if profile is None:
+            profile = cProfile.Profile()
+            profiles[phase] = profile
+            with self._lock:
+                self._profiles[phase, threading.current_thread().name].append(profile)
+        return profile
+
+    def _enabled(self) -> List[cProfile.Profile]:
+        return self._local.__dict__.setdefault("enabled", [])
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory, name)
+
+    def __reduce__(self) -> tuple:
+        return _get_profiler, (self._directory,)
+
+
+class _Phase(ContextManager[None]):
+    def __init__(self, profiler: CProfiler, name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> None:
+        profile = self._profiler._profile_of(self._name)
+        self._enabled = self._profiler._enabled()
+        if self._enabled:
+            self._enabled[-1].disable()
+        self._enabled.append(profile)
+        _enable(profile)
+
+    def __exit__(self, *args) -> None:
+        # Disabled first not to profile this method.
+        self._enabled.pop().disable()
+        if self._enabled:
+            _enable(self._enabled[-1])
+
+
+class _Profiling(Iterator[T]):
+    """
+    Profiles each iteration.
+    Unlike generators, iteration can be continued after errors as the original can.
+    """
+
+    def __init__(self, profiler: CProfiler, name: str, iterator: Iterator[T]):
+        self._profiler = profiler
+        self._name = name
+        self._iterator = iterator
+
+    def __next__(self) -> T:
+        with self._profiler.phase(self._name):
+            return next(self._iterator)
+
+
+_PROFILERS: Dict[str, CProfiler] = {}
+
+
+def _get_profiler(directory: str) -> CProfiler:
+    # Copies share a profiler in each process, which dumps when the process exits.
+    profiler = _PROFILERS.get(directory)
+    if profiler is None or profiler._pid != os.getpid():
+        profiler = CProfiler(directory)
+        _PROFILERS[directory] = profiler
+        Finalize(profiler, profiler.dump, exitpriority=0)
+    return profiler
+
+
+def _enable(profile: cProfile.Profile) -> None:
+    try:
+        profile.enable()
+    except ValueError:  # pragma: no cover
+        # Only one thread can be profiled at a time since Python 3.12.
+        pass
+
+
+def write_summary(directory: str, limit: int = DEFAULT_SUMMARY_LIMIT) -> None:
+    """
+    Write the hottest functions of each phase, which are dumped by all processes.
+
+    Args:
+        directory: The directory where profiles are dumped.
+        limit: The max number of functions for each phase.
+    """
+    with open(os.path.join(directory, SUMMARY_FILE_NAME), "w") as f:
+        for phase in PHASES:
+            paths = sorted(glob(os.path.join(escape(directory), f"{phase}-*.prof")))
+            if not paths:
+                continue
+            stream = StringIO()
+            stats = pstats.Stats(*paths, stream=stream).strip_dirs()
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(limit)
+            f.write(f"== {phase} ({len(paths)} profiles) ==\n")
+            f.write(stream.getvalue().lstrip("\n"))
+            f.write("\n")
+
+
+def _collapse(stats: Mapping, root: str) -> Iterator[Tuple[str, int]]:
+    """
+    Approximate stacks from caller-callee pairs,
+    where the time of each function is divided in proportion to its callers.
+    """
+    callees: Dict[tuple, List[Tuple[tuple, float]]] = defaultdict(list)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, cumulative) in callers.items():
+            callees[caller].append((func, cumulative))
+
+    stack: List[Tuple[tuple, float]] = [
+        ((func,), stats[func][3]) for func, (_, _, _, _, callers) in stats.items() if not callers
+    ]
+    while stack:
+        funcs, seconds = stack.pop()
+        _, _, total, cumulative, _ = stats[funcs[-1]]
+        share = seconds / cumulative if cumulative else 0.0
+        if total * share >= _MIN_SECONDS:
+            frames = ";".join(_label(func) for func in funcs)
+            yield f"{root};{frames}", round(total * share * 1_000_000)
+        if len(funcs) >= _MAX_STACK_DEPTH:
+            continue
+        for callee, callee_seconds in callees.get(funcs[-1], ()):
+            if callee not in funcs and callee_seconds * share >= _MIN_SECONDS:
+                stack.append((funcs + (callee,), callee_seconds * share))
+
+
+def _label(func: tuple) -> str:
+    filename, line, name = func
+    label = name if filename == "~" else f"{name} ({os.path.basename(filename)}:{line})"
+    return label.replace(";", ",")
+
+
+def _sanitize(name: str) -> str:
+    return re.sub(r"[^\w.]", "_", name)
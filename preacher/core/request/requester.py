@@ -1,8 +1,10 @@
+import threading
 import uuid
+from contextlib import nullcontext
 from copy import copy
 from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Mapping, Union, Optional, Tuple
+from typing import ContextManager, Mapping, Union, Optional, Tuple
 
 import requests
 
@@ -11,12 +13,15 @@ from preacher.core.context import Context, closed_context
 from preacher.core.datetime import now
 from preacher.core.status import Statused, Status
 from preacher.core.util.error import to_message
+from preacher.core.util.slots import slotted
 from .request import Request
 from .response import Response, ResponseBody
 from .url_param import resolve_url_params
 
 _DEFAULT_HEADERS = {"User-Agent": f"Preacher {_version}"}
 
+_LOCAL = threading.local()
+
 
 class ResponseBodyWrapper(ResponseBody):
     def __init__(self, res: requests.Response):
@@ -30,6 +35,10 @@ class ResponseBodyWrapper(ResponseBody):
     def content(self) -> bytes:
         return self._res.content
 
+    @property
+    def encoding(self) -> Optional[str]:
+        return self._res.encoding
+
 
 class ResponseWrapper(Response):
     def __init__(self, id: str, res: requests.Response):
@@ -60,6 +69,7 @@ class ResponseWrapper(Response):
         return self._body
 
 
+@slotted
 @dataclass
 class PreparedRequest:
     method: str
@@ -68,12 +78,14 @@ class PreparedRequest:
     body: Union[None, str, bytes]
 
 
+@slotted
 @dataclass(frozen=True)
 class ExecutionReport(Statused):
     status: Status = Status.SKIPPED
     starts: datetime = field(default_factory=now)
     request: Optional[PreparedRequest] = None
     message: Optional[str] = None
+    attempts: int = 1  # Including retries.
 
 
 class Requester:
@@ -81,19 +93,30 @@ class Requester:
         self,
         base_url: str = "",
         timeout: Optional[float] = None,
+        keep_sessions: bool = False,
     ):
         """
         Args:
             base_url: A base URL.
             timeout: The timeout in seconds. ``None`` means no timeout.
+            keep_sessions: Whether to keep a session for each thread,
+                which keeps connections alive across cases and runs.
+                Cookies are cleared whenever the session is taken.
         """
         self._base_url = base_url
         self._timeout = timeout
+        self._keep_sessions = keep_sessions
 
     @property
     def base_url(self) -> str:
         return self._base_url
 
+    def session(self) -> ContextManager[requests.Session]:
+        """A session without cookies, which should be used in a ``with`` statement."""
+        if self._keep_sessions:
+            return nullcontext(_kept_session())
+        return requests.Session()
+
     def execute(
         self,
         request: Request,
@@ -112,8 +135,8 @@ class Requester:
             When there is no response, the response will be ``None``.
         """
         if session is None:
-            with requests.Session() as new_session:
-                return self.execute(request, session=new_session)
+            with self.session() as new_session:
+                return self.execute(request, session=new_session, context=context)
 
         context = context if context is not None else Context()
         starts = now()
@@ -132,7 +155,7 @@ class Requester:
             request=PreparedRequest(
                 method=prepped.method or "",
                 url=prepped.url or "",
-                headers=prepped.headers,
+                headers=dict(prepped.headers),  # Plain to be cheap to be pickled.
                 body=prepped.body,
             ),
         )
@@ -173,3 +196,12 @@ class Requester:
 
 def _generate_id() -> str:
     return str(uuid.uuid4())
+
+
+def _kept_session() -> requests.Session:
+    session = getattr(_LOCAL, "session", None)
+    if session is None:
+        session = requests.Session()
+        _LOCAL.session = session
+    session.cookies.clear()
+    return session
@@ -1,7 +1,7 @@
 """Response."""
 
 from abc import ABC, abstractmethod
-from typing import Mapping
+from typing import Mapping, Optional
 
 
 class ResponseBody(ABC):
@@ -15,6 +15,11 @@ class ResponseBody(ABC):
     def content(self) -> bytes:
         ...  # pragma: no cover
 
+    @property
+    def encoding(self) -> Optional[str]:
+        """The encoding of the text, or ``None`` when it is unknown."""
+        return None
+
 
 class Response(ABC):
     @property
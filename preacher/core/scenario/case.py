@@ -4,14 +4,15 @@ along the given descriptions.
 """
 
 from datetime import timedelta
-from typing import Optional, List
+from typing import FrozenSet, Iterable, Optional, List, Tuple
 
 from preacher.core.request import Request
+from preacher.core.util.sharing import Shareable
 from preacher.core.verification import Description
 from preacher.core.verification import ResponseDescription
 
 
-class Case:
+class Case(Shareable):
     """
     Test cases, which execute a given request and verify its response
     along the given descriptions.
@@ -25,6 +26,8 @@ class Case:
         request: Optional[Request] = None,
         response: Optional[ResponseDescription] = None,
         waiting_time: Optional[timedelta] = None,
+        tags: Iterable[str] = (),
+        depends_on: Iterable[str] = (),
     ):
         self._label = label
         self._enabled = enabled
@@ -32,6 +35,8 @@ class Case:
         self._request = request or Request()
         self._response = response or ResponseDescription()
         self._waiting_time = waiting_time or timedelta()
+        self._tags = frozenset(tags)
+        self._depends_on = tuple(depends_on)
 
     @property
     def label(self) -> Optional[str]:
@@ -56,3 +61,12 @@ class Case:
     @property
     def waiting_time(self) -> timedelta:
         return self._waiting_time
+
+    @property
+    def tags(self) -> FrozenSet[str]:
+        return self._tags
+
+    @property
+    def depends_on(self) -> Tuple[str, ...]:
+        """The labels of the cases to run after, which hand off their contexts to this case."""
+        return self._depends_on
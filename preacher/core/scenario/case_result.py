@@ -1,11 +1,14 @@
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
 from preacher.core.request import ExecutionReport
 from preacher.core.status import Statused, Status, merge_statuses
+from preacher.core.util.slots import slotted
 from preacher.core.verification import Verification, ResponseVerification
 
 
+@slotted
 @dataclass(frozen=True)
 class CaseResult(Statused):
     """
@@ -16,9 +19,18 @@ class CaseResult(Statused):
     conditions: Verification = field(default_factory=Verification)
     execution: ExecutionReport = field(default_factory=ExecutionReport)
     response: Optional[ResponseVerification] = None
+    _status: Status = field(init=False, repr=False, compare=False, default=Status.SKIPPED)
+
+    def __post_init__(self) -> None:
+        if isinstance(self.label, str):
+            object.__setattr__(self, "label", sys.intern(self.label))
+        object.__setattr__(self, "_status", self._compute_status())
 
     @property
-    def status(self) -> Status:  # HACK: should be cached
+    def status(self) -> Status:
+        return self._status
+
+    def _compute_status(self) -> Status:
         if self.conditions.status == Status.UNSTABLE:
             return Status.SKIPPED
         if self.conditions.status == Status.FAILURE:
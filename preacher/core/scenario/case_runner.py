@@ -1,27 +1,40 @@
+from contextlib import nullcontext
 from time import sleep
-from typing import Optional
+from typing import ContextManager, Iterable, List, Optional
 
 import requests
 
 from preacher.core.context import Context, closed_context
 from preacher.core.datetime import now
 from preacher.core.extraction import MappingAnalyzer
+from preacher.core.profiling import Profiler
 from preacher.core.unit import UnitRunner
 from preacher.core.verification import Verification
 from .case import Case
 from .case_listener import CaseListener
 from .case_result import CaseResult
+from .util.forwarding import EventRecorder, ExecutionEvent
 
 
 class CaseRunner:
-    def __init__(self, unit_runner: UnitRunner, listener: Optional[CaseListener] = None):
+    def __init__(
+        self,
+        unit_runner: UnitRunner,
+        listener: Optional[CaseListener] = None,
+        profiler: Optional[Profiler] = None,
+    ):
         self._unit_runner = unit_runner
         self._listener = listener or CaseListener()
+        self._profiler = profiler or Profiler()
 
     @property
     def base_url(self) -> str:
         return self._unit_runner.base_url
 
+    def session(self) -> ContextManager[requests.Session]:
+        """A session to run cases in order."""
+        return self._unit_runner.session()
+
     def run(
         self,
         case: Case,
@@ -31,6 +44,15 @@ class CaseRunner:
         if not case.enabled:
             return CaseResult(label=case.label)
 
+        with self._profiler.span(case.label or "Case", "case"):
+            return self._run(case, session, context)
+
+    def _run(
+        self,
+        case: Case,
+        session: Optional[requests.Session],
+        context: Optional[Context],
+    ) -> CaseResult:
         context = context if context is not None else Context()
         with closed_context(context, starts=now(), base_url=self.base_url) as context:
             context_analyzer = MappingAnalyzer(context)
@@ -40,7 +62,9 @@ class CaseRunner:
             if not conditions.status.is_succeeded:
                 return CaseResult(case.label, conditions)
 
-            sleep(max(case.waiting_time.total_seconds(), 0.0))
+            waiting_time = max(case.waiting_time.total_seconds(), 0.0)
+            with self._profiler.span("Wait", "wait") if waiting_time else nullcontext():
+                sleep(waiting_time)
 
             execution, response, verification = self._unit_runner.run(
                 request=case.request,
@@ -51,3 +75,22 @@ class CaseRunner:
         self._listener.on_execution(execution, response)
 
         return CaseResult(case.label, conditions, execution, verification)
+
+    def take_events(self) -> List[ExecutionEvent]:
+        """
+        Take execution events recorded by a copy in another process,
+        which should be forwarded to the original with ``forward_events``.
+        """
+        if isinstance(self._listener, EventRecorder):
+            return self._listener.take()
+        return []
+
+    def forward_events(self, events: Iterable[ExecutionEvent]) -> None:
+        for execution, response in events:
+            self._listener.on_execution(execution, response)
+
+    def __getstate__(self) -> dict:
+        # Copies in other processes record events instead of the listener.
+        state = self.__dict__.copy()
+        state["_listener"] = EventRecorder()
+        return state
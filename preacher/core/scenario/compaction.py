@@ -0,0 +1,98 @@
+"""Compaction of scenario results, which are held for reports until the end of running."""
+
+from dataclasses import replace
+from typing import Optional, Union
+
+from preacher.core.request import ExecutionReport
+from preacher.core.status import StatusedList
+from preacher.core.verification import ResponseVerification, Verification
+from .case_result import CaseResult
+from .scenario_result import ScenarioResult
+
+_TRUNCATION_MARK = "..."
+
+
+class ResultCompactor:
+    """
+    Compacts scenario results so that the memory to hold them stays small.
+    Statuses and labels are always kept.
+    """
+
+    def __init__(
+        self,
+        drop_succeeded_details: bool = False,
+        max_body_length: Optional[int] = None,
+    ):
+        """
+        Args:
+            drop_succeeded_details: Whether to drop the details of succeeded cases,
+                which are request headers, request bodies and child verifications.
+            max_body_length: The max length of request bodies to be kept.
+                Longer bodies are truncated. ``None`` means no limit.
+        """
+        self._drop_succeeded_details = drop_succeeded_details
+        self._max_body_length = max_body_length
+
+    def compact(self, result: ScenarioResult) -> ScenarioResult:
+        return replace(
+            result,
+            cases=StatusedList.collect(self._compact_case(case) for case in result.cases.items),
+            subscenarios=StatusedList.collect(
+                self.compact(subscenario) for subscenario in result.subscenarios.items
+            ),
+        )
+
+    def _compact_case(self, case: CaseResult) -> CaseResult:
+        if self._drop_succeeded_details and case.status.is_succeeded:
+            return replace(
+                case,
+                conditions=_drop_children(case.conditions),
+                execution=_drop_request_details(case.execution),
+                response=_drop_response_details(case.response),
+            )
+        if self._max_body_length is not None:
+            return replace(case, execution=self._truncate_request_body(case.execution))
+        return case
+
+    def _truncate_request_body(self, execution: ExecutionReport) -> ExecutionReport:
+        request = execution.request
+        if request is None or request.body is None:
+            return execution
+        body = _truncate(request.body, self._max_body_length)
+        if body is request.body:
+            return execution
+        return replace(execution, request=replace(request, body=body))
+
+
+def _truncate(body: Union[str, bytes], max_length: Optional[int]) -> Union[str, bytes]:
+    if max_length is None or len(body) <= max_length:
+        return body
+    if isinstance(body, bytes):
+        return body[:max_length] + _TRUNCATION_MARK.encode()
+    return body[:max_length] + _TRUNCATION_MARK
+
+
+def _drop_children(verification: Verification) -> Verification:
+    if not verification.children:
+        return verification
+    return Verification(status=verification.status, message=verification.message)
+
+
+def _drop_request_details(execution: ExecutionReport) -> ExecutionReport:
+    request = execution.request
+    if request is None:
+        return execution
+    return replace(execution, request=replace(request, headers={}, body=None))
+
+
+def _drop_response_details(
+    response: Optional[ResponseVerification],
+) -> Optional[ResponseVerification]:
+    if response is None:
+        return None
+    return replace(
+        response,
+        status_code=_drop_children(response.status_code),
+        headers=_drop_children(response.headers),
+        body=_drop_children(response.body),
+    )
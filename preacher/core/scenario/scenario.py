@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import FrozenSet, Iterable, List, Optional, Tuple
 
 from preacher.core.verification import Description
 from .case import Case
@@ -16,12 +16,16 @@ class Scenario:
         conditions: Optional[List[Description]] = None,
         cases: Optional[List[Case]] = None,
         subscenarios: Optional[List[Scenario]] = None,
+        tags: Iterable[str] = (),
+        depends_on: Iterable[str] = (),
     ):
         self._label = label
         self._ordered = ordered
         self._conditions = conditions or []
         self._cases = cases or []
         self._subscenarios = subscenarios or []
+        self._tags = frozenset(tags)
+        self._depends_on = tuple(depends_on)
 
     @property
     def label(self) -> Optional[str]:
@@ -42,3 +46,16 @@ class Scenario:
     @property
     def subscenarios(self) -> List[Scenario]:
         return self._subscenarios
+
+    @property
+    def tags(self) -> FrozenSet[str]:
+        """The tags of this scenario, which its cases and subscenarios inherit."""
+        return self._tags
+
+    @property
+    def depends_on(self) -> Tuple[str, ...]:
+        """
+        The labels of the sibling scenarios to run after,
+        which hand off their contexts to this scenario.
+        """
+        return self._depends_on
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
 from preacher.core.status import Statused, Status, StatusedList
+from preacher.core.util.slots import slotted
 from preacher.core.verification import Verification
 from .case_result import CaseResult
 
 
+@slotted
 @dataclass(frozen=True)
 class ScenarioResult(Statused):
     label: Optional[str] = None
@@ -16,3 +19,8 @@ class ScenarioResult(Statused):
     conditions: Verification = field(default_factory=Verification)
     cases: StatusedList[CaseResult] = field(default_factory=StatusedList)
     subscenarios: StatusedList[ScenarioResult] = field(default_factory=StatusedList)
+
+    def __post_init__(self) -> None:
+        # Labels are shared among the results of the same scenario, which can be many.
+        if isinstance(self.label, str):
+            object.__setattr__(self, "label", sys.intern(self.label))
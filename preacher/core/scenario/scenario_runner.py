@@ -1,26 +1,46 @@
+import time
 from concurrent.futures import Executor
+from functools import partial
+from typing import Dict, List, Optional
 
 from preacher.core.context import Context, CONTEXT_KEY_BASE_URL, CONTEXT_KEY_STARTS
 from preacher.core.datetime import now
 from preacher.core.extraction import MappingAnalyzer
+from preacher.core.profiling import Profiler
 from preacher.core.status import Status
 from preacher.core.verification import Verification
 from .case_runner import CaseRunner
 from .scenario import Scenario
 from .scenario_result import ScenarioResult
 from .scenario_task import ScenarioTask, StaticScenarioTask, RunningScenarioTask
+from .scenario_task import DependentScenarioTask
 from .util.concurrency import CasesTask, OrderedCasesTask, UnorderedCasesTask
+from .util.concurrency import DependentCasesTask
+from .util.dependency import resolve_dependencies, sort_topologically
 
 
 class ScenarioRunner:
-    def __init__(self, executor: Executor, case_runner: CaseRunner):
+    def __init__(
+        self,
+        executor: Executor,
+        case_runner: CaseRunner,
+        profiler: Optional[Profiler] = None,
+    ):
         self._executor = executor
         self._case_runner = case_runner
+        self._profiler = profiler or Profiler()
 
-    def submit(self, scenario: Scenario) -> ScenarioTask:
+    def submit(self, scenario: Scenario, context: Optional[Context] = None) -> ScenarioTask:
+        """
+        Args:
+            scenario: The scenario to run.
+            context: The context handed off from the scenarios that this scenario depends on.
+        """
+        handed_off = context or Context()
         starts = now()
         context = Context(
             **{
+                **handed_off,
                 CONTEXT_KEY_STARTS: starts,
                 CONTEXT_KEY_BASE_URL: self._case_runner.base_url,
             }
@@ -38,6 +58,7 @@ class ScenarioRunner:
             result = ScenarioResult(label=scenario.label, status=status, conditions=conditions)
             return StaticScenarioTask(result)
 
+        submitted = time.time()
         if scenario.ordered:
             cases: CasesTask = OrderedCasesTask(
                 self._executor,
@@ -45,12 +66,45 @@ class ScenarioRunner:
                 scenario.cases,
                 context=context,
             )
+        elif handed_off or any(case.depends_on for case in scenario.cases):
+            cases = DependentCasesTask(
+                self._executor,
+                self._case_runner,
+                scenario.cases,
+                context=context,
+            )
         else:
             cases = UnorderedCasesTask(self._executor, self._case_runner, scenario.cases)
-        subscenarios = [self.submit(subscenario) for subscenario in scenario.subscenarios]
+        subscenarios = self._submit_subscenarios(scenario.subscenarios)
         return RunningScenarioTask(
             label=scenario.label,
             conditions=conditions,
             cases=cases,
             subscenarios=subscenarios,
+            profiler=self._profiler,
+            starts=submitted,
         )
+
+    def _submit_subscenarios(self, scenarios: List[Scenario]) -> List[ScenarioTask]:
+        dependencies = resolve_dependencies(
+            [scenario.label for scenario in scenarios],
+            [scenario.depends_on for scenario in scenarios],
+        )
+        tasks: Dict[int, ScenarioTask] = {}
+        # Sorted so that the tasks depended on exist before the dependent ones.
+        for index in sort_topologically(dependencies):
+            scenario = scenarios[index]
+            if not dependencies[index]:
+                tasks[index] = self.submit(scenario)
+                continue
+            tasks[index] = DependentScenarioTask(
+                label=scenario.label,
+                dependencies=[tasks[dependency] for dependency in dependencies[index]],
+                submit=partial(self.submit, scenario),
+            )
+
+        # The scenarios left are in dependency cycles.
+        return [
+            tasks.get(index) or StaticScenarioTask(ScenarioResult(label=scenario.label))
+            for index, scenario in enumerate(scenarios)
+        ]
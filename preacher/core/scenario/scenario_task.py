@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Optional, List
 
-from preacher.core.status import StatusedList, merge_statuses
+from preacher.core.context import Context
+from preacher.core.profiling import Profiler
+from preacher.core.status import Status, StatusedList, merge_statuses
 from preacher.core.verification import Verification
 from .scenario_result import ScenarioResult
-from .util.concurrency import CasesTask
+from .util.concurrency import CasesTask, Countdown
 
 
 class ScenarioTask(ABC):
@@ -12,6 +16,14 @@ class ScenarioTask(ABC):
     def result(self) -> ScenarioResult:
         ...  # pragma: no cover
 
+    @abstractmethod
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        """Call the function when this task finishes, or at once when it has finished."""
+
+    @abstractmethod
+    def context(self) -> Context:
+        """The context to hand off to the dependent scenarios, which is complete when done."""
+
 
 class StaticScenarioTask(ScenarioTask):
     def __init__(self, result: ScenarioResult):
@@ -20,6 +32,12 @@ class StaticScenarioTask(ScenarioTask):
     def result(self) -> ScenarioResult:
         return self._result
 
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        fn()
+
+    def context(self) -> Context:
+        return Context()
+
 
 class RunningScenarioTask(ScenarioTask):
     def __init__(
@@ -28,14 +46,46 @@ class RunningScenarioTask(ScenarioTask):
         conditions: Verification,
         cases: CasesTask,
         subscenarios: List[ScenarioTask],
+        profiler: Optional[Profiler] = None,
+        starts: float = 0.0,
     ):
+        """
+        Args:
+            profiler: A profiler to record the span of cases.
+            starts: The time when the cases are submitted in seconds since the epoch.
+        """
         self._label = label
         self._conditions = conditions
         self._cases = cases
         self._subscenarios = subscenarios
+        self._profiler = profiler or Profiler()
+        self._starts = starts
+        self._result: Optional[ScenarioResult] = None
+        self._lock = Lock()
+
+        self._done = Countdown(1 + len(subscenarios))
+        cases.add_done_callback(self._done.count_down)
+        for subscenario in subscenarios:
+            subscenario.add_done_callback(self._done.count_down)
 
     def result(self) -> ScenarioResult:
+        # Made only once, since dependent scenarios also see the result.
+        with self._lock:
+            if self._result is None:
+                self._result = self._make_result()
+            return self._result
+
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        self._done.add_done_callback(fn)
+
+    def context(self) -> Context:
+        return self._cases.context()
+
+    def _make_result(self) -> ScenarioResult:
         cases = self._cases.result()
+        ends = self._cases.finished_at()
+        if ends is not None:
+            self._profiler.record_span(self._label or "Scenario", "scenario", self._starts, ends)
         subscenarios = StatusedList.collect(s.result() for s in self._subscenarios)
         return ScenarioResult(
             label=self._label,
@@ -44,3 +94,69 @@ class RunningScenarioTask(ScenarioTask):
             cases=cases,
             subscenarios=subscenarios,
         )
+
+
+class DependentScenarioTask(ScenarioTask):
+    """
+    Submits a scenario when all the scenarios it depends on succeed,
+    with the contexts handed off from them.
+    The scenario is skipped when any of them does not succeed.
+    """
+
+    def __init__(
+        self,
+        label: Optional[str],
+        dependencies: List[ScenarioTask],
+        submit: Callable[[Context], ScenarioTask],
+    ):
+        """
+        Args:
+            label: The label of the scenario.
+            dependencies: The tasks of the scenarios depended on.
+            submit: The function to submit the scenario with the context handed off.
+        """
+        self._label = label
+        self._dependencies = dependencies
+        self._submit = submit
+        self._task: "Future[ScenarioTask]" = Future()
+        self._done = Countdown(1)
+
+        waiting = Countdown(len(dependencies))
+        for dependency in dependencies:
+            dependency.add_done_callback(waiting.count_down)
+        waiting.add_done_callback(self._start)
+
+    def result(self) -> ScenarioResult:
+        return self._task.result().result()
+
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        self._done.add_done_callback(fn)
+
+    def context(self) -> Context:
+        return self._task.result().context()
+
+    def _start(self) -> None:
+        try:
+            task = self._submit_after_dependencies()
+        except BaseException as error:
+            self._task.set_exception(error)
+            self._done.count_down()
+            return
+        self._task.set_result(task)
+        task.add_done_callback(self._done.count_down)
+
+    def _submit_after_dependencies(self) -> ScenarioTask:
+        context = Context()
+        for dependency in self._dependencies:
+            if not _is_successful(dependency):
+                return StaticScenarioTask(ScenarioResult(label=self._label))
+            context.update(dependency.context())
+        return self._submit(context)
+
+
+def _is_successful(task: ScenarioTask) -> bool:
+    try:
+        return task.result().status is Status.SUCCESS
+    except Exception:
+        # The error is raised by the task itself.
+        return False
@@ -1,14 +1,19 @@
+import time
 from abc import ABC, abstractmethod
-from concurrent.futures import Executor
-from typing import Iterable, Optional
-
-from requests import Session
+from concurrent.futures import Executor, Future
+from functools import partial
+from threading import Event, Lock
+from typing import Callable, Generic, Iterable, List, Optional, Tuple, TypeVar
 
 from preacher.core.context import Context
 from preacher.core.scenario.case import Case
 from preacher.core.scenario.case_result import CaseResult
 from preacher.core.scenario.case_runner import CaseRunner
-from preacher.core.status import StatusedList
+from preacher.core.scenario.util.dependency import resolve_dependencies, sort_topologically
+from preacher.core.scenario.util.forwarding import ExecutionEvent
+from preacher.core.status import Status, StatusedList
+
+T = TypeVar("T")
 
 
 class CasesTask(ABC):
@@ -16,16 +21,142 @@ class CasesTask(ABC):
     def result(self) -> StatusedList[CaseResult]:
         ...  # pragma: no cover
 
+    @abstractmethod
+    def finished_at(self) -> Optional[float]:
+        """
+        The time when all the cases finished in seconds since the epoch,
+        or ``None`` when not finished, cancelled or no case exists.
+        """
+
+    @abstractmethod
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        """Call the function when all the cases finish, or at once when they have finished."""
+
+    @abstractmethod
+    def context(self) -> Context:
+        """The context that the cases have stored values into, which is complete when done."""
+
+
+class Countdown:
+    """Calls the functions given by ``add_done_callback`` when counted down to zero."""
+
+    def __init__(self, count: int):
+        self._count = count
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = Lock()
+
+    def count_down(self, *_args) -> None:
+        with self._lock:
+            self._count -= 1
+            if self._count > 0:
+                return
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn()
+
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        with self._lock:
+            if self._count > 0:
+                self._callbacks.append(fn)
+                return
+        fn()
+
+
+class _ForwardingFuture(Generic[T]):
+    """
+    Wraps a future of a result with execution events, which are recorded in another process.
+    The events are forwarded as soon as the future is done.
+    A cancelled future results in what ``skip`` returns.
+    """
+
+    def __init__(
+        self,
+        future: "Future[Tuple[T, List[ExecutionEvent]]]",
+        runner: CaseRunner,
+        skip: Callable[[], T],
+    ):
+        self._future = future
+        self._runner = runner
+        self._skip = skip
+        self._forwarded = Event()
+        self._error: Optional[BaseException] = None
+        self.finished_at: Optional[float] = None
+        future.add_done_callback(self._forward)
+
+    def _forward(self, future: "Future[Tuple[T, List[ExecutionEvent]]]") -> None:
+        if future.cancelled():
+            self._forwarded.set()
+            return
+
+        self.finished_at = time.time()
+        try:
+            if future.exception() is None:
+                _, events = future.result()
+                self._runner.forward_events(events)
+        except BaseException as error:
+            self._error = error
+        finally:
+            self._forwarded.set()
+
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        # Called after forwarding, which is the first callback of the future.
+        self._future.add_done_callback(lambda _: fn())
+
+    def result(self) -> T:
+        # Waits for the events to be forwarded so that listeners get them before the results.
+        self._forwarded.wait()
+        if self._error is not None:
+            raise self._error
+        if self._future.cancelled():
+            return self._skip()
+        result, _ = self._future.result()
+        return result
+
+
+def _run_case(runner: CaseRunner, case: Case) -> Tuple[CaseResult, List[ExecutionEvent]]:
+    result = runner.run(case)
+    return result, runner.take_events()
+
+
+def _run_case_in_context(
+    runner: CaseRunner,
+    case: Case,
+    context: Context,
+) -> Tuple[Tuple[CaseResult, Context], List[ExecutionEvent]]:
+    result = runner.run(case, context=context)
+    return (result, context), runner.take_events()
+
+
+def _skip(case: Case) -> CaseResult:
+    return CaseResult(label=case.label)
+
+
+def _skip_in_context(case: Case, context: Context) -> Tuple[CaseResult, Context]:
+    return _skip(case), context
+
+
+def _skip_all(cases: Iterable[Case]) -> StatusedList[CaseResult]:
+    return StatusedList.collect(_skip(case) for case in cases)
+
+
+def _skip_all_in_context(
+    cases: Iterable[Case],
+    context: Context,
+) -> Tuple[StatusedList[CaseResult], Context]:
+    return _skip_all(cases), context
+
 
 def _run_cases_in_order(
     runner: CaseRunner,
     cases: Iterable[Case],
-    context: Optional[Context],
-) -> StatusedList[CaseResult]:
-    with Session() as session:
-        return StatusedList.collect(
+    context: Context,
+) -> Tuple[Tuple[StatusedList[CaseResult], Context], List[ExecutionEvent]]:
+    # The context is returned since it is a copy in another process.
+    with runner.session() as session:
+        results = StatusedList.collect(
             runner.run(case, session=session, context=context) for case in cases
         )
+    return (results, context), runner.take_events()
 
 
 class OrderedCasesTask(CasesTask):
@@ -36,15 +167,172 @@ class OrderedCasesTask(CasesTask):
         cases: Iterable[Case],
         context: Optional[Context] = None,
     ):
-        self._future = executor.submit(_run_cases_in_order, runner, cases, context)
+        cases = list(cases)
+        context = context if context is not None else Context()
+        future = executor.submit(_run_cases_in_order, runner, cases, context)
+        self._future = _ForwardingFuture(
+            future,
+            runner,
+            partial(_skip_all_in_context, cases, context),
+        )
 
     def result(self) -> StatusedList[CaseResult]:
-        return self._future.result()
+        results, _ = self._future.result()
+        return results
+
+    def finished_at(self) -> Optional[float]:
+        return self._future.finished_at
+
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        self._future.add_done_callback(fn)
+
+    def context(self) -> Context:
+        _, context = self._future.result()
+        return context
 
 
 class UnorderedCasesTask(CasesTask):
     def __init__(self, executor: Executor, runner: CaseRunner, cases: Iterable[Case]):
-        self._futures = [executor.submit(runner.run, case) for case in cases]
+        self._futures = [
+            _ForwardingFuture(
+                executor.submit(_run_case, runner, case),
+                runner,
+                partial(_skip, case),
+            )
+            for case in cases
+        ]
+        self._done = Countdown(len(self._futures))
+        for future in self._futures:
+            future.add_done_callback(self._done.count_down)
 
     def result(self) -> StatusedList[CaseResult]:
         return StatusedList.collect(f.result() for f in self._futures)
+
+    def finished_at(self) -> Optional[float]:
+        return _finished_at(f.finished_at for f in self._futures)
+
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        self._done.add_done_callback(fn)
+
+    def context(self) -> Context:
+        # Each case has its own context, which is not handed off.
+        return Context()
+
+
+class DependentCasesTask(CasesTask):
+    """
+    Runs each case as soon as all the cases it depends on succeed,
+    with the contexts handed off from them.
+    The cases depending on ones that do not succeed are skipped,
+    and so are the ones in dependency cycles.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        runner: CaseRunner,
+        cases: Iterable[Case],
+        context: Optional[Context] = None,
+    ):
+        self._executor = executor
+        self._runner = runner
+        self._cases = list(cases)
+        self._context = context if context is not None else Context()
+
+        self._dependencies = resolve_dependencies(
+            [case.label for case in self._cases],
+            [case.depends_on for case in self._cases],
+        )
+        self._dependents: List[List[int]] = [[] for _ in self._cases]
+        for index, dependencies in enumerate(self._dependencies):
+            for dependency in dependencies:
+                self._dependents[dependency].append(index)
+
+        self._lock = Lock()
+        self._waiting = [len(dependencies) for dependencies in self._dependencies]
+        self._blocked = [False] * len(self._cases)
+        self._futures: List[Optional[_ForwardingFuture]] = [None] * len(self._cases)
+        self._results: List["Future[Tuple[CaseResult, Context]]"] = [Future() for _ in self._cases]
+        self._done = Countdown(len(self._cases))
+
+        startable = set(sort_topologically(self._dependencies))
+        for index, case in enumerate(self._cases):
+            if index not in startable:
+                self._results[index].set_result((_skip(case), Context()))
+                self._done.count_down()
+
+        # Collected before starting, since starting can make dependents ready at once.
+        ready = [index for index, count in enumerate(self._waiting) if not count]
+        for index in ready:
+            self._start(index)
+
+    def result(self) -> StatusedList[CaseResult]:
+        return StatusedList.collect(future.result()[0] for future in self._results)
+
+    def finished_at(self) -> Optional[float]:
+        return _finished_at(f.finished_at if f else None for f in self._futures)
+
+    def add_done_callback(self, fn: Callable[[], None]) -> None:
+        self._done.add_done_callback(fn)
+
+    def context(self) -> Context:
+        context = Context(**self._context)
+        for future in self._results:
+            if future.exception() is None:
+                context.update(future.result()[1])
+        return context
+
+    def _start(self, index: int) -> None:
+        case = self._cases[index]
+        if self._blocked[index]:
+            self._results[index].set_result((_skip(case), Context()))
+            self._release(index, succeeded=False)
+            return
+
+        context = Context(**self._context)
+        for dependency in self._dependencies[index]:
+            context.update(self._results[dependency].result()[1])
+        try:
+            future = self._executor.submit(_run_case_in_context, self._runner, case, context)
+        except Exception as error:
+            self._results[index].set_exception(error)
+            self._release(index, succeeded=False)
+            return
+
+        forwarding = _ForwardingFuture(
+            future,
+            self._runner,
+            partial(_skip_in_context, case, context),
+        )
+        self._futures[index] = forwarding
+        forwarding.add_done_callback(partial(self._finish, index, forwarding))
+
+    def _finish(self, index: int, future: _ForwardingFuture[Tuple[CaseResult, Context]]) -> None:
+        try:
+            result = future.result()
+        except BaseException as error:
+            self._results[index].set_exception(error)
+            self._release(index, succeeded=False)
+            return
+        self._results[index].set_result(result)
+        self._release(index, succeeded=result[0].status is Status.SUCCESS)
+
+    def _release(self, index: int, succeeded: bool) -> None:
+        ready = []
+        with self._lock:
+            for dependent in self._dependents[index]:
+                if not succeeded:
+                    self._blocked[dependent] = True
+                self._waiting[dependent] -= 1
+                if not self._waiting[dependent]:
+                    ready.append(dependent)
+        for dependent in ready:
+            self._start(dependent)
+        self._done.count_down()
+
+
+def _finished_at(times: Iterable[Optional[float]]) -> Optional[float]:
+    times = list(times)
+    if not times or None in times:
+        return None
+    return max(t for t in times if t is not None)
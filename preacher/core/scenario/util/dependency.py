@@ -0,0 +1,58 @@
+"""Dependencies among cases or scenarios, which refer to each other by labels."""
+
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Sequence
+
+
+def resolve_dependencies(
+    labels: Sequence[Optional[str]],
+    depends_on: Sequence[Iterable[str]],
+) -> List[List[int]]:
+    """
+    Resolve the labels that items depend on into the indices of the items with those labels.
+    An item depends on all the items with a label.
+    Unknown labels and the items themselves are ignored.
+
+    Returns:
+        The indices that each item depends on in ascending order.
+    """
+    indices: Dict[str, List[int]] = {}
+    for index, label in enumerate(labels):
+        if label is not None:
+            indices.setdefault(label, []).append(index)
+
+    return [
+        sorted(
+            {
+                dependency
+                for label in item_depends_on
+                for dependency in indices.get(label, ())
+                if dependency != index
+            }
+        )
+        for index, item_depends_on in enumerate(depends_on)
+    ]
+
+
+def sort_topologically(dependencies: Sequence[Sequence[int]]) -> List[int]:
+    """
+    Sort the indices of items so that each item comes after the ones it depends on,
+    keeping the original order as much as possible.
+    The items in cycles and the ones depending on them are left out, since they can never start.
+    """
+    waiting = [len(indices) for indices in dependencies]
+    dependents: List[List[int]] = [[] for _ in dependencies]
+    for index, indices in enumerate(dependencies):
+        for dependency in indices:
+            dependents[dependency].append(index)
+
+    ready: Deque[int] = deque(index for index, count in enumerate(waiting) if not count)
+    order: List[int] = []
+    while ready:
+        index = ready.popleft()
+        order.append(index)
+        for dependent in dependents[index]:
+            waiting[dependent] -= 1
+            if not waiting[dependent]:
+                ready.append(dependent)
+    return order
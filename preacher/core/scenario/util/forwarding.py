@@ -0,0 +1,94 @@
+"""
+Forwarding of listener events from worker processes.
+
+Events are recorded in workers and forwarded to the original listener along with results,
+where responses are replaced by compact snapshots.
+"""
+
+import codecs
+from typing import List, Mapping, Optional, Tuple
+
+from requests.structures import CaseInsensitiveDict
+
+from preacher.core.request import ExecutionReport, Response, ResponseBody
+from preacher.core.scenario.case_listener import CaseListener
+
+ExecutionEvent = Tuple[ExecutionReport, Optional[Response]]
+
+
+class ResponseBodySnapshot(ResponseBody):
+    def __init__(self, body: ResponseBody):
+        self._content = body.content
+        self._encoding = body.encoding
+        # The text is not held when it is decoded from the content as UTF-8, which is usual.
+        self._text = None if _is_utf8(self._encoding) else body.text
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            return self._content.decode("utf-8", errors="replace")
+        return self._text
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+    @property
+    def encoding(self) -> Optional[str]:
+        return self._encoding
+
+
+class ResponseSnapshot(Response):
+    """A response that holds only values, which is cheap to be pickled."""
+
+    def __init__(self, response: Response):
+        self._id = response.id
+        self._elapsed = response.elapsed
+        self._status_code = response.status_code
+        self._headers = CaseInsensitiveDict(response.headers)
+        self._body = ResponseBodySnapshot(response.body)
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    @property
+    def status_code(self) -> int:
+        return self._status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._headers
+
+    @property
+    def body(self) -> ResponseBody:
+        return self._body
+
+
+class EventRecorder(CaseListener):
+    """Records execution events in a worker process to forward them later."""
+
+    def __init__(self):
+        self._events: List[ExecutionEvent] = []
+
+    def on_execution(self, execution: ExecutionReport, response: Optional[Response]) -> None:
+        snapshot = None if response is None else ResponseSnapshot(response)
+        self._events.append((execution, snapshot))
+
+    def take(self) -> List[ExecutionEvent]:
+        """Take the recorded events, which are cleared."""
+        events, self._events = self._events, []
+        return events
+
+
+def _is_utf8(encoding: Optional[str]) -> bool:
+    if encoding is None:
+        return False
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
@@ -1,10 +1,14 @@
+from preacher.core.scheduling.background import BackgroundListener
 from preacher.core.scheduling.factory import create_scheduler
 from preacher.core.scheduling.listener import Listener, MergingListener
+from preacher.core.scheduling.profiling import ProfilingListener
 from preacher.core.scheduling.scenario_scheduler import ScenarioScheduler
 
 __all__ = [
     "ScenarioScheduler",
     "Listener",
     "MergingListener",
+    "BackgroundListener",
+    "ProfilingListener",
     "create_scheduler",
 ]
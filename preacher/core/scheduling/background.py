@@ -0,0 +1,110 @@
+from queue import Queue
+from threading import Lock, Thread
+from typing import Any, Callable, Optional, Tuple
+
+from preacher.core.request import Response, ExecutionReport
+from preacher.core.scenario import ScenarioResult
+from preacher.core.status import Status
+from .listener import Listener
+
+DEFAULT_MAX_QUEUE_SIZE = 256
+
+_Event = Tuple[Callable[..., None], Tuple[Any, ...]]
+_END = None
+
+
+class BackgroundListener(Listener):
+    """
+    Delegates events to another listener on a dedicated thread,
+    so that slow listeners like report writers do not block workers.
+    Callers wait only when the queue is full.
+    Queued events are all handled before ``on_end`` is delegated.
+    Copies made by pickling, which run in other processes, delegate events synchronously.
+    """
+
+    def __init__(self, listener: Listener, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
+        """
+        Args:
+            listener: The listener to delegate events.
+            max_queue_size: The max number of events waiting to be delegated.
+        """
+        self._listener = listener
+        self._max_queue_size = max_queue_size
+        self._synchronous = False
+
+        self._lock = Lock()
+        self._queue: Optional["Queue[Optional[_Event]]"] = None
+        self._thread: Optional[Thread] = None
+        self._error: Optional[BaseException] = None
+
+    def on_execution(self, execution: ExecutionReport, response: Optional[Response]) -> None:
+        self._put(self._listener.on_execution, execution, response)
+
+    def on_scenario(self, result: ScenarioResult) -> None:
+        self._put(self._listener.on_scenario, result)
+
+    def on_end(self, status: Status) -> None:
+        self.flush()
+        self._listener.on_end(status)
+
+    def close(self) -> None:
+        self.flush()
+        self._listener.close()
+
+    def flush(self) -> None:
+        """
+        Wait for all the queued events to be handled.
+
+        Raises:
+            BaseException: The first error raised by the delegated listener since the last flush.
+        """
+        with self._lock:
+            queue, thread = self._queue, self._thread
+            self._queue, self._thread = None, None
+        if queue is not None and thread is not None:
+            queue.put(_END)
+            thread.join()
+
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _put(self, func: Callable[..., None], *args: Any) -> None:
+        if self._synchronous:
+            func(*args)
+            return
+        # Put while locked so that no event is put after the end of a flushed queue.
+        with self._lock:
+            self._start().put((func, args))
+
+    def _start(self) -> "Queue[Optional[_Event]]":
+        if self._queue is None:
+            self._queue = Queue(self._max_queue_size)
+            self._thread = Thread(
+                target=self._drain,
+                args=(self._queue,),
+                name="preacher-listener",
+                daemon=True,
+            )
+            self._thread.start()
+        return self._queue
+
+    def _drain(self, queue: "Queue[Optional[_Event]]") -> None:
+        while True:
+            event = queue.get()
+            if event is _END:
+                return
+            func, args = event
+            try:
+                func(*args)
+            except BaseException as error:
+                # Keeps draining not to block the callers.
+                if self._error is None:
+                    self._error = error
+
+    def __getstate__(self) -> dict:
+        return {"listener": self._listener, "max_queue_size": self._max_queue_size}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["listener"], state["max_queue_size"])  # type: ignore
+        self._synchronous = True
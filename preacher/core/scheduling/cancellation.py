@@ -0,0 +1,51 @@
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Set
+
+
+class CancellableExecutor(Executor):
+    """
+    Wraps an executor to cancel the tasks that have not started yet.
+    Running tasks are not interrupted, and tasks submitted after cancelling are cancelled at once.
+    """
+
+    def __init__(self, executor: Executor):
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._futures: Set[Future] = set()
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def submit(self, __fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "Future[Any]":
+        with self._lock:
+            if self._cancelled:
+                future: Future = Future()
+                future.cancel()
+                return future
+            future = self._executor.submit(__fn, *args, **kwargs)
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def cancel(self) -> None:
+        """Cancel the tasks waiting to start and the ones to be submitted."""
+        with self._lock:
+            self._cancelled = True
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    def reset(self) -> None:
+        """Accept tasks again after cancelling."""
+        with self._lock:
+            self._cancelled = False
+
+    def shutdown(self, wait: bool = True, **kwargs: Any) -> None:
+        self._executor.shutdown(wait, **kwargs)
+
+    def _discard(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
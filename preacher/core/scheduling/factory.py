@@ -1,9 +1,11 @@
 from concurrent.futures import Executor
 from typing import Optional
 
+from preacher.core.profiling import Profiler
 from preacher.core.request import Requester
-from preacher.core.scenario import CaseRunner, ScenarioRunner
+from preacher.core.scenario import CaseRunner, ResultCompactor, ScenarioRunner
 from preacher.core.unit import UnitRunner
+from .cancellation import CancellableExecutor
 from .listener import Listener
 from .scenario_scheduler import ScenarioScheduler
 
@@ -15,9 +17,28 @@ def create_scheduler(
     retry: int = 0,
     delay: float = 0.1,
     listener: Optional[Listener] = None,
+    compactor: Optional[ResultCompactor] = None,
+    profiler: Optional[Profiler] = None,
+    keep_sessions: bool = False,
+    max_failures: Optional[int] = None,
+    deadline: Optional[float] = None,
+    window: Optional[int] = None,
 ) -> ScenarioScheduler:
-    requester = Requester(base_url=base_url, timeout=timeout)
-    unit_runner = UnitRunner(requester=requester, retry=retry, delay=delay)
-    case_runner = CaseRunner(unit_runner=unit_runner, listener=listener)
-    runner = ScenarioRunner(executor=executor, case_runner=case_runner)
-    return ScenarioScheduler(runner=runner, listener=listener)
+    cancellable = None
+    if max_failures is not None or deadline is not None:
+        cancellable = CancellableExecutor(executor)
+        executor = cancellable
+
+    requester = Requester(base_url=base_url, timeout=timeout, keep_sessions=keep_sessions)
+    unit_runner = UnitRunner(requester=requester, retry=retry, delay=delay, profiler=profiler)
+    case_runner = CaseRunner(unit_runner=unit_runner, listener=listener, profiler=profiler)
+    runner = ScenarioRunner(executor=executor, case_runner=case_runner, profiler=profiler)
+    return ScenarioScheduler(
+        runner=runner,
+        listener=listener,
+        compactor=compactor,
+        executor=cancellable,
+        max_failures=max_failures,
+        deadline=deadline,
+        window=window,
+    )
@@ -17,6 +17,9 @@ class Listener(CaseListener):
     def on_scenario(self, result: ScenarioResult) -> None:
         pass
 
+    def close(self) -> None:
+        """Release the resources held over runs, after which no event is given."""
+
 
 class MergingListener(Listener):
     def __init__(self):
@@ -36,3 +39,7 @@ class MergingListener(Listener):
     def on_end(self, status: Status) -> None:
         for listener in self._listeners:
             listener.on_end(status)
+
+    def close(self) -> None:
+        for listener in self._listeners:
+            listener.close()
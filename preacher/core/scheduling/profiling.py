@@ -0,0 +1,30 @@
+from typing import Optional
+
+from preacher.core.profiling import PHASE_REPORT, Profiler
+from preacher.core.request import Response, ExecutionReport
+from preacher.core.scenario import ScenarioResult
+from preacher.core.status import Status
+from .listener import Listener
+
+
+class ProfilingListener(Listener):
+    """Delegates events to another listener, which is profiled as the reporting phase."""
+
+    def __init__(self, listener: Listener, profiler: Profiler):
+        self._listener = listener
+        self._profiler = profiler
+
+    def on_execution(self, execution: ExecutionReport, response: Optional[Response]) -> None:
+        with self._profiler.phase(PHASE_REPORT):
+            self._listener.on_execution(execution, response)
+
+    def on_scenario(self, result: ScenarioResult) -> None:
+        with self._profiler.phase(PHASE_REPORT):
+            self._listener.on_scenario(result)
+
+    def on_end(self, status: Status) -> None:
+        with self._profiler.phase(PHASE_REPORT):
+            self._listener.on_end(status)
+
+    def close(self) -> None:
+        self._listener.close()
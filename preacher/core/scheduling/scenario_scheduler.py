@@ -1,18 +1,47 @@
-from typing import Iterable, Iterator, Optional
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterable, Iterator, Optional
 
 from preacher.core.scenario import Scenario
 from preacher.core.scenario import ScenarioRunner
+from preacher.core.scenario import ResultCompactor
 from preacher.core.scenario import ScenarioResult
 from preacher.core.scenario import ScenarioTask
 from preacher.core.scenario.scenario_task import StaticScenarioTask
 from preacher.core.status import Status
+from .cancellation import CancellableExecutor
 from .listener import Listener
 
 
 class ScenarioScheduler:
-    def __init__(self, runner: ScenarioRunner, listener: Optional[Listener] = None):
+    def __init__(
+        self,
+        runner: ScenarioRunner,
+        listener: Optional[Listener] = None,
+        compactor: Optional[ResultCompactor] = None,
+        executor: Optional[CancellableExecutor] = None,
+        max_failures: Optional[int] = None,
+        deadline: Optional[float] = None,
+        window: Optional[int] = None,
+    ):
+        """
+        Args:
+            executor: The executor of the runner to cancel scenarios that have not started.
+                Cancelled scenarios are reported as skipped.
+            max_failures: The number of failed scenarios to cancel the rest after.
+            deadline: The time limit of each run in seconds to cancel the rest after.
+            window: The max number of scenarios submitted and not reported yet.
+                The next scenario is taken only after the oldest one is reported,
+                so that streamed scenarios are not all held at once. Unlimited when ``None``.
+        """
         self._runner = runner
         self._listener = listener or Listener()
+        self._compactor = compactor
+        self._executor = executor
+        self._max_failures = max_failures
+        self._deadline = deadline
+        self._window = window
 
     def run(self, scenarios: Iterable[Scenario]) -> Status:
         """
@@ -24,17 +53,56 @@ class ScenarioScheduler:
         Returns:
             The execution status.
         """
-        tasks = self._submit_all(scenarios)
-        results = (task.result() for task in list(tasks))
+        if self._executor:
+            self._executor.reset()
 
-        status = Status.SKIPPED
-        for result in results:
-            status = status.merge(result.status)
-            self._listener.on_scenario(result)
+        with self._cancelling_at_deadline():
+            status = Status.SKIPPED
+            failures = 0
+            for result in self._results(scenarios):
+                status = status.merge(result.status)
+                if not result.status.is_succeeded:
+                    failures += 1
+                    self._cancel_on_failures(failures)
+                self._listener.on_scenario(result)
 
         self._listener.on_end(status)
         return status
 
+    def _results(self, scenarios: Iterable[Scenario]) -> Iterator[ScenarioResult]:
+        # Tasks are released one by one not to hold all the results until the end.
+        tasks: Deque[ScenarioTask] = deque()
+        for task in self._submit_all(scenarios):
+            tasks.append(task)
+            if self._window is not None and len(tasks) >= self._window:
+                yield self._result(tasks.popleft())
+        while tasks:
+            yield self._result(tasks.popleft())
+
+    def _result(self, task: ScenarioTask) -> ScenarioResult:
+        result = task.result()
+        if self._compactor:
+            result = self._compactor.compact(result)
+        return result
+
+    def _cancel_on_failures(self, failures: int) -> None:
+        if self._executor and self._max_failures and failures >= self._max_failures:
+            self._executor.cancel()
+
+    @contextmanager
+    def _cancelling_at_deadline(self) -> Iterator[None]:
+        if not self._executor or self._deadline is None:
+            yield
+            return
+
+        timer = threading.Timer(self._deadline, self._executor.cancel)
+        timer.daemon = True
+        timer.start()
+        try:
+            yield
+        finally:
+            timer.cancel()
+
     def _submit_all(self, scenarios: Iterable[Scenario]) -> Iterator[ScenarioTask]:
         iterator = iter(scenarios)
         while True:
@@ -6,9 +6,11 @@ from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import reduce
+from operator import attrgetter
 from typing import Generic, List, TypeVar
 
+from preacher.core.util.slots import slotted
+
 
 class Status(Enum):
 
@@ -23,7 +25,7 @@ class Status(Enum):
         return self.value <= Status.SUCCESS.value
 
     def merge(self, other: Status):
-        return max(self, other, key=lambda status: status.value)
+        return self if self.value >= other.value else other
 
     def __str__(self) -> str:
         return self.name
@@ -35,11 +37,17 @@ class Status(Enum):
         return self.is_succeeded
 
 
+_PRIORITY = attrgetter("value")
+
+
 def merge_statuses(statuses: Iterable[Status]) -> Status:
-    return reduce(lambda lhs, rhs: lhs.merge(rhs), statuses, Status.SKIPPED)
+    # Merges the integer priorities instead of merging the statuses one by one.
+    return Status(max(map(_PRIORITY, statuses), default=Status.SKIPPED.value))
 
 
 class Statused(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def status(self) -> Status:
@@ -49,13 +57,19 @@ class Statused(ABC):
 StatusedType = TypeVar("StatusedType", bound=Statused)
 
 
+@slotted
 @dataclass(frozen=True)
 class StatusedList(Generic[StatusedType], Statused):
     items: List[StatusedType] = field(default_factory=list)
+    _status: Status = field(init=False, repr=False, compare=False, default=Status.SKIPPED)
+
+    def __post_init__(self) -> None:
+        # The status is computed only once, since items are not changed after construction.
+        object.__setattr__(self, "_status", merge_statuses(item.status for item in self.items))
 
     @property
-    def status(self) -> Status:  # HACK: should be cached
-        return merge_statuses(item.status for item in self.items)
+    def status(self) -> Status:
+        return self._status
 
     @staticmethod
     def collect(
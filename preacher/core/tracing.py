@@ -0,0 +1,154 @@
+"""
+Tracing of runs in the Chrome trace event format,
+which can be loaded into trace viewers like Perfetto and ``chrome://tracing``.
+
+Phases and spans are traced on a lane for each process and thread.
+Spans recorded afterwards, like scenarios, are traced as asynchronous ones,
+which can overlap others.
+"""
+
+import json
+import os
+import threading
+import time
+from glob import escape, glob
+from itertools import count
+from multiprocessing.util import Finalize
+from typing import ContextManager, Dict, List, Optional
+
+from .profiling import Profiler
+
+Event = Dict[str, object]
+
+CATEGORY_PHASE = "phase"
+
+
+class Tracer(Profiler):
+    """
+    Traces phases and spans, which are dumped into a directory for each process.
+    Copies in other processes trace on their own and dump when the processes exit.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: The directory to dump events into, which is created if not exists.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._pid = os.getpid()
+        self._events: List[Event] = []
+        self._threads: Dict[int, str] = {}
+        self._ids = count()
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def phase(self, name: str) -> ContextManager[None]:
+        return _Span(self, name, CATEGORY_PHASE, {})
+
+    def span(self, name: str, category: str, **args: object) -> ContextManager[None]:
+        return _Span(self, name, category, args)
+
+    def record_span(
+        self,
+        name: str,
+        category: str,
+        starts: float,
+        ends: float,
+        **args: object,
+    ) -> None:
+        event = self._event(name, category, starts)
+        event["id"] = next(self._ids)
+        self._events.append(dict(event, ph="b", args=args))
+        self._events.append(dict(event, ph="e", ts=_microseconds(ends)))
+
+    def dump(self) -> None:
+        events, self._events = self._events, []
+        threads, self._threads = self._threads, {}
+        if not events:
+            return
+
+        events.append(_metadata("process_name", self._pid, 0, f"preacher ({self._pid})"))
+        events.extend(
+            _metadata("thread_name", self._pid, thread, name) for thread, name in threads.items()
+        )
+        path = os.path.join(self._directory, f"{self._pid}-{time.time_ns()}.json")
+        with open(path, "w") as f:
+            json.dump(events, f, separators=(",", ":"))
+
+    def _event(self, name: str, category: str, starts: float) -> Event:
+        thread = threading.current_thread()
+        self._threads[thread.ident or 0] = thread.name
+        return {
+            "name": name,
+            "cat": category,
+            "ts": _microseconds(starts),
+            "pid": self._pid,
+            "tid": thread.ident or 0,
+        }
+
+    def __reduce__(self) -> tuple:
+        return _get_tracer, (self._directory,)
+
+
+class _Span(ContextManager[None]):
+    def __init__(self, tracer: Tracer, name: str, category: str, args: Dict[str, object]):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._starts = 0.0
+
+    def __enter__(self) -> None:
+        self._starts = time.time()
+
+    def __exit__(self, *args) -> None:
+        ends = time.time()
+        event = self._tracer._event(self._name, self._category, self._starts)
+        event["ph"] = "X"
+        event["dur"] = _microseconds(ends) - _microseconds(self._starts)
+        if self._args:
+            event["args"] = self._args
+        self._tracer._events.append(event)
+
+
+_TRACERS: Dict[str, Tracer] = {}
+
+
+def _get_tracer(directory: str) -> Tracer:
+    # Copies share a tracer in each process, which dumps when the process exits.
+    tracer = _TRACERS.get(directory)
+    if tracer is None or tracer._pid != os.getpid():
+        tracer = Tracer(directory)
+        _TRACERS[directory] = tracer
+        Finalize(tracer, tracer.dump, exitpriority=0)
+    return tracer
+
+
+def write_trace(directory: str, path: str, metadata: Optional[Dict[str, object]] = None) -> None:
+    """
+    Write a trace file of the events dumped by all processes.
+
+    Args:
+        directory: The directory where events are dumped.
+        path: The trace file path.
+        metadata: Metadata of the trace.
+    """
+    events: List[Event] = []
+    for dumped in sorted(glob(os.path.join(escape(directory), "*.json"))):
+        with open(dumped) as f:
+            events.extend(json.load(f))
+
+    trace = {"traceEvents": events, "displayTimeUnit": "ms", "otherData": metadata or {}}
+    with open(path, "w") as f:
+        json.dump(trace, f, separators=(",", ":"))
+
+
+def _metadata(name: str, pid: int, tid: int, value: str) -> Event:
+    return {"name": name, "ph": "M", "pid": pid, "tid": tid, "args": {"name": value}}
+
+
+def _microseconds(seconds: float) -> int:
+    return int(seconds * 1_000_000)
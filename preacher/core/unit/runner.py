@@ -1,11 +1,14 @@
 """An executor."""
 
+from dataclasses import replace
 from functools import partial
-from typing import Optional, Tuple
+from itertools import count
+from typing import ContextManager, Iterator, Optional, Tuple
 
 import requests
 
 from preacher.core.context import Context, closed_context
+from preacher.core.profiling import PHASE_EXECUTE, PHASE_VERIFY, Profiler
 from preacher.core.request import Request, Response, Requester, ExecutionReport
 from preacher.core.scenario.util.retry import retry_while_false
 from preacher.core.verification import ResponseDescription, ResponseVerification
@@ -23,18 +26,28 @@ def predicate(result: Result) -> bool:
 
 
 class UnitRunner:
-    def __init__(self, requester: Requester, retry: int = 0, delay: float = 0.1):
+    def __init__(
+        self,
+        requester: Requester,
+        retry: int = 0,
+        delay: float = 0.1,
+        profiler: Optional[Profiler] = None,
+    ):
         if retry < 0:
             raise ValueError(f"`retry` must be zero or positive, given {retry}")
 
         self._requester = requester
         self._retry = retry
         self._delay = delay
+        self._profiler = profiler or Profiler()
 
     @property
     def base_url(self) -> str:
         return self._requester.base_url
 
+    def session(self) -> ContextManager[requests.Session]:
+        return self._requester.session()
+
     def run(
         self,
         request: Request,
@@ -43,13 +56,22 @@ class UnitRunner:
         context: Optional[Context] = None,
     ) -> Result:
         context = context if context is not None else Context()
+        attempts = count(1)
         return retry_while_false(
-            partial(self._execute, request, requirements, session, context),
+            partial(self._attempt, attempts, request, requirements, session, context),
             attempts=self._retry + 1,
             delay=self._delay,
             predicate=predicate,
         )
 
+    def _attempt(self, attempts: Iterator[int], *args) -> Result:
+        attempt = next(attempts)
+        with self._profiler.span(f"Attempt {attempt}", "attempt"):
+            execution, response, verification = self._execute(*args)
+        if attempt > 1:
+            execution = replace(execution, attempts=attempt)
+        return execution, response, verification
+
     def _execute(
         self,
         request: Request,
@@ -57,11 +79,14 @@ class UnitRunner:
         session: Optional[requests.Session],
         context: Context,
     ) -> Result:
-        execution, response = self._requester.execute(request, session=session, context=context)
+        with self._profiler.phase(PHASE_EXECUTE):
+            execution, response = self._requester.execute(
+                request, session=session, context=context
+            )
         if not response:
             return execution, None, None
 
-        with closed_context(context, starts=execution.starts):
+        with self._profiler.phase(PHASE_VERIFY), closed_context(context, starts=execution.starts):
             verification = requirements.verify(response, context)
 
         return execution, response, verification
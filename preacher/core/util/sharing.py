@@ -0,0 +1,40 @@
+"""
+Objects shared with forked processes.
+
+Forked processes have copies of the objects that exist in the parent before forking,
+so shared objects are pickled into references to them instead of their whole object graphs.
+"""
+
+from typing import Any, Dict
+
+_SHARED: Dict[int, object] = {}
+
+
+def share(obj: "Shareable") -> None:
+    """
+    Share an object with processes forked later.
+    Processes forked before sharing or not forked cannot unpickle it.
+    """
+    _SHARED[id(obj)] = obj
+
+
+def unshare_all() -> None:
+    """Stop sharing all the objects, which can be collected then."""
+    _SHARED.clear()
+
+
+def is_shared(obj: object) -> bool:
+    return _SHARED.get(id(obj)) is obj
+
+
+class Shareable:
+    """An object that is pickled into a reference when shared."""
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        if is_shared(self):
+            return _resolve, (id(self),)
+        return super().__reduce_ex__(protocol)
+
+
+def _resolve(key: int) -> object:
+    return _SHARED[key]
@@ -0,0 +1,96 @@
+"""Slotted dataclasses, which is available as ``dataclass(slots=True)`` only since Python 3.10."""
+
+from dataclasses import MISSING, Field, fields, is_dataclass
+from typing import Any, Dict, Tuple, Type, TypeVar, cast
+
+T = TypeVar("T")
+
+_Fields = Tuple[Tuple[Field, ...], Tuple[Field, ...]]
+_FIELDS: Dict[type, _Fields] = {}
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """
+    Recreate a dataclass with ``__slots__``, which saves the memory for each instance.
+    Frozen dataclasses can also be pickled into compact data,
+    which holds only the values given on construction, and omits trailing default values.
+    After unpickled, ``__post_init__`` is called again if defined
+    to restore the values computed on construction.
+
+    Args:
+        cls: A dataclass, whose base classes should define ``__slots__``.
+    Returns:
+        The slotted dataclass.
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"Must be a dataclass: {cls}")
+
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)  # Remove the default values, which conflict with slots.
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__getstate__"] = _getstate
+    cls_dict["__setstate__"] = _setstate
+
+    metaclass: type = type(cls)
+    slotted_cls = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return cast(Type[T], slotted_cls)
+
+
+def _getstate(self) -> tuple:
+    state_fields, _ = _fields_of(type(self))
+    values = [getattr(self, f.name) for f in state_fields]
+    size = len(values)
+    while size > 1 and _is_default(values[size - 1], state_fields[size - 1]):
+        size -= 1
+    return tuple(values[:size])
+
+
+def _setstate(self, state: tuple) -> None:
+    # Frozen dataclasses reject ``setattr``.
+    state_fields, derived_fields = _fields_of(type(self))
+    for f, value in zip(state_fields, state):
+        object.__setattr__(self, f.name, value)
+    given = len(state)
+    for f in state_fields[given:]:
+        object.__setattr__(self, f.name, f.default)
+    for f in derived_fields:
+        default = _default_of(f)
+        if default is not MISSING:
+            object.__setattr__(self, f.name, default)
+
+    post_init = getattr(self, "__post_init__", None)
+    if post_init:
+        post_init()
+
+
+def _fields_of(cls: type) -> _Fields:
+    """Returns the fields given on construction and the others, which are derived."""
+    cached = _FIELDS.get(cls)
+    if cached is None:
+        all_fields = fields(cls)
+        cached = (
+            tuple(f for f in all_fields if f.init),
+            tuple(f for f in all_fields if not f.init),
+        )
+        _FIELDS[cls] = cached
+    return cached
+
+
+def _is_default(value: Any, f: Field) -> bool:
+    default = f.default
+    if default is MISSING:
+        return False
+    return value is default or (type(value) is type(default) and value == default)
+
+
+def _default_of(f: Field) -> Any:
+    if f.default is not MISSING:
+        return f.default
+    if f.default_factory is not MISSING:  # type: ignore
+        return f.default_factory()  # type: ignore
+    return MISSING
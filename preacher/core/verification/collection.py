@@ -0,0 +1,352 @@
+"""
+Hamcrest matchers for collections, which evaluate items in bulk.
+
+Items of large homogeneous boolean, integer, float or string collections are compared
+as NumPy arrays when NumPy is available. Otherwise, and for other items,
+they are tested by native loops (see :mod:`preacher.core.verification.native`).
+"""
+
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from hamcrest.core.base_matcher import BaseMatcher
+from hamcrest.core.core.allof import AllOf
+from hamcrest.core.core.anyof import AnyOf
+from hamcrest.core.core.is_ import Is
+from hamcrest.core.core.isanything import IsAnything
+from hamcrest.core.core.isequal import IsEqual
+from hamcrest.core.core.isnot import IsNot
+from hamcrest.core.description import Description
+from hamcrest.core.matcher import Matcher
+from hamcrest.library.number.ordering_comparison import OrderingComparison
+
+from .native import NativeTest, compile_native
+
+BULK_MIN_SIZE = 64
+"""Collections smaller than this are tested by native loops, which are faster for them."""
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+_FLOAT_EXACT_INT_MAX = 2**53
+_BULK_COMPARISONS = (operator.lt, operator.le, operator.gt, operator.ge)
+
+BulkTest = Callable[[Any], Any]
+
+
+@lru_cache(maxsize=None)
+def _load_numpy() -> Any:
+    try:
+        import numpy
+
+        return numpy
+    except ImportError:  # pragma: no cover
+        return None
+
+
+def _to_array(items: List[Any]) -> Optional[Tuple[Any, str]]:
+    """Returns a NumPy array and its kind only when it is equivalent to the items."""
+    numpy = _load_numpy()
+    if numpy is None or len(items) < BULK_MIN_SIZE:
+        return None
+
+    types = set(map(type, items))
+    if types == {bool}:
+        return numpy.array(items, dtype=bool), "b"
+    if types == {int}:
+        try:
+            return numpy.array(items, dtype=numpy.int64), "i"
+        except OverflowError:
+            return None
+    if types == {float}:
+        return numpy.array(items, dtype=numpy.float64), "f"
+    if types == {str} and "\0" not in "".join(items):  # NumPy strips trailing NULs.
+        return numpy.array(items, dtype=str), "U"
+    return None
+
+
+def _is_compatible(value: Any, kind: str) -> bool:
+    tp = type(value)
+    if kind == "b":
+        return tp is bool
+    if kind == "i":
+        return tp is int and _INT64_MIN <= value <= _INT64_MAX
+    if kind == "f":
+        return tp is float or (tp is int and abs(value) <= _FLOAT_EXACT_INT_MAX)
+    if kind == "U":
+        return tp is str and "\0" not in value
+    return False
+
+
+def _compile_bulk(matcher: Any, kind: str) -> Optional[BulkTest]:
+    """Returns an element-wise test on arrays equivalent to the matcher if possible."""
+    tp = type(matcher)
+    if tp is IsEqual:
+        return _compile_bulk_equal(matcher, kind)
+    if tp is OrderingComparison:
+        return _compile_bulk_ordering(matcher, kind)
+    if tp is Is:
+        return _compile_bulk(matcher.matcher, kind)
+    if tp is IsNot:
+        return _compile_bulk_not(matcher, kind)
+    if tp is IsAnything:
+        return lambda array: _load_numpy().ones(len(array), dtype=bool)
+    if tp is AllOf or tp is AnyOf:
+        return _compile_bulk_logical(matcher, kind)
+    return None
+
+
+def _compile_bulk_equal(matcher: IsEqual, kind: str) -> Optional[BulkTest]:
+    expected = matcher.object
+    if not _is_compatible(expected, kind):
+        return None
+    return lambda array: array == expected
+
+
+def _compile_bulk_ordering(matcher: OrderingComparison, kind: str) -> Optional[BulkTest]:
+    compare = matcher.comparison_function
+    value = matcher.value
+    if compare not in _BULK_COMPARISONS or not _is_compatible(value, kind):
+        return None
+    return lambda array: compare(array, value)
+
+
+def _compile_bulk_not(matcher: IsNot, kind: str) -> Optional[BulkTest]:
+    inner = _compile_bulk(matcher.matcher, kind)
+    if inner is None:
+        return None
+    return lambda array: ~inner(array)
+
+
+def _compile_bulk_logical(matcher: Any, kind: str) -> Optional[BulkTest]:
+    inners: List[BulkTest] = []
+    for inner_matcher in matcher.matchers:
+        inner = _compile_bulk(inner_matcher, kind)
+        if inner is None:
+            return None
+        inners.append(inner)
+    if not inners:
+        return None
+
+    numpy = _load_numpy()
+    reduce = numpy.logical_and.reduce if type(matcher) is AllOf else numpy.logical_or.reduce
+    return lambda array: reduce([inner(array) for inner in inners])
+
+
+def _to_list(item: Any) -> Optional[List[Any]]:
+    try:
+        return list(item)
+    except TypeError:  # not a collection
+        return None
+
+
+class _ItemsMatcher(BaseMatcher):
+    """Tests all items of a collection with an item matcher."""
+
+    _REPORTED_RESULT = False
+    """The result for an item to be reported on a mismatch."""
+
+    def __init__(self, item_matcher: Matcher):
+        self.item_matcher = item_matcher
+        self._native: Optional[NativeTest] = None
+        self._bulk: Dict[str, Optional[BulkTest]] = {}
+
+    def _test_all(self, items: List[Any]) -> List[bool]:
+        """Returns whether each of the items matches the item matcher."""
+        array = _to_array(items)
+        if array is not None:
+            values, kind = array
+            if kind not in self._bulk:
+                self._bulk[kind] = _compile_bulk(self.item_matcher, kind)
+            bulk = self._bulk[kind]
+            if bulk is not None:
+                return bulk(values).tolist()
+
+        if self._native is None:
+            self._native = compile_native(self.item_matcher)
+        return [bool(result) for result in map(self._native, items)]
+
+    def describe_mismatch(self, item: object, mismatch_description: Description) -> None:
+        items = _to_list(item)
+        results = [] if items is None else self._test_all(items)
+        idx = next((i for (i, r) in enumerate(results) if r is self._REPORTED_RESULT), None)
+        if items is None or idx is None:
+            super().describe_mismatch(item, mismatch_description)
+            return
+
+        mismatch_description.append_text(f"item at index {idx} ")
+        if self._REPORTED_RESULT:
+            mismatch_description.append_text("matched: ").append_description_of(items[idx])
+        else:
+            self.item_matcher.describe_mismatch(items[idx], mismatch_description)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_native"] = None
+        state["_bulk"] = {}
+        return state
+
+
+class _EveryItem(_ItemsMatcher):
+    def _matches(self, item: object) -> bool:
+        items = _to_list(item)
+        if items is None:
+            return False
+        return all(self._test_all(items))
+
+    def describe_to(self, description: Description) -> None:
+        description.append_text("every item ").append_description_of(self.item_matcher)
+
+
+class _NoItem(_ItemsMatcher):
+    _REPORTED_RESULT = True
+
+    def _matches(self, item: object) -> bool:
+        items = _to_list(item)
+        if items is None:
+            return False
+        return not any(self._test_all(items))
+
+    def describe_to(self, description: Description) -> None:
+        description.append_text("no item ").append_description_of(self.item_matcher)
+
+
+class _IsSorted(BaseMatcher):
+    def __init__(self, descending: bool = False):
+        self.descending = descending
+
+    def _matches(self, item: object) -> bool:
+        items = _to_list(item)
+        if items is None:
+            return False
+        return self._find_unsorted(items) is None
+
+    def _find_unsorted(self, items: List[Any]) -> Optional[int]:
+        """Returns the index of the first item out of order."""
+        compare = operator.ge if self.descending else operator.le
+        array = _to_array(items)
+        if array is not None:
+            values, _ = array
+            unsorted = (~compare(values[:-1], values[1:])).nonzero()[0]
+            return int(unsorted[0]) + 1 if len(unsorted) else None
+
+        return next(
+            (idx for idx in range(1, len(items)) if not compare(items[idx - 1], items[idx])),
+            None,
+        )
+
+    def describe_to(self, description: Description) -> None:
+        order = "descending" if self.descending else "ascending"
+        description.append_text(f"a collection sorted in {order} order")
+
+    def describe_mismatch(self, item: object, mismatch_description: Description) -> None:
+        items = _to_list(item)
+        idx = None if items is None else self._find_unsorted(items)
+        if items is None or idx is None:
+            super().describe_mismatch(item, mismatch_description)
+            return
+        mismatch_description.append_text(f"item at index {idx} was out of order: ")
+        mismatch_description.append_description_of(items[idx])
+
+
+class _HasUniqueItems(BaseMatcher):
+    def _matches(self, item: object) -> bool:
+        items = _to_list(item)
+        if items is None:
+            return False
+        return self._find_duplicate(items) is None
+
+    @staticmethod
+    def _find_duplicate(items: List[Any]) -> Optional[int]:
+        """Returns the index of the first item that equals to a former item."""
+        try:
+            seen = set()
+            for idx, value in enumerate(items):
+                if value in seen:
+                    return idx
+                seen.add(value)
+            return None
+        except TypeError:  # not hashable
+            return next(
+                (idx for idx in range(len(items)) if items[idx] in items[:idx]),
+                None,
+            )
+
+    def describe_to(self, description: Description) -> None:
+        description.append_text("a collection with unique items")
+
+    def describe_mismatch(self, item: object, mismatch_description: Description) -> None:
+        items = _to_list(item)
+        idx = None if items is None else self._find_duplicate(items)
+        if items is None or idx is None:
+            super().describe_mismatch(item, mismatch_description)
+            return
+        mismatch_description.append_text(f"item at index {idx} was duplicated: ")
+        mismatch_description.append_description_of(items[idx])
+
+
+class _HasAggregation(BaseMatcher):
+    """Matches the aggregation of a collection, like ``has_length``."""
+
+    def __init__(self, name: str, aggregate: Callable[[List[Any]], object], matcher: Matcher):
+        self.name = name
+        self.aggregate = aggregate
+        self.matcher = matcher
+
+    def _matches(self, item: object) -> bool:
+        items = _to_list(item)
+        if not items:
+            return False
+        return self.matcher.matches(self.aggregate(items))
+
+    def describe_to(self, description: Description) -> None:
+        description.append_text(f"a collection with {self.name} ")
+        description.append_description_of(self.matcher)
+
+    def describe_mismatch(self, item: object, mismatch_description: Description) -> None:
+        items = _to_list(item)
+        if not items:
+            super().describe_mismatch(item, mismatch_description)
+            return
+        mismatch_description.append_text(f"{self.name} ")
+        self.matcher.describe_mismatch(self.aggregate(items), mismatch_description)
+
+
+def every_item(matcher: Matcher) -> Matcher:
+    """Matches a collection whose items all match the given matcher."""
+    return _EveryItem(matcher)
+
+
+def no_item(matcher: Matcher) -> Matcher:
+    """Matches a collection that has no item matching the given matcher."""
+    return _NoItem(matcher)
+
+
+def sorted_ascending() -> Matcher:
+    """Matches a collection sorted in (non-strictly) ascending order."""
+    return _IsSorted()
+
+
+def sorted_descending() -> Matcher:
+    """Matches a collection sorted in (non-strictly) descending order."""
+    return _IsSorted(descending=True)
+
+
+def unique_items() -> Matcher:
+    """Matches a collection whose items are all different from each other."""
+    return _HasUniqueItems()
+
+
+def has_sum(matcher: Matcher) -> Matcher:
+    """Matches a non-empty collection whose sum matches the given matcher."""
+    return _HasAggregation("sum", sum, matcher)
+
+
+def has_min(matcher: Matcher) -> Matcher:
+    """Matches a non-empty collection whose minimum matches the given matcher."""
+    return _HasAggregation("min", min, matcher)
+
+
+def has_max(matcher: Matcher) -> Matcher:
+    """Matches a non-empty collection whose maximum matches the given matcher."""
+    return _HasAggregation("max", max, matcher)
@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional, TypeVar
+from typing import Callable, List, Optional, Tuple, TypeVar
 
-from hamcrest import assert_that
 from hamcrest.core.matcher import Matcher
 
 from preacher.core.context import Context
 from preacher.core.status import Status
 from preacher.core.value import Value
 from preacher.core.value.impl.static import StaticValue
+from .native import NativeTest, compile_native, describe_mismatch
 from .predicate import Predicate
 from .verification import Verification
 
@@ -20,15 +20,22 @@ MatcherFunc = Callable[..., Matcher]
 
 
 class MatcherWrappingPredicate(Predicate):
-    """Matcher implemented by hamcrest matchers."""
+    """
+    Matcher implemented by hamcrest matchers.
+    Hamcrest matchers are evaluated natively when supported,
+    and mismatches are described only when matching fails.
+    """
 
     def __init__(self, factory: MatcherFactory):
         self._factory = factory
+        self._native: Optional[Tuple[Matcher, NativeTest]] = None
 
     def verify(self, actual: object, context: Optional[Context] = None) -> Verification:
         try:
             hamcrest_matcher = self._factory.create(context)
-            assert_that(actual, hamcrest_matcher)
+            if not self._compile_native(hamcrest_matcher)(actual):
+                message = describe_mismatch(hamcrest_matcher, actual)
+                return Verification(status=Status.UNSTABLE, message=message)
         except AssertionError as error:
             message = str(error).strip()
             return Verification(status=Status.UNSTABLE, message=message)
@@ -37,33 +44,99 @@ class MatcherWrappingPredicate(Predicate):
 
         return Verification.succeed()
 
+    def _compile_native(self, hamcrest_matcher: Matcher) -> NativeTest:
+        native = self._native
+        if native is None or native[0] is not hamcrest_matcher:
+            native = (hamcrest_matcher, compile_native(hamcrest_matcher))
+            self._native = native
+        return native[1]
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_native"] = None
+        return state
+
 
 class MatcherFactory(ABC):
     @abstractmethod
     def create(self, context: Optional[Context] = None) -> Matcher:
         ...  # pragma: no cover
 
+    @property
+    def is_static(self) -> bool:
+        """Whether created matchers depend on no context, which can be created only once."""
+        return False
+
 
 class StaticMatcherFactory(MatcherFactory):
     def __init__(self, matcher: Matcher):
         self._matcher = matcher
 
+    @property
+    def is_static(self) -> bool:
+        return True
+
     def create(self, context: Optional[Context] = None) -> Matcher:
         return self._matcher
 
 
-class ValueMatcherFactory(MatcherFactory):
+class _PreparingMatcherFactory(MatcherFactory):
+    """
+    A matcher factory that creates the matcher in advance when it depends on no context.
+    Prepared matchers are not pickled but prepared again, because some of them cannot be pickled.
+    """
+
+    def __init__(self):
+        self._prepared: Optional[Matcher] = None
+
+    def create(self, context: Optional[Context] = None) -> Matcher:
+        if self._prepared is not None:
+            return self._prepared
+        return self._create(context)
+
+    @abstractmethod
+    def _create(self, context: Optional[Context]) -> Matcher:
+        ...  # pragma: no cover
+
+    def _prepare(self) -> None:
+        if not self.is_static:
+            return
+        try:
+            self._prepared = self._create(None)
+        except Exception:
+            pass  # Fails again on creation to be reported as a verification failure.
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_prepared"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._prepare()
+
+
+class ValueMatcherFactory(_PreparingMatcherFactory):
     def __init__(
         self,
         matcher_func: MatcherFunc,
         arg: object,
         value_func: Callable[[object], Value] = StaticValue,
     ):
+        super().__init__()
         self._inner_factory = matcher_func
         self._arg = arg
         self._value_func = value_func
+        self._prepare()
 
-    def create(self, context: Optional[Context] = None) -> Matcher:
+    @property
+    def is_static(self) -> bool:
+        try:
+            return isinstance(self._ensure_value(), StaticValue)
+        except Exception:
+            return False
+
+    def _create(self, context: Optional[Context]) -> Matcher:
         resolved_value = self._ensure_value().resolve(context)
         return self._inner_factory(resolved_value)
 
@@ -73,11 +146,17 @@ class ValueMatcherFactory(MatcherFactory):
         return self._value_func(self._arg)
 
 
-class RecursiveMatcherFactory(MatcherFactory):
+class RecursiveMatcherFactory(_PreparingMatcherFactory):
     def __init__(self, matcher_func: MatcherFunc, inner_factories: List[MatcherFactory]):
+        super().__init__()
         self._matcher_func = matcher_func
         self._inner_factories = inner_factories
+        self._prepare()
 
-    def create(self, context: Optional[Context] = None) -> Matcher:
+    @property
+    def is_static(self) -> bool:
+        return all(factory.is_static for factory in self._inner_factories)
+
+    def _create(self, context: Optional[Context]) -> Matcher:
         inner_matchers = (factory.create(context) for factory in self._inner_factories)
         return self._matcher_func(*inner_matchers)
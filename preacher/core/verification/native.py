@@ -0,0 +1,187 @@
+"""
+Native evaluation of hamcrest matchers.
+
+Built-in hamcrest matchers are compiled into plain functions that return booleans,
+which are equivalent to ``Matcher.matches`` but skip hamcrest's dispatching.
+Mismatch messages are built from the hamcrest matchers only when matching fails,
+so that they are identical to the ones of ``hamcrest.assert_that``.
+"""
+
+from typing import Any, Callable, Dict
+
+from hamcrest.core.core.allof import AllOf
+from hamcrest.core.core.anyof import AnyOf
+from hamcrest.core.core.is_ import Is
+from hamcrest.core.core.isanything import IsAnything
+from hamcrest.core.core.isequal import IsEqual
+from hamcrest.core.core.isnone import IsNone
+from hamcrest.core.core.isnot import IsNot
+from hamcrest.core.helpers.hasmethod import hasmethod
+from hamcrest.core.matcher import Matcher
+from hamcrest.core.string_description import StringDescription
+from hamcrest.library.collection.is_empty import IsEmpty
+from hamcrest.library.collection.issequence_containing import IsSequenceContaining
+from hamcrest.library.number.ordering_comparison import OrderingComparison
+from hamcrest.library.object.haslength import HasLength
+from hamcrest.library.text.stringcontains import StringContains
+from hamcrest.library.text.stringendswith import StringEndsWith
+from hamcrest.library.text.stringstartswith import StringStartsWith
+
+NativeTest = Callable[[object], object]
+
+
+def compile_native(matcher: Matcher) -> NativeTest:
+    """
+    Compile a hamcrest matcher into a function equivalent to ``matcher.matches``.
+    Matchers that are not supported natively fall back to ``matcher.matches``.
+
+    Args:
+        matcher: A hamcrest matcher.
+    Returns:
+        A function that takes an actual value and returns whether it matches.
+    """
+    compile = _COMPILERS.get(type(matcher))
+    if compile is None:
+        return matcher.matches
+    return compile(matcher)
+
+
+def describe_mismatch(matcher: Matcher, actual: object) -> str:
+    """
+    Describe a mismatch in the same way as ``hamcrest.assert_that``.
+
+    Args:
+        matcher: A hamcrest matcher that does not match the actual value.
+        actual: The actual value.
+    Returns:
+        The mismatch message.
+    """
+    description = StringDescription()
+    description.append_text("\nExpected: ").append_description_of(matcher)
+    description.append_text("\n     but: ")
+    matcher.describe_mismatch(actual, description)
+    return str(description).strip()
+
+
+def _compile_equal(matcher: IsEqual) -> NativeTest:
+    expected = matcher.object
+    return lambda item: item == expected
+
+
+def _compile_ordering(matcher: OrderingComparison) -> NativeTest:
+    compare = matcher.comparison_function
+    value = matcher.value
+
+    def _test(item: object) -> object:
+        try:
+            return compare(item, value)
+        except TypeError:
+            return False
+
+    return _test
+
+
+def _compile_none(matcher: IsNone) -> NativeTest:
+    return lambda item: item is None
+
+
+def _compile_not(matcher: IsNot) -> NativeTest:
+    inner = compile_native(matcher.matcher)
+    return lambda item: not inner(item)
+
+
+def _compile_is(matcher: Is) -> NativeTest:
+    return compile_native(matcher.matcher)
+
+
+def _compile_anything(matcher: IsAnything) -> NativeTest:
+    return lambda item: True
+
+
+def _compile_all_of(matcher: AllOf) -> NativeTest:
+    inners = [compile_native(inner) for inner in matcher.matchers]
+    return lambda item: all(inner(item) for inner in inners)
+
+
+def _compile_any_of(matcher: AnyOf) -> NativeTest:
+    inners = [compile_native(inner) for inner in matcher.matchers]
+    return lambda item: any(inner(item) for inner in inners)
+
+
+def _compile_contains(matcher: StringContains) -> NativeTest:
+    substring = matcher.substring
+
+    def _test(item: Any) -> object:
+        return hasmethod(item, "find") and item.find(substring) >= 0
+
+    return _test
+
+
+def _compile_starts_with(matcher: StringStartsWith) -> NativeTest:
+    substring = matcher.substring
+
+    def _test(item: Any) -> object:
+        return hasmethod(item, "startswith") and item.startswith(substring)
+
+    return _test
+
+
+def _compile_ends_with(matcher: StringEndsWith) -> NativeTest:
+    substring = matcher.substring
+
+    def _test(item: Any) -> object:
+        return hasmethod(item, "endswith") and item.endswith(substring)
+
+    return _test
+
+
+def _compile_length(matcher: HasLength) -> NativeTest:
+    inner = compile_native(matcher.len_matcher)
+
+    def _test(item: Any) -> object:
+        return hasmethod(item, "__len__") and inner(len(item))
+
+    return _test
+
+
+def _compile_empty(matcher: IsEmpty) -> NativeTest:
+    def _test(item: Any) -> bool:
+        try:
+            return len(item) == 0
+        except TypeError:
+            return False
+
+    return _test
+
+
+def _compile_has_item(matcher: IsSequenceContaining) -> NativeTest:
+    inner = compile_native(matcher.element_matcher)
+
+    def _test(item: Any) -> bool:
+        try:
+            for element in item:
+                if inner(element):
+                    return True
+        except TypeError:  # not a sequence
+            return False
+        return False
+
+    return _test
+
+
+_COMPILERS: Dict[type, Callable[[Any], NativeTest]] = {
+    IsEqual: _compile_equal,
+    OrderingComparison: _compile_ordering,
+    IsNone: _compile_none,
+    IsNot: _compile_not,
+    Is: _compile_is,
+    IsAnything: _compile_anything,
+    AllOf: _compile_all_of,
+    AnyOf: _compile_any_of,
+    StringContains: _compile_contains,
+    StringStartsWith: _compile_starts_with,
+    StringEndsWith: _compile_ends_with,
+    HasLength: _compile_length,
+    IsEmpty: _compile_empty,
+    IsSequenceContaining: _compile_has_item,
+}
@@ -4,27 +4,36 @@ and the body.
 """
 
 from dataclasses import dataclass, field
+from time import perf_counter
 from typing import List, Optional
 
 from preacher.core.context import Context
 from preacher.core.extraction import ResponseBodyAnalyzer, MappingAnalyzer
 from preacher.core.request import Response
 from preacher.core.status import Status, Statused, merge_statuses
+from preacher.core.util.slots import slotted
 from .description import Description
 from .predicate import Predicate
 from .verification import Verification
 
 
+@slotted
 @dataclass(frozen=True)
 class ResponseVerification(Statused):
     response_id: str
     status_code: Verification = field(default_factory=Verification)
     headers: Verification = field(default_factory=Verification)
     body: Verification = field(default_factory=Verification)
+    elapsed: float = field(default=0.0, compare=False)  # Seconds spent verifying.
+    _status: Status = field(init=False, repr=False, compare=False, default=Status.SKIPPED)
 
-    @property  # HACK should be cached.
+    def __post_init__(self) -> None:
+        status = merge_statuses([self.status_code.status, self.headers.status, self.body.status])
+        object.__setattr__(self, "_status", status)
+
+    @property
     def status(self) -> Status:
-        return merge_statuses([self.status_code.status, self.headers.status, self.body.status])
+        return self._status
 
 
 class ResponseDescription:
@@ -43,6 +52,7 @@ class ResponseDescription:
         response: Response,
         context: Optional[Context] = None,
     ) -> ResponseVerification:
+        starts = perf_counter()
         status_code = Verification.collect(
             p.verify(response.status_code, context) for p in self._status_code
         )
@@ -58,4 +68,5 @@ class ResponseDescription:
             status_code=status_code,
             headers=headers,
             body=body,
+            elapsed=perf_counter() - starts,
         )
@@ -7,8 +7,10 @@ from typing import Iterable, Optional, Sequence
 
 from preacher.core.status import Status, Statused, merge_statuses
 from preacher.core.util.error import to_message
+from preacher.core.util.slots import slotted
 
 
+@slotted
 @dataclass(frozen=True)
 class Verification(Statused):
     status: Status = Status.SKIPPED
@@ -17,7 +19,7 @@ class Verification(Statused):
 
     @staticmethod
     def succeed() -> Verification:
-        return Verification(status=Status.SUCCESS)
+        return _SUCCEEDED
 
     @staticmethod
     def of_error(error: Exception) -> Verification:
@@ -28,3 +30,7 @@ class Verification(Statused):
         children = list(children)
         status = merge_statuses(child.status for child in children)
         return Verification(status=status, children=children)
+
+
+# Shared, which is pickled only once in a result.
+_SUCCEEDED = Verification(status=Status.SUCCESS)
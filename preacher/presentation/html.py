@@ -1,38 +1,178 @@
 import os
-from typing import Iterable
-
-import jinja2
+import shutil
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Iterable, List, Optional
 
 from preacher.core.request import Response, ExecutionReport
 from preacher.core.scenario import ScenarioResult
+from preacher.core.status import Status
+
+DEFAULT_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class _Page:
+    number: int
+    count: int = 0
+    status: Status = Status.SKIPPED
+
+    @property
+    def name(self) -> str:
+        return f"scenarios-{self.number}.html"
 
 
 class HtmlReporter:
-    def __init__(self, path):
+    """
+    Exports HTML reports.
+    Scenario results are written incrementally into pages, which have ``page_size`` scenarios,
+    and the summary page ``index.html`` is updated on each page,
+    so that an interrupted run still leaves a usable partial report.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        bytecode_cache_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            path: The directory path to export reports.
+            page_size: The max number of scenarios in a page.
+            bytecode_cache_dir: The directory path to cache compiled templates,
+                which saves the compilation on later runs. Not cached when ``None``.
+        """
         self._path = path
         self._responses_path = os.path.join(self._path, "responses")
+        self._page_size = page_size
+        self._bytecode_cache_dir = bytecode_cache_dir
+        self._load_templates()
 
-        self._loader = jinja2.PackageLoader("preacher", "resources/report/html")
-
+        self._page_file: Optional[IO[str]] = None
+        self._reset()
         self._initialize()
 
+    def _load_templates(self) -> None:
+        import jinja2  # Imported only when reporting.
+
+        # Templates are compiled only once for each reporter.
+        bytecode_cache = None
+        if self._bytecode_cache_dir is not None:
+            os.makedirs(self._bytecode_cache_dir, exist_ok=True)
+            bytecode_cache = jinja2.FileSystemBytecodeCache(self._bytecode_cache_dir)
+        env = jinja2.Environment(
+            loader=jinja2.PackageLoader("preacher", "resources/report/html"),
+            autoescape=True,
+            auto_reload=False,
+            bytecode_cache=bytecode_cache,
+        )
+        self._response_template = env.get_template("response-view.html")
+        self._summary_template = env.get_template("index.html")
+        self._head_template = env.get_template("scenarios-head.html")
+        self._tail_template = env.get_template("scenarios-tail.html")
+        self._scenario_macros: Any = env.get_template("macros/scenario.html").module
+
+    def _reset(self) -> None:
+        self._pages: List[_Page] = []
+        self._counts: Dict[Status, int] = {status: 0 for status in Status}
+
     def _initialize(self) -> None:
         os.makedirs(self._path, exist_ok=True)
         os.makedirs(self._responses_path, exist_ok=True)
+        self._export_summary(finished=False)
 
     def export_response(self, execution: ExecutionReport, response: Response) -> None:
         name = f"{response.id}.html"
         path = os.path.join(self._responses_path, name)
 
-        env = jinja2.Environment(loader=self._loader, autoescape=True)
-        template = env.get_template("response-view.html")
         with open(path, "w") as f:
-            template.stream(execution=execution, response=response).dump(f)
+            self._response_template.stream(execution=execution, response=response).dump(f)
+
+    def export_result(self, result: ScenarioResult) -> None:
+        """Append a scenario result to the current page, which is written immediately."""
+        page_file = self._page_file
+        if page_file is None or self._pages[-1].count >= self._page_size:
+            page_file = self._open_page()
+
+        page_file.write(self._scenario_macros.show_scenario(result))
+        page_file.flush()
+
+        page = self._pages[-1]
+        self._pages[-1] = _Page(page.number, page.count + 1, page.status.merge(result.status))
+        self._counts[result.status] += 1
+
+    def close(self) -> None:
+        """Finish the current page and the summary."""
+        self._close_page()
+        self._export_summary(finished=True)
+
+    def restart(self) -> None:
+        """Start a new report, which replaces the former one including its responses."""
+        self._close_page()
+        for page in self._pages:
+            os.remove(os.path.join(self._path, page.name))
+        shutil.rmtree(self._responses_path, ignore_errors=True)
+        self._reset()
+        self._initialize()
 
     def export_results(self, results: Iterable[ScenarioResult]) -> None:
+        for result in results:
+            self.export_result(result)
+        self.close()
+
+    def _open_page(self) -> IO[str]:
+        self._close_page()
+
+        page = _Page(number=len(self._pages) + 1)
+        self._pages.append(page)
+        self._export_summary(finished=False)
+
+        page_file = open(os.path.join(self._path, page.name), "w")
+        page_file.write(self._head_template.render(page=page.number))
+        page_file.flush()
+        self._page_file = page_file
+        return page_file
+
+    def _close_page(self) -> None:
+        if self._page_file is None:
+            return
+        self._page_file.write(self._tail_template.render())
+        self._page_file.close()
+        self._page_file = None
+
+    def _export_summary(self, finished: bool) -> None:
+        status = Status.SKIPPED
+        for page in self._pages:
+            status = status.merge(page.status)
+
+        # Written into a temporary file and replaced not to leave a broken summary.
         html_path = os.path.join(self._path, "index.html")
+        temporary_path = f"{html_path}.tmp"
+        with open(temporary_path, "w") as f:
+            f.write(
+                self._summary_template.render(
+                    status=status,
+                    counts=list(self._counts.items()),
+                    pages=self._pages,
+                    finished=finished,
+                )
+            )
+        os.replace(temporary_path, html_path)
+
+    def __getstate__(self) -> dict:
+        # Compiled templates and the opened page cannot be pickled.
+        state = self.__dict__.copy()
+        for key in (
+            "_response_template",
+            "_summary_template",
+            "_head_template",
+            "_tail_template",
+            "_scenario_macros",
+        ):
+            del state[key]
+        state["_page_file"] = None
+        return state
 
-        env = jinja2.Environment(loader=self._loader, autoescape=True)
-        template = env.get_template("index.html")
-        with open(html_path, "w") as f:
-            template.stream(scenarios=results).dump(f)
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._load_templates()
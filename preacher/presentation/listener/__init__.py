@@ -1,11 +1,14 @@
 from .factory import create_listener
 from .html import HtmlReportingListener, create_html_reporting_listener
 from .logging import LoggingReportingListener, create_logging_reporting_listener
+from .metrics import MetricsListener, create_metrics_listener
 
 __all__ = [
     "HtmlReportingListener",
     "LoggingReportingListener",
+    "MetricsListener",
     "create_html_reporting_listener",
     "create_logging_reporting_listener",
+    "create_metrics_listener",
     "create_listener",
 ]
@@ -1,19 +1,35 @@
 from logging import Formatter
 from typing import Optional
 
-from preacher.core.scheduling import Listener, MergingListener
+from preacher.core.profiling import Profiler
+from preacher.core.scheduling import BackgroundListener, Listener, MergingListener
+from preacher.core.scheduling import ProfilingListener
 from preacher.core.status import Status
 from .logging import create_logging_reporting_listener
 from .html import create_html_reporting_listener
+from .metrics import create_metrics_listener
 
 
 def create_listener(
     level: Status = Status.SUCCESS,
     formatter: Optional[Formatter] = None,
     report_dir: Optional[str] = None,
+    profiler: Optional[Profiler] = None,
+    metrics_path: Optional[str] = None,
+    metrics_port: Optional[int] = None,
 ) -> Listener:
+    def profiled(listener: Listener) -> Listener:
+        if profiler is None:
+            return listener
+        return ProfilingListener(listener, profiler)
+
     merging = MergingListener()
-    merging.append(create_logging_reporting_listener(level=level, formatter=formatter))
+    merging.append(
+        profiled(create_logging_reporting_listener(level=level, formatter=formatter))
+    )
     if report_dir:
-        merging.append(create_html_reporting_listener(report_dir))
+        # Report files are written in the background not to block workers.
+        merging.append(BackgroundListener(profiled(create_html_reporting_listener(report_dir))))
+    if metrics_path or metrics_port is not None:
+        merging.append(create_metrics_listener(path=metrics_path, port=metrics_port))
     return merging
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Optional
 
 from preacher.core.request import Response, ExecutionReport
 from preacher.core.scenario import ScenarioResult
@@ -8,22 +8,36 @@ from preacher.presentation.html import HtmlReporter
 
 
 class HtmlReportingListener(Listener):
+    """
+    Reports in HTML, where scenario results are written as soon as they are given.
+    Events after the end start a new report, which replaces the former one.
+    """
+
     def __init__(self, reporter: HtmlReporter):
         self._reporter = reporter
-        self._results: List[ScenarioResult] = []
+        self._ended = False
 
     def on_execution(self, execution: ExecutionReport, response: Optional[Response]) -> None:
         if not response:
             return
+        self._restart_if_ended()
         self._reporter.export_response(execution, response)
 
     def on_scenario(self, result: ScenarioResult) -> None:
-        self._results.append(result)
+        self._restart_if_ended()
+        self._reporter.export_result(result)
 
     def on_end(self, status: Status) -> None:
-        self._reporter.export_results(self._results)
+        self._restart_if_ended()
+        self._reporter.close()
+        self._ended = True
+
+    def _restart_if_ended(self) -> None:
+        if self._ended:
+            self._reporter.restart()
+            self._ended = False
 
 
-def create_html_reporting_listener(path: str):
-    reporter = HtmlReporter(path)
+def create_html_reporting_listener(path: str, bytecode_cache_dir: Optional[str] = None):
+    reporter = HtmlReporter(path, bytecode_cache_dir=bytecode_cache_dir)
     return HtmlReportingListener(reporter)
@@ -0,0 +1,144 @@
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from preacher.core.request import ExecutionReport, Response
+from preacher.core.scenario import CaseResult, ScenarioResult
+from preacher.core.scheduling import Listener
+from preacher.core.status import Status
+from preacher.presentation.metrics import MetricsRegistry, MetricsServer, write_metrics
+
+VERIFICATION_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+_CASE_LABELS = ("label", "host")
+
+
+class MetricsListener(Listener):
+    """
+    Counts requests and observes responses for each case label and host.
+
+    Responses are given before the cases owning them,
+    so they are held until their cases are given.
+    """
+
+    def __init__(self, registry: MetricsRegistry, path: Optional[str] = None):
+        """
+        Args:
+            registry: The registry to register metrics to.
+            path: The file path to write metrics into at the end.
+        """
+        self._registry = registry
+        self._path = path
+        self._responses: Dict[str, Tuple[int, int, float]] = {}
+
+        self._cases = registry.counter(
+            "preacher_cases",
+            "Cases run by their statuses.",
+            _CASE_LABELS + ("status",),
+        )
+        self._requests = registry.counter(
+            "preacher_requests",
+            "Requests sent, including retries.",
+            _CASE_LABELS,
+        )
+        self._retries = registry.counter("preacher_retries", "Retried requests.", _CASE_LABELS)
+        self._responses_total = registry.counter(
+            "preacher_responses",
+            "Responses by their status codes, which are of the last attempts.",
+            _CASE_LABELS + ("code",),
+        )
+        self._response_bytes = registry.counter(
+            "preacher_response_bytes",
+            "Bytes of response bodies.",
+            _CASE_LABELS,
+        )
+        self._response_seconds = registry.histogram(
+            "preacher_response_seconds",
+            "Seconds from sending requests to receiving responses.",
+            _CASE_LABELS,
+        )
+        self._verification_seconds = registry.histogram(
+            "preacher_verification_seconds",
+            "Seconds spent verifying responses.",
+            _CASE_LABELS,
+            buckets=VERIFICATION_BUCKETS,
+        )
+        self._runs = registry.counter("preacher_runs", "Runs by their statuses.", ("status",))
+
+    def on_execution(self, execution: ExecutionReport, response: Optional[Response]) -> None:
+        if not response:
+            return
+        self._responses[response.id] = (
+            response.status_code,
+            len(response.body.content),
+            response.elapsed,
+        )
+
+    def on_scenario(self, result: ScenarioResult) -> None:
+        for case in result.cases.items:
+            self._observe(case)
+        for subscenario in result.subscenarios.items:
+            self.on_scenario(subscenario)
+
+    def on_end(self, status: Status) -> None:
+        self._runs.inc((_status_label(status),))
+        if self._path:
+            write_metrics(self._registry, self._path)
+
+    def _observe(self, case: CaseResult) -> None:
+        request = case.execution.request
+        host = urlsplit(request.url).netloc if request else ""
+        labels = (case.label or "", host)
+        self._cases.inc(labels + (_status_label(case.status),))
+        if request is None:
+            return
+
+        attempts = case.execution.attempts
+        self._requests.inc(labels, attempts)
+        self._retries.inc(labels, attempts - 1)
+        if case.response is None:
+            return
+
+        self._verification_seconds.observe(labels, case.response.elapsed)
+        response = self._responses.pop(case.response.response_id, None)
+        if response is None:
+            return
+        code, size, elapsed = response
+        self._responses_total.inc(labels + (str(code),))
+        self._response_bytes.inc(labels, size)
+        self._response_seconds.observe(labels, elapsed)
+
+
+class ServingMetricsListener(MetricsListener):
+    """Serves metrics over HTTP until closed, which lasts over runs."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        server: MetricsServer,
+        path: Optional[str] = None,
+    ):
+        super().__init__(registry, path)
+        self._server = server
+        self._server.start()
+
+    def close(self) -> None:
+        self._server.close()
+
+
+def create_metrics_listener(
+    path: Optional[str] = None,
+    port: Optional[int] = None,
+) -> MetricsListener:
+    """
+    Args:
+        path: The file path to write metrics into at the end.
+        port: The port to serve metrics on localhost until the listener is closed.
+    """
+    registry = MetricsRegistry()
+    if port is None:
+        return MetricsListener(registry, path)
+    return ServingMetricsListener(registry, MetricsServer(registry, port), path)
+
+
+def _status_label(status: Status) -> str:
+    return status.name.lower()
@@ -0,0 +1,229 @@
+"""
+Metrics of runs in the OpenMetrics text format, which Prometheus can scrape.
+
+Metrics are exposed on an HTTP endpoint or written into a file,
+which suits the textfile collector of the node exporter.
+"""
+
+import math
+import os
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+class Metric(ABC):
+    """A metric family, whose samples are distinguished by label values."""
+
+    type = ""
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = ()):
+        self._name = name
+        self._description = description
+        self._labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def expose(self) -> Iterator[str]:
+        yield f"# TYPE {self._name} {self.type}\n"
+        yield f"# HELP {self._name} {_escape(self._description)}\n"
+        with self._lock:
+            yield from self._samples()
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]:
+        ...  # pragma: no cover
+
+    def _check(self, values: LabelValues) -> None:
+        if len(values) != len(self._labels):
+            raise ValueError(f"{self._name} needs labels {self._labels}, given {values}")
+
+    def _sample(self, suffix: str, values: LabelValues, value: float, *extra: str) -> str:
+        pairs = [f'{label}="{_escape(v)}"' for label, v in zip(self._labels, values)]
+        pairs.extend(extra)
+        labels = "{" + ",".join(pairs) + "}" if pairs else ""
+        return f"{self._name}{suffix}{labels} {_format(value)}\n"
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, description: str, labels: Sequence[str] = ()):
+        super().__init__(name, description, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, values: LabelValues = (), amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError(f"Counters can only increase, given {amount}")
+        self._check(values)
+        with self._lock:
+            self._values[values] = self._values.get(values, 0.0) + amount
+
+    def _samples(self) -> Iterator[str]:
+        for values, value in sorted(self._values.items()):
+            yield self._sample("_total", values, value)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """
+        Args:
+            buckets: The upper bounds of buckets in ascending order, except ``+Inf``.
+        """
+        super().__init__(name, description, labels)
+        self._buckets = tuple(sorted(buckets))
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, values: LabelValues, value: float) -> None:
+        self._check(values)
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            counts = self._counts.get(values)
+            if counts is None:
+                counts = [0] * (len(self._buckets) + 1)
+                self._counts[values] = counts
+                self._sums[values] = 0.0
+            counts[index] += 1
+            self._sums[values] += value
+
+    def _samples(self) -> Iterator[str]:
+        for values, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(self._buckets + (math.inf,), counts):
+                cumulative += count
+                le = f'le="{_format_bound(bound)}"'
+                yield self._sample("_bucket", values, cumulative, le)
+            yield self._sample("_count", values, cumulative)
+            yield self._sample("_sum", values, self._sums[values])
+
+
+class MetricsRegistry:
+    """Holds metrics to expose them together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str, labels: Sequence[str] = ()) -> Counter:
+        counter = Counter(name, description, labels)
+        self._register(counter)
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        histogram = Histogram(name, description, labels, buckets)
+        self._register(histogram)
+        return histogram
+
+    def expose(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(line for metric in metrics for line in metric.expose()) + "# EOF\n"
+
+    def _register(self, metric: Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+
+def write_metrics(registry: MetricsRegistry, path: str) -> None:
+    """
+    Write metrics into a file.
+    The file is replaced atomically not to be read while written.
+    """
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "w") as f:
+        f.write(registry.expose())
+    os.replace(temporary_path, path)
+
+
+class MetricsServer:
+    """Serves metrics over HTTP in a background thread."""
+
+    def __init__(self, registry: MetricsRegistry, port: int, host: str = "localhost"):
+        """
+        Args:
+            registry: The registry of metrics to serve.
+            port: The port to listen. A free port is chosen when ``0``.
+            host: The host to listen.
+        """
+        handler = type("Handler", (_Handler,), {"registry": registry})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._thread:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    registry = MetricsRegistry()
+
+    def do_GET(self):
+        if self.path.partition("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+
+        body = self.registry.expose().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _format_bound(bound: float) -> str:
+    if bound == math.inf:
+        return "+Inf"
+    return repr(float(bound))
@@ -3,20 +3,25 @@ Tests only arguments and that whole process is run.
 Styles should be checked independently.
 """
 
+import json
 import logging
 import os
 from concurrent.futures import Executor
 from tempfile import TemporaryDirectory
 from typing import Iterable
-from unittest.mock import NonCallableMock, NonCallableMagicMock, ANY, sentinel
+from unittest.mock import Mock, NonCallableMock, NonCallableMagicMock, ANY, sentinel
 
 from pytest import fixture
 
 from preacher.app.cli.app import app
-from preacher.app.cli.executor import ExecutorFactory
+from preacher.app.cli.daemon import Daemon
+from preacher.app.cli.executor import ExecutorFactory, HybridPoolFactory
+from preacher.app.cli.watch import ScenarioFiles, Watcher
+from preacher.core.profiling import CProfiler, MergingProfiler
 from preacher.core.scenario import Scenario
-from preacher.core.scheduling import ScenarioScheduler
+from preacher.core.scheduling import Listener, ScenarioScheduler
 from preacher.core.status import Status
+from preacher.core.tracing import Tracer
 
 PKG = "preacher.app.cli.app"
 
@@ -43,6 +48,7 @@ def executor():
 @fixture
 def executor_factory(executor):
     factory = NonCallableMock(ExecutorFactory)
+    factory.prepare.side_effect = lambda scenarios: scenarios
     factory.create.return_value = executor
     return factory
 
@@ -60,8 +66,8 @@ def test_app_normal(mocker, base_dir, executor, executor_factory):
     compile_scenarios = mocker.patch(f"{PKG}.compile_scenarios")
     compile_scenarios.return_value = iter([sentinel.scenario])
 
-    listener_ctor = mocker.patch(f"{PKG}.create_listener")
-    listener_ctor.return_value = sentinel.listener
+    listener = NonCallableMock(Listener)
+    listener_ctor = mocker.patch(f"{PKG}.create_listener", return_value=listener)
 
     def _run(scenarios: Iterable[Scenario]) -> Status:
         assert list(scenarios) == [sentinel.scenario]
@@ -70,6 +76,8 @@ def test_app_normal(mocker, base_dir, executor, executor_factory):
     scheduler = NonCallableMock(ScenarioScheduler)
     scheduler.run.side_effect = _run
     scheduler_ctor = mocker.patch(f"{PKG}.create_scheduler", return_value=scheduler)
+    compactor = sentinel.compactor
+    compactor_ctor = mocker.patch(f"{PKG}.ResultCompactor", return_value=compactor)
 
     exit_code = app(
         paths=sentinel.paths,
@@ -77,11 +85,17 @@ def test_app_normal(mocker, base_dir, executor, executor_factory):
         arguments=sentinel.args,
         level=sentinel.level,
         report_dir=sentinel.report_dir,
+        compact=True,
+        body_limit=sentinel.body_limit,
         retry=sentinel.retry,
         delay=sentinel.delay,
         timeout=sentinel.timeout,
-        concurrency=sentinel.concurrency,
+        max_failures=sentinel.max_failures,
+        deadline=sentinel.deadline,
+        concurrency=2,
         executor_factory=executor_factory,
+        metrics_path=sentinel.metrics_path,
+        metrics_port=sentinel.metrics_port,
         plugins=sentinel.plugins,
         verbosity=sentinel.verbosity,
     )
@@ -102,23 +116,39 @@ def test_app_normal(mocker, base_dir, executor, executor_factory):
         arguments=sentinel.args,
         plugin_manager=sentinel.plugin_manager,
         logger=logger,
+        selector=None,
     )
     listener_ctor.assert_called_once_with(
         level=sentinel.level,
         formatter=ANY,
         report_dir=sentinel.report_dir,
+        profiler=ANY,
+        metrics_path=sentinel.metrics_path,
+        metrics_port=sentinel.metrics_port,
     )
     scheduler_ctor.assert_called_once_with(
         executor=executor,
-        listener=sentinel.listener,
+        listener=listener,
         base_url=sentinel.base_url,
         timeout=sentinel.timeout,
         retry=sentinel.retry,
         delay=sentinel.delay,
+        compactor=compactor,
+        profiler=ANY,
+        keep_sessions=False,
+        max_failures=sentinel.max_failures,
+        deadline=sentinel.deadline,
+        window=8,
+    )
+    compactor_ctor.assert_called_once_with(
+        drop_succeeded_details=True,
+        max_body_length=sentinel.body_limit,
     )
-    executor_factory.create.assert_called_once_with(sentinel.concurrency)
+    executor_factory.prepare.assert_called_once_with(compile_scenarios.return_value)
+    executor_factory.create.assert_called_once_with(2)
     scheduler.run.assert_called_once()
     executor.__exit__.assert_called_once()
+    listener.close.assert_called_once_with()
 
 
 def test_app_plugin_loading_fails(mocker):
@@ -126,6 +156,23 @@ def test_app_plugin_loading_fails(mocker):
     assert app() == 3
 
 
+def test_app_listener_creation_fails(mocker, base_dir):
+    mocker.patch(f"{PKG}.create_listener", side_effect=OSError("msg"))
+    profiler = NonCallableMock(CProfiler, directory=sentinel.profile_dir)
+    profiler.iterate.side_effect = lambda name, iterable: iterable
+    mocker.patch(f"{PKG}.CProfiler", return_value=profiler)
+    mocker.patch(f"{PKG}.write_summary")
+    trace_dir = os.path.join(base_dir, "trace")
+    os.mkdir(trace_dir)
+    mocker.patch(f"{PKG}.mkdtemp", return_value=trace_dir)
+
+    path = os.path.join(base_dir, "trace.json")
+    assert app(profile_dir=sentinel.profile_dir, trace_path=path) == 3
+
+    profiler.dump.assert_called_once_with()
+    assert not os.path.exists(trace_dir)
+
+
 def test_app_scenario_running_not_succeeds(mocker, executor_factory, executor):
     scheduler = NonCallableMock(ScenarioScheduler)
     scheduler.run.return_value = Status.UNSTABLE
@@ -146,3 +193,167 @@ def test_app_scenario_running_raises_an_unexpected_error(mocker, executor_factor
     assert exit_code == 3
 
     executor.__exit__.assert_called_once()
+
+
+def test_app_without_compaction(mocker, executor_factory):
+    scheduler = NonCallableMock(ScenarioScheduler, run=Mock(return_value=Status.SUCCESS))
+    scheduler_ctor = mocker.patch(f"{PKG}.create_scheduler", return_value=scheduler)
+
+    assert app(executor_factory=executor_factory) == 0
+    assert scheduler_ctor.call_args[1]["compactor"] is None
+
+
+def test_app_with_hybrid_executor(mocker, executor):
+    scheduler = NonCallableMock(ScenarioScheduler, run=Mock(return_value=Status.SUCCESS))
+    scheduler_ctor = mocker.patch(f"{PKG}.create_scheduler", return_value=scheduler)
+    executor_ctor = mocker.patch(
+        "preacher.app.cli.hybrid.HybridPoolExecutor",
+        return_value=executor,
+    )
+
+    exit_code = app(concurrency=1, executor_factory=HybridPoolFactory(2, 3))
+    assert exit_code == 0
+    executor_ctor.assert_called_once_with(2, 3)
+    assert scheduler_ctor.call_args[1]["keep_sessions"] is True
+
+
+def test_app_with_profiler(mocker, executor_factory):
+    profiler = NonCallableMock(CProfiler, directory=sentinel.profile_dir)
+    profiler.iterate.side_effect = lambda name, iterable: iterable
+    profiler_ctor = mocker.patch(f"{PKG}.CProfiler", return_value=profiler)
+    write_summary = mocker.patch(f"{PKG}.write_summary")
+    listener_ctor = mocker.patch(f"{PKG}.create_listener")
+    scheduler = NonCallableMock(ScenarioScheduler, run=Mock(return_value=Status.SUCCESS))
+    scheduler_ctor = mocker.patch(f"{PKG}.create_scheduler", return_value=scheduler)
+
+    assert app(executor_factory=executor_factory, profile_dir=sentinel.profile_dir) == 0
+
+    profiler_ctor.assert_called_once_with(sentinel.profile_dir)
+    assert [args[0] for args, _ in profiler.iterate.call_args_list] == ["load", "compile"]
+    assert listener_ctor.call_args[1]["profiler"] is profiler
+    assert scheduler_ctor.call_args[1]["profiler"] is profiler
+    profiler.dump.assert_called_once_with()
+    write_summary.assert_called_once_with(sentinel.profile_dir)
+
+
+def test_app_with_tracer(mocker, executor_factory, base_dir):
+    listener_ctor = mocker.patch(f"{PKG}.create_listener")
+
+    def _run(scenarios):
+        profiler = scheduler_ctor.call_args[1]["profiler"]
+        profiler.record_span("Scenario", "scenario", 1.0, 2.0)
+        return Status.SUCCESS
+
+    scheduler = NonCallableMock(ScenarioScheduler, run=Mock(side_effect=_run))
+    scheduler_ctor = mocker.patch(f"{PKG}.create_scheduler", return_value=scheduler)
+
+    path = os.path.join(base_dir, "trace.json")
+    assert app(paths=["foo.yml"], executor_factory=executor_factory, trace_path=path) == 0
+
+    tracer = listener_ctor.call_args[1]["profiler"]
+    assert isinstance(tracer, Tracer)
+    assert scheduler_ctor.call_args[1]["profiler"] is tracer
+    assert not os.path.exists(tracer.directory)
+    with open(path) as f:
+        trace = json.load(f)
+    assert trace["otherData"]["paths"] == ["foo.yml"]
+    assert [event["name"] for event in trace["traceEvents"] if event["ph"] == "b"] == ["Scenario"]
+
+
+def test_app_with_tracer_and_profiler(mocker, executor_factory, base_dir):
+    profiler = NonCallableMock(CProfiler)
+    profiler.iterate.side_effect = lambda name, iterable: iterable
+    mocker.patch(f"{PKG}.CProfiler", return_value=profiler)
+    mocker.patch(f"{PKG}.write_summary")
+    listener_ctor = mocker.patch(f"{PKG}.create_listener")
+    scheduler = NonCallableMock(ScenarioScheduler, run=Mock(return_value=Status.SUCCESS))
+    mocker.patch(f"{PKG}.create_scheduler", return_value=scheduler)
+
+    path = os.path.join(base_dir, "trace.json")
+    exit_code = app(
+        executor_factory=executor_factory,
+        profile_dir=sentinel.profile_dir,
+        trace_path=path,
+    )
+    assert exit_code == 0
+    assert isinstance(listener_ctor.call_args[1]["profiler"], MergingProfiler)
+    assert os.path.exists(path)
+
+
+def test_app_as_daemon(mocker, executor_factory, executor):
+    compile_scenarios = mocker.patch(f"{PKG}.compile_scenarios")
+    compile_scenarios.return_value = iter([sentinel.scenario])
+    listener_ctor = mocker.patch(f"{PKG}.create_listener")
+    scheduler = NonCallableMock(ScenarioScheduler)
+    scheduler.run.side_effect = [Status.SUCCESS, Status.FAILURE]
+    scheduler_ctor = mocker.patch(f"{PKG}.create_scheduler", return_value=scheduler)
+
+    def _run(func):
+        assert func() is Status.SUCCESS
+        return func()
+
+    daemon = NonCallableMock(Daemon, run=Mock(side_effect=_run))
+    daemon_ctor = mocker.patch(f"{PKG}.Daemon", return_value=daemon)
+
+    assert app(executor_factory=executor_factory, interval=sentinel.interval) == 1
+
+    daemon_ctor.assert_called_once_with(sentinel.interval, ANY)
+    listener_ctor.assert_called_once()
+    scheduler_ctor.assert_called_once()
+    assert scheduler_ctor.call_args[1]["keep_sessions"] is True
+    executor_factory.create.assert_called_once()
+    executor.__exit__.assert_called_once()
+
+    # Scenarios are compiled once and run repeatedly.
+    compile_scenarios.assert_called_once()
+    prepared = executor_factory.prepare.call_args[0][0]
+    assert list(prepared) == [sentinel.scenario]
+    assert list(prepared) == [sentinel.scenario]
+
+
+def test_app_watching(mocker, executor_factory, executor):
+    load_from_paths = mocker.patch(f"{PKG}.load_from_paths")
+    files = NonCallableMock(ScenarioFiles)
+    files.scenarios.return_value = sentinel.scenarios
+    files_ctor = mocker.patch(f"{PKG}.ScenarioFiles", return_value=files)
+    scheduler = NonCallableMock(ScenarioScheduler, run=Mock(return_value=Status.FAILURE))
+    scheduler_ctor = mocker.patch(f"{PKG}.create_scheduler", return_value=scheduler)
+    watcher = NonCallableMock(Watcher, run=Mock(return_value=Status.SUCCESS))
+    watcher_ctor = mocker.patch(f"{PKG}.Watcher", return_value=watcher)
+
+    exit_code = app(
+        paths=sentinel.paths,
+        arguments=sentinel.args,
+        executor_factory=executor_factory,
+        watch=True,
+    )
+    assert exit_code == 0
+
+    load_from_paths.assert_not_called()
+    files_ctor.assert_called_once_with(sentinel.paths, sentinel.args, ANY, ANY, ANY, None)
+    executor_factory.prepare.assert_called_once_with(sentinel.scenarios)
+    assert scheduler_ctor.call_args[1]["keep_sessions"] is True
+    watcher_ctor.assert_called_once_with(files, ANY)
+    watcher.run.assert_called_once_with(scheduler.run)
+    executor.__exit__.assert_called_once()
+
+
+def test_app_selecting(mocker, executor_factory):
+    mocker.patch(f"{PKG}.load_from_paths")
+    compile_scenarios = mocker.patch(f"{PKG}.compile_scenarios", return_value=iter([]))
+    selector_ctor = mocker.patch(f"{PKG}.ScenarioSelector", return_value=sentinel.selector)
+
+    exit_code = app(
+        tags=iter(["smoke"]),
+        excluded_tags=("slow",),
+        label=sentinel.label,
+        executor_factory=executor_factory,
+    )
+    assert exit_code == 0
+
+    selector_ctor.assert_called_once_with(
+        tags=["smoke"],
+        excluded_tags=["slow"],
+        label=sentinel.label,
+    )
+    assert compile_scenarios.call_args[1]["selector"] is sentinel.selector
@@ -0,0 +1,79 @@
+import logging
+import os
+import signal
+import threading
+from unittest.mock import NonCallableMock
+
+from pytest import mark
+
+from preacher.app.cli.daemon import Daemon
+from preacher.core.status import Status
+
+
+def _logger():
+    return NonCallableMock(logging.Logger)
+
+
+def test_run_until_stopped():
+    daemon = Daemon(0.0, _logger())
+    statuses = iter([Status.SUCCESS, Status.FAILURE, Status.UNSTABLE])
+
+    def _run():
+        status = next(statuses)
+        if status is Status.UNSTABLE:
+            daemon.stop()
+        return status
+
+    assert daemon.run(_run) is Status.UNSTABLE
+
+
+def test_triggered_before_interval():
+    daemon = Daemon(60.0, _logger())
+    runs = []
+
+    def _run():
+        runs.append(None)
+        if len(runs) == 1:
+            threading.Timer(0.01, daemon.trigger).start()
+        else:
+            daemon.stop()
+        return Status.SUCCESS
+
+    assert daemon.run(_run) is Status.SUCCESS
+    assert len(runs) == 2
+
+
+def test_stopped_while_waiting():
+    daemon = Daemon(60.0, _logger())
+    threading.Timer(0.01, daemon.stop).start()
+    assert daemon.run(lambda: Status.SUCCESS) is Status.SUCCESS
+
+
+@mark.skipif(not hasattr(signal, "SIGUSR1"), reason="no SIGUSR1")
+def test_signals():
+    original = signal.getsignal(signal.SIGTERM)
+    daemon = Daemon(60.0, _logger())
+    runs = []
+
+    def _run():
+        runs.append(None)
+        os.kill(os.getpid(), signal.SIGUSR1 if len(runs) == 1 else signal.SIGTERM)
+        return Status.SUCCESS
+
+    assert daemon.run(_run) is Status.SUCCESS
+    assert len(runs) == 2
+    assert signal.getsignal(signal.SIGTERM) is original
+
+
+def test_in_another_thread():
+    daemon = Daemon(0.0, _logger())
+    results = []
+
+    def _run():
+        daemon.stop()
+        return Status.SUCCESS
+
+    thread = threading.Thread(target=lambda: results.append(daemon.run(_run)))
+    thread.start()
+    thread.join()
+    assert results == [Status.SUCCESS]
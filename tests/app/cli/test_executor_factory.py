@@ -1,13 +1,127 @@
+import pickle
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import sentinel
 
+from pytest import raises
+
+from preacher.app.cli.executor import FORKING_PROCESS_POOL_FACTORY, HYBRID_POOL_FACTORY
+from preacher.app.cli.executor import HybridPoolFactory, compile_all
 from preacher.app.cli.executor import PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY
+from preacher.core.scenario import Scenario
+from preacher.core.scenario.case import Case
+
+PKG = "preacher.app.cli.executor"
 
 
 def test_process_pool_factory():
     executor = PROCESS_POOL_FACTORY.create(1)
     assert isinstance(executor, ProcessPoolExecutor)
+    assert PROCESS_POOL_FACTORY.prepare(sentinel.scenarios) is sentinel.scenarios
 
 
 def test_thread_pool_factory():
     executor = THREAD_POOL_FACTORY.create(1)
     assert isinstance(executor, ThreadPoolExecutor)
+    assert THREAD_POOL_FACTORY.prepare(sentinel.scenarios) is sentinel.scenarios
+
+
+def test_forking_process_pool_factory(mocker):
+    freeze = mocker.patch("gc.freeze")
+    unfreeze = mocker.patch("gc.unfreeze")
+    unshare_all = mocker.patch("preacher.app.cli.forking.unshare_all")
+
+    with FORKING_PROCESS_POOL_FACTORY.create(1) as executor:
+        assert isinstance(executor, ProcessPoolExecutor)
+        freeze.assert_called_once_with()
+        unfreeze.assert_not_called()
+        unshare_all.assert_not_called()
+
+    # Released when the pool shuts down.
+    unfreeze.assert_called_once_with()
+    unshare_all.assert_called_once_with()
+
+
+def test_forking_process_pool_factory_prepare(mocker):
+    share = mocker.patch(f"{PKG}.share")
+
+    case1, case2, case3 = Case(label="1"), Case(label="2"), Case(label="3")
+    scenario1 = Scenario(cases=[case1], subscenarios=[Scenario(cases=[case2])])
+    scenario2 = Scenario(cases=[case3])
+
+    class _Continuing:
+        """An iterator that can be continued after an error, like compiled scenarios."""
+
+        def __init__(self):
+            self._items = [scenario1, RuntimeError("message"), scenario2]
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            if not self._items:
+                raise StopIteration
+            item = self._items.pop(0)
+            if isinstance(item, Exception):
+                raise item
+            return item
+
+    prepared = FORKING_PROCESS_POOL_FACTORY.prepare(_Continuing())
+    assert [call.args[0] for call in share.call_args_list] == [case1, case2, case3]
+
+    # Can be replayed as the original.
+    for _ in range(2):
+        iterator = iter(prepared)
+        assert next(iterator) is scenario1
+        with raises(RuntimeError, match="message"):
+            next(iterator)
+        assert next(iterator) is scenario2
+        with raises(StopIteration):
+            next(iterator)
+
+    # Not shared, and so pickled as is.
+    assert pickle.loads(pickle.dumps(case1)).label == "1"
+
+
+def test_compile_all(mocker):
+    share = mocker.patch(f"{PKG}.share")
+
+    def _compile():
+        yield sentinel.scenario1
+        yield sentinel.scenario2
+
+    compiled = compile_all(_compile())
+    for _ in range(2):
+        assert list(compiled) == [sentinel.scenario1, sentinel.scenario2]
+
+    # Compiled scenarios are prepared without copying them.
+    assert list(FORKING_PROCESS_POOL_FACTORY.prepare(compile_all([]))) == []
+    share.assert_not_called()
+
+
+def test_hybrid_pool_factory_default(mocker):
+    mocker.patch("os.cpu_count", return_value=4)
+    executor_ctor = mocker.patch(
+        "preacher.app.cli.hybrid.HybridPoolExecutor",
+        return_value=sentinel.executor,
+    )
+
+    assert HYBRID_POOL_FACTORY.create(10) is sentinel.executor
+    executor_ctor.assert_called_once_with(4, 3)
+
+    executor_ctor.reset_mock()
+    HYBRID_POOL_FACTORY.create(2)
+    executor_ctor.assert_called_once_with(2, 1)
+
+
+def test_hybrid_pool_factory_given_sizes(mocker):
+    executor_ctor = mocker.patch(
+        "preacher.app.cli.hybrid.HybridPoolExecutor",
+        return_value=sentinel.executor,
+    )
+
+    assert HybridPoolFactory(2, 5).create(1) is sentinel.executor
+    executor_ctor.assert_called_once_with(2, 5)
+
+    executor_ctor.reset_mock()
+    HybridPoolFactory(processes=3).create(10)
+    executor_ctor.assert_called_once_with(3, 4)
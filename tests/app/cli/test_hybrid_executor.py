@@ -0,0 +1,142 @@
+import os
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from pytest import fixture, raises
+
+from preacher.app.cli.hybrid import HybridPoolExecutor
+
+
+def _where(value):
+    return value, os.getpid(), threading.get_ident()
+
+
+def _sleep(value):
+    time.sleep(0.2)
+    return _where(value)
+
+
+def _raise(message):
+    raise RuntimeError(message)
+
+
+def _return_unpicklable():
+    return lambda: None
+
+
+def _fail_unpickling():
+    raise RuntimeError("unpickling")
+
+
+class _UnpicklableInParent:
+    def __reduce__(self):
+        return _fail_unpickling, ()
+
+
+def _return_unpicklable_in_parent():
+    return _UnpicklableInParent()
+
+
+def _raise_unpicklable_in_parent():
+    raise _UnpicklableError()
+
+
+class _UnpicklableError(Exception):
+    def __reduce__(self):
+        return _fail_unpickling, ()
+
+
+def _exit():
+    os._exit(1)
+
+
+@fixture
+def context():
+    return get_context("fork")
+
+
+def test_invalid_sizes():
+    with raises(ValueError):
+        HybridPoolExecutor(0, 1)
+    with raises(ValueError):
+        HybridPoolExecutor(1, 0)
+
+
+def test_run_on_processes_and_threads(context):
+    with HybridPoolExecutor(1, 3, mp_context=context) as executor:
+        # Run concurrently on the threads of a process.
+        results = [f.result(timeout=10.0) for f in [executor.submit(_sleep, i) for i in range(3)]]
+    assert [value for value, _, _ in results] == [0, 1, 2]
+    assert len({pid for _, pid, _ in results}) == 1
+    assert len({thread for _, _, thread in results}) == 3
+
+    with HybridPoolExecutor(2, 2, mp_context=context) as executor:
+        results = [f.result() for f in [executor.submit(_where, i) for i in range(20)]]
+    assert [value for value, _, _ in results] == list(range(20))
+    assert all(pid != os.getpid() for _, pid, _ in results)
+
+    with raises(RuntimeError):
+        executor.submit(_where, 0)
+
+
+def test_errors(context):
+    with HybridPoolExecutor(1, 2, mp_context=context) as executor:
+        with raises(RuntimeError, match="message"):
+            executor.submit(_raise, "message").result()
+        with raises(RuntimeError, match="Failed to pickle the result"):
+            executor.submit(_return_unpicklable).result()
+        with raises(RuntimeError, match="Failed to unpickle the result"):
+            executor.submit(_return_unpicklable_in_parent).result(timeout=10.0)
+        with raises(RuntimeError, match="Failed to unpickle the result"):
+            executor.submit(_raise_unpicklable_in_parent).result(timeout=10.0)
+        with raises(Exception):
+            executor.submit(lambda: None)  # Not picklable.
+        assert executor.submit(_where, 1).result(timeout=10.0)[0] == 1
+
+
+def test_broken(context):
+    executor = HybridPoolExecutor(1, 1, mp_context=context)
+    with raises(BrokenProcessPool):
+        executor.submit(_exit).result(timeout=10.0)
+    with raises(BrokenProcessPool):
+        executor.submit(_where, 1)
+    executor.shutdown()
+
+
+def test_shutdown_without_tasks():
+    executor = HybridPoolExecutor(1, 1)
+    executor.shutdown()
+    executor.shutdown()
+
+
+def test_shutdown_without_waiting(context):
+    executor = HybridPoolExecutor(1, 1, mp_context=context)
+    future = executor.submit(_where, 1)
+    executor.shutdown(wait=False)
+    assert future.result(timeout=10.0)[0] == 1
+
+
+def test_cancelling_waiting_tasks(context):
+    with HybridPoolExecutor(1, 1, mp_context=context) as executor:
+        futures = [executor.submit(_sleep, i) for i in range(4)]
+        # A process takes as many tasks as its threads and one more.
+        assert [f.cancel() for f in futures] == [False, False, True, True]
+        assert [f.result(timeout=10.0)[0] for f in futures[:2]] == [0, 1]
+        assert executor.submit(_where, 4).result(timeout=10.0)[0] == 4
+
+
+def test_shutdown_cancelling_waiting_tasks(context):
+    executor = HybridPoolExecutor(1, 1, mp_context=context)
+    futures = [executor.submit(_sleep, i) for i in range(4)]
+    executor.shutdown(cancel_futures=True)
+    assert [f.result(timeout=10.0)[0] for f in futures[:2]] == [0, 1]
+    assert [f.cancelled() for f in futures] == [False, False, True, True]
+
+
+def test_shutdown_with_waiting_tasks(context):
+    executor = HybridPoolExecutor(1, 1, mp_context=context)
+    futures = [executor.submit(_sleep, i) for i in range(4)]
+    executor.shutdown()
+    assert [f.result()[0] for f in futures] == [0, 1, 2, 3]
@@ -1,14 +1,16 @@
 import os
+import re
 from tempfile import TemporaryDirectory
 
 from click.testing import CliRunner
 from pytest import fixture, mark
 
+from preacher.app.cli.executor import HYBRID_POOL_FACTORY
 from preacher.app.cli.executor import PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY
 from preacher.app.cli.main import main
 from preacher.core.status import Status
 
-PKG = "preacher.app.cli.main"
+PKG = "preacher.app.cli.app"
 
 
 @fixture
@@ -45,6 +47,7 @@ def test_show_and_exit(args):
         ["--argument", "foo=["],
         ["--argument", "foo=!include file.yml"],
         ["-l", "foo"],
+        ["--label", "("],
         ["--level", "bar"],
         ["-r", "foo"],
         ["--retry", "-1"],
@@ -52,8 +55,26 @@ def test_show_and_exit(args):
         ["--delay", "-0.1"],
         ["-t", "foo"],
         ["--timeout", "0.0"],
+        ["--max-failures", "0"],
+        ["--max-failures", "foo"],
+        ["--deadline", "foo"],
+        ["--deadline", "0.0"],
         ["-c", "foo"],
         ["--concurrency", "0"],
+        ["--body-limit", "-1"],
+        ["--processes", "0"],
+        ["--threads-per-process", "0"],
+        ["--processes", "2"],
+        ["-E", "thread", "--threads-per-process", "2"],
+        ["--profile", __file__],
+        ["--trace", os.path.dirname(__file__)],
+        ["--metrics", os.path.dirname(__file__)],
+        ["--metrics-port", "0"],
+        ["--metrics-port", "65536"],
+        ["--interval", "foo"],
+        ["--interval", "0.0"],
+        ["--watch"],
+        ["--watch", "--interval", "1", __file__],
         ["-C", "foo"],
         ["--concurrent-executor", "foo"],
         ["-p", "invalid"],
@@ -74,13 +95,29 @@ def test_given_invalid_options(args, base_dir):
         {
             "PREACHER_CLI_BASE_URL": "",
             "PREACHER_CLI_ARGUMENT": "",
+            "PREACHER_CLI_TAG": "",
+            "PREACHER_CLI_EXCLUDE_TAG": "",
+            "PREACHER_CLI_LABEL": "",
             "PREACHER_CLI_LEVEL": "",
             "PREACHER_CLI_RETRY": "",
             "PREACHER_CLI_DELAY": "",
             "PREACHER_CLI_TIMEOUT": "",
+            "PREACHER_CLI_FAIL_FAST": "",
+            "PREACHER_CLI_MAX_FAILURES": "",
+            "PREACHER_CLI_DEADLINE": "",
             "PREACHER_CLI_CONCURRENCY": "",
             "PREACHER_CLI_CONCURRENT_EXECUTOR": "",
+            "PREACHER_CLI_PROCESSES": "",
+            "PREACHER_CLI_THREADS_PER_PROCESS": "",
+            "PREACHER_CLI_PROFILE": "",
+            "PREACHER_CLI_TRACE": "",
+            "PREACHER_CLI_METRICS": "",
+            "PREACHER_CLI_METRICS_PORT": "",
+            "PREACHER_CLI_INTERVAL": "",
+            "PREACHER_CLI_WATCH": "",
             "PREACHER_CLI_PLUGIN": "",
+            "PREACHER_CLI_COMPACT": "",
+            "PREACHER_CLI_BODY_LIMIT": "",
         },
     ),
 )
@@ -93,13 +130,26 @@ def test_default(mocker, env):
         paths=(),
         base_url="",
         arguments={},
+        tags=(),
+        excluded_tags=(),
+        label=None,
         level=Status.SUCCESS,
         report_dir=None,
+        compact=False,
+        body_limit=None,
         retry=0,
         delay=0.1,
         timeout=None,
+        max_failures=None,
+        deadline=None,
         concurrency=1,
         executor_factory=PROCESS_POOL_FACTORY,
+        profile_dir=None,
+        trace_path=None,
+        metrics_path=None,
+        metrics_port=None,
+        interval=None,
+        watch=False,
         plugins=(),
         verbosity=0,
     )
@@ -119,20 +169,46 @@ def test_arguments(mocker, base_dir):
         "baz=1.2",
         "--argument",
         "spam=[ham,eggs]",
+        "--tag",
+        "smoke",
+        "--tag",
+        "fast",
+        "--exclude-tag",
+        "slow",
+        "--label",
+        "^foo",
         "--level",
         "unstable",
         "--report",
         os.path.join(base_dir, "report"),
+        "--compact",
+        "--body-limit",
+        "100",
         "--retry",
         "5",
         "--delay",
         "2.5",
         "--timeout",
         "3.5",
+        "--fail-fast",
+        "--max-failures",
+        "3",
+        "--deadline",
+        "600",
         "--concurrency",
         "4",
         "--executor",
-        "thread",
+        "hybrid",
+        "--profile",
+        os.path.join(base_dir, "profile"),
+        "--trace",
+        os.path.join(base_dir, "trace.json"),
+        "--metrics",
+        os.path.join(base_dir, "metrics.prom"),
+        "--metrics-port",
+        "9100",
+        "--interval",
+        "60",
         "-p",
         os.path.join(base_dir, "plugin.py"),
         "--plugin",
@@ -144,12 +220,23 @@ def test_arguments(mocker, base_dir):
     env = {
         "PREACHER_CLI_BASE_URL": "https://my-domain.com/api",
         "PREACHER_CLI_ARGUMENT": "foo",
+        "PREACHER_CLI_TAG": "foo",
+        "PREACHER_CLI_EXCLUDE_TAG": "foo",
+        "PREACHER_CLI_LABEL": "foo",
         "PREACHER_CLI_LEVEL": "foo",
         "PREACHER_CLI_RETRY": "foo",
         "PREACHER_CLI_DELAY": "foo",
         "PREACHER_CLI_TIMEOUT": "foo",
+        "PREACHER_CLI_FAIL_FAST": "foo",
+        "PREACHER_CLI_MAX_FAILURES": "foo",
+        "PREACHER_CLI_DEADLINE": "foo",
         "PREACHER_CLI_CONCURRENCY": "foo",
         "PREACHER_CLI_CONCURRENT_EXECUTOR": "foo",
+        "PREACHER_CLI_PROFILE": "foo",
+        "PREACHER_CLI_TRACE": "foo",
+        "PREACHER_CLI_METRICS": "foo",
+        "PREACHER_CLI_METRICS_PORT": "foo",
+        "PREACHER_CLI_INTERVAL": "foo",
         "PREACHER_CLI_PLUGIN": "foo",
     }
     result = CliRunner().invoke(main, args=args, env=env)
@@ -158,13 +245,26 @@ def test_arguments(mocker, base_dir):
         paths=(os.path.join(base_dir, "foo.yml"), os.path.join(base_dir, "bar.yml")),
         base_url="https://your-domain.com/api",
         arguments={"foo": None, "bar": 1, "baz": 1.2, "spam": ["ham", "eggs"]},
+        tags=("smoke", "fast"),
+        excluded_tags=("slow",),
+        label=re.compile("^foo"),
         level=Status.UNSTABLE,
         report_dir=os.path.join(base_dir, "report"),
+        compact=True,
+        body_limit=100,
         retry=5,
         delay=2.5,
         timeout=3.5,
+        max_failures=3,
+        deadline=600.0,
         concurrency=4,
-        executor_factory=THREAD_POOL_FACTORY,
+        executor_factory=HYBRID_POOL_FACTORY,
+        profile_dir=os.path.join(base_dir, "profile"),
+        trace_path=os.path.join(base_dir, "trace.json"),
+        metrics_path=os.path.join(base_dir, "metrics.prom"),
+        metrics_port=9100,
+        interval=60.0,
+        watch=False,
         plugins=(os.path.join(base_dir, "plugin.py"), os.path.join(base_dir, "dir")),
         verbosity=1,
     )
@@ -176,13 +276,25 @@ def test_environ(mocker, base_dir):
     env = {
         "PREACHER_CLI_BASE_URL": "https://my-domain.com/api",
         "PREACHER_CLI_ARGUMENT": 'foo=1 bar=" baz " spam="ham\'""eggs"',
+        "PREACHER_CLI_TAG": "smoke fast",
+        "PREACHER_CLI_EXCLUDE_TAG": "slow",
+        "PREACHER_CLI_LABEL": "bar$",
         "PREACHER_CLI_LEVEL": "failure",
         "PREACHER_CLI_REPORT": "reports/",
+        "PREACHER_CLI_COMPACT": "true",
+        "PREACHER_CLI_BODY_LIMIT": "10",
         "PREACHER_CLI_RETRY": "10",
         "PREACHER_CLI_DELAY": "1.2",
         "PREACHER_CLI_TIMEOUT": "3.4",
+        "PREACHER_CLI_MAX_FAILURES": "2",
+        "PREACHER_CLI_DEADLINE": "5.6",
         "PREACHER_CLI_CONCURRENCY": "5",
         "PREACHER_CLI_CONCURRENT_EXECUTOR": "thread",
+        "PREACHER_CLI_PROFILE": "profiles/",
+        "PREACHER_CLI_TRACE": "trace.json",
+        "PREACHER_CLI_METRICS": "metrics.prom",
+        "PREACHER_CLI_METRICS_PORT": "9101",
+        "PREACHER_CLI_INTERVAL": "1.5",
         "PREACHER_CLI_PLUGIN": ":".join(
             (
                 os.path.join(base_dir, "plugin.py"),
@@ -196,21 +308,89 @@ def test_environ(mocker, base_dir):
         paths=(),
         base_url="https://my-domain.com/api",
         arguments={"foo": 1, "bar": "baz", "spam": "ham'eggs"},
+        tags=("smoke", "fast"),
+        excluded_tags=("slow",),
+        label=re.compile("bar$"),
         level=Status.FAILURE,
         report_dir="reports/",
+        compact=True,
+        body_limit=10,
         retry=10,
         delay=1.2,
         timeout=3.4,
+        max_failures=2,
+        deadline=5.6,
         concurrency=5,
         executor_factory=THREAD_POOL_FACTORY,
+        profile_dir="profiles/",
+        trace_path="trace.json",
+        metrics_path="metrics.prom",
+        metrics_port=9101,
+        interval=1.5,
+        watch=False,
         plugins=(os.path.join(base_dir, "plugin.py"), os.path.join(base_dir, "dir")),
         verbosity=0,
     )
 
 
+@mark.parametrize(
+    ("args", "expected"),
+    (
+        ([], None),
+        (["--fail-fast"], 1),
+        (["--max-failures", "2"], 2),
+        (["--fail-fast", "--max-failures", "3"], 3),
+    ),
+)
+def test_fail_fast(mocker, base_dir, args, expected):
+    app = mocker.patch(f"{PKG}.app", return_value=0)
+
+    path = os.path.join(base_dir, "foo.yml")
+    result = CliRunner().invoke(main, args=args + [path])
+    assert result.exit_code == 0
+    assert app.call_args[1]["max_failures"] == expected
+    assert app.call_args[1]["paths"] == (path,)
+
+
+@mark.parametrize(
+    ("args", "env"),
+    (
+        (["--watch"], {}),
+        ([], {"PREACHER_CLI_WATCH": "true"}),
+    ),
+)
+def test_watch(mocker, base_dir, args, env):
+    app = mocker.patch(f"{PKG}.app", return_value=0)
+
+    path = os.path.join(base_dir, "foo.yml")
+    result = CliRunner().invoke(main, args=args + [path], env=env)
+    assert result.exit_code == 0
+    assert app.call_args[1]["paths"] == (path,)
+    assert app.call_args[1]["watch"] is True
+
+
 @mark.parametrize("exit_code", list(range(-1, 5)))
 def test_exit_code(mocker, exit_code):
     mocker.patch(f"{PKG}.app", return_value=exit_code)
 
     result = CliRunner().invoke(main)
     assert result.exit_code == exit_code
+
+
+@mark.parametrize(
+    ("args", "env", "expected"),
+    (
+        (["-E", "hybrid", "--processes", "2", "--threads-per-process", "3"], {}, (2, 3)),
+        (["--processes", "2"], {"PREACHER_CLI_CONCURRENT_EXECUTOR": "hybrid"}, (2, 5)),
+        (["-E", "hybrid"], {"PREACHER_CLI_THREADS_PER_PROCESS": "4"}, (3, 4)),
+    ),
+)
+def test_hybrid_executor_sizes(mocker, args, env, expected):
+    app = mocker.patch(f"{PKG}.app", return_value=0)
+    mocker.patch("os.cpu_count", return_value=3)
+    executor_ctor = mocker.patch("preacher.app.cli.hybrid.HybridPoolExecutor")
+
+    result = CliRunner().invoke(main, args=args, env=env)
+    assert result.exit_code == 0
+    app.call_args[1]["executor_factory"].create(10)
+    executor_ctor.assert_called_once_with(*expected)
@@ -1,5 +1,6 @@
 from click import Option
 
+from preacher.app.cli.executor import FORKING_PROCESS_POOL_FACTORY, HYBRID_POOL_FACTORY
 from preacher.app.cli.executor import PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY
 from preacher.app.cli.option import LevelType, ExecutorFactoryType
 from preacher.core.status import Status
@@ -25,9 +26,13 @@ def test_executor_factory_type():
     tp = ExecutorFactoryType()
 
     param = Option(["--executor"])
-    assert tp.get_metavar(param) == "[process|thread]"
-    assert tp.get_missing_message(param) == "Choose from:\n\tprocess,\n\tthread"
+    assert tp.get_metavar(param) == "[process|thread|fork|hybrid]"
+    assert tp.get_missing_message(param) == (
+        "Choose from:\n\tprocess,\n\tthread,\n\tfork,\n\thybrid"
+    )
 
     assert tp.convert("process", None, None) is PROCESS_POOL_FACTORY
     assert tp.convert("Thread", None, None) is THREAD_POOL_FACTORY
+    assert tp.convert("fork", None, None) is FORKING_PROCESS_POOL_FACTORY
+    assert tp.convert("hybrid", None, None) is HYBRID_POOL_FACTORY
     assert tp.convert(PROCESS_POOL_FACTORY, None, None) is PROCESS_POOL_FACTORY
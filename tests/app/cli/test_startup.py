@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+from pytest import mark
+
+HEAVY_MODULES = ("requests", "lxml", "jinja2", "hamcrest", "yaml", "jq", "pluggy", "dateutil")
+
+
+@mark.parametrize("module", ("preacher.app.cli.main", "preacher.app.cli.executor"))
+def test_heavy_modules_not_imported_on_startup(module):
+    code = "\n".join(
+        (
+            "import sys",
+            f"import {module}",
+            "print(' '.join(sorted(name for name in sys.modules if '.' not in name)))",
+        )
+    )
+    output = subprocess.run(
+        (sys.executable, "-c", code),
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+    imported = set(output.split())
+    assert not imported.intersection(HEAVY_MODULES)
@@ -0,0 +1,138 @@
+import logging
+import os
+import threading
+from tempfile import TemporaryDirectory
+from unittest.mock import NonCallableMock, sentinel
+
+from pytest import fixture, raises
+
+from preacher.app.cli.watch import ScenarioFiles, Watcher
+from preacher.compilation.error import CompilationError
+from preacher.core.status import Status
+from preacher.plugin import impl
+from preacher.plugin.manager import get_plugin_manager
+
+
+@fixture
+def base_dir():
+    with TemporaryDirectory() as path:
+        _write(os.path.join(path, "foo.yml"), "label: foo\ncases: !include cases.yml")
+        _write(os.path.join(path, "cases.yml"), "- label: case")
+        _write(os.path.join(path, "bar.yml"), "label: bar\n---\nlabel: baz")
+        yield path
+
+
+def _write(path, content):
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def _labels(scenarios):
+    return [scenario.label for scenario in scenarios]
+
+
+def _files(base_dir, *names):
+    paths = [os.path.join(base_dir, name) for name in names]
+    plugin_manager = get_plugin_manager()
+    if not plugin_manager.is_registered(impl):
+        plugin_manager.register(impl)
+    return ScenarioFiles(paths, plugin_manager=plugin_manager)
+
+
+def test_scenario_files_recompiled_only_when_changed(base_dir):
+    files = _files(base_dir, "foo.yml", "bar.yml")
+    scenarios = list(files.scenarios())
+    assert _labels(scenarios) == ["foo", "bar", "baz"]
+    assert files.update() == []
+
+    _write(os.path.join(base_dir, "cases.yml"), "- label: case\n- label: case")
+    assert files.update() == [os.path.join(base_dir, "foo.yml")]
+    assert files.update() == []
+
+    foo = list(files.scenarios([os.path.join(base_dir, "foo.yml")]))
+    assert len(foo) == 1
+    assert foo[0] is not scenarios[0]
+    assert len(foo[0].cases) == 2
+    assert list(files.scenarios([os.path.join(base_dir, "bar.yml")])) == scenarios[1:]
+
+
+def test_scenario_files_recompiled_when_parameters_change(base_dir):
+    _write(
+        os.path.join(base_dir, "params.yml"),
+        "label: params\nparameters:\n  source: !path rows.csv\n  label: name\ncases: []",
+    )
+    _write(os.path.join(base_dir, "rows.csv"), "name\na\n")
+    files = _files(base_dir, "params.yml")
+    assert [_labels(s.subscenarios) for s in files.scenarios()] == [["a"]]
+    assert files.update() == []
+
+    _write(os.path.join(base_dir, "rows.csv"), "name\na\nbb\n")
+    assert files.update() == [os.path.join(base_dir, "params.yml")]
+    assert [_labels(s.subscenarios) for s in files.scenarios()] == [["a"], ["bb"]]
+
+
+def test_scenario_files_with_errors(base_dir):
+    _write(os.path.join(base_dir, "foo.yml"), "label: []")
+    files = _files(base_dir, "foo.yml", "bar.yml", "missing.yml")
+
+    for _ in range(2):
+        scenarios = iter(files.scenarios())
+        with raises(CompilationError):
+            next(scenarios)
+        assert _labels([next(scenarios), next(scenarios)]) == ["bar", "baz"]
+        with raises(Exception):
+            next(scenarios)
+
+    _write(os.path.join(base_dir, "missing.yml"), "label: found")
+    assert files.update() == [os.path.join(base_dir, "missing.yml")]
+    assert _labels(files.scenarios([os.path.join(base_dir, "missing.yml")])) == ["found"]
+
+
+def _watcher(files):
+    return Watcher(files, NonCallableMock(logging.Logger), poll_interval=0.0)
+
+
+def test_watcher_runs_changed_scenarios():
+    files = NonCallableMock(ScenarioFiles)
+    files.scenarios.side_effect = lambda paths=None: paths or sentinel.all
+    files.update.side_effect = [[], ["foo.yml"], [], ["bar.yml"]]
+    watcher = _watcher(files)
+    runs = []
+
+    def _run(scenarios):
+        runs.append(scenarios)
+        if len(runs) == 3:
+            watcher.stop()
+        return Status.SUCCESS if len(runs) < 3 else Status.FAILURE
+
+    assert watcher.run(_run) is Status.FAILURE
+    assert runs == [sentinel.all, ["foo.yml"], ["bar.yml"]]
+
+
+def test_watcher_triggered():
+    files = NonCallableMock(ScenarioFiles)
+    files.scenarios.side_effect = lambda paths=None: paths or sentinel.all
+    files.update.return_value = []
+    watcher = Watcher(files, NonCallableMock(logging.Logger), poll_interval=60.0)
+    runs = []
+
+    def _run(scenarios):
+        runs.append(scenarios)
+        if len(runs) == 1:
+            threading.Timer(0.01, watcher.trigger).start()
+        else:
+            watcher.stop()
+        return Status.SUCCESS
+
+    assert watcher.run(_run) is Status.SUCCESS
+    assert runs == [sentinel.all, sentinel.all]
+
+
+def test_watcher_stopped_while_waiting():
+    files = NonCallableMock(ScenarioFiles)
+    files.update.return_value = []
+    watcher = Watcher(files, NonCallableMock(logging.Logger), poll_interval=60.0)
+    threading.Timer(0.01, watcher.stop).start()
+
+    assert watcher.run(lambda scenarios: Status.UNSTABLE) is Status.UNSTABLE
+    files.update.assert_not_called()
@@ -200,3 +200,12 @@ def test_add_default_extractions(mocker, value, expected_factory, expected_call)
 
     assert compiler.compile(value) is sentinel.extraction
     factory.assert_has_calls([expected_call])
+
+
+def test_compiled_extractors_are_shared(compiler, jq_factory):
+    jq_factory.side_effect = lambda *_args: object()
+
+    extractor = compiler.compile({"jq": ".foo", "multiple": True})
+    assert compiler.compile({"multiple": True, "jq": ".foo"}) is extractor
+    assert compiler.compile({"jq": ".foo"}) is not extractor
+    assert jq_factory.call_count == 2
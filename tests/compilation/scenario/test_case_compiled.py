@@ -14,6 +14,8 @@ def test_replace():
         request=sentinel.initial_request,
         response=sentinel.initial_response,
         wait=sentinel.initial_wait,
+        tags=sentinel.initial_tags,
+        depends_on=sentinel.initial_depends_on,
     )
 
     other = CaseCompiled()
@@ -23,6 +25,8 @@ def test_replace():
     assert replaced.request is sentinel.initial_request
     assert replaced.response is sentinel.initial_response
     assert replaced.wait is sentinel.initial_wait
+    assert replaced.tags is sentinel.initial_tags
+    assert replaced.depends_on is sentinel.initial_depends_on
 
     other = CaseCompiled(
         label=sentinel.label,
@@ -30,6 +34,8 @@ def test_replace():
         request=sentinel.request,
         response=sentinel.response,
         wait=sentinel.wait,
+        tags=sentinel.tags,
+        depends_on=sentinel.depends_on,
     )
     replaced = initial.replace(other)
     assert replaced.label is sentinel.label
@@ -37,6 +43,8 @@ def test_replace():
     assert replaced.request is sentinel.request
     assert replaced.response is sentinel.response
     assert replaced.wait is sentinel.wait
+    assert replaced.tags is sentinel.tags
+    assert replaced.depends_on is sentinel.depends_on
 
 
 def test_fix_hollow(mocker):
@@ -53,6 +61,8 @@ def test_fix_hollow(mocker):
         request=None,
         response=None,
         waiting_time=None,
+        tags=(),
+        depends_on=(),
     )
 
 
@@ -72,6 +82,8 @@ def test_fix_filled(mocker):
         request=request,
         response=response,
         wait=sentinel.wait,
+        tags=sentinel.tags,
+        depends_on=sentinel.depends_on,
     )
     fixed = compiled.fix()
     assert fixed is sentinel.fixed
@@ -83,6 +95,8 @@ def test_fix_filled(mocker):
         request=sentinel.request,
         response=sentinel.response,
         waiting_time=sentinel.wait,
+        tags=sentinel.tags,
+        depends_on=sentinel.depends_on,
     )
     request.fix.assert_called_once_with()
     response.fix.assert_called_once_with()
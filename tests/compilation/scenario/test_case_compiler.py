@@ -46,6 +46,9 @@ def desc():
         ({"label": []}, [NamedNode("label")]),
         ({"enabled": []}, [NamedNode("enabled")]),
         ({"wait": "foo"}, [NamedNode("wait")]),
+        ({"tags": 1}, [NamedNode("tags"), IndexedNode(0)]),
+        ({"tags": ["foo", []]}, [NamedNode("tags"), IndexedNode(1)]),
+        ({"depends_on": {}}, [NamedNode("depends_on"), IndexedNode(0)]),
     ),
 )
 def test_given_invalid_values(compiler: CaseCompiler, value, expected_path):
@@ -89,6 +92,8 @@ def test_given_an_empty_object(compiler: CaseCompiler, req, res):
     assert compiled.request is None
     assert compiled.response is None
     assert compiled.wait is None
+    assert compiled.tags is None
+    assert compiled.depends_on is None
 
     req.compile.assert_not_called()
     res.compile.assert_not_called()
@@ -103,6 +108,8 @@ def test_creates_a_case(compiler: CaseCompiler, req, res, desc):
             "request": {"path": "/path"},
             "response": {"key": "value"},
             "wait": "2 minutes",
+            "tags": "smoke",
+            "depends_on": ["foo", "bar"],
         }
     )
     assert compiled.label == "label"
@@ -112,6 +119,8 @@ def test_creates_a_case(compiler: CaseCompiler, req, res, desc):
     assert compiled.response is sentinel.response
     assert compiled.wait
     assert compiled.wait.total_seconds() == 120.0
+    assert compiled.tags == ["smoke"]
+    assert compiled.depends_on == ["foo", "bar"]
 
     req.compile.assert_called_once_with({"path": "/path"})
     res.compile.assert_called_once_with({"key": "value"})
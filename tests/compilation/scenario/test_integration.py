@@ -16,6 +16,7 @@ def test_compile_scenario(mocker):
         arguments=sentinel.args,
         plugin_manager=sentinel.plugin_manager,
         logger=sentinel.logger,
+        selector=sentinel.selector,
     )
     assert list(scenarios) == [sentinel.scenario]
 
@@ -23,4 +24,8 @@ def test_compile_scenario(mocker):
         plugin_manager=sentinel.plugin_manager,
         logger=sentinel.logger,
     )
-    compiler.compile_flattening.assert_called_once_with(sentinel.objs, arguments=sentinel.args)
+    compiler.compile_flattening.assert_called_once_with(
+        sentinel.objs,
+        arguments=sentinel.args,
+        selector=sentinel.selector,
+    )
@@ -6,12 +6,22 @@ from preacher.compilation.argument import Argument
 from preacher.compilation.error import CompilationError, NamedNode, IndexedNode
 from preacher.compilation.parameter import Parameter
 from preacher.compilation.scenario.case import CaseCompiler
+from preacher.compilation.scenario.factory import create_scenario_compiler
 from preacher.compilation.scenario.scenario import ScenarioCompiler
+from preacher.compilation.scenario.selection import ScenarioSelector
 from preacher.compilation.verification import DescriptionCompiler
 
 PKG = "preacher.compilation.scenario.scenario"
 
 
+@fixture(autouse=True)
+def compiled_items():
+    # Compiled cases and scenarios are checked for their dependencies.
+    for item in (sentinel.case, sentinel.sub_case, sentinel.scenario):
+        item.label = None
+        item.depends_on = ()
+
+
 @fixture
 def compiler(description, case) -> ScenarioCompiler:
     return ScenarioCompiler(description=description, case=case)
@@ -52,6 +62,7 @@ def sub_case():
         ("", []),
         ({"label": []}, [NamedNode("label")]),
         ({"ordered": 1}, [NamedNode("ordered")]),
+        ({"tags": [1]}, [NamedNode("tags"), IndexedNode(0)]),
         ({"parameters": ""}, [NamedNode("parameters"), IndexedNode(0)]),
         ({"subscenarios": ""}, [NamedNode("subscenarios"), IndexedNode(0)]),
     ),
@@ -74,6 +85,8 @@ def test_given_an_empty_object(compiler: ScenarioCompiler, case, case_of_default
         conditions=[],
         cases=[],
         subscenarios=[],
+        tags=[],
+        depends_on=[],
     )
 
     case.compile_default.assert_called_once_with({})
@@ -118,6 +131,8 @@ def test_given_a_filled_object(
                 conditions=[],
                 cases=[sentinel.sub_case],
                 subscenarios=[],
+                tags=[],
+                depends_on=[],
             ),
             call(
                 label="v1",
@@ -125,6 +140,8 @@ def test_given_a_filled_object(
                 conditions=[sentinel.description],
                 cases=[sentinel.case, sentinel.case],
                 subscenarios=[sentinel.scenario],
+                tags=[],
+                depends_on=[],
             ),
         ]
     )
@@ -147,7 +164,7 @@ def test_given_empty_parameter(compiler: ScenarioCompiler, mocker):
     scenario = compiler.compile({"parameters": []})
     assert scenario is sentinel.scenario
 
-    ctor.assert_called_once_with(label=None, subscenarios=[])
+    ctor.assert_called_once_with(label=None, subscenarios=[], tags=[], depends_on=[])
     compile_parameter.assert_not_called()
 
 
@@ -204,6 +221,8 @@ def test_given_filled_parameters(
                 conditions=[],
                 cases=[],
                 subscenarios=[],
+                tags=[],
+                depends_on=[],
             ),
             call(
                 label="param1",
@@ -211,6 +230,8 @@ def test_given_filled_parameters(
                 conditions=[sentinel.description],
                 cases=[sentinel.case],
                 subscenarios=[sentinel.scenario],
+                tags=[],
+                depends_on=[],
             ),
             call(
                 label="eggs",
@@ -218,6 +239,8 @@ def test_given_filled_parameters(
                 conditions=[],
                 cases=[],
                 subscenarios=[],
+                tags=[],
+                depends_on=[],
             ),
             call(
                 label="param2",
@@ -225,8 +248,15 @@ def test_given_filled_parameters(
                 conditions=[sentinel.description],
                 cases=[sentinel.case],
                 subscenarios=[sentinel.scenario],
+                tags=[],
+                depends_on=[],
+            ),
+            call(
+                label="original",
+                subscenarios=[sentinel.scenario] * 2,
+                tags=[],
+                depends_on=[],
             ),
-            call(label="original", subscenarios=[sentinel.scenario] * 2),
         ]
     )
     compile_parameter.assert_has_calls(
@@ -253,12 +283,8 @@ def test_given_filled_parameters(
             call({"spam": "eggs"}),
         ]
     )
-    case_of_default.compile_default.assert_has_calls(
-        [
-            call().compile_default({}),
-            call().compile_default({}),
-        ]
-    )
+    # Compiled only once because it does not depend on any argument.
+    case_of_default.compile_default.assert_called_once_with({})
 
 
 def test_compile_flattening(compiler: ScenarioCompiler):
@@ -283,3 +309,258 @@ def test_compile_flattening(compiler: ScenarioCompiler):
 
     with raises(StopIteration):
         next(scenarios)
+
+
+def test_compile_flattening_with_selector(compiler: ScenarioCompiler):
+    obj = [{"label": "foo", "tags": "skipped", "cases": "invalid"}, {"label": "bar"}]
+    selector = NonCallableMock(ScenarioSelector)
+    selector.may_select.side_effect = [False, True]
+    selector.select.return_value = None
+
+    scenarios = compiler.compile_flattening(obj, selector=selector)
+    assert list(scenarios) == []
+
+    selector.may_select.assert_has_calls([call(obj[0]), call(obj[1])])
+    selector.select.assert_called_once()
+    assert selector.select.call_args[0][0].label == "bar"
+
+
+def test_given_tags(compiler: ScenarioCompiler, mocker):
+    ctor = mocker.patch(f"{PKG}.Scenario", return_value=sentinel.scenario)
+
+    scenario = compiler.compile(
+        {
+            "tags": Argument("tag"),
+            "parameters": [{"args": {}}],
+            "subscenarios": [{"tags": ["foo", "bar"]}],
+        },
+        arguments={"tag": "smoke"},
+    )
+    assert scenario is sentinel.scenario
+
+    ctor.assert_has_calls(
+        [
+            call(
+                label=None,
+                ordered=True,
+                conditions=[],
+                cases=[],
+                subscenarios=[],
+                tags=["foo", "bar"],
+                depends_on=[],
+            ),
+            call(
+                label=None,
+                ordered=True,
+                conditions=[],
+                cases=[],
+                subscenarios=[sentinel.scenario],
+                tags=[],
+                depends_on=[],
+            ),
+            call(label=None, subscenarios=[sentinel.scenario], tags=["smoke"], depends_on=[]),
+        ]
+    )
+
+
+@mark.parametrize(
+    ("obj", "expected_path"),
+    (
+        ({"depends_on": "foo"}, [NamedNode("depends_on")]),
+        (
+            {"ordered": False, "cases": [{"label": "foo"}, {"depends_on": "bar"}]},
+            [NamedNode("cases"), IndexedNode(1), NamedNode("depends_on")],
+        ),
+        (
+            {"cases": [{"label": "foo"}, {"depends_on": "foo"}]},
+            [NamedNode("cases"), IndexedNode(1), NamedNode("depends_on")],
+        ),
+        (
+            {"ordered": False, "cases": [{"label": "foo", "depends_on": "foo"}]},
+            [NamedNode("cases"), IndexedNode(0), NamedNode("depends_on")],
+        ),
+        (
+            {"subscenarios": [{"label": "foo"}, {"label": "bar", "depends_on": ["foo", "bar"]}]},
+            [NamedNode("subscenarios"), IndexedNode(1), NamedNode("depends_on")],
+        ),
+        (
+            {
+                "subscenarios": [
+                    {"label": "foo", "depends_on": "bar"},
+                    {"label": "bar", "depends_on": "foo"},
+                    {"label": "baz"},
+                ],
+            },
+            [NamedNode("subscenarios"), IndexedNode(0), NamedNode("depends_on")],
+        ),
+    ),
+)
+def test_given_invalid_dependencies(obj, expected_path):
+    with raises(CompilationError) as error_info:
+        create_scenario_compiler().compile(obj)
+    assert error_info.value.path == expected_path
+
+
+def test_given_dependencies():
+    scenario = create_scenario_compiler().compile(
+        {
+            "ordered": False,
+            "cases": [{"label": "foo"}, {"label": "bar", "depends_on": ["foo"]}],
+            "subscenarios": [
+                {"label": "foo"},
+                {"label": "bar", "depends_on": "foo", "parameters": [{"args": {}}]},
+            ],
+        }
+    )
+    assert [case.depends_on for case in scenario.cases] == [(), ("foo",)]
+    assert [s.depends_on for s in scenario.subscenarios] == [(), ("foo",)]
+    assert scenario.subscenarios[1].subscenarios[0].depends_on == ()
+
+
+def test_given_parameter_source(compiler: ScenarioCompiler, tmp_path, mocker):
+    ctor = mocker.patch(f"{PKG}.Scenario", return_value=sentinel.scenario)
+    path = tmp_path / "params.csv"
+    path.write_text("name,value\nfoo,1\nbar,2\n")
+
+    scenario = compiler.compile(
+        {
+            "label": "original",
+            "parameters": {"source": str(path), "label": "name"},
+            "ordered": False,
+            "subscenarios": [{"label": Argument("value")}],
+        }
+    )
+    assert scenario is sentinel.scenario
+
+    ctor.assert_has_calls(
+        [
+            call(
+                label="1",
+                ordered=True,
+                conditions=[],
+                cases=[],
+                subscenarios=[],
+                tags=[],
+                depends_on=[],
+            ),
+            call(
+                label="foo",
+                ordered=False,
+                conditions=[],
+                cases=[],
+                subscenarios=[sentinel.scenario],
+                tags=[],
+                depends_on=[],
+            ),
+            call(
+                label="2",
+                ordered=True,
+                conditions=[],
+                cases=[],
+                subscenarios=[],
+                tags=[],
+                depends_on=[],
+            ),
+            call(
+                label="bar",
+                ordered=False,
+                conditions=[],
+                cases=[],
+                subscenarios=[sentinel.scenario],
+                tags=[],
+                depends_on=[],
+            ),
+            call(
+                label="original",
+                subscenarios=[sentinel.scenario] * 2,
+                tags=[],
+                depends_on=[],
+            ),
+        ]
+    )
+
+
+def test_when_parameter_source_fails(compiler: ScenarioCompiler, tmp_path):
+    path = tmp_path / "params.jsonl"
+    path.write_text('{"label": "foo"}\n"bar"\n')
+
+    with raises(CompilationError) as error_info:
+        compiler.compile({"parameters": {"source": str(path)}})
+    assert error_info.value.path == [NamedNode("parameters"), IndexedNode(1)]
+
+
+def test_static_parts_are_compiled_once_for_parameters(
+    compiler: ScenarioCompiler,
+    description,
+    case,
+    case_of_default,
+    sub_case,
+):
+    scenario = compiler.compile(
+        obj={
+            "parameters": [{"args": {"foo": "bar"}}, {"args": {"foo": "baz"}}],
+            "default": {"static": True},
+            "when": [{"static": True}],
+            "cases": [{"static": True}, {"foo": Argument("foo")}],
+            "subscenarios": [{"label": "static", "cases": [{"static": True}]}],
+        },
+    )
+
+    first, second = scenario.subscenarios
+    assert first.conditions is second.conditions
+    assert first.subscenarios[0] is second.subscenarios[0]
+    assert first.cases is not second.cases
+
+    case.compile_default.assert_called_once_with({"static": True})
+    description.compile.assert_called_once_with({"static": True})
+    case_of_default.compile_fixed.assert_has_calls(
+        [
+            call({"static": True}),
+            call({"foo": "bar"}),
+            call({"static": True}),
+            call({"foo": "baz"}),
+        ]
+    )
+    sub_case.compile_fixed.assert_called_once_with({"static": True})
+
+
+def test_compile_flattening_parameter_source(compiler: ScenarioCompiler, tmp_path):
+    path = tmp_path / "params.jsonl"
+    path.write_text('{"label": "foo"}\n{"label": "bar"}\n"baz"\n')
+    obj = [
+        {"label": "other"},
+        {
+            "label": "original",
+            "tags": "tag",
+            "parameters": {"source": str(path), "label": "label"},
+        },
+    ]
+
+    scenarios = compiler.compile_flattening(obj)
+    assert next(scenarios).label == "other"
+    for label in ("foo", "bar"):
+        # Parameterized scenarios are compiled one by one.
+        scenario = next(scenarios)
+        assert scenario.label == "original"
+        assert scenario.tags == frozenset(["tag"])
+        assert [subscenario.label for subscenario in scenario.subscenarios] == [label]
+
+    with raises(CompilationError) as error_info:
+        next(scenarios)
+    assert error_info.value.path == [IndexedNode(1), NamedNode("parameters"), IndexedNode(2)]
+
+
+def test_compile_flattening_parameter_source_with_selector(
+    compiler: ScenarioCompiler,
+    tmp_path,
+):
+    path = tmp_path / "params.csv"
+    path.write_text("value\nfoo\nbar\n")
+    obj = {"label": "original", "parameters": {"source": str(path)}}
+    selector = NonCallableMock(ScenarioSelector)
+    selector.may_select.return_value = True
+    selector.select.side_effect = lambda scenario: scenario
+
+    scenarios = list(compiler.compile_flattening(obj, selector=selector))
+    assert [scenario.label for scenario in scenarios] == ["original", "original"]
+    assert selector.select.call_count == 2
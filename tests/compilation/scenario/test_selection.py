@@ -0,0 +1,173 @@
+import re
+
+from pytest import mark
+
+from preacher.compilation.argument import Argument
+from preacher.compilation.scenario.selection import ScenarioSelector
+from preacher.core.scenario import Case, Scenario
+
+
+@mark.parametrize(
+    ("selector", "obj", "expected"),
+    (
+        (ScenarioSelector(), {}, True),
+        (ScenarioSelector(label=re.compile("^foo")), [], True),
+        (ScenarioSelector(label=re.compile("^foo")), {"label": "foobar"}, True),
+        (ScenarioSelector(label=re.compile("^foo")), {"label": "barfoo"}, False),
+        (ScenarioSelector(label=re.compile("^foo")), {"label": Argument("x")}, True),
+        (ScenarioSelector(excluded_tags=["slow"]), {"tags": "slow"}, False),
+        (ScenarioSelector(excluded_tags=["slow"]), {"tags": ["smoke", "slow"]}, False),
+        (ScenarioSelector(excluded_tags=["slow"]), {"tags": ["smoke"]}, True),
+        (ScenarioSelector(excluded_tags=["slow"]), {"tags": Argument("x")}, True),
+        (ScenarioSelector(tags=["smoke"]), {"tags": ["smoke"]}, True),
+        (ScenarioSelector(tags=["smoke"]), {"tags": Argument("x")}, True),
+        (ScenarioSelector(tags=["smoke"]), {"tags": ["slow"]}, False),
+        (ScenarioSelector(tags=["smoke"]), {"cases": [{}, {"label": "foo"}]}, False),
+        (ScenarioSelector(tags=["smoke"]), {"cases": [{}, {"tags": "foo"}]}, True),
+        (ScenarioSelector(tags=["smoke"]), {"cases": Argument("x")}, True),
+        (ScenarioSelector(tags=["smoke"]), {"default": {"tags": "foo"}}, True),
+        (ScenarioSelector(tags=["smoke"]), {"subscenarios": [{"cases": [{"tags": []}]}]}, True),
+    ),
+)
+def test_may_select(selector: ScenarioSelector, obj, expected):
+    assert selector.may_select(obj) is expected
+
+
+def test_select_all():
+    scenario = Scenario(cases=[Case()], subscenarios=[Scenario()])
+    assert ScenarioSelector().select(scenario) is scenario
+
+
+@mark.parametrize(
+    ("label", "expected"),
+    (
+        (None, False),
+        ("bar", False),
+        ("foobar", True),
+    ),
+)
+def test_select_by_label(label, expected):
+    scenario = Scenario(label=label, subscenarios=[Scenario(label="foo")])
+    selected = ScenarioSelector(label=re.compile("^foo")).select(scenario)
+    assert (selected is scenario) is expected
+
+
+def test_select_by_tags():
+    selector = ScenarioSelector(tags=["smoke"], excluded_tags=["slow"])
+    scenario = Scenario(
+        label="root",
+        ordered=False,
+        cases=[Case(label="a"), Case(label="b", tags=["smoke"]), Case(label="c")],
+        subscenarios=[
+            Scenario(label="included", tags=["smoke"], cases=[Case(label="d")]),
+            Scenario(
+                label="partial",
+                tags=["smoke"],
+                cases=[Case(tags=["slow"]), Case()],
+                depends_on=["included"],
+            ),
+            Scenario(label="excluded", tags=["smoke", "slow"], cases=[Case()]),
+            Scenario(label="not included", cases=[Case(label="e")]),
+        ],
+        tags=["root"],
+    )
+
+    selected = selector.select(scenario)
+    assert selected is not None
+    assert selected.label == "root"
+    assert not selected.ordered
+    assert selected.tags == frozenset(["root"])
+    assert [case.label for case in selected.cases] == ["b"]
+
+    subscenarios = selected.subscenarios
+    assert [subscenario.label for subscenario in subscenarios] == ["included", "partial"]
+    assert subscenarios[0] is scenario.subscenarios[0]
+    assert subscenarios[1].cases == [scenario.subscenarios[1].cases[1]]
+    assert subscenarios[1].depends_on == ("included",)
+
+
+def test_select_cases_in_an_ordered_scenario():
+    selector = ScenarioSelector(tags=["smoke"], excluded_tags=["slow"])
+    scenario = Scenario(
+        ordered=True,
+        cases=[
+            Case(label="login"),
+            Case(label="wait", tags=["slow"]),
+            Case(label="read", tags=["smoke"]),
+            Case(label="delete"),
+        ],
+    )
+
+    selected = selector.select(scenario)
+    assert selected is not None
+    assert selected.ordered
+    assert [case.label for case in selected.cases] == ["login", "read"]
+
+
+def test_select_a_case_appearing_twice_in_an_ordered_scenario():
+    selector = ScenarioSelector(tags=["smoke"])
+    shared = Case(label="read", tags=["smoke"])
+    scenario = Scenario(ordered=True, cases=[shared, Case(label="login"), shared])
+    assert selector.select(scenario) is scenario
+
+
+def test_select_dependencies_of_cases():
+    selector = ScenarioSelector(tags=["smoke"], excluded_tags=["slow"])
+    scenario = Scenario(
+        ordered=False,
+        cases=[
+            Case(label="create"),
+            Case(label="update", depends_on=["create"]),
+            Case(label="read", tags=["smoke"], depends_on=["update"]),
+            Case(label="other"),
+            Case(label="wait", tags=["slow"]),
+            Case(label="check", tags=["smoke"], depends_on=["wait"]),
+        ],
+    )
+
+    selected = selector.select(scenario)
+    assert selected is not None
+    assert [(case.label, case.depends_on) for case in selected.cases] == [
+        ("create", ()),
+        ("update", ("create",)),
+        ("read", ("update",)),
+    ]
+
+
+def test_select_dependencies_of_subscenarios():
+    selector = ScenarioSelector(tags=["smoke"], excluded_tags=["slow"])
+    scenario = Scenario(
+        subscenarios=[
+            Scenario(label="setup", cases=[Case(label="login"), Case(tags=["slow"])]),
+            Scenario(label="read", cases=[Case(tags=["smoke"])], depends_on=["setup"]),
+            Scenario(label="other", cases=[Case()]),
+            Scenario(label="wait", tags=["slow"], cases=[Case()]),
+            Scenario(label="check", cases=[Case(tags=["smoke"])], depends_on=["wait"]),
+        ],
+    )
+
+    selected = selector.select(scenario)
+    assert selected is not None
+    subscenarios = selected.subscenarios
+    assert [subscenario.label for subscenario in subscenarios] == ["setup", "read"]
+    assert [case.label for case in subscenarios[0].cases] == ["login"]
+    assert subscenarios[1] is scenario.subscenarios[1]
+
+
+@mark.parametrize(
+    "scenario",
+    (
+        Scenario(),
+        Scenario(tags=["slow"], cases=[Case(tags=["smoke"])]),
+        Scenario(cases=[Case()], subscenarios=[Scenario(cases=[Case(tags=["other"])])]),
+        Scenario(tags=["smoke"], cases=[Case(tags=["slow"])]),
+    ),
+)
+def test_select_nothing(scenario):
+    selector = ScenarioSelector(tags=["smoke"], excluded_tags=["slow"])
+    assert selector.select(scenario) is None
+
+
+def test_select_an_empty_scenario_having_included_tags():
+    scenario = Scenario(tags=["smoke"])
+    assert ScenarioSelector(tags=["smoke"]).select(scenario) is scenario
@@ -1,7 +1,7 @@
 from pytest import raises
 
-from preacher.compilation.argument import Argument, inject_arguments
-from preacher.compilation.error import CompilationError
+from preacher.compilation.argument import Argument, Template, inject_arguments
+from preacher.compilation.error import CompilationError, IndexedNode, NamedNode
 
 
 def test_given_single_value():
@@ -26,3 +26,32 @@ def test_given_invalid_key():
     value = {1: 2, 3: Argument("key")}
     with raises(CompilationError):
         inject_arguments(value, {"key": "value"})
+
+
+def test_template_given_static_value():
+    value = {"foo": [1, {"bar": "baz"}]}
+    template = Template(value)
+    assert template.is_static
+    assert template.bind() is value
+    assert template.bind({"foo": "x"}) is value
+
+
+def test_template_shares_static_subtrees():
+    static = {"spam": ["ham", "eggs"]}
+    value = {"foo": Argument("foo"), "bar": [static, Argument("bar")], "static": static}
+    template = Template(value)
+    assert not template.is_static
+
+    bound1 = template.bind({"foo": 1, "bar": 2})
+    assert bound1 == {"foo": 1, "bar": [static, 2], "static": static}
+    assert bound1["static"] is static
+    assert bound1["bar"][0] is static
+
+    bound2 = template.bind({"foo": 3})
+    assert bound2 == {"foo": 3, "bar": [static, None], "static": static}
+
+
+def test_template_given_invalid_key():
+    with raises(CompilationError) as error_info:
+        Template({"foo": [{1: Argument("key")}]})
+    assert error_info.value.path == [NamedNode("foo"), IndexedNode(0)]
@@ -1,7 +1,10 @@
 from pytest import mark, raises
 
-from preacher.compilation.error import CompilationError, NamedNode
+from preacher.compilation.error import CompilationError, IndexedNode, NamedNode
+from preacher.compilation.parameter import Parameter
 from preacher.compilation.parameter import compile_parameter
+from preacher.compilation.parameter import compile_parameter_source
+from preacher.compilation.parameter import is_parameter_source
 
 
 @mark.parametrize(
@@ -30,3 +33,133 @@ def test_given_filled_mapping():
     parameter = compile_parameter({"label": "foo", "args": {"k": "v"}})
     assert parameter.label == "foo"
     assert parameter.arguments == {"k": "v"}
+
+
+@mark.parametrize(
+    ("obj", "expected_path"),
+    (
+        ({"source": 1}, [NamedNode("source")]),
+        ({"source": "a.csv", "format": "xml"}, [NamedNode("format")]),
+        ({"source": "a.csv", "label": 1}, [NamedNode("label")]),
+        ({"source": "a.csv", "args": []}, [NamedNode("args")]),
+        ({"source": "a.csv", "args": {"a": 1}}, [NamedNode("args"), NamedNode("a")]),
+        ({"source": "a.csv", "start": -1}, [NamedNode("start")]),
+        ({"source": "a.csv", "stop": "1"}, [NamedNode("stop")]),
+        ({"source": "a.csv", "step": 0}, [NamedNode("step")]),
+        ({"source": "a.csv", "sample": 1.5}, [NamedNode("sample")]),
+        ({"source": "a.csv", "sample": True}, [NamedNode("sample")]),
+        ({"source": "a.csv", "seed": 1.0}, [NamedNode("seed")]),
+    ),
+)
+def test_given_invalid_source(obj, expected_path):
+    with raises(CompilationError) as error_info:
+        compile_parameter_source(obj)
+    assert error_info.value.path == expected_path
+
+
+@mark.parametrize(
+    ("obj", "expected"),
+    (
+        ("", False),
+        ({"label": "foo"}, False),
+        ({"source": "foo.csv"}, True),
+    ),
+)
+def test_is_parameter_source(obj, expected):
+    assert is_parameter_source(obj) is expected
+
+
+@mark.parametrize(
+    ("path", "expected"),
+    (("a.csv", "csv"), ("a.JSONL", "jsonl"), ("a.ndjson", "jsonl"), ("a", "csv")),
+)
+def test_source_format_is_inferred(path, expected):
+    assert compile_parameter_source({"source": path}).format == expected
+
+
+def test_given_csv_source(tmp_path):
+    path = tmp_path / "params.csv"
+    path.write_text("name,id,extra\nfoo,1,x\nbar,2,y\nbaz,3,z\n")
+
+    source = compile_parameter_source({"source": str(path)})
+    assert list(source) == [
+        Parameter(arguments={"name": "foo", "id": "1", "extra": "x"}),
+        Parameter(arguments={"name": "bar", "id": "2", "extra": "y"}),
+        Parameter(arguments={"name": "baz", "id": "3", "extra": "z"}),
+    ]
+
+    source = compile_parameter_source(
+        {
+            "source": str(path),
+            "label": "name",
+            "args": {"user_id": "id", "missing": "nothing"},
+            "start": 1,
+        }
+    )
+    assert list(source) == [
+        Parameter(label="bar", arguments={"user_id": "2", "missing": None}),
+        Parameter(label="baz", arguments={"user_id": "3", "missing": None}),
+    ]
+    # Can be iterated again.
+    assert len(list(source)) == 2
+
+
+def test_given_jsonl_source(tmp_path):
+    path = tmp_path / "params.jsonl"
+    path.write_text("".join(f'{{"n": {n}, "s": "v{n}"}}\n' for n in range(10)) + "\n")
+
+    source = compile_parameter_source(
+        {"source": str(path), "label": "s", "args": {"n": "n"}, "stop": 7, "step": 3}
+    )
+    assert list(source) == [
+        Parameter(label="v0", arguments={"n": 0}),
+        Parameter(label="v3", arguments={"n": 3}),
+        Parameter(label="v6", arguments={"n": 6}),
+    ]
+
+
+def test_given_sampled_source(tmp_path):
+    path = tmp_path / "params.jsonl"
+    path.write_text("".join(f'{{"n": {n}}}\n' for n in range(100)))
+
+    source = compile_parameter_source({"source": str(path), "sample": 0.2, "seed": 1})
+    sampled = list(source)
+    assert 0 < len(sampled) < 100
+    assert list(source) == sampled
+
+    assert list(compile_parameter_source({"source": str(path), "sample": 0.0})) == []
+    assert len(list(compile_parameter_source({"source": str(path), "sample": 1.0}))) == 100
+
+
+def test_when_source_is_not_found(tmp_path):
+    source = compile_parameter_source({"source": str(tmp_path / "not-found.csv")})
+    with raises(CompilationError):
+        list(source)
+
+
+def test_when_source_has_invalid_rows(tmp_path):
+    path = tmp_path / "params.jsonl"
+    path.write_text('{"label": "foo"}\n[]\n')
+    source = compile_parameter_source({"source": str(path)})
+    with raises(CompilationError) as error_info:
+        list(source)
+    assert error_info.value.path == [IndexedNode(1)]
+
+    path.write_text('{"label": "foo"}\n\n{\n')
+    with raises(CompilationError) as error_info:
+        list(source)
+    assert error_info.value.path == [IndexedNode(2)]
+
+    path.write_text('{"label": 1}\n')
+    source = compile_parameter_source({"source": str(path), "label": "label"})
+    with raises(CompilationError) as error_info:
+        list(source)
+    assert error_info.value.path == [IndexedNode(0), NamedNode("label")]
+
+
+def test_when_source_is_not_utf8(tmp_path):
+    path = tmp_path / "params.csv"
+    path.write_bytes("name\nfoo\n".encode("utf-16"))
+    source = compile_parameter_source({"source": str(path)})
+    with raises(CompilationError, match="Failed to read parameters"):
+        list(source)
@@ -0,0 +1,74 @@
+from unittest.mock import Mock, sentinel
+
+from pytest import mark, raises
+
+from preacher.compilation.error import CompilationError
+from preacher.compilation.util.interning import Interner, freeze
+
+
+@mark.parametrize(
+    ("lhs", "rhs"),
+    (
+        (1, 1),
+        ("foo", "foo"),
+        ([1, "2"], [1, "2"]),
+        ({"a": 1, "b": [2]}, {"b": [2], "a": 1}),
+    ),
+)
+def test_freeze_equal(lhs, rhs):
+    assert freeze(lhs) == freeze(rhs)
+
+
+@mark.parametrize(
+    ("lhs", "rhs"),
+    (
+        (1, True),
+        (1, 1.0),
+        ([1], (1,)),
+        ({"a": 1}, {"a": True}),
+        ({"a": [1, 2]}, {"a": [2, 1]}),
+    ),
+)
+def test_freeze_not_equal(lhs, rhs):
+    assert freeze(lhs) != freeze(rhs)
+
+
+def test_freeze_given_unhashable():
+    assert freeze({"a": {1, 2}}) is None
+
+
+def test_intern():
+    interner = Interner()
+    compile = Mock(side_effect=lambda obj: object())
+
+    first = interner.intern({"a": [1]}, compile)
+    assert interner.intern({"a": [1]}, compile) is first
+    assert interner.intern({"a": [True]}, compile) is not first
+    assert compile.call_count == 2
+
+    unhashable = {"a": {1}}
+    assert interner.intern(unhashable, compile) is not interner.intern(unhashable, compile)
+
+    interner.clear()
+    assert interner.intern({"a": [1]}, compile) is not first
+
+
+def test_intern_does_not_memorize_errors():
+    interner = Interner()
+    compile = Mock(side_effect=[CompilationError("message"), sentinel.compiled])
+
+    with raises(CompilationError):
+        interner.intern("foo", compile)
+    assert interner.intern("foo", compile) is sentinel.compiled
+
+
+def test_intern_forgets_least_recently_used():
+    interner = Interner(maxsize=2)
+    compile = Mock(side_effect=lambda obj: object())
+
+    first = interner.intern("a", compile)
+    second = interner.intern("b", compile)
+    assert interner.intern("a", compile) is first
+    interner.intern("c", compile)
+    assert interner.intern("a", compile) is first
+    assert interner.intern("b", compile) is not second
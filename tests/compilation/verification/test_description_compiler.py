@@ -88,3 +88,11 @@ def test_given_a_list_of_mapping_predicates(mocker, compiler, extraction, predic
         predicates=[sentinel.predicate, sentinel.predicate],
         value_name="foo",
     )
+
+
+def test_compiled_descriptions_are_shared(compiler, extraction, predicate):
+    description = compiler.compile({"describe": "foo", "should": {"equal": 1}})
+    assert compiler.compile({"should": {"equal": 1}, "describe": "foo"}) is description
+    assert compiler.compile({"describe": "foo", "should": {"equal": True}}) is not description
+
+    assert extraction.compile.call_count == 2
@@ -128,6 +128,24 @@ def test_invalid_mapping(compiler, obj):
             True,
         ),
         ({"contain_in_any_order": [1, {"be_greater_than": 2}]}, [1, 2, 4], False),
+        ({"have_every_item": {"be_greater_than": 0}}, None, False),
+        ({"have_every_item": {"be_greater_than": 0}}, [], True),
+        ({"have_every_item": {"be_greater_than": 0}}, [1, 2], True),
+        ({"have_every_item": {"be_greater_than": 0}}, [1, 0], False),
+        ({"have_no_item": {"equal": 1}}, None, False),
+        ({"have_no_item": {"equal": 1}}, [0, 2], True),
+        ({"have_no_item": {"equal": 1}}, [0, 1], False),
+        ("be_sorted", [1, 2, 2], True),
+        ("be_sorted", [2, 1], False),
+        ("be_sorted_descending", [2, 2, 1], True),
+        ("be_sorted_descending", [1, 2], False),
+        ("have_unique_items", [1, 2, 3], True),
+        ("have_unique_items", [1, 2, 1], False),
+        ({"have_sum": 6}, [1, 2, 3], True),
+        ({"have_sum": 6}, [], False),
+        ({"have_min": {"be_greater_than": 0}}, [1, 2], True),
+        ({"have_min": {"be_greater_than": 0}}, [0, 2], False),
+        ({"have_max": {"be_less_than": 2}}, [1, 2], False),
         ({"not": 1}, "A", True),
         ({"not": 1}, 0, True),
         ({"not": 1}, 1, False),
@@ -205,3 +223,16 @@ def test_matcher_matching_failure(compiler, obj, item):
     matcher = factory.create()
     with raises(TypeError):
         matcher.matches(item)
+
+
+def test_compiled_matcher_factories_are_shared(compiler):
+    factory = compiler.compile({"all_of": [{"equal": 1}, {"be_greater_than": 0}]})
+    assert compiler.compile({"all_of": [{"equal": 1}, {"be_greater_than": 0}]}) is factory
+    assert compiler.compile({"all_of": [{"equal": 1}]}) is not factory
+    assert compiler.compile({"equal": 1}) is not compiler.compile({"equal": 1.0})
+
+
+def test_interned_matcher_factories_are_cleared_when_modified(compiler):
+    factory = compiler.compile({"equal": 1})
+    compiler.add_taking_value("equal", lambda value: value)
+    assert compiler.compile({"equal": 1}) is not factory
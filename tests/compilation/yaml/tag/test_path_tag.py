@@ -0,0 +1,46 @@
+import os
+from io import StringIO
+
+from pytest import fixture, mark, raises
+from yamlen import Loader, YamlenError
+
+from preacher.compilation.yaml.recording import RecordingLoader
+from preacher.compilation.yaml.tag.path import PathTag
+
+
+@fixture
+def loader() -> Loader:
+    loader = Loader()
+    loader.add_tag("!path", PathTag())
+    return loader
+
+
+@mark.parametrize(
+    ("content", "expected_message"),
+    (("!path []", '", line 1, column 1'), ("!path {}", '", line 1, column 1')),
+)
+def test_given_invalid_paths(loader: Loader, content, expected_message):
+    stream = StringIO(content)
+    with raises(YamlenError) as error_info:
+        loader.load(stream)
+    assert expected_message in str(error_info.value)
+
+
+def test_given_no_origin(loader: Loader):
+    assert loader.load(StringIO("!path foo/bar.csv")) == "foo/bar.csv"
+
+
+def test_given_origin(loader: Loader, tmp_path):
+    path = tmp_path / "scenario.yml"
+    path.write_text("source: !path data/params.csv")
+    actual = loader.load_from_path(str(path))
+    assert actual == {"source": os.path.join(str(tmp_path), "data/params.csv")}
+
+
+def test_recorded(tmp_path):
+    loader = RecordingLoader()
+    loader.add_tag("!path", PathTag())
+    path = tmp_path / "scenario.yml"
+    path.write_text("source: !path data/params.csv")
+    loader.load_from_path(str(path))
+    assert loader.pop_paths() == [str(path), os.path.join(str(tmp_path), "data/params.csv")]
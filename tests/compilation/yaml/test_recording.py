@@ -0,0 +1,35 @@
+import os
+from tempfile import TemporaryDirectory
+
+from pytest import fixture, raises
+from yamlen import YamlenError
+from yamlen.tag.impl.inclusion import InclusionTag
+
+from preacher.compilation.yaml.recording import RecordingLoader
+
+
+@fixture
+def base_dir():
+    with TemporaryDirectory() as path:
+        with open(os.path.join(path, "foo.yml"), "w") as f:
+            f.write("foo: !include bar.yml\n---\nbaz: !include missing.yml")
+        with open(os.path.join(path, "bar.yml"), "w") as f:
+            f.write("bar")
+        yield path
+
+
+def test_recording_paths(base_dir):
+    loader = RecordingLoader()
+    loader.add_tag("!include", InclusionTag())
+
+    objs = loader.load_all_from_path(os.path.join(base_dir, "foo.yml"))
+    assert next(objs) == {"foo": "bar"}
+    with raises(YamlenError):
+        next(objs)
+
+    assert loader.pop_paths() == [
+        os.path.join(base_dir, "foo.yml"),
+        os.path.join(base_dir, "bar.yml"),
+        os.path.join(base_dir, "missing.yml"),
+    ]
+    assert loader.pop_paths() == []
@@ -1,3 +1,4 @@
+import pickle
 from unittest.mock import NonCallableMock
 
 from lxml.etree import XMLParser, fromstring
@@ -98,3 +99,11 @@ def test_extract_default(query, expected, analyzer):
 def test_extract(query, multiple, cast, expected, analyzer):
     extractor = XPathExtractor(query, multiple=multiple, cast=cast)
     assert extractor.extract(analyzer) == expected
+
+
+def test_extractor_can_be_pickled(analyzer):
+    extractor = XPathExtractor("/root/foo")
+    assert extractor.extract(analyzer) == "foo-text"
+
+    restored = pickle.loads(pickle.dumps(extractor))
+    assert restored.extract(analyzer) == "foo-text"
@@ -1,4 +1,5 @@
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import Optional
 from unittest.mock import NonCallableMock, NonCallableMagicMock, sentinel
@@ -25,6 +26,7 @@ def session():
     response.headers = {"Header-Name": "Header-Value"}
     response.text = sentinel.text
     response.content = sentinel.content
+    response.encoding = sentinel.encoding
 
     session = NonCallableMagicMock(requests.Session)
     session.__enter__.return_value = session
@@ -51,6 +53,7 @@ def test_default_request(mocker, session):
     report, _res = requester.execute(request)
     assert report.request.method == "GET"
     assert report.request.url == "http://base-url.org/"
+    assert type(report.request.headers) is dict
     assert report.request.headers["User-Agent"].startswith("Preacher")
     assert report.request.body is None
 
@@ -170,6 +173,7 @@ def test_when_request_succeeds(mocker, session, body):
     assert response.headers == {"header-name": "Header-Value"}
     assert response.body.text == sentinel.text
     assert response.body.content == sentinel.content
+    assert response.body.encoding == sentinel.encoding
 
     uuid4.assert_called()
     now.assert_called()
@@ -222,3 +226,33 @@ def test_request_overwrites_default_headers(session, body):
     assert isinstance(prepped, requests.PreparedRequest)
     assert prepped.headers["User-Agent"].startswith("Preacher")
     assert prepped.headers["Content-Type"] == "text/plain"
+
+
+def test_sessions_not_kept(mocker, session):
+    session_ctor = mocker.patch("requests.Session", return_value=session)
+
+    requester = Requester()
+    with requester.session() as taken:
+        assert taken is session
+    session.__exit__.assert_called_once()
+
+    requester.execute(Request(), context=Context(foo="bar"))
+    assert session_ctor.call_count == 2
+
+
+def _take_session(requester):
+    with requester.session() as session:
+        return session
+
+
+def test_sessions_kept():
+    requester = Requester(keep_sessions=True)
+    with requester.session() as taken:
+        taken.cookies.set("name", "value")
+    with requester.session() as retaken:
+        assert retaken is taken
+        assert not retaken.cookies
+
+    with ThreadPoolExecutor(1) as executor:
+        other = executor.submit(_take_session, requester).result()
+    assert other is not taken
@@ -1,3 +1,5 @@
+import pickle
+from contextlib import contextmanager
 from datetime import timedelta
 from functools import partial
 from typing import Optional
@@ -8,7 +10,8 @@ from pytest import mark
 
 from preacher.core.context import Context
 from preacher.core.extraction import Analyzer
-from preacher.core.request import ExecutionReport, Request
+from preacher.core.profiling import Profiler
+from preacher.core.request import ExecutionReport, Request, Requester, Response, ResponseBody
 from preacher.core.scenario import CaseListener
 from preacher.core.scenario.case import Case
 from preacher.core.scenario.case_runner import CaseRunner
@@ -32,8 +35,10 @@ def test_case_listener():
 
 def test_runner_properties():
     unit_runner = NonCallableMock(UnitRunner, base_url=sentinel.base_url)
+    unit_runner.session.return_value = sentinel.session
     runner = CaseRunner(unit_runner)
     assert runner.base_url is sentinel.base_url
+    assert runner.session() is sentinel.session
 
 
 def test_when_disabled(mocker):
@@ -225,3 +230,61 @@ def test_given_a_negative_waiting_time(mocker):
     runner.run(case)
 
     sleep.assert_called_once_with(0.0)
+
+
+def test_profiling_spans(mocker):
+    mocker.patch(f"{PKG}.now", return_value=sentinel.starts)
+    mocker.patch(f"{PKG}.sleep")
+
+    spans = []
+
+    @contextmanager
+    def _span(name, category):
+        spans.append((name, category))
+        yield
+        spans.append(f"/{name}")
+
+    profiler = NonCallableMock(Profiler)
+    profiler.span.side_effect = _span
+    unit_runner = NonCallableMock(UnitRunner, base_url=sentinel.base_url)
+    unit_runner.run.return_value = ExecutionReport(), None, None
+    runner = CaseRunner(unit_runner=unit_runner, profiler=profiler)
+    runner.run(Case(label="label", waiting_time=timedelta(seconds=1)))
+    runner.run(Case())
+    runner.run(Case(enabled=False))
+
+    assert spans == [
+        ("label", "case"),
+        ("Wait", "wait"),
+        "/Wait",
+        "/label",
+        ("Case", "case"),
+        "/Case",
+    ]
+
+
+def test_forwarding_events_from_copies(mocker):
+    mocker.patch(f"{PKG}.sleep")
+
+    response = NonCallableMock(Response, id="id", elapsed=1.0, status_code=200, headers={})
+    response.body = NonCallableMock(ResponseBody, text="text", content=b"text", encoding="utf-8")
+    execution = ExecutionReport(status=Status.SUCCESS)
+    unit_runner = UnitRunner(Requester(base_url="base-url"))
+    listener = NonCallableMock(CaseListener)
+    runner = CaseRunner(unit_runner=unit_runner, listener=listener)
+    assert runner.take_events() == []
+
+    copied = pickle.loads(pickle.dumps(runner))
+    copied._unit_runner = NonCallableMock(UnitRunner, base_url="base-url")
+    copied._unit_runner.run.return_value = execution, response, None
+    copied.run(Case())
+    listener.on_execution.assert_not_called()
+
+    events = copied.take_events()
+    assert copied.take_events() == []
+    runner.forward_events(pickle.loads(pickle.dumps(events)))
+    listener.on_execution.assert_called_once()
+    forwarded_execution, forwarded_response = listener.on_execution.call_args[0]
+    assert forwarded_execution == execution
+    assert forwarded_response.id == "id"
+    assert forwarded_response.body.text == "text"
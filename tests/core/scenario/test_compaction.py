@@ -0,0 +1,93 @@
+from pytest import mark
+
+from preacher.core.request import ExecutionReport
+from preacher.core.request.requester import PreparedRequest
+from preacher.core.scenario import CaseResult, ResultCompactor, ScenarioResult
+from preacher.core.status import Status, StatusedList
+from preacher.core.verification import ResponseVerification, Verification
+
+CHILDREN = [Verification(status=Status.SUCCESS)]
+
+
+def _case(status: Status, body) -> CaseResult:
+    return CaseResult(
+        label="Case",
+        conditions=Verification.collect(CHILDREN),
+        execution=ExecutionReport(
+            status=Status.SUCCESS,
+            request=PreparedRequest(method="POST", url="url", headers={"k": "v"}, body=body),
+        ),
+        response=ResponseVerification(
+            response_id="id",
+            status_code=Verification.collect(CHILDREN),
+            headers=Verification(status=Status.SUCCESS),
+            body=Verification(status=status, children=[Verification(status=status)]),
+        ),
+    )
+
+
+def _scenario(case: CaseResult) -> ScenarioResult:
+    return ScenarioResult(
+        label="Scenario",
+        status=case.status,
+        cases=StatusedList([case]),
+        subscenarios=StatusedList([ScenarioResult(cases=StatusedList([case]))]),
+    )
+
+
+def test_default_compaction_keeps_results():
+    result = _scenario(_case(Status.SUCCESS, "body"))
+    assert ResultCompactor().compact(result) == result
+
+
+def test_dropping_succeeded_details():
+    compactor = ResultCompactor(drop_succeeded_details=True)
+    compacted = compactor.compact(_scenario(_case(Status.SUCCESS, "body")))
+    assert compacted.label == "Scenario"
+    assert compacted.status is Status.SUCCESS
+
+    for case in (compacted.cases.items[0], compacted.subscenarios.items[0].cases.items[0]):
+        assert case.label == "Case"
+        assert case.status is Status.SUCCESS
+        assert case.conditions == Verification(status=Status.SUCCESS)
+        assert case.execution.request == PreparedRequest(
+            method="POST",
+            url="url",
+            headers={},
+            body=None,
+        )
+        assert case.response.response_id == "id"
+        assert case.response.status_code == Verification(status=Status.SUCCESS)
+        assert case.response.body == Verification(status=Status.SUCCESS)
+
+
+def test_dropping_succeeded_details_keeps_failures():
+    result = _scenario(_case(Status.UNSTABLE, "body"))
+    compactor = ResultCompactor(drop_succeeded_details=True)
+    assert compactor.compact(result) == result
+
+
+@mark.parametrize(
+    ("body", "expected"),
+    (
+        (None, None),
+        ("", ""),
+        ("abc", "abc"),
+        ("abcd", "abc..."),
+        (b"abc", b"abc"),
+        (b"abcd", b"abc..."),
+    ),
+)
+def test_truncating_request_bodies(body, expected):
+    compactor = ResultCompactor(max_body_length=3)
+    compacted = compactor.compact(_scenario(_case(Status.UNSTABLE, body)))
+    case = compacted.cases.items[0]
+    assert case.execution.request.body == expected
+    assert case.execution.request.headers == {"k": "v"}
+    assert case.status is Status.UNSTABLE
+
+
+def test_truncating_given_no_request():
+    case = CaseResult(execution=ExecutionReport(status=Status.FAILURE))
+    compacted = ResultCompactor(max_body_length=3).compact(_scenario(case))
+    assert compacted.cases.items[0] == case
@@ -1,8 +1,9 @@
-from unittest.mock import Mock, NonCallableMock, call, sentinel
+from unittest.mock import ANY, Mock, NonCallableMock, call, sentinel
 
 from pytest import mark
 
 from preacher.core.context import Context
+from preacher.core.scenario.case import Case
 from preacher.core.scenario.case_runner import CaseRunner
 from preacher.core.scenario.scenario import Scenario
 from preacher.core.scenario.scenario_runner import ScenarioRunner
@@ -85,6 +86,8 @@ def test_unordered(mocker):
         conditions=Verification(status=Status.SUCCESS, children=[condition_verification]),
         cases=sentinel.cases_task,
         subscenarios=[],
+        profiler=ANY,
+        starts=ANY,
     )
 
     condition.verify.assert_called_once()
@@ -130,12 +133,87 @@ def test_ordered(mocker):
                 conditions=Verification.collect([]),
                 cases=sentinel.cases_task,
                 subscenarios=[],
+                profiler=ANY,
+                starts=ANY,
             ),
             call(
                 label=sentinel.label,
                 conditions=Verification(status=Status.SKIPPED, children=[]),
                 cases=sentinel.cases_task,
                 subscenarios=[sentinel.task],
+                profiler=ANY,
+                starts=ANY,
             ),
         ]
     )
+
+
+def test_given_cases_with_dependencies(mocker):
+    mocker.patch(f"{PKG}.now", return_value=sentinel.starts)
+    cases_task_ctor = mocker.patch(f"{PKG}.DependentCasesTask", return_value=sentinel.cases_task)
+    mocker.patch(f"{PKG}.RunningScenarioTask", return_value=sentinel.task)
+
+    cases = [Case(label="a"), Case(depends_on=["a"])]
+    scenario = Scenario(ordered=False, cases=cases)
+    case_runner = NonCallableMock(CaseRunner, base_url=sentinel.base_url)
+    runner = ScenarioRunner(executor=sentinel.executor, case_runner=case_runner)
+    assert runner.submit(scenario) is sentinel.task
+
+    cases_task_ctor.assert_called_once_with(
+        sentinel.executor,
+        case_runner,
+        cases,
+        context=Context(starts=sentinel.starts, base_url=sentinel.base_url),
+    )
+
+
+def test_given_handed_off_context(mocker):
+    mocker.patch(f"{PKG}.now", return_value=sentinel.starts)
+    cases_task_ctor = mocker.patch(f"{PKG}.DependentCasesTask", return_value=sentinel.cases_task)
+    mocker.patch(f"{PKG}.RunningScenarioTask", return_value=sentinel.task)
+
+    scenario = Scenario(ordered=False, cases=sentinel.cases)
+    case_runner = NonCallableMock(CaseRunner, base_url=sentinel.base_url)
+    runner = ScenarioRunner(executor=sentinel.executor, case_runner=case_runner)
+    handed_off = Context(foo="bar", starts=sentinel.old_starts)
+    assert runner.submit(scenario, handed_off) is sentinel.task
+
+    cases_task_ctor.assert_called_once_with(
+        sentinel.executor,
+        case_runner,
+        sentinel.cases,
+        context=Context(foo="bar", starts=sentinel.starts, base_url=sentinel.base_url),
+    )
+
+
+def test_given_subscenarios_with_dependencies(mocker):
+    mocker.patch(f"{PKG}.OrderedCasesTask", return_value=sentinel.cases_task)
+    task_ctor = mocker.patch(f"{PKG}.RunningScenarioTask", return_value=sentinel.task)
+    dependent_task_ctor = mocker.patch(
+        f"{PKG}.DependentScenarioTask",
+        return_value=sentinel.dependent_task,
+    )
+
+    subscenarios = [
+        Scenario(label="c", depends_on=["a", "b"]),
+        Scenario(label="a"),
+        Scenario(label="b", depends_on=["a"]),
+        Scenario(label="d", depends_on=["e"]),
+        Scenario(label="e", depends_on=["d"]),
+    ]
+    scenario = Scenario(subscenarios=subscenarios)
+    case_runner = NonCallableMock(CaseRunner, base_url=sentinel.base_url)
+    runner = ScenarioRunner(executor=sentinel.executor, case_runner=case_runner)
+    runner.submit(scenario)
+
+    assert dependent_task_ctor.call_count == 2
+    b, c = dependent_task_ctor.call_args_list
+    assert b[1]["label"] == "b"
+    assert b[1]["dependencies"] == [sentinel.task]
+    assert c[1]["label"] == "c"
+    assert c[1]["dependencies"] == [sentinel.task, sentinel.dependent_task]
+
+    submitted = task_ctor.call_args[1]["subscenarios"]
+    assert submitted[:3] == [sentinel.dependent_task, sentinel.task, sentinel.dependent_task]
+    assert [task.result().label for task in submitted[3:]] == ["d", "e"]
+    assert [task.result().status for task in submitted[3:]] == [Status.SKIPPED] * 2
@@ -1,10 +1,13 @@
-from unittest.mock import NonCallableMock, sentinel
+from unittest.mock import Mock, NonCallableMock, call, sentinel
 
-from pytest import mark
+from pytest import mark, raises
 
+from preacher.core.context import Context
+from preacher.core.profiling import Profiler
 from preacher.core.scenario.scenario_result import ScenarioResult
 from preacher.core.scenario.scenario_task import ScenarioTask
 from preacher.core.scenario.scenario_task import StaticScenarioTask, RunningScenarioTask
+from preacher.core.scenario.scenario_task import DependentScenarioTask
 from preacher.core.scenario.util.concurrency import CasesTask
 from preacher.core.status import Status, StatusedList
 
@@ -12,6 +15,11 @@ from preacher.core.status import Status, StatusedList
 def test_static_scenario_task():
     task = StaticScenarioTask(sentinel.result)
     assert task.result() is sentinel.result
+    assert task.context() == Context()
+
+    callback = Mock()
+    task.add_done_callback(callback)
+    callback.assert_called_once_with()
 
 
 def test_running_scenario_task_empty():
@@ -37,6 +45,33 @@ def test_running_scenario_task_empty():
     cases.result.assert_called_once_with()
 
 
+@mark.parametrize(
+    ("label", "finished_at", "expected_calls"),
+    (
+        (None, None, []),
+        (None, 2.0, [call("Scenario", "scenario", 1.0, 2.0)]),
+        ("label", 3.0, [call("label", "scenario", 1.0, 3.0)]),
+    ),
+)
+def test_running_scenario_task_profiled(label, finished_at, expected_calls):
+    cases = NonCallableMock(CasesTask)
+    cases.result.return_value = NonCallableMock(StatusedList, status=Status.SUCCESS)
+    cases.finished_at.return_value = finished_at
+    profiler = NonCallableMock(Profiler)
+
+    task = RunningScenarioTask(
+        label=label,
+        conditions=sentinel.conditions,
+        cases=cases,
+        subscenarios=[],
+        profiler=profiler,
+        starts=1.0,
+    )
+    task.result()
+
+    assert profiler.record_span.call_args_list == expected_calls
+
+
 @mark.parametrize(
     ("cases_status", "subscenario_status", "expected_status"),
     (
@@ -68,3 +103,92 @@ def test_running_scenario_task_filled(cases_status, subscenario_status, expected
     assert result.cases is cases_result
     assert len(result.subscenarios.items) == 1
     assert result.subscenarios.items[0] is subscenario_result
+
+
+def test_running_scenario_task_done():
+    cases = NonCallableMock(CasesTask)
+    cases.result.return_value = NonCallableMock(StatusedList, status=Status.SUCCESS)
+    cases.finished_at.return_value = None
+    cases.context.return_value = sentinel.context
+    subscenario = NonCallableMock(ScenarioTask)
+    subscenario.result.return_value = ScenarioResult(status=Status.SUCCESS)
+
+    task = RunningScenarioTask(
+        label=sentinel.label,
+        conditions=sentinel.conditions,
+        cases=cases,
+        subscenarios=[subscenario],
+    )
+    callback = Mock()
+    task.add_done_callback(callback)
+    assert task.context() is sentinel.context
+
+    cases.add_done_callback.call_args[0][0]()
+    callback.assert_not_called()
+    subscenario.add_done_callback.call_args[0][0]()
+    callback.assert_called_once_with()
+
+    assert task.result() is task.result()
+    cases.result.assert_called_once_with()
+    subscenario.result.assert_called_once_with()
+
+
+def dependency(status=Status.SUCCESS, context=None, error=None) -> ScenarioTask:
+    task = NonCallableMock(ScenarioTask)
+    task.result.return_value = ScenarioResult(status=status)
+    task.result.side_effect = error
+    task.context.return_value = context or Context()
+    return task
+
+
+def test_dependent_scenario_task_submitted():
+    dependencies = [dependency(context=Context(foo=1, bar=2)), dependency(context=Context(bar=3))]
+    submitted = StaticScenarioTask(sentinel.result)
+    submit = Mock(return_value=submitted)
+
+    task = DependentScenarioTask(label="label", dependencies=dependencies, submit=submit)
+    callback = Mock()
+    task.add_done_callback(callback)
+
+    dependencies[0].add_done_callback.call_args[0][0]()
+    submit.assert_not_called()
+    callback.assert_not_called()
+
+    dependencies[1].add_done_callback.call_args[0][0]()
+    submit.assert_called_once_with(Context(foo=1, bar=3))
+    callback.assert_called_once_with()
+    assert task.result() is sentinel.result
+    assert task.context() == Context()
+
+
+@mark.parametrize(
+    "failing_dependency",
+    (
+        dependency(status=Status.UNSTABLE),
+        dependency(error=RuntimeError("message")),
+    ),
+)
+def test_dependent_scenario_task_skipped(failing_dependency):
+    dependencies = [dependency(), failing_dependency]
+    submit = Mock()
+
+    task = DependentScenarioTask(label="label", dependencies=dependencies, submit=submit)
+    for dependency_task in dependencies:
+        dependency_task.add_done_callback.call_args[0][0]()
+
+    result = task.result()
+    assert result.label == "label"
+    assert result.status is Status.SKIPPED
+    assert task.context() == Context()
+    submit.assert_not_called()
+
+
+def test_dependent_scenario_task_failing_to_submit():
+    submit = Mock(side_effect=RuntimeError("message"))
+    task = DependentScenarioTask(label=None, dependencies=[], submit=submit)
+
+    callback = Mock()
+    task.add_done_callback(callback)
+    callback.assert_called_once_with()
+    with raises(RuntimeError, match="message"):
+        task.result()
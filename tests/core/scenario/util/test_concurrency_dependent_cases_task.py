@@ -0,0 +1,155 @@
+from concurrent.futures import Executor, Future
+from unittest.mock import Mock, NonCallableMock, sentinel
+
+from pytest import fixture, raises
+
+from preacher.core.context import Context
+from preacher.core.scenario.case import Case
+from preacher.core.scenario.case_result import CaseResult
+from preacher.core.scenario.case_runner import CaseRunner
+from preacher.core.scenario.util.concurrency import DependentCasesTask
+from preacher.core.status import Status
+
+
+def submit(func, *args, **kwargs) -> Future:
+    future: Future = Future()
+    try:
+        future.set_result(func(*args, **kwargs))
+    except Exception as error:
+        future.set_exception(error)
+    return future
+
+
+@fixture
+def executor():
+    executor = NonCallableMock(Executor)
+    executor.submit.side_effect = submit
+    return executor
+
+
+def run(statuses):
+    def _run(case: Case, context: Context) -> CaseResult:
+        assert case.label is not None
+        context[case.label] = dict(context)
+        return NonCallableMock(CaseResult, label=case.label, status=statuses.get(case.label))
+
+    return _run
+
+
+def test_given_no_cases(executor):
+    task = DependentCasesTask(executor, NonCallableMock(CaseRunner), [])
+    result = task.result()
+    assert result.status is Status.SKIPPED
+    assert not result.items
+    assert task.finished_at() is None
+    assert task.context() == Context()
+
+    callback = Mock()
+    task.add_done_callback(callback)
+    callback.assert_called_once_with()
+
+
+def test_given_cases(executor):
+    runner = NonCallableMock(CaseRunner)
+    runner.run.side_effect = run({"a": Status.SUCCESS, "b": Status.SUCCESS, "c": Status.SUCCESS})
+    runner.take_events.return_value = []
+    cases = [
+        Case(label="c", depends_on=["a", "b"]),
+        Case(label="a"),
+        Case(label="b", depends_on=["a"]),
+    ]
+
+    task = DependentCasesTask(executor, runner, cases, context=Context(base="v"))
+    result = task.result()
+    assert result.status is Status.SUCCESS
+    assert [item.label for item in result.items] == ["c", "a", "b"]
+    assert task.finished_at() is not None
+
+    assert [call[0][0].label for call in runner.run.call_args_list] == ["a", "b", "c"]
+    a = {"base": "v"}
+    b = {"base": "v", "a": a}
+    assert task.context() == Context(base="v", a=a, b=b, c={"base": "v", "a": a, "b": b})
+
+
+def test_given_cases_depending_on_ones_not_succeeded(executor):
+    runner = NonCallableMock(CaseRunner)
+    runner.run.side_effect = run({"a": Status.SUCCESS, "b": Status.UNSTABLE})
+    runner.take_events.return_value = []
+    cases = [
+        Case(label="a"),
+        Case(label="b", depends_on=["a"]),
+        Case(label="c", depends_on=["b"]),
+        Case(label="d", depends_on=["c", "a"]),
+    ]
+
+    task = DependentCasesTask(executor, runner, cases)
+    result = task.result()
+    assert result.status is Status.UNSTABLE
+    assert [item.status for item in result.items][2:] == [Status.SKIPPED, Status.SKIPPED]
+    assert [item.label for item in result.items] == ["a", "b", "c", "d"]
+    assert task.finished_at() is None
+    assert runner.run.call_count == 2
+
+
+def test_given_cyclic_cases(executor):
+    runner = NonCallableMock(CaseRunner)
+    runner.run.side_effect = run({"c": Status.SUCCESS})
+    runner.take_events.return_value = []
+    cases = [
+        Case(label="a", depends_on=["b"]),
+        Case(label="b", depends_on=["a"]),
+        Case(label="c"),
+    ]
+
+    task = DependentCasesTask(executor, runner, cases)
+    result = task.result()
+    statuses = [item.status for item in result.items]
+    assert statuses == [Status.SKIPPED, Status.SKIPPED, Status.SUCCESS]
+    assert runner.run.call_count == 1
+
+
+def test_given_waiting_cases():
+    futures = [Future(), Future()]
+    executor = NonCallableMock(Executor, submit=Mock(side_effect=futures))
+    runner = NonCallableMock(CaseRunner)
+    cases = [Case(label="a"), Case(label="b", depends_on=["a"])]
+
+    task = DependentCasesTask(executor, runner, cases)
+    callback = Mock()
+    task.add_done_callback(callback)
+    assert executor.submit.call_count == 1
+
+    context = executor.submit.call_args[0][3]
+    context["foo"] = "bar"
+    result = NonCallableMock(CaseResult, status=Status.SUCCESS)
+    futures[0].set_result(((result, context), [sentinel.event]))
+    assert executor.submit.call_count == 2
+    assert executor.submit.call_args[0][3] == Context(foo="bar")
+    runner.forward_events.assert_called_once_with([sentinel.event])
+    callback.assert_not_called()
+
+    futures[1].cancel()
+    callback.assert_called_once_with()
+    assert task.result().items[1].status is Status.SKIPPED
+
+
+def test_given_failing_cases(executor):
+    runner = NonCallableMock(CaseRunner)
+    runner.run.side_effect = RuntimeError("message")
+    cases = [Case(label="a"), Case(label="b", depends_on=["a"])]
+
+    task = DependentCasesTask(executor, runner, cases)
+    with raises(RuntimeError, match="message"):
+        task.result()
+    assert runner.run.call_count == 1
+    assert task.context() == Context()
+
+
+def test_when_submission_fails():
+    executor = NonCallableMock(Executor, submit=Mock(side_effect=RuntimeError("message")))
+    cases = [Case(label="a"), Case(label="b", depends_on=["a"])]
+
+    task = DependentCasesTask(executor, NonCallableMock(CaseRunner), cases)
+    with raises(RuntimeError, match="message"):
+        task.result()
+    assert executor.submit.call_count == 1
@@ -1,16 +1,15 @@
 from concurrent.futures import Executor, Future
-from unittest.mock import MagicMock, NonCallableMock, call, sentinel
+from unittest.mock import MagicMock, Mock, NonCallableMock, call, sentinel
 
 from pytest import fixture
 from requests import Session
 
+from preacher.core.scenario.case import Case
 from preacher.core.scenario.case_result import CaseResult
 from preacher.core.scenario.case_runner import CaseRunner
 from preacher.core.scenario.util.concurrency import OrderedCasesTask
 from preacher.core.status import Status
 
-PACKAGE = "preacher.core.scenario.util.concurrency"
-
 
 def submit(func, *args, **kwargs) -> Future:
     future: Future = Future()
@@ -27,6 +26,7 @@ def executor():
 
 def test_given_no_cases(executor):
     runner = NonCallableMock(CaseRunner)
+    runner.session.return_value = MagicMock(Session)
     task = OrderedCasesTask(executor, runner, [])
     result = task.result()
     assert result.status is Status.SKIPPED
@@ -36,23 +36,30 @@ def test_given_no_cases(executor):
     runner.run.assert_not_called()
 
 
-def test_given_cases(mocker, executor):
+def test_given_cases(executor):
     session = MagicMock(Session)
     session.__enter__.return_value = session
-    session_ctor = mocker.patch(f"{PACKAGE}.Session", return_value=session)
 
     case_results = [
         NonCallableMock(CaseResult, status=Status.SUCCESS),
         NonCallableMock(CaseResult, status=Status.UNSTABLE),
     ]
     runner = NonCallableMock(CaseRunner)
+    runner.session.return_value = session
     runner.run.side_effect = case_results
+    runner.take_events.return_value = [sentinel.event1, sentinel.event2]
     cases = [sentinel.case1, sentinel.case2]
 
     task = OrderedCasesTask(executor, runner, cases, context=sentinel.context)
     result = task.result()
     assert result.status is Status.UNSTABLE
     assert result.items == case_results
+    assert task.finished_at() is not None
+    assert task.context() is sentinel.context
+
+    callback = Mock()
+    task.add_done_callback(callback)
+    callback.assert_called_once_with()
 
     executor.submit.assert_called_once()
     runner.run.assert_has_calls(
@@ -62,5 +69,31 @@ def test_given_cases(mocker, executor):
         ]
     )
 
-    session_ctor.assert_called_once()
+    runner.session.assert_called_once_with()
     session.__exit__.assert_called()
+
+    runner.take_events.assert_called_once_with()
+    runner.forward_events.assert_called_once_with([sentinel.event1, sentinel.event2])
+
+
+def test_given_cancelled_cases():
+    future: Future = Future()
+    executor = NonCallableMock(Executor, submit=Mock(return_value=future))
+    runner = NonCallableMock(CaseRunner)
+    cases = [NonCallableMock(Case, label="foo"), NonCallableMock(Case, label="bar")]
+
+    task = OrderedCasesTask(executor, runner, cases, context=sentinel.context)
+    callback = Mock()
+    task.add_done_callback(callback)
+    callback.assert_not_called()
+
+    future.cancel()
+    callback.assert_called_once_with()
+    assert task.context() is sentinel.context
+    result = task.result()
+    assert result.status is Status.SKIPPED
+    assert [item.label for item in result.items] == ["foo", "bar"]
+    assert all(item.status is Status.SKIPPED for item in result.items)
+    assert task.finished_at() is None
+
+    runner.forward_events.assert_not_called()
@@ -1,8 +1,10 @@
 from concurrent.futures import Executor, Future
-from unittest.mock import NonCallableMock, call, sentinel
+from unittest.mock import Mock, NonCallableMock, call, sentinel
 
-from pytest import fixture
+from pytest import fixture, raises
 
+from preacher.core.context import Context
+from preacher.core.scenario.case import Case
 from preacher.core.scenario.case_result import CaseResult
 from preacher.core.scenario.case_runner import CaseRunner
 from preacher.core.scenario.util.concurrency import UnorderedCasesTask
@@ -11,7 +13,10 @@ from preacher.core.status import Status
 
 def submit(func, *args, **kwargs) -> Future:
     future: Future = Future()
-    future.set_result(func(*args, **kwargs))
+    try:
+        future.set_result(func(*args, **kwargs))
+    except Exception as error:
+        future.set_exception(error)
     return future
 
 
@@ -29,6 +34,13 @@ def test_given_no_cases(executor):
     assert result.status is Status.SKIPPED
     assert not result.items
 
+    assert task.finished_at() is None
+    assert task.context() == Context()
+
+    callback = Mock()
+    task.add_done_callback(callback)
+    callback.assert_called_once_with()
+
     executor.submit.assert_not_called()
     runner.run.assert_not_called()
 
@@ -40,12 +52,69 @@ def test_given_cases(executor):
     ]
     runner = NonCallableMock(CaseRunner)
     runner.run.side_effect = case_results
+    runner.take_events.side_effect = [[sentinel.event1], []]
     cases = [sentinel.case1, sentinel.case2]
 
     task = UnorderedCasesTask(executor, runner, cases)
     result = task.result()
     assert result.status is Status.FAILURE
     assert result.items == case_results
+    assert task.finished_at() is not None
 
     assert executor.submit.call_count == 2
     runner.run.assert_has_calls([call(sentinel.case1), call(sentinel.case2)])
+    runner.forward_events.assert_has_calls([call([sentinel.event1]), call([])])
+
+
+def test_given_cases_failing_to_forward_events(executor):
+    runner = NonCallableMock(CaseRunner)
+    runner.run.return_value = NonCallableMock(CaseResult, status=Status.SUCCESS)
+    runner.take_events.return_value = [sentinel.event]
+    runner.forward_events.side_effect = RuntimeError("message")
+
+    task = UnorderedCasesTask(executor, runner, [sentinel.case])
+    with raises(RuntimeError, match="message"):
+        task.result()
+
+
+def test_given_failing_cases(executor):
+    runner = NonCallableMock(CaseRunner)
+    runner.run.side_effect = RuntimeError("message")
+
+    task = UnorderedCasesTask(executor, runner, [sentinel.case])
+    with raises(RuntimeError, match="message"):
+        task.result()
+    runner.forward_events.assert_not_called()
+
+
+def test_given_unfinished_cases():
+    executor = NonCallableMock(Executor)
+    future: Future = Future()
+    executor.submit.side_effect = [future, submit(lambda: (sentinel.result, []))]
+    task = UnorderedCasesTask(executor, NonCallableMock(CaseRunner), [sentinel.case] * 2)
+    assert task.finished_at() is None
+
+    callback = Mock()
+    task.add_done_callback(callback)
+    callback.assert_not_called()
+    future.cancel()
+    callback.assert_called_once_with()
+
+
+def test_given_cancelled_cases(executor):
+    cancelled: Future = Future()
+    cancelled.cancel()
+    succeeded = NonCallableMock(CaseResult, status=Status.SUCCESS)
+    executor.submit.side_effect = [submit(lambda: (succeeded, [])), cancelled]
+    runner = NonCallableMock(CaseRunner)
+
+    cases = [sentinel.case, NonCallableMock(Case, label="foo")]
+    task = UnorderedCasesTask(executor, runner, cases)
+    result = task.result()
+    assert result.status is Status.SUCCESS
+    assert result.items[0] is succeeded
+    assert result.items[1].label == "foo"
+    assert result.items[1].status is Status.SKIPPED
+    assert task.finished_at() is None
+
+    runner.forward_events.assert_called_once_with([])
@@ -0,0 +1,23 @@
+from pytest import mark
+
+from preacher.core.scenario.util.dependency import resolve_dependencies, sort_topologically
+
+
+def test_resolve_dependencies():
+    labels = ["foo", None, "bar", "foo", "baz"]
+    depends_on = [["foo"], [], ["foo", "unknown"], ["bar", "baz"], ["foo", "foo"]]
+    assert resolve_dependencies(labels, depends_on) == [[3], [], [0, 3], [2, 4], [0, 3]]
+
+
+@mark.parametrize(
+    ("dependencies", "expected"),
+    (
+        ([], []),
+        ([[], [], []], [0, 1, 2]),
+        ([[1], [2], []], [2, 1, 0]),
+        ([[], [0], [0], [1, 2]], [0, 1, 2, 3]),
+        ([[1], [0], [], [0], [2]], [2, 4]),
+    ),
+)
+def test_sort_topologically(dependencies, expected):
+    assert sort_topologically(dependencies) == expected
@@ -0,0 +1,62 @@
+import pickle
+from typing import Optional
+from unittest.mock import NonCallableMock, sentinel
+
+from pytest import mark
+
+from preacher.core.request import Response, ResponseBody
+from preacher.core.scenario.util.forwarding import EventRecorder, ResponseSnapshot
+
+
+def _response(text: str, content: bytes, encoding: Optional[str] = "utf-8") -> Response:
+    response = NonCallableMock(
+        Response,
+        id="id",
+        elapsed=1.5,
+        status_code=200,
+        headers={"content-type": "text/plain"},
+    )
+    response.body = NonCallableMock(ResponseBody, text=text, content=content, encoding=encoding)
+    return response
+
+
+@mark.parametrize(
+    ("text", "content", "encoding", "text_held"),
+    (
+        ("", b"", "utf-8", False),
+        ("テキスト", "テキスト".encode("utf-8"), "UTF-8", False),
+        ("テキスト", "テキスト".encode("shift_jis"), "shift_jis", True),
+        ("テキスト", "テキスト".encode("utf-8"), None, True),
+        ("テキスト", "テキスト".encode("utf-8"), "unknown", True),
+        ("�", b"\xff", "utf-8", False),
+    ),
+)
+def test_response_snapshot(text, content, encoding, text_held):
+    response = _response(text, content, encoding)
+    snapshot = pickle.loads(pickle.dumps(ResponseSnapshot(response)))
+    assert snapshot.id == "id"
+    assert snapshot.elapsed == 1.5
+    assert snapshot.status_code == 200
+    assert snapshot.headers == {"content-type": "text/plain"}
+    assert snapshot.headers["Content-Type"] == "text/plain"
+    assert snapshot.body.text == text
+    assert snapshot.body.content == content
+    assert snapshot.body.encoding == encoding
+    assert (snapshot.body._text is not None) is text_held
+
+
+def test_event_recorder():
+    recorder = EventRecorder()
+    assert recorder.take() == []
+
+    recorder.on_execution(sentinel.execution1, None)
+    recorder.on_execution(sentinel.execution2, _response("text", b"text"))
+    events = recorder.take()
+    assert recorder.take() == []
+
+    assert len(events) == 2
+    assert events[0] == (sentinel.execution1, None)
+    execution, response = events[1]
+    assert execution is sentinel.execution2
+    assert isinstance(response, ResponseSnapshot)
+    assert response.body.text == "text"
@@ -0,0 +1,122 @@
+import pickle
+import threading
+from typing import List
+from unittest.mock import NonCallableMock, call, sentinel
+
+from pytest import raises
+
+from preacher.core.scheduling.background import BackgroundListener
+from preacher.core.scheduling.listener import Listener
+
+
+class _RecordingListener(Listener):
+    def __init__(self):
+        self.events: List[object] = []
+        self.threads: List[str] = []
+
+    def on_scenario(self, result) -> None:
+        self.events.append(result)
+        self.threads.append(threading.current_thread().name)
+
+
+def test_delegates_in_order():
+    delegated = NonCallableMock(Listener)
+    listener = BackgroundListener(delegated)
+
+    listener.on_execution(sentinel.execution1, sentinel.response1)
+    listener.on_scenario(sentinel.scenario)
+    listener.on_execution(sentinel.execution2, None)
+    listener.on_end(sentinel.status)
+
+    assert delegated.mock_calls == [
+        call.on_execution(sentinel.execution1, sentinel.response1),
+        call.on_scenario(sentinel.scenario),
+        call.on_execution(sentinel.execution2, None),
+        call.on_end(sentinel.status),
+    ]
+
+    listener.on_scenario(sentinel.scenario)
+    listener.close()
+    assert delegated.mock_calls[-2:] == [call.on_scenario(sentinel.scenario), call.close()]
+
+
+def test_delegates_on_another_thread():
+    delegated = _RecordingListener()
+    listener = BackgroundListener(delegated, max_queue_size=1)
+
+    for i in range(10):
+        listener.on_scenario(i)
+    listener.flush()
+    assert delegated.events == list(range(10))
+    assert set(delegated.threads) == {"preacher-listener"}
+
+    # Available after flushed.
+    listener.on_scenario(10)
+    listener.on_end(sentinel.status)
+    assert delegated.events == list(range(11))
+
+
+def test_delegates_events_put_while_flushing():
+    delegated = _RecordingListener()
+    listener = BackgroundListener(delegated, max_queue_size=4)
+
+    def _put(offset: int) -> None:
+        for i in range(100):
+            listener.on_scenario(offset + i)
+
+    putting = [threading.Thread(target=_put, args=(offset,)) for offset in (0, 100, 200)]
+    for thread in putting:
+        thread.start()
+    while any(thread.is_alive() for thread in putting):
+        listener.flush()
+    listener.flush()
+    assert sorted(delegated.events) == list(range(300))
+
+
+def test_backpressure():
+    released = threading.Event()
+
+    class _BlockingListener(Listener):
+        def on_scenario(self, result) -> None:
+            released.wait()
+
+    listener = BackgroundListener(_BlockingListener(), max_queue_size=1)
+    listener.on_scenario(sentinel.scenario1)  # taken by the thread, which is blocked.
+    listener.on_scenario(sentinel.scenario2)  # queued.
+
+    putting = threading.Thread(target=listener.on_scenario, args=(sentinel.scenario3,))
+    putting.start()
+    putting.join(timeout=0.1)
+    assert putting.is_alive()
+
+    released.set()
+    putting.join()
+    listener.on_end(sentinel.status)
+
+
+def test_error():
+    delegated = NonCallableMock(Listener)
+    delegated.on_scenario.side_effect = [RuntimeError("1"), RuntimeError("2"), None]
+    listener = BackgroundListener(delegated)
+
+    listener.on_scenario(sentinel.scenario1)
+    listener.on_scenario(sentinel.scenario2)
+    listener.on_scenario(sentinel.scenario3)
+    with raises(RuntimeError, match="1"):
+        listener.on_end(sentinel.status)
+    assert delegated.on_scenario.call_count == 3
+    delegated.on_end.assert_not_called()
+
+    listener.flush()  # The error is raised only once.
+
+
+def test_pickled():
+    listener = BackgroundListener(_RecordingListener())
+    listener.on_scenario(1)
+
+    copied = pickle.loads(pickle.dumps(listener))
+    copied.on_scenario(2)
+    assert copied._listener.events == [2]
+    assert copied._listener.threads == [threading.current_thread().name]
+
+    listener.flush()
@@ -0,0 +1,50 @@
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from unittest.mock import NonCallableMock, sentinel
+
+from preacher.core.scheduling.cancellation import CancellableExecutor
+
+
+def test_cancelling_waiting_tasks():
+    started = threading.Event()
+    released = threading.Event()
+
+    def _block():
+        started.set()
+        released.wait(10.0)
+        return sentinel.blocked
+
+    with CancellableExecutor(ThreadPoolExecutor(1)) as executor:
+        running = executor.submit(_block)
+        waiting = executor.submit(lambda: sentinel.waiting)
+        assert started.wait(10.0)
+
+        executor.cancel()
+        assert executor.cancelled
+        submitted = executor.submit(lambda: sentinel.submitted)
+        released.set()
+
+        assert running.result(10.0) is sentinel.blocked
+        assert waiting.cancelled()
+        assert submitted.cancelled()
+
+        executor.reset()
+        assert not executor.cancelled
+        assert executor.submit(lambda: sentinel.reset).result(10.0) is sentinel.reset
+
+
+def test_delegation():
+    future: Future = Future()
+    inner = NonCallableMock(Executor)
+    inner.submit.return_value = future
+    executor = CancellableExecutor(inner)
+
+    assert executor.submit(sentinel.fn, sentinel.arg, key=sentinel.value) is future
+    inner.submit.assert_called_once_with(sentinel.fn, sentinel.arg, key=sentinel.value)
+
+    future.set_result(sentinel.result)
+    executor.cancel()
+    assert not future.cancelled()
+
+    executor.shutdown(wait=False)
+    inner.shutdown.assert_called_once_with(False)
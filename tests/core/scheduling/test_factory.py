@@ -19,21 +19,54 @@ def test_create_scheduler(mocker):
         timeout=sentinel.timeout,
         retry=sentinel.retry,
         delay=sentinel.delay,
+        compactor=sentinel.compactor,
+        profiler=sentinel.profiler,
+        keep_sessions=sentinel.keep_sessions,
     )
     assert scheduler is sentinel.scheduler
 
-    requester_ctor.assert_called_once_with(base_url=sentinel.base_url, timeout=sentinel.timeout)
+    requester_ctor.assert_called_once_with(
+        base_url=sentinel.base_url,
+        timeout=sentinel.timeout,
+        keep_sessions=sentinel.keep_sessions,
+    )
     unit_runner_ctor.assert_called_once_with(
         requester=sentinel.requester,
         retry=sentinel.retry,
         delay=sentinel.delay,
+        profiler=sentinel.profiler,
     )
     case_runner_ctor.assert_called_once_with(
         unit_runner=sentinel.unit_runner,
         listener=sentinel.listener,
+        profiler=sentinel.profiler,
     )
     runner_ctor.assert_called_once_with(
         executor=sentinel.executor,
         case_runner=sentinel.case_runner,
+        profiler=sentinel.profiler,
     )
-    scheduler_ctor.assert_called_once_with(runner=sentinel.runner, listener=sentinel.listener)
+    scheduler_ctor.assert_called_once_with(
+        runner=sentinel.runner,
+        listener=sentinel.listener,
+        compactor=sentinel.compactor,
+        executor=None,
+        max_failures=None,
+        deadline=None,
+        window=None,
+    )
+
+
+def test_create_cancellable_scheduler(mocker):
+    executor_ctor = mocker.patch(f"{PKG}.CancellableExecutor", return_value=sentinel.cancellable)
+    runner_ctor = mocker.patch(f"{PKG}.ScenarioRunner", return_value=sentinel.runner)
+    scheduler_ctor = mocker.patch(f"{PKG}.ScenarioScheduler", return_value=sentinel.scheduler)
+
+    scheduler = create_scheduler(executor=sentinel.executor, max_failures=1)
+    assert scheduler is sentinel.scheduler
+
+    executor_ctor.assert_called_once_with(sentinel.executor)
+    assert runner_ctor.call_args[1]["executor"] is sentinel.cancellable
+    assert scheduler_ctor.call_args[1]["executor"] is sentinel.cancellable
+    assert scheduler_ctor.call_args[1]["max_failures"] == 1
+    assert scheduler_ctor.call_args[1]["deadline"] is None
@@ -7,3 +7,4 @@ def test_listener():
     listener = Listener()
     listener.on_end(sentinel.status)
     listener.on_scenario(sentinel.scenario)
+    listener.close()
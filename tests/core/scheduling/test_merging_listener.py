@@ -34,3 +34,9 @@ def test_on_end(merging_listener, listeners):
     merging_listener.on_end(sentinel.status)
     for listener in listeners:
         listener.on_end.assert_called_once_with(sentinel.status)
+
+
+def test_close(merging_listener, listeners):
+    merging_listener.close()
+    for listener in listeners:
+        listener.close.assert_called_once_with()
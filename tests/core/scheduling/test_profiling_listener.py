@@ -0,0 +1,58 @@
+from contextlib import contextmanager
+from unittest.mock import Mock, NonCallableMock, sentinel
+
+from pytest import fixture
+
+from preacher.core.profiling import Profiler
+from preacher.core.scheduling import Listener, ProfilingListener
+
+
+@fixture
+def events():
+    return []
+
+
+@fixture
+def listener(events):
+    def _record(name):
+        return Mock(side_effect=lambda *args: events.append((name, args)))
+
+    return NonCallableMock(
+        Listener,
+        on_execution=_record("on_execution"),
+        on_scenario=_record("on_scenario"),
+        on_end=_record("on_end"),
+    )
+
+
+@fixture
+def profiler(events):
+    @contextmanager
+    def _phase(name):
+        events.append(name)
+        yield
+        events.append(f"/{name}")
+
+    return NonCallableMock(Profiler, phase=Mock(side_effect=_phase))
+
+
+def test_profiling_listener(listener, profiler, events):
+    profiling = ProfilingListener(listener, profiler)
+    profiling.on_execution(sentinel.execution, sentinel.response)
+    profiling.on_scenario(sentinel.result)
+    profiling.on_end(sentinel.status)
+
+    assert events == [
+        "report",
+        ("on_execution", (sentinel.execution, sentinel.response)),
+        "/report",
+        "report",
+        ("on_scenario", (sentinel.result,)),
+        "/report",
+        "report",
+        ("on_end", (sentinel.status,)),
+        "/report",
+    ]
+
+    profiling.close()
+    listener.close.assert_called_once_with()
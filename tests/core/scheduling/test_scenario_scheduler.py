@@ -1,7 +1,10 @@
+import threading
 from typing import Iterable, Iterator
 from unittest.mock import Mock, NonCallableMock, call, sentinel
 
+from preacher.core.scenario import ResultCompactor
 from preacher.core.scenario import Scenario, ScenarioRunner, ScenarioResult, ScenarioTask
+from preacher.core.scheduling.cancellation import CancellableExecutor
 from preacher.core.scheduling.listener import Listener
 from preacher.core.scheduling.scenario_scheduler import ScenarioScheduler
 from preacher.core.status import Status
@@ -74,3 +77,100 @@ def test_given_scenarios():
         task.result.assert_called_once_with()
     listener.on_scenario.assert_has_calls([call(r) for r in results])
     listener.on_end.assert_called_once_with(Status.FAILURE)
+
+
+def test_given_a_compactor():
+    result = ScenarioResult(status=Status.UNSTABLE)
+    compacted = ScenarioResult(status=Status.UNSTABLE)
+    task = NonCallableMock(ScenarioTask, result=Mock(return_value=result))
+    runner = NonCallableMock(ScenarioRunner, submit=Mock(return_value=task))
+    compactor = NonCallableMock(ResultCompactor, compact=Mock(return_value=compacted))
+    listener = NonCallableMock(Listener)
+
+    scheduler = ScenarioScheduler(runner=runner, listener=listener, compactor=compactor)
+    status = scheduler.run([sentinel.scenario])
+    assert status is Status.UNSTABLE
+
+    compactor.compact.assert_called_once_with(result)
+    listener.on_scenario.assert_called_once_with(compacted)
+
+
+def test_given_a_window():
+    events = []
+
+    def _submit(scenario: int) -> ScenarioTask:
+        events.append(f"submit {scenario}")
+
+        def _result() -> ScenarioResult:
+            events.append(f"result {scenario}")
+            return ScenarioResult(status=Status.SUCCESS)
+
+        return NonCallableMock(ScenarioTask, result=Mock(side_effect=_result))
+
+    runner = NonCallableMock(ScenarioRunner, submit=Mock(side_effect=_submit))
+    scheduler = ScenarioScheduler(runner, window=2)
+    assert scheduler.run(iter(range(4))) is Status.SUCCESS
+    assert events == [
+        "submit 0",
+        "submit 1",
+        "result 0",
+        "submit 2",
+        "result 1",
+        "submit 3",
+        "result 2",
+        "result 3",
+    ]
+
+
+def test_cancelled_after_failures():
+    statuses = [Status.UNSTABLE, Status.SUCCESS, Status.FAILURE, Status.SKIPPED]
+    tasks = [
+        NonCallableMock(ScenarioTask, result=Mock(return_value=ScenarioResult(status=status)))
+        for status in statuses
+    ]
+    runner = NonCallableMock(ScenarioRunner)
+    runner.submit.side_effect = tasks
+    executor = NonCallableMock(CancellableExecutor)
+    listener = NonCallableMock(Listener)
+
+    def _on_scenario(_):
+        if len(listener.on_scenario.call_args_list) < 3:
+            executor.cancel.assert_not_called()
+        else:
+            executor.cancel.assert_called_once_with()
+
+    listener.on_scenario.side_effect = _on_scenario
+
+    scheduler = ScenarioScheduler(runner, listener, executor=executor, max_failures=2)
+    assert scheduler.run([sentinel.scenario] * 4) is Status.FAILURE
+
+    executor.reset.assert_called_once_with()
+    assert listener.on_scenario.call_count == 4
+    listener.on_end.assert_called_once_with(Status.FAILURE)
+
+
+def test_cancelled_at_deadline():
+    cancelled = threading.Event()
+    executor = NonCallableMock(CancellableExecutor, cancel=Mock(side_effect=cancelled.set))
+
+    def _result():
+        assert cancelled.wait(10.0)
+        return ScenarioResult(status=Status.SKIPPED)
+
+    task = NonCallableMock(ScenarioTask, result=Mock(side_effect=_result))
+    runner = NonCallableMock(ScenarioRunner, submit=Mock(return_value=task))
+
+    scheduler = ScenarioScheduler(runner, executor=executor, deadline=0.01)
+    assert scheduler.run([sentinel.scenario]) is Status.SKIPPED
+    executor.cancel.assert_called_once_with()
+
+
+def test_not_cancelled_before_deadline():
+    executor = NonCallableMock(CancellableExecutor)
+    task = NonCallableMock(ScenarioTask, result=Mock(return_value=ScenarioResult()))
+    runner = NonCallableMock(ScenarioRunner, submit=Mock(return_value=task))
+
+    scheduler = ScenarioScheduler(runner, executor=executor, max_failures=1, deadline=0.01)
+    scheduler.run([sentinel.scenario])
+    threading.Event().wait(0.05)
+    executor.cancel.assert_not_called()
@@ -0,0 +1,23 @@
+from preacher.core.util.lru import LruCache
+
+
+def test_lru_cache():
+    cache: LruCache[str, int] = LruCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.put("a", 4)
+    cache.put("d", 5)
+    assert cache.get("c") is None
+    assert cache.get("a") == 4
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("a") is None
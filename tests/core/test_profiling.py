@@ -0,0 +1,173 @@
+import os
+import pickle
+import pstats
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import get_context
+from tempfile import TemporaryDirectory
+from unittest.mock import NonCallableMock, sentinel
+
+from pytest import fixture, raises
+
+from preacher.core.profiling import CProfiler, MergingProfiler, Profiler, write_summary
+
+
+@fixture
+def directory():
+    with TemporaryDirectory() as path:
+        yield os.path.join(path, "profiles")
+
+
+def _loading():
+    return sum(range(100))
+
+
+def _compiling(profiler):
+    with profiler.phase("load"):
+        _loading()
+    return sum(range(100))
+
+
+def _executing(profiler):
+    with profiler.phase("execute"):
+        return os.getpid()
+
+
+def _functions(path):
+    return {name for _, _, name in pstats.Stats(path).stats}
+
+
+def test_profiler_profiles_nothing():
+    profiler = Profiler()
+    with profiler.phase("load"):
+        pass
+    with profiler.span("Case", "case", number=1):
+        pass
+    profiler.record_span("Scenario", "scenario", 1.0, 2.0)
+    assert profiler.iterate("load", sentinel.iterable) is sentinel.iterable
+    profiler.dump()
+
+
+def test_merging_profiler():
+    calls = []
+
+    def _profiler(name):
+        profiler = NonCallableMock(Profiler)
+        profiler.phase.side_effect = lambda phase: _recording(calls, f"{name}:{phase}")
+        profiler.span.side_effect = lambda span, _, **args: _recording(calls, f"{name}:{span}")
+        profiler.iterate.side_effect = lambda phase, iterable: [f"{name}:{x}" for x in iterable]
+        return profiler
+
+    profilers = [_profiler("a"), _profiler("b")]
+    merged = MergingProfiler(profilers)
+    with merged.phase("load"):
+        calls.append("loading")
+    with merged.span("Case", "case", number=1):
+        calls.append("running")
+    assert calls == [
+        "a:load",
+        "b:load",
+        "loading",
+        "/b:load",
+        "/a:load",
+        "a:Case",
+        "b:Case",
+        "running",
+        "/b:Case",
+        "/a:Case",
+    ]
+    assert merged.iterate("load", ["x"]) == ["a:b:x"]
+
+    merged.record_span("Scenario", "scenario", 1.0, 2.0, number=1)
+    merged.dump()
+    for profiler in profilers:
+        profiler.span.assert_called_once_with("Case", "case", number=1)
+        profiler.record_span.assert_called_once_with("Scenario", "scenario", 1.0, 2.0, number=1)
+        profiler.dump.assert_called_once_with()
+
+
+@contextmanager
+def _recording(calls, name):
+    calls.append(name)
+    yield
+    calls.append(f"/{name}")
+
+
+def test_nested_phases(directory):
+    profiler = CProfiler(directory)
+    with profiler.phase("compile"):
+        _compiling(profiler)
+    profiler.dump()
+
+    pid = os.getpid()
+    compiled = _functions(os.path.join(directory, f"compile-{pid}-MainThread.prof"))
+    assert "_compiling" in compiled
+    assert "_loading" not in compiled
+    loaded = _functions(os.path.join(directory, f"load-{pid}-MainThread.prof"))
+    assert "_loading" in loaded
+    assert "_compiling" not in loaded
+
+    with open(os.path.join(directory, f"{pid}.collapsed")) as f:
+        lines = [line.rsplit(" ", 1) for line in f]
+    assert any(stack.startswith("compile;_compiling") for stack, _ in lines)
+    assert any(stack.startswith("load;") and "_loading" in stack for stack, _ in lines)
+    assert all(int(microseconds) > 0 for _, microseconds in lines)
+
+
+def test_iteration_continues_after_errors(directory):
+    def _items():
+        yield 1
+        raise RuntimeError
+
+    class Items:
+        def __init__(self):
+            self._iterator = _items()
+            self._raised = False
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            if not self._raised:
+                self._raised = True
+                raise ValueError
+            return next(self._iterator)
+
+    profiler = CProfiler(directory)
+    iterator = iter(profiler.iterate("load", Items()))
+    with raises(ValueError):
+        next(iterator)
+    assert next(iterator) == 1
+    with raises(RuntimeError):
+        next(iterator)
+
+
+def test_threads(directory):
+    profiler = CProfiler(directory)
+    with ThreadPoolExecutor(2, thread_name_prefix="worker") as executor:
+        list(executor.map(_executing, [profiler] * 4))
+    profiler.dump()
+
+    names = os.listdir(directory)
+    assert any(name.startswith(f"execute-{os.getpid()}-worker_") for name in names)
+
+    write_summary(directory)
+    with open(os.path.join(directory, "summary.txt")) as f:
+        summary = f.read()
+    assert "== execute (" in summary
+    assert "getpid" in summary
+    assert "== load" not in summary
+
+
+def test_copies_in_processes(directory):
+    profiler = CProfiler(directory)
+    copied = pickle.loads(pickle.dumps(profiler))
+    assert copied is not profiler
+    assert copied is pickle.loads(pickle.dumps(profiler))
+    assert copied.directory == directory
+
+    with ProcessPoolExecutor(1, mp_context=get_context("fork")) as executor:
+        pid = executor.submit(_executing, profiler).result()
+    assert pid != os.getpid()
+    assert os.path.exists(os.path.join(directory, f"execute-{pid}-MainThread.prof"))
+    assert os.path.exists(os.path.join(directory, f"{pid}.collapsed"))
@@ -0,0 +1,30 @@
+import pickle
+
+from preacher.core.util import sharing
+from preacher.core.util.sharing import Shareable, is_shared, share, unshare_all
+
+
+class _Object(Shareable):
+    def __init__(self, value: int):
+        self.value = value
+
+
+def test_sharing(mocker):
+    mocker.patch.object(sharing, "_SHARED", {})
+
+    obj = _Object(1)
+    assert not is_shared(obj)
+    copied = pickle.loads(pickle.dumps(obj))
+    assert copied is not obj
+    assert copied.value == 1
+
+    share(obj)
+    assert is_shared(obj)
+    assert not is_shared(_Object(1))
+    data = pickle.dumps(obj)
+    assert b"value" not in data
+    assert pickle.loads(data) is obj
+
+    unshare_all()
+    assert not is_shared(obj)
+    assert pickle.loads(pickle.dumps(obj)) is not obj
@@ -0,0 +1,87 @@
+import pickle
+from dataclasses import FrozenInstanceError, dataclass, field, replace
+from typing import Optional
+
+from pytest import mark, raises
+
+from preacher.core.util.slots import slotted
+
+
+class _Base:
+    __slots__ = ()
+
+
+@slotted
+@dataclass(frozen=True)
+class _Frozen(_Base):
+    value: int = 0
+    items: list = field(default_factory=list)
+    _double: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_double", self.value * 2)
+
+    @property
+    def double(self) -> int:
+        return self._double
+
+
+@slotted
+@dataclass
+class _Mutable(_Base):
+    value: int = 0
+
+
+def test_slotted_frozen_dataclass():
+    obj = _Frozen(1, [2])
+    assert not hasattr(obj, "__dict__")
+    assert obj == _Frozen(1, [2])
+    assert obj.double == 2
+    assert repr(obj) == "_Frozen(value=1, items=[2])"
+    assert _Frozen().items == []
+    assert replace(obj, value=3).double == 6
+
+    with raises(FrozenInstanceError):
+        obj.value = 2  # type: ignore
+
+    restored = pickle.loads(pickle.dumps(obj))
+    assert restored == obj
+    assert restored.double == 2
+
+
+@slotted
+@dataclass(frozen=True)
+class _WithDefaults(_Base):
+    required: int
+    message: Optional[str] = None
+    children: tuple = ()
+
+
+@mark.parametrize(
+    ("obj", "expected_state"),
+    (
+        (_WithDefaults(1), (1,)),
+        (_WithDefaults(1, "m"), (1, "m")),
+        (_WithDefaults(1, children=(2,)), (1, None, (2,))),
+        (_WithDefaults(1, children=()), (1,)),
+        (_Frozen(), (0, [])),  # Not omitted for the default factory.
+        (_Frozen(0, [1]), (0, [1])),
+    ),
+)
+def test_slotted_pickled_state(obj, expected_state):
+    assert obj.__getstate__() == expected_state
+    assert pickle.loads(pickle.dumps(obj)) == obj
+
+
+def test_slotted_mutable_dataclass():
+    obj = _Mutable()
+    obj.value = 1
+    assert not hasattr(obj, "__dict__")
+    assert pickle.loads(pickle.dumps(obj)) == _Mutable(1)
+    with raises(AttributeError):
+        obj.another = 1  # type: ignore
+
+
+def test_given_not_a_dataclass():
+    with raises(TypeError):
+        slotted(_Base)
@@ -1,8 +1,11 @@
+import pickle
+from dataclasses import replace
 from typing import Iterable
+from unittest.mock import NonCallableMock, PropertyMock
 
 from pytest import mark
 
-from preacher.core.status import Status, merge_statuses
+from preacher.core.status import Status, Statused, StatusedList, merge_statuses
 
 
 @mark.parametrize(
@@ -46,7 +49,45 @@ def test_merge(lhs: Status, rhs: Status, expected: Status):
 
 @mark.parametrize(
     ("statuses", "expected"),
-    (([], Status.SKIPPED), ([Status.SUCCESS, Status.UNSTABLE, Status.FAILURE], Status.FAILURE)),
+    (
+        ([], Status.SKIPPED),
+        ([Status.SUCCESS, Status.UNSTABLE, Status.FAILURE], Status.FAILURE),
+        ([Status.UNSTABLE, Status.SKIPPED], Status.UNSTABLE),
+        (iter([Status.SKIPPED, Status.SUCCESS]), Status.SUCCESS),
+    ),
 )
 def test_merge_statuses(statuses: Iterable[Status], expected: Status):
     assert merge_statuses(statuses) is expected
+
+
+def test_statused_list_status_is_computed_once():
+    status = PropertyMock(return_value=Status.UNSTABLE)
+    item = NonCallableMock(Statused)
+    type(item).status = status
+
+    statused_list = StatusedList([item])
+    assert statused_list.status is Status.UNSTABLE
+    assert statused_list.status is Status.UNSTABLE
+    status.assert_called_once_with()
+
+
+class _Statused(Statused):
+    def __init__(self, status: Status):
+        self._status = status
+
+    @property
+    def status(self) -> Status:
+        return self._status
+
+
+def test_statused_list_status_on_replacement_and_pickling():
+    statused_list = StatusedList([])
+    assert statused_list.status is Status.SKIPPED
+
+    items = [_Statused(Status.FAILURE), _Statused(Status.SUCCESS)]
+    replaced = replace(statused_list, items=items)
+    assert replaced.status is Status.FAILURE
+    assert replaced == StatusedList(items)
+
+    restored = pickle.loads(pickle.dumps(replaced))
+    assert restored.status is Status.FAILURE
@@ -0,0 +1,110 @@
+import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from tempfile import TemporaryDirectory
+
+from pytest import fixture
+
+from preacher.core.tracing import Tracer, write_trace
+
+
+@fixture
+def directory():
+    with TemporaryDirectory() as path:
+        yield os.path.join(path, "events")
+
+
+def _events(directory):
+    events = []
+    for name in os.listdir(directory):
+        with open(os.path.join(directory, name)) as f:
+            events.extend(json.load(f))
+    return events
+
+
+def _tracing(tracer):
+    with tracer.span("Case", "case", number=1):
+        with tracer.phase("execute"):
+            pass
+    return os.getpid()
+
+
+def test_spans(directory):
+    tracer = Tracer(directory)
+    _tracing(tracer)
+    tracer.record_span("Scenario", "scenario", 1.0, 2.5)
+    tracer.dump()
+
+    events = _events(directory)
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    case = spans["Case"]
+    assert case["cat"] == "case"
+    assert case["args"] == {"number": 1}
+    assert case["pid"] == os.getpid()
+    execute = spans["execute"]
+    assert execute["cat"] == "phase"
+    assert "args" not in execute
+    assert execute["tid"] == case["tid"]
+    assert case["ts"] <= execute["ts"]
+    assert execute["ts"] + execute["dur"] <= case["ts"] + case["dur"]
+
+    begin, end = (event for event in events if event["name"] == "Scenario")
+    assert begin["ph"] == "b"
+    assert begin["ts"] == 1_000_000
+    assert end["ph"] == "e"
+    assert end["ts"] == 2_500_000
+    assert begin["id"] == end["id"]
+
+    names = {event["name"]: event["args"]["name"] for event in events if event["ph"] == "M"}
+    assert names["process_name"] == f"preacher ({os.getpid()})"
+    assert names["thread_name"] == "MainThread"
+
+
+def test_dump_nothing(directory):
+    tracer = Tracer(directory)
+    tracer.dump()
+    assert not os.listdir(directory)
+
+
+def test_threads(directory):
+    tracer = Tracer(directory)
+    with ThreadPoolExecutor(2, thread_name_prefix="worker") as executor:
+        list(executor.map(_tracing, [tracer] * 4))
+    tracer.dump()
+
+    events = _events(directory)
+    assert len([event for event in events if event["ph"] == "X"]) == 8
+    thread_names = {event["args"]["name"] for event in events if event["name"] == "thread_name"}
+    assert all(name.startswith("worker_") for name in thread_names)
+
+
+def test_copies_in_processes(directory):
+    tracer = Tracer(directory)
+    copied = pickle.loads(pickle.dumps(tracer))
+    assert copied is not tracer
+    assert copied is pickle.loads(pickle.dumps(tracer))
+    assert copied.directory == directory
+
+    with ProcessPoolExecutor(1, mp_context=get_context("fork")) as executor:
+        pid = executor.submit(_tracing, tracer).result()
+    assert pid != os.getpid()
+    assert any(name.startswith(f"{pid}-") for name in os.listdir(directory))
+
+
+def test_write_trace(directory):
+    tracer = Tracer(directory)
+    _tracing(tracer)
+    tracer.dump()
+    with ProcessPoolExecutor(1, mp_context=get_context("fork")) as executor:
+        pid = executor.submit(_tracing, tracer).result()
+
+    path = os.path.join(directory, "..", "trace.json")
+    write_trace(directory, path, metadata={"version": "x"})
+    with open(path) as f:
+        trace = json.load(f)
+    assert trace["displayTimeUnit"] == "ms"
+    assert trace["otherData"] == {"version": "x"}
+    pids = {event["pid"] for event in trace["traceEvents"] if event["name"] == "Case"}
+    assert pids == {os.getpid(), pid}
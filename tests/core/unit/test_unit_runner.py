@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from typing import Optional
 from unittest.mock import ANY, Mock, NonCallableMock, sentinel
 
@@ -5,6 +6,7 @@ from pytest import mark, raises
 
 from preacher.core.context import Context
 from preacher.core.extraction import Analyzer
+from preacher.core.profiling import Profiler
 from preacher.core.request import ExecutionReport, Requester
 from preacher.core.status import Status
 from preacher.core.unit.runner import predicate, UnitRunner
@@ -60,6 +62,7 @@ def test_given_no_response(mocker):
 
     runner = UnitRunner(requester)
     assert runner.base_url is sentinel.requester_base_url
+    assert runner.session() is requester.session.return_value
 
     execution, response, verification = runner.run(sentinel.request, requirements)
     assert execution is sentinel.execution
@@ -107,3 +110,51 @@ def test_given_a_response(mocker):
     # Contextual values will disappear.
     requirements.verify.assert_called_with(sentinel.response, Context(foo="bar"))
     retry.assert_called_once_with(ANY, attempts=4, delay=sentinel.delay, predicate=ANY)
+
+
+def test_counting_attempts():
+    requester = NonCallableMock(Requester)
+    requester.execute.return_value = ExecutionReport(Status.UNSTABLE), None
+
+    execution, _, _ = UnitRunner(requester, retry=2, delay=0.0).run(sentinel.request, None)
+    assert execution.attempts == 3
+    assert requester.execute.call_count == 3
+
+    execution, _, _ = UnitRunner(requester).run(sentinel.request, None)
+    assert execution.attempts == 1
+
+
+def test_profiling_phases_and_attempts():
+    phases = []
+
+    @contextmanager
+    def _phase(name, *_args):
+        phases.append(name)
+        yield
+        phases.append(f"/{name}")
+
+    profiler = NonCallableMock(Profiler, phase=Mock(side_effect=_phase))
+    profiler.span.side_effect = _phase
+    requester = NonCallableMock(Requester)
+    requester.execute.side_effect = lambda *args, **kwargs: _record(phases, "executed")
+    requirements = NonCallableMock(ResponseDescription)
+    requirements.verify.side_effect = lambda *args: _record(phases, "verified")[0]
+
+    runner = UnitRunner(requester=requester, profiler=profiler)
+    runner.run(sentinel.request, requirements)
+
+    assert phases == [
+        "Attempt 1",
+        "execute",
+        "executed",
+        "/execute",
+        "verify",
+        "verified",
+        "/verify",
+        "/Attempt 1",
+    ]
+
+
+def _record(phases, name):
+    phases.append(name)
+    return ExecutionReport(Status.SUCCESS), sentinel.response
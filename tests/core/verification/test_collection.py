@@ -0,0 +1,182 @@
+import pickle
+
+import hamcrest
+from hamcrest import assert_that
+from hamcrest.core.string_description import StringDescription
+from pytest import fixture, mark, raises
+
+from preacher.core.verification import collection
+from preacher.core.verification.collection import every_item, no_item, unique_items
+from preacher.core.verification.collection import has_max, has_min, has_sum
+from preacher.core.verification.collection import sorted_ascending, sorted_descending
+
+PKG = "preacher.core.verification.collection"
+SIZE = collection.BULK_MIN_SIZE
+
+INTS = list(range(SIZE))
+FLOATS = [float(i) / 2 for i in range(SIZE)]
+STRS = [f"{i:03d}" for i in range(SIZE)]
+BOOLS = [True] * SIZE
+
+
+@fixture(params=[True, False], ids=["numpy", "loop"])
+def with_numpy(request, mocker):
+    if not request.param:
+        mocker.patch(f"{PKG}._load_numpy", return_value=None)
+    return request.param
+
+
+def _mismatch(matcher, item) -> str:
+    description = StringDescription()
+    matcher.describe_mismatch(item, description)
+    return str(description)
+
+
+@mark.parametrize(
+    ("item_matcher", "items", "every_expected", "no_expected"),
+    (
+        (hamcrest.greater_than_or_equal_to(0), INTS, True, False),
+        (hamcrest.greater_than(0), INTS, False, False),
+        (hamcrest.greater_than(SIZE), INTS, False, True),
+        (hamcrest.less_than(2**70), INTS, True, False),
+        (hamcrest.equal_to(1.0), INTS, False, False),
+        (hamcrest.less_than(SIZE), FLOATS, True, False),
+        (hamcrest.less_than(1), FLOATS, False, False),
+        (hamcrest.equal_to(True), BOOLS, True, False),
+        (hamcrest.is_(hamcrest.equal_to(False)), BOOLS, False, True),
+        (hamcrest.starts_with("0"), STRS, True, False),
+        (hamcrest.greater_than_or_equal_to("000"), STRS, True, False),
+        (hamcrest.equal_to(0), STRS, False, True),
+        (hamcrest.greater_than(0), STRS, False, True),
+        (hamcrest.not_(hamcrest.equal_to(-1)), INTS, True, False),
+        (hamcrest.anything(), INTS, True, False),
+        (
+            hamcrest.all_of(hamcrest.greater_than_or_equal_to(0), hamcrest.less_than(SIZE)),
+            INTS,
+            True,
+            False,
+        ),
+        (
+            hamcrest.any_of(hamcrest.less_than(0), hamcrest.greater_than_or_equal_to(SIZE)),
+            INTS,
+            False,
+            True,
+        ),
+        (hamcrest.greater_than(0), INTS + [None], False, False),
+        (hamcrest.greater_than(0), [1, 2], True, False),
+        (hamcrest.greater_than(0), [], True, True),
+        (hamcrest.greater_than(0), None, False, False),
+    ),
+)
+def test_every_item_and_no_item(with_numpy, item_matcher, items, every_expected, no_expected):
+    assert every_item(item_matcher).matches(items) is every_expected
+    assert no_item(item_matcher).matches(items) is no_expected
+
+
+def test_every_item_mismatch(with_numpy):
+    matcher = every_item(hamcrest.less_than(SIZE - 1))
+    with raises(AssertionError) as error_info:
+        assert_that(INTS, matcher)
+    message = str(error_info.value)
+    assert f"Expected: every item a value less than <{SIZE - 1}>" in message
+    assert f"but: item at index {SIZE - 1} was <{SIZE - 1}>" in message
+
+    assert _mismatch(matcher, None) == "was <None>"
+
+
+def test_no_item_mismatch(with_numpy):
+    matcher = no_item(hamcrest.equal_to(3))
+    with raises(AssertionError) as error_info:
+        assert_that(INTS, matcher)
+    message = str(error_info.value)
+    assert "Expected: no item <3>" in message
+    assert "but: item at index 3 matched: <3>" in message
+
+
+@mark.parametrize(
+    ("items", "ascending_expected", "descending_expected"),
+    (
+        (None, False, False),
+        ([], True, True),
+        ([1], True, True),
+        (INTS, True, False),
+        (INTS[::-1], False, True),
+        (FLOATS + [0.0], False, False),
+        (STRS, True, False),
+        ([1, 1, 2], True, False),
+        ([1.0, float("nan")], False, False),
+    ),
+)
+def test_sorted(with_numpy, items, ascending_expected, descending_expected):
+    assert sorted_ascending().matches(items) is ascending_expected
+    assert sorted_descending().matches(items) is descending_expected
+
+
+def test_sorted_mismatch(with_numpy):
+    matcher = sorted_ascending()
+    assert _mismatch(matcher, INTS + [0]) == f"item at index {SIZE} was out of order: <0>"
+    assert _mismatch(matcher, None) == "was <None>"
+
+
+def test_sorted_given_incomparable_items():
+    with raises(TypeError):
+        sorted_ascending().matches([1, "A"])
+
+
+@mark.parametrize(
+    ("items", "expected"),
+    (
+        (None, False),
+        ([], True),
+        (INTS, True),
+        (INTS + [SIZE - 1], False),
+        ([1, 1.0], False),
+        ([[1], [2]], True),
+        ([[1], [1]], False),
+    ),
+)
+def test_unique_items(items, expected):
+    assert unique_items().matches(items) is expected
+
+
+def test_unique_items_mismatch():
+    matcher = unique_items()
+    assert _mismatch(matcher, [1, 2, 1]) == "item at index 2 was duplicated: <1>"
+    assert _mismatch(matcher, None) == "was <None>"
+
+
+@mark.parametrize(
+    ("factory", "items", "expected"),
+    (
+        (has_sum, None, False),
+        (has_sum, [], False),
+        (has_sum, [1, 2, 3], 6),
+        (has_min, [2, 1, 3], 1),
+        (has_max, [2, 3, 1], 3),
+        (has_max, STRS, STRS[-1]),
+    ),
+)
+def test_aggregations(factory, items, expected):
+    if expected is False:
+        assert not factory(hamcrest.anything()).matches(items)
+        return
+    assert factory(hamcrest.equal_to(expected)).matches(items)
+    assert not factory(hamcrest.not_(hamcrest.equal_to(expected))).matches(items)
+
+
+def test_aggregation_description():
+    matcher = has_sum(hamcrest.greater_than(10))
+    with raises(AssertionError) as error_info:
+        assert_that([1, 2], matcher)
+    message = str(error_info.value)
+    assert "Expected: a collection with sum a value greater than <10>" in message
+    assert "but: sum was <3>" in message
+
+
+def test_pickling(with_numpy):
+    matcher = every_item(hamcrest.greater_than(0))
+    assert not matcher.matches(INTS)
+
+    restored = pickle.loads(pickle.dumps(matcher))
+    assert not restored.matches(INTS)
+    assert restored.matches(INTS[1:])
@@ -1,8 +1,12 @@
+import pickle
 from unittest.mock import Mock, NonCallableMock, sentinel
 
-from pytest import fixture
+from pytest import fixture, raises
+
+from hamcrest import equal_to, not_
 
 from preacher.core.value import Value
+from preacher.core.value.impl.static import StaticValue
 from preacher.core.verification.matcher import MatcherFactory
 from preacher.core.verification.matcher import RecursiveMatcherFactory
 from preacher.core.verification.matcher import StaticMatcherFactory
@@ -33,8 +37,16 @@ def test_value_factory(matcher_func):
 
 def test_recursive_factory(matcher_func):
     inner_factories = [
-        NonCallableMock(MatcherFactory, create=Mock(return_value=sentinel.inner_matcher_0)),
-        NonCallableMock(MatcherFactory, create=Mock(return_value=sentinel.inner_matcher_1)),
+        NonCallableMock(
+            MatcherFactory,
+            is_static=False,
+            create=Mock(return_value=sentinel.inner_matcher_0),
+        ),
+        NonCallableMock(
+            MatcherFactory,
+            is_static=False,
+            create=Mock(return_value=sentinel.inner_matcher_1),
+        ),
     ]
 
     factory = RecursiveMatcherFactory(matcher_func, inner_factories)
@@ -43,3 +55,62 @@ def test_recursive_factory(matcher_func):
     for inner_matcher in inner_factories:
         inner_matcher.create.assert_called_once_with(sentinel.context)
     matcher_func.assert_called_once_with(sentinel.inner_matcher_0, sentinel.inner_matcher_1)
+
+
+def test_static_factory_is_static():
+    assert StaticMatcherFactory(sentinel.matcher).is_static
+
+
+def test_value_factory_given_a_static_value(matcher_func):
+    factory = ValueMatcherFactory(matcher_func, StaticValue(sentinel.value))
+    assert factory.is_static
+    matcher_func.assert_called_once_with(sentinel.value)
+
+    assert factory.create(sentinel.context_0) is sentinel.matcher
+    assert factory.create(sentinel.context_1) is sentinel.matcher
+    matcher_func.assert_called_once_with(sentinel.value)
+
+
+def test_value_factory_given_a_raw_value(matcher_func):
+    factory = ValueMatcherFactory(matcher_func, sentinel.value)
+    assert factory.is_static
+    assert factory.create() is sentinel.matcher
+    matcher_func.assert_called_once_with(sentinel.value)
+
+
+def test_value_factory_given_a_dynamic_value(matcher_func):
+    value = NonCallableMock(Value)
+    factory = ValueMatcherFactory(matcher_func, value)
+    assert not factory.is_static
+    matcher_func.assert_not_called()
+
+
+def test_value_factory_when_preparation_fails():
+    matcher_func = Mock(side_effect=RuntimeError("message"))
+    factory = ValueMatcherFactory(matcher_func, sentinel.value)
+    matcher_func.assert_called_once_with(sentinel.value)
+
+    with raises(RuntimeError):
+        factory.create()
+
+
+def test_recursive_factory_given_static_inner_factories(matcher_func):
+    inner_factories = [
+        StaticMatcherFactory(sentinel.inner_matcher_0),
+        StaticMatcherFactory(sentinel.inner_matcher_1),
+    ]
+    factory = RecursiveMatcherFactory(matcher_func, inner_factories)
+    assert factory.is_static
+    matcher_func.assert_called_once_with(sentinel.inner_matcher_0, sentinel.inner_matcher_1)
+
+    assert factory.create(sentinel.context) is sentinel.matcher
+    matcher_func.assert_called_once()
+
+
+def test_prepared_factory_pickling():
+    factory = RecursiveMatcherFactory(not_, [ValueMatcherFactory(equal_to, 1)])
+    restored = pickle.loads(pickle.dumps(factory))
+
+    assert restored.is_static
+    assert restored.create().matches(2)
+    assert not restored.create().matches(1)
@@ -1,9 +1,12 @@
-from unittest.mock import sentinel, NonCallableMock
+import pickle
+from unittest.mock import Mock, NonCallableMock, call, sentinel
 
+from hamcrest import equal_to
 from pytest import fixture
 
 from preacher.core.status import Status
 from preacher.core.verification import MatcherWrappingPredicate, MatcherFactory
+from preacher.core.verification import StaticMatcherFactory
 
 PKG = "preacher.core.verification.matcher"
 
@@ -30,31 +33,71 @@ def test_match_when_matcher_creation_fails(predicate, factory):
 
 
 def test_match_when_an_error_occurs_on_assertion(mocker, predicate, factory):
-    assert_that = mocker.patch(f"{PKG}.assert_that")
-    assert_that.side_effect = RuntimeError("message")
+    native = Mock(side_effect=RuntimeError("message"))
+    compile_native = mocker.patch(f"{PKG}.compile_native", return_value=native)
 
     verification = predicate.verify(sentinel.actual, sentinel.context)
     assert verification.status == Status.FAILURE
     assert verification.message == "RuntimeError: message"
     factory.create.assert_called_once_with(sentinel.context)
-    assert_that.assert_called_once_with(sentinel.actual, sentinel.matcher)
+    compile_native.assert_called_once_with(sentinel.matcher)
+    native.assert_called_once_with(sentinel.actual)
+
+
+def test_match_when_an_assertion_error_occurs(mocker, predicate, factory):
+    native = Mock(side_effect=AssertionError(" message "))
+    mocker.patch(f"{PKG}.compile_native", return_value=native)
+
+    verification = predicate.verify(sentinel.actual)
+    assert verification.status == Status.UNSTABLE
+    assert verification.message == "message"
 
 
 def test_match_when_assertion_fails(mocker, predicate, factory):
-    assert_that = mocker.patch(f"{PKG}.assert_that")
-    assert_that.side_effect = AssertionError("message")
+    native = Mock(return_value=False)
+    mocker.patch(f"{PKG}.compile_native", return_value=native)
+    describe_mismatch = mocker.patch(f"{PKG}.describe_mismatch", return_value="message")
 
     verification = predicate.verify(sentinel.actual)
     assert verification.status == Status.UNSTABLE
     assert verification.message == "message"
     factory.create.assert_called_once_with(None)
-    assert_that.assert_called_once_with(sentinel.actual, sentinel.matcher)
+    native.assert_called_once_with(sentinel.actual)
+    describe_mismatch.assert_called_once_with(sentinel.matcher, sentinel.actual)
 
 
 def test_match_when_the_assertion_succeeds(mocker, predicate, factory):
-    assert_that = mocker.patch(f"{PKG}.assert_that")
+    native = Mock(return_value=True)
+    compile_native = mocker.patch(f"{PKG}.compile_native", return_value=native)
+    describe_mismatch = mocker.patch(f"{PKG}.describe_mismatch")
 
     verification = predicate.verify(sentinel.actual)
     assert verification.status == Status.SUCCESS
     factory.create.assert_called_once_with(None)
-    assert_that.assert_called_once_with(sentinel.actual, sentinel.matcher)
+    native.assert_called_once_with(sentinel.actual)
+    describe_mismatch.assert_not_called()
+
+    predicate.verify(sentinel.actual)
+    compile_native.assert_called_once_with(sentinel.matcher)
+
+
+def test_native_compilation_for_another_matcher(mocker, predicate, factory):
+    compile_native = mocker.patch(f"{PKG}.compile_native", return_value=Mock(return_value=True))
+
+    predicate.verify(sentinel.actual)
+    factory.create.return_value = sentinel.another_matcher
+    predicate.verify(sentinel.actual)
+
+    assert compile_native.call_args_list == [
+        call(sentinel.matcher),
+        call(sentinel.another_matcher),
+    ]
+
+
+def test_pickling():
+    predicate = MatcherWrappingPredicate(StaticMatcherFactory(equal_to(1)))
+    assert predicate.verify(1).status == Status.SUCCESS
+
+    restored = pickle.loads(pickle.dumps(predicate))
+    assert restored.verify(1).status == Status.SUCCESS
+    assert restored.verify(2).status == Status.UNSTABLE
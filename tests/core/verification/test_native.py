@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import Any, List
+
+import hamcrest
+from hamcrest import assert_that
+from hamcrest.core.matcher import Matcher
+from pytest import mark, raises
+
+from preacher.core.verification.hamcrest import before, day_of_week
+from preacher.core.verification.native import compile_native, describe_mismatch
+
+NOW = datetime(2020, 12, 31, 1, 23, 45)
+ITEMS = [None, 0, 1, 2.5, True, "", "xyz", "abc", [], [1, "x"], {"x": 1}, NOW.isoformat()]
+
+
+def _assertion_message(matcher, actual):
+    with raises(AssertionError) as error_info:
+        assert_that(actual, matcher)
+    return str(error_info.value).strip()
+
+
+MATCHERS: List[Matcher[Any]] = [
+    hamcrest.equal_to(1),
+    hamcrest.equal_to("xyz"),
+    hamcrest.none(),
+    hamcrest.not_none(),
+    hamcrest.is_(hamcrest.equal_to([])),
+    hamcrest.not_(hamcrest.equal_to(0)),
+    hamcrest.anything(),
+    hamcrest.greater_than(1),
+    hamcrest.greater_than_or_equal_to(1),
+    hamcrest.less_than(1),
+    hamcrest.less_than_or_equal_to("x"),
+    hamcrest.contains_string("y"),
+    hamcrest.starts_with("a"),
+    hamcrest.ends_with("z"),
+    hamcrest.has_length(2),
+    hamcrest.has_length(hamcrest.greater_than(0)),
+    hamcrest.empty(),
+    hamcrest.has_item(1),
+    hamcrest.has_item(hamcrest.starts_with("x")),
+    hamcrest.all_of(hamcrest.not_none(), hamcrest.has_length(0)),
+    hamcrest.any_of(hamcrest.equal_to(0), hamcrest.contains_string("b")),
+    hamcrest.has_items(1, "x"),
+    day_of_week(3),
+]
+
+
+@mark.parametrize("matcher", MATCHERS)
+@mark.parametrize("item", ITEMS)
+def test_equivalence_to_hamcrest(matcher, item):
+    try:
+        expected = bool(matcher.matches(item))
+    except Exception as error:
+        with raises(type(error)):
+            compile_native(matcher)(item)
+        return
+
+    assert bool(compile_native(matcher)(item)) is expected
+    if not expected:
+        assert describe_mismatch(matcher, item) == _assertion_message(matcher, item)
+
+
+def test_fallback_to_matches():
+    matcher = before(NOW)
+    native = compile_native(matcher)
+    assert native("2020-01-01T00:00:00")
+    assert not native("2021-01-01T00:00:00")
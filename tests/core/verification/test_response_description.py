@@ -40,6 +40,7 @@ def test_when_given_no_description(mocker, response):
 def test_when_given_descriptions(mocker, response):
     analyze_headers = mocker.patch(f"{PKG}.MappingAnalyzer", return_value=sentinel.a_headers)
     analyze_body = mocker.patch(f"{PKG}.ResponseBodyAnalyzer", return_value=sentinel.a_body)
+    mocker.patch(f"{PKG}.perf_counter", side_effect=[1.0, 2.5])
 
     status_code = [
         NonCallableMock(Predicate, verify=Mock(return_value=Verification(status=Status.UNSTABLE))),
@@ -64,6 +65,7 @@ def test_when_given_descriptions(mocker, response):
     assert verification.status_code.status == Status.UNSTABLE
     assert verification.headers.status == Status.UNSTABLE
     assert verification.body.status == Status.UNSTABLE
+    assert verification.elapsed == 1.5
 
     analyze_headers.assert_called_once_with(sentinel.headers)
     analyze_body.assert_called_once_with(sentinel.body)
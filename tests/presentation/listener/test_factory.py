@@ -20,12 +20,14 @@ def test_create_listener_default(mocker, merging_listener):
     logging_factory = mocker.patch(f"{PKG}.create_logging_reporting_listener")
     logging_factory.return_value = sentinel.logging
     html_factory = mocker.patch(f"{PKG}.create_html_reporting_listener")
+    metrics_factory = mocker.patch(f"{PKG}.create_metrics_listener")
 
     create_listener()
 
     merging_listener.append.assert_called_once_with(sentinel.logging)
     logging_factory.assert_called_once_with(level=Status.SUCCESS, formatter=ANY)
     html_factory.assert_not_called()
+    metrics_factory.assert_not_called()
 
 
 def test_create_listener_with_all_parameters(mocker, merging_listener):
@@ -33,6 +35,7 @@ def test_create_listener_with_all_parameters(mocker, merging_listener):
     logging_factory.return_value = sentinel.logging
     html_factory = mocker.patch(f"{PKG}.create_html_reporting_listener")
     html_factory.return_value = sentinel.html
+    background_ctor = mocker.patch(f"{PKG}.BackgroundListener", return_value=sentinel.background)
 
     create_listener(
         level=sentinel.level,
@@ -40,6 +43,42 @@ def test_create_listener_with_all_parameters(mocker, merging_listener):
         report_dir=sentinel.report_dir,
     )
 
-    merging_listener.append.assert_has_calls((call(sentinel.logging), call(sentinel.html)))
+    merging_listener.append.assert_has_calls((call(sentinel.logging), call(sentinel.background)))
     logging_factory.assert_called_once_with(level=sentinel.level, formatter=sentinel.formatter)
     html_factory.assert_called_once_with(sentinel.report_dir)
+    background_ctor.assert_called_once_with(sentinel.html)
+
+
+def test_create_listener_with_profiler(mocker, merging_listener):
+    logging_factory = mocker.patch(f"{PKG}.create_logging_reporting_listener")
+    logging_factory.return_value = sentinel.logging
+    html_factory = mocker.patch(f"{PKG}.create_html_reporting_listener")
+    html_factory.return_value = sentinel.html
+    background_ctor = mocker.patch(f"{PKG}.BackgroundListener", return_value=sentinel.background)
+    profiling_ctor = mocker.patch(f"{PKG}.ProfilingListener")
+    profiling_ctor.side_effect = [sentinel.profiling_logging, sentinel.profiling_html]
+
+    create_listener(report_dir=sentinel.report_dir, profiler=sentinel.profiler)
+
+    merging_listener.append.assert_has_calls(
+        (call(sentinel.profiling_logging), call(sentinel.background))
+    )
+    profiling_ctor.assert_has_calls(
+        (call(sentinel.logging, sentinel.profiler), call(sentinel.html, sentinel.profiler))
+    )
+    background_ctor.assert_called_once_with(sentinel.profiling_html)
+
+
+def test_create_listener_with_metrics(mocker, merging_listener):
+    logging_factory = mocker.patch(f"{PKG}.create_logging_reporting_listener")
+    logging_factory.return_value = sentinel.logging
+    metrics_factory = mocker.patch(f"{PKG}.create_metrics_listener")
+    metrics_factory.return_value = sentinel.metrics
+
+    create_listener(metrics_path=sentinel.metrics_path, metrics_port=sentinel.metrics_port)
+
+    merging_listener.append.assert_has_calls((call(sentinel.logging), call(sentinel.metrics)))
+    metrics_factory.assert_called_once_with(
+        path=sentinel.metrics_path,
+        port=sentinel.metrics_port,
+    )
@@ -18,13 +18,15 @@ def test_given_no_item(reporter):
     listener.on_end(sentinel.status)
 
     reporter.export_response.assert_not_called()
-    reporter.export_results.assert_called_once_with([])
+    reporter.export_result.assert_not_called()
+    reporter.close.assert_called_once_with()
 
 
 def test_given_items(reporter):
     listener = HtmlReportingListener(reporter)
     listener.on_execution(sentinel.execution1, sentinel.response1)
     listener.on_scenario(sentinel.scenario1)
+    reporter.export_result.assert_called_once_with(sentinel.scenario1)
     listener.on_execution(sentinel.execution2, sentinel.response2)
     listener.on_execution(sentinel.execution_none, None)
     listener.on_execution(sentinel.execution3, sentinel.response3)
@@ -38,7 +40,26 @@ def test_given_items(reporter):
             call(sentinel.execution3, sentinel.response3),
         )
     )
-    reporter.export_results.assert_called_once_with([sentinel.scenario1, sentinel.scenario2])
+    reporter.export_result.assert_has_calls((call(sentinel.scenario1), call(sentinel.scenario2)))
+    reporter.close.assert_called_once_with()
+
+
+def test_restarting_after_end(reporter):
+    listener = HtmlReportingListener(reporter)
+    listener.on_scenario(sentinel.scenario1)
+    listener.on_end(sentinel.status)
+    reporter.restart.assert_not_called()
+
+    listener.on_execution(sentinel.execution, None)
+    reporter.restart.assert_not_called()
+    listener.on_execution(sentinel.execution, sentinel.response)
+    listener.on_scenario(sentinel.scenario2)
+    listener.on_end(sentinel.status)
+    reporter.restart.assert_called_once_with()
+
+    listener.on_end(sentinel.status)
+    assert reporter.restart.call_count == 2
+    assert reporter.close.call_count == 3
 
 
 @patch(f"{PKG}.HtmlReportingListener", return_value=sentinel.listener)
@@ -47,5 +68,12 @@ def test_from_path(reporter_ctor, listener_ctor):
     listener = create_html_reporting_listener(sentinel.path)
     assert listener is sentinel.listener
 
-    reporter_ctor.assert_called_once_with(sentinel.path)
+    reporter_ctor.assert_called_once_with(sentinel.path, bytecode_cache_dir=None)
     listener_ctor.assert_called_once_with(sentinel.reporter)
+
+
+@patch(f"{PKG}.HtmlReportingListener", return_value=sentinel.listener)
+@patch(f"{PKG}.HtmlReporter", return_value=sentinel.reporter)
+def test_from_path_with_bytecode_cache(reporter_ctor, listener_ctor):
+    create_html_reporting_listener(sentinel.path, bytecode_cache_dir=sentinel.cache_dir)
+    reporter_ctor.assert_called_once_with(sentinel.path, bytecode_cache_dir=sentinel.cache_dir)
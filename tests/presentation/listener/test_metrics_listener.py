@@ -0,0 +1,129 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest.mock import NonCallableMock, sentinel
+
+from preacher.core.request import ExecutionReport, PreparedRequest, Response, ResponseBody
+from preacher.core.scenario import CaseResult, ScenarioResult
+from preacher.core.status import Status, StatusedList
+from preacher.core.verification import ResponseVerification, Verification
+from preacher.presentation.listener import MetricsListener, create_metrics_listener
+from preacher.presentation.metrics import MetricsRegistry, MetricsServer
+
+PKG = "preacher.presentation.listener.metrics"
+
+
+def _request(url):
+    return PreparedRequest(method="GET", url=url, headers={}, body=None)
+
+
+def _response(id, status_code, content, elapsed):
+    body = NonCallableMock(ResponseBody, content=content)
+    return NonCallableMock(Response, id=id, status_code=status_code, body=body, elapsed=elapsed)
+
+
+def _sample(exposed, name):
+    return [line for line in exposed.splitlines() if line.startswith(name)]
+
+
+def test_given_no_items():
+    registry = MetricsRegistry()
+    listener = MetricsListener(registry)
+    listener.on_end(Status.SKIPPED)
+
+    exposed = registry.expose()
+    assert _sample(exposed, "preacher_runs_total") == ['preacher_runs_total{status="skipped"} 1']
+    assert _sample(exposed, "preacher_cases_total") == []
+
+
+def test_given_items():
+    registry = MetricsRegistry()
+    listener = MetricsListener(registry)
+
+    execution = ExecutionReport(
+        status=Status.SUCCESS,
+        request=_request("http://host:8080/path?a=b"),
+        attempts=3,
+    )
+    listener.on_execution(execution, _response("response1", 200, b"body", 0.2))
+    listener.on_execution(sentinel.execution, None)
+    unsent = ExecutionReport(status=Status.FAILURE)
+    unreachable = ExecutionReport(status=Status.UNSTABLE, request=_request("http://other/"))
+    verification = ResponseVerification(
+        response_id="response1",
+        status_code=Verification.succeed(),
+        elapsed=0.002,
+    )
+    result = ScenarioResult(
+        cases=StatusedList([CaseResult("case", execution=execution, response=verification)]),
+        subscenarios=StatusedList(
+            [
+                ScenarioResult(
+                    cases=StatusedList(
+                        [
+                            CaseResult("unsent", execution=unsent),
+                            CaseResult(execution=unreachable),
+                            CaseResult("skipped", conditions=Verification(Status.UNSTABLE)),
+                        ]
+                    )
+                )
+            ]
+        ),
+    )
+    listener.on_scenario(result)
+    listener.on_end(Status.FAILURE)
+
+    exposed = registry.expose()
+    case = 'label="case",host="host:8080"'
+    assert _sample(exposed, "preacher_cases_total") == [
+        'preacher_cases_total{label="",host="other",status="unstable"} 1',
+        f'preacher_cases_total{{{case},status="success"}} 1',
+        'preacher_cases_total{label="skipped",host="",status="skipped"} 1',
+        'preacher_cases_total{label="unsent",host="",status="failure"} 1',
+    ]
+    assert _sample(exposed, "preacher_requests_total") == [
+        'preacher_requests_total{label="",host="other"} 1',
+        f"preacher_requests_total{{{case}}} 3",
+    ]
+    assert _sample(exposed, "preacher_retries_total") == [
+        'preacher_retries_total{label="",host="other"} 0',
+        f"preacher_retries_total{{{case}}} 2",
+    ]
+    assert _sample(exposed, "preacher_responses_total") == [
+        f'preacher_responses_total{{{case},code="200"}} 1',
+    ]
+    assert _sample(exposed, "preacher_response_bytes_total") == [
+        f"preacher_response_bytes_total{{{case}}} 4",
+    ]
+    assert f'preacher_response_seconds_bucket{{{case},le="0.25"}} 1' in exposed
+    assert f'preacher_response_seconds_bucket{{{case},le="0.1"}} 0' in exposed
+    assert f"preacher_response_seconds_sum{{{case}}} 0.2" in exposed
+    assert f'preacher_verification_seconds_bucket{{{case},le="0.0025"}} 1' in exposed
+    assert f'preacher_verification_seconds_bucket{{{case},le="0.001"}} 0' in exposed
+    assert _sample(exposed, "preacher_runs_total") == ['preacher_runs_total{status="failure"} 1']
+
+
+def test_writing_into_file():
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "metrics.prom")
+        listener = create_metrics_listener(path=path)
+        assert not os.path.exists(path)
+
+        listener.on_end(Status.SUCCESS)
+        with open(path) as f:
+            assert 'preacher_runs_total{status="success"} 1' in f.read()
+
+
+def test_serving(mocker):
+    server = NonCallableMock(MetricsServer)
+    server_ctor = mocker.patch(f"{PKG}.MetricsServer", return_value=server)
+
+    listener = create_metrics_listener(port=9100)
+    server_ctor.assert_called_once_with(mocker.ANY, 9100)
+    server.start.assert_called_once_with()
+    server.close.assert_not_called()
+
+    listener.on_end(Status.SUCCESS)
+    server.close.assert_not_called()
+
+    listener.close()
+    server.close.assert_called_once_with()
@@ -4,6 +4,7 @@ Styles should be checked independently.
 """
 
 import os
+import pickle
 from dataclasses import dataclass, field
 from tempfile import TemporaryDirectory
 from typing import Mapping
@@ -27,7 +28,7 @@ class ResponseImpl(Response):
     elapsed: float = 0.0
     status_code: int = 200
     headers: Mapping[str, str] = field(default_factory=dict)
-    body: ResponseBody = field(default=ResponseBodyImpl())
+    body: ResponseBody = field(default_factory=ResponseBodyImpl)
 
     @property
     def id(self) -> str:
@@ -40,9 +41,8 @@ def path():
         yield path
 
 
-def test_export_execution(path):
-    execution = ExecutionReport()
-
+@fixture
+def response():
     response_body = NonCallableMock(ResponseBody)
     response_body.text = "ABC"
     response_body.content = b"ABC"
@@ -53,9 +53,12 @@ def test_export_execution(path):
     response.status_code = 200
     response.headers = {"key": "value"}
     response.body = response_body
+    return response
+
 
+def test_export_execution(path, response):
     reporter = HtmlReporter(path)
-    reporter.export_response(execution, response)
+    reporter.export_response(ExecutionReport(), response)
     assert os.path.isfile(os.path.join(path, "responses", "res-id.html"))
 
 
@@ -68,5 +71,72 @@ def test_export_execution(path):
 )
 def test_export_results(path, results):
     reporter = HtmlReporter(path)
-    reporter.export_results([])
+    reporter.export_results(results)
+    assert os.path.isfile(os.path.join(path, "index.html"))
+
+
+def test_export_results_in_pages(path):
+    reporter = HtmlReporter(path, page_size=2)
     assert os.path.isfile(os.path.join(path, "index.html"))
+
+    for idx, result in enumerate(FILLED_SCENARIO_RESULTS * 2):
+        reporter.export_result(result)
+        # Written results are always readable.
+        page_path = os.path.join(path, f"scenarios-{idx // 2 + 1}.html")
+        with open(page_path) as f:
+            assert f.read().count('class="accordion-item status-') >= 1
+    with open(os.path.join(path, "index.html")) as f:
+        assert "Running, or interrupted." in f.read()
+
+    reporter.close()
+    page_count = (len(FILLED_SCENARIO_RESULTS) * 2 + 1) // 2
+    for number in range(1, page_count + 1):
+        with open(os.path.join(path, f"scenarios-{number}.html")) as f:
+            assert f.read().rstrip().endswith("</html>")
+    assert not os.path.exists(os.path.join(path, f"scenarios-{page_count + 1}.html"))
+
+    with open(os.path.join(path, "index.html")) as f:
+        summary = f.read()
+    assert "Running, or interrupted." not in summary
+    assert 'href="scenarios-1.html"' in summary
+    assert f'href="scenarios-{page_count}.html"' in summary
+
+
+def test_restart(path, response):
+    reporter = HtmlReporter(path, page_size=1)
+    reporter.export_response(ExecutionReport(), response)
+    reporter.export_results(FILLED_SCENARIO_RESULTS[:2])
+    assert os.path.isfile(os.path.join(path, "scenarios-2.html"))
+
+    reporter.restart()
+    assert os.listdir(os.path.join(path, "responses")) == []
+    assert not os.path.exists(os.path.join(path, "scenarios-1.html"))
+    assert not os.path.exists(os.path.join(path, "scenarios-2.html"))
+    with open(os.path.join(path, "index.html")) as f:
+        assert "Running, or interrupted." in f.read()
+
+    reporter.export_results(FILLED_SCENARIO_RESULTS[:1])
+    assert os.path.isfile(os.path.join(path, "scenarios-1.html"))
+    assert not os.path.exists(os.path.join(path, "scenarios-2.html"))
+
+
+def test_export_with_bytecode_cache(path, response):
+    cache_dir = os.path.join(path, "cache")
+
+    HtmlReporter(os.path.join(path, "report1"), bytecode_cache_dir=cache_dir)
+    assert os.listdir(cache_dir)
+
+    reporter = HtmlReporter(os.path.join(path, "report2"), bytecode_cache_dir=cache_dir)
+    reporter.export_response(ExecutionReport(), response)
+    reporter.export_results(FILLED_SCENARIO_RESULTS)
+    assert os.path.isfile(os.path.join(path, "report2", "responses", "res-id.html"))
+    assert os.path.isfile(os.path.join(path, "report2", "index.html"))
+
+
+def test_pickled(path, response):
+    reporter = HtmlReporter(path)
+    reporter.export_results(FILLED_SCENARIO_RESULTS[:1])
+
+    copied = pickle.loads(pickle.dumps(reporter))
+    copied.export_response(ExecutionReport(), response)
+    assert os.path.isfile(os.path.join(path, "responses", "res-id.html"))
@@ -0,0 +1,102 @@
+import os
+from tempfile import TemporaryDirectory
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from pytest import raises
+
+from preacher.presentation.metrics import CONTENT_TYPE, MetricsRegistry, MetricsServer
+from preacher.presentation.metrics import write_metrics
+
+
+def test_empty_registry():
+    assert MetricsRegistry().expose() == "# EOF\n"
+
+
+def test_counter():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests", "Requests.", ("label", "host"))
+    counter.inc(("b", "host"))
+    counter.inc(("a", 'quoted "\\\n"'), 2.5)
+    counter.inc(("b", "host"), 2)
+
+    assert registry.expose() == (
+        "# TYPE requests counter\n"
+        "# HELP requests Requests.\n"
+        'requests_total{label="a",host="quoted \\"\\\\\\n\\""} 2.5\n'
+        'requests_total{label="b",host="host"} 3\n'
+        "# EOF\n"
+    )
+
+
+def test_counter_without_labels():
+    registry = MetricsRegistry()
+    registry.counter("runs", "Runs.").inc()
+    assert 'runs_total 1\n' in registry.expose()
+
+
+def test_counter_given_invalid_values():
+    counter = MetricsRegistry().counter("requests", "Requests.", ("label",))
+    with raises(ValueError):
+        counter.inc(("a",), -1)
+    with raises(ValueError):
+        counter.inc(("a", "b"))
+
+
+def test_histogram():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("seconds", "Seconds.", ("label",), buckets=(1, 0.5))
+    histogram.observe(("a",), 0.5)
+    histogram.observe(("a",), 0.75)
+    histogram.observe(("a",), 2)
+
+    assert registry.expose() == (
+        "# TYPE seconds histogram\n"
+        "# HELP seconds Seconds.\n"
+        'seconds_bucket{label="a",le="0.5"} 1\n'
+        'seconds_bucket{label="a",le="1.0"} 2\n'
+        'seconds_bucket{label="a",le="+Inf"} 3\n'
+        'seconds_count{label="a"} 3\n'
+        'seconds_sum{label="a"} 3.25\n'
+        "# EOF\n"
+    )
+
+
+def test_duplicated_metrics():
+    registry = MetricsRegistry()
+    registry.counter("requests", "Requests.")
+    with raises(ValueError):
+        registry.histogram("requests", "Requests.")
+
+
+def test_write_metrics():
+    registry = MetricsRegistry()
+    registry.counter("runs", "Runs.").inc()
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, "metrics.prom")
+        write_metrics(registry, path)
+        assert os.listdir(directory) == ["metrics.prom"]
+        with open(path) as f:
+            assert f.read() == registry.expose()
+
+
+def test_server():
+    registry = MetricsRegistry()
+    counter = registry.counter("runs", "Runs.")
+    server = MetricsServer(registry, 0)
+    server.start()
+    try:
+        url = f"http://localhost:{server.port}"
+        counter.inc()
+        with urlopen(f"{url}/metrics") as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert "runs_total 1\n" in response.read().decode("utf-8")
+
+        counter.inc()
+        with urlopen(url) as response:
+            assert "runs_total 2\n" in response.read().decode("utf-8")
+
+        with raises(HTTPError):
+            urlopen(f"{url}/foo")
+    finally:
+        server.close()